@@ -8,6 +8,11 @@
 #          비대화형 모드로 실행하고 결과를 JSON으로 반환합니다.
 #
 # 🕒 변경 이력 (REVISION HISTORY):
+# [2026-10-17] agent_live.jsonl 증분 인덱스(src.live_index.LiveRunIndex) — 폴링마다 전체 재파싱 제거
+#   - _merge_live_file_status / handle_live_runs: 새로 추가된 줄만 반영된 집계를 조회
+#   - handle_live_runs: 정의되지 않은 _api_dir 참조(NameError) 제거
+# [2026-10-17] _json_response → src.http_response.send_json (협상 gzip + Content-Length)
+# [2026-10-17] 라우팅 테이블 — import 시 api.router.ROUTER에 경로별 핸들러 직접 등록
 # [2026-03-08] Claude: Gemini 세션 실제 작업 표시 — PTY Gemini 현재 지시 내용 보완
 #   - _get_gemini_last_task(): Gemini 세션 JSON에서 마지막 사용자 메시지 추출
 #   - server.py pty_sessions에 cwd 필드 추가 → 프로젝트별 세션 파일 정확 매핑
@@ -49,6 +54,10 @@ import threading
 import time
 from pathlib import Path
 
+from api.router import ROUTER
+from src.http_response import send_json
+from src.live_index import LiveRunIndex
+
 # ─── cli_agent 모듈 경로 등록 ─────────────────────────────────────────────────
 # [2026-03-08] Claude: [버그수정] 배포(frozen) EXE에서 cli_agent를 못 찾는 버그 수정
 #   - Dev 환경: __file__ = .ai_monitor/api/agent_api.py
@@ -82,6 +91,10 @@ except ImportError as e:
 # handle_terminals()에서 cli_agent 상태를 이 값으로 오버라이드하여 대화형 세션을 실시간 표시.
 _interactive_stages: dict = {}
 
+# ── agent_live.jsonl 증분 인덱스 (프로세스 전역) ──────────────────────────────
+# /api/agent/terminals · /api/agent/live-runs가 공유. 조회 시 마지막 오프셋 이후 새 줄만 파싱합니다.
+_LIVE_INDEX = LiveRunIndex(_BASE_DIR / 'data' / 'agent_live.jsonl')
+
 # 모든 사용자 지시는 항상 오케스트레이션으로 시작합니다.
 FORCE_ORCHESTRATION = True
 
@@ -98,12 +111,8 @@ def set_pty_sessions_getter(getter) -> None:
 
 
 def _json_response(handler, data: dict | list, status: int = 200) -> None:
-    """JSON 응답 공통 헬퍼 — hive_api.py와 동일한 패턴."""
-    handler.send_response(status)
-    handler.send_header('Content-Type', 'application/json;charset=utf-8')
-    handler.send_header('Access-Control-Allow-Origin', '*')
-    handler.end_headers()
-    handler.wfile.write(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+    """JSON 응답 공통 헬퍼 — hive_api.py와 동일한 패턴 (src.http_response 협상 gzip)."""
+    send_json(handler, data, status)
 
 
 def _read_body(handler) -> dict:
@@ -339,62 +348,12 @@ def _merge_live_file_status(terminals: dict) -> None:
     - 그 이후에 done 이벤트가 없으면 running으로 표시
     - 최근 10분(600초) 이내 이벤트만 고려 (오래된 이력 무시)
     """
-    import datetime as _dt
-
-    # agent_live.jsonl 경로: .ai_monitor/data/agent_live.jsonl
-    _api_dir = Path(__file__).resolve().parent
-    live_file = _api_dir.parent / 'data' / 'agent_live.jsonl'
-    if not live_file.exists():
-        return
-
+    # 터미널별 { 'last_started': {...}, 'last_done': {...} } — 증분 인덱스에서 O(1) 조회
     try:
-        lines = live_file.read_text(encoding='utf-8').strip().splitlines()
+        terminal_events = _LIVE_INDEX.terminal_events(cutoff=600)  # 10분 이내 이벤트만 처리
     except Exception:
         return
 
-    now = time.time()
-    cutoff = 600  # 10분 이내 이벤트만 처리
-
-    # 터미널별 최근 상태를 추적할 임시 딕셔너리
-    # { 'T1': {'last_started': {...}, 'last_done': {...}} }
-    terminal_events: dict = {}
-
-    for line in lines[-500:]:  # 마지막 500줄만 처리 (성능 보호)
-        try:
-            ev = json.loads(line)
-        except Exception:
-            continue
-
-        # agent_shell.py는 'terminal' 키를, cli_agent.py는 'terminal_id' 키를 사용
-        tid = ev.get('terminal') or ev.get('terminal_id', '')
-        if not tid or not tid.startswith('T'):
-            continue
-
-        ts_str = ev.get('ts', '')
-        if not ts_str:
-            continue
-
-        # ISO 타임스탬프를 epoch 초로 변환 (시간 범위 필터링용)
-        try:
-            ts_epoch = _dt.datetime.fromisoformat(ts_str).timestamp()
-        except Exception:
-            continue
-
-        if now - ts_epoch > cutoff:
-            continue  # 10분 이전 이벤트 무시
-
-        if tid not in terminal_events:
-            terminal_events[tid] = {'last_started': None, 'last_done': None}
-
-        ev_type = ev.get('type', '')
-        if ev_type == 'started':
-            terminal_events[tid]['last_started'] = ev
-        elif ev_type in ('done', 'stopped', 'error'):
-            # done 이벤트는 started 이후에만 유효하도록 ts 비교
-            current_done = terminal_events[tid].get('last_done')
-            if current_done is None or ts_str > current_done.get('ts', ''):
-                terminal_events[tid]['last_done'] = ev
-
     # 수집한 이벤트로 terminals 딕셔너리 업데이트
     for tid, evs in terminal_events.items():
         started = evs.get('last_started')
@@ -674,101 +633,13 @@ def handle_live_runs(handler) -> None:
     반환 구조: { "T1": [...runs], "T2": [...runs], ... }
     각 run: { run_id, task, cli, status, ts, output_preview }
     """
-    live_file = _api_dir.parent / 'data' / 'agent_live.jsonl'
-    result: dict[str, list[dict]] = {}
-
-    if not live_file.exists():
-        _json_response(handler, result)
-        return
-
+    # run_id 단위 집계(정리된 task, 상태, 미리보기 3줄)는 _LIVE_INDEX가 새 줄만 읽어 유지
     try:
-        # ── agent_live.jsonl 파싱 — run_id 단위로 묶음 ────────────────────────
-        # started 이벤트로 run을 열고, done/error 이벤트로 닫습니다.
-        # output 이벤트는 미리보기 3줄만 캡처합니다.
-        runs_by_id: dict[str, dict] = {}
-        order: list[str] = []  # 삽입 순서 유지
-
-        with open(live_file, encoding='utf-8', errors='replace') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    ev = json.loads(line)
-                except Exception:
-                    continue
-
-                rid = ev.get('run_id')
-                if not rid:
-                    continue
-                etype = ev.get('type', '')
-
-                if etype == 'started':
-                    # 이스케이프 시퀀스가 섞인 task 문자열 정리
-                    raw_task = ev.get('task', '')
-                    # ANSI/VT 이스케이프 + OSC 시퀀스 제거 후 의미 있는 텍스트만 추출
-                    import re as _re
-                    # 1단계: ESC CSI 시퀀스 제거 (\x1b[31m 등)
-                    _s = _re.sub(r'\x1b\[[^a-zA-Z]*[a-zA-Z]', '', raw_task)
-                    # 2단계: OSC 시퀀스 제거 (]11;rgb:1e1e/...\) — 다음 OSC/CSI 시작까지 매칭
-                    _s = _re.sub(r']\d+;[^"\n]*?(?=]|\[|\Z)', '', _s)
-                    # 3단계: 이스케이프 없는 CSI 제거 ([?1;2c, [O, [I 등)
-                    _s = _re.sub(r'\[[\?]?[0-9;]*[a-zA-Z]', '', _s)
-                    # 4단계: 나머지 제어문자 + 백슬래시(\x5c) 제거
-                    _s = _re.sub(r'[\x00-\x1f\x7f\x5c]', '', _s)
-                    clean_task = _s.strip(" '\"")
-                    # 5단계: 의미 있는 텍스트 판별 (한글 or 5자 이상 영문 단어)
-                    # → 3자 이하 영문은 'rgb', 'I', 'O' 같은 노이즈도 포함되므로 5자로 제한
-                    has_korean = bool(_re.search(r'[가-힣ㄱ-ㅎㅏ-ㅣ]', clean_task))
-                    has_words  = bool(_re.search(r'[a-zA-Z]{5,}', clean_task))
-                    if not has_korean and not has_words:
-                        continue
-                    runs_by_id[rid] = {
-                        'run_id': rid,
-                        'task': clean_task,
-                        'cli': ev.get('cli', ''),
-                        'terminal_id': ev.get('terminal_id', ''),
-                        'status': 'running',
-                        'ts': ev.get('ts', ''),
-                        'output': [],
-                    }
-                    if rid not in order:
-                        order.append(rid)
-
-                elif etype in ('done', 'error'):
-                    if rid in runs_by_id:
-                        runs_by_id[rid]['status'] = ev.get('status', etype)
-                        if ev.get('terminal_id'):
-                            runs_by_id[rid]['terminal_id'] = ev['terminal_id']
-
-                elif etype == 'output':
-                    if rid in runs_by_id and len(runs_by_id[rid]['output']) < 3:
-                        text = ev.get('line', '').strip()
-                        if text:
-                            runs_by_id[rid]['output'].append(text)
-
-        # ── 터미널별로 그룹화 (최근 20개, 역순) ─────────────────────────────
-        for rid in reversed(order):
-            run = runs_by_id[rid]
-            tid = run.get('terminal_id') or 'unknown'
-            if not tid or not run.get('task'):
-                continue  # task 없는 노이즈 제외
-
-            if tid not in result:
-                result[tid] = []
-            if len(result[tid]) < 20:
-                result[tid].append({
-                    'run_id': run['run_id'],
-                    'task': run['task'],
-                    'cli': run['cli'],
-                    'status': run['status'],
-                    'ts': run['ts'],
-                    'output_preview': run['output'],
-                })
-
-    except Exception as exc:
+        result = _LIVE_INDEX.live_runs()
+    except Exception:
         import traceback
         traceback.print_exc()
+        result = {}
 
     _json_response(handler, result)
 
@@ -808,3 +679,17 @@ def handle_post(handler, path: str) -> bool:
         handle_stage_update(handler)
         return True
     return False
+
+
+# ── 라우트 등록 (api.router) ─────────────────────────────────────────────────
+# 경로별 핸들러를 직접 등록 — handle_get/handle_post의 if 체인을 거치지 않음
+for _method, _path, _fn in (
+    ('GET', '/api/agent/status', handle_status),
+    ('GET', '/api/agent/runs', handle_runs),
+    ('GET', '/api/agent/terminals', handle_terminals),
+    ('GET', '/api/agent/live-runs', handle_live_runs),
+    ('POST', '/api/agent/run', handle_run),
+    ('POST', '/api/agent/stop', handle_stop),
+    ('POST', '/api/agent/stage', handle_stage_update),
+):
+    ROUTER.add(_method, _path, lambda handler, req, _fn=_fn: _fn(handler), source='agent_api')
@@ -2,6 +2,9 @@ import os
 import json
 from http import server
 
+from api.router import ROUTER
+from src.http_response import send_json
+
 # .env 파일 경로
 ENV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env')
 
@@ -70,10 +73,7 @@ def save_discord_config(new_config):
 
 def handle_get_config(handler):
     config = load_discord_config()
-    handler.send_response(200)
-    handler.send_header('Content-Type', 'application/json')
-    handler.end_headers()
-    handler.wfile.write(json.dumps(config).encode('utf-8'))
+    send_json(handler, config, cors=False)
 
 def handle_post_config(handler):
     content_length = int(handler.headers['Content-Length'])
@@ -81,10 +81,12 @@ def handle_post_config(handler):
     new_config = json.loads(post_data.decode('utf-8'))
     
     if save_discord_config(new_config):
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json')
-        handler.end_headers()
-        handler.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
+        send_json(handler, {"status": "success"}, cors=False)
     else:
         handler.send_response(500)
+        handler.send_header('Content-Length', '0')
         handler.end_headers()
+
+
+# 라우트 등록 (api.router)
+ROUTER.add('GET', '/api/config/discord', lambda handler, req: handle_get_config(handler), source='config_api')
@@ -7,16 +7,20 @@ DESCRIPTION: /api/git/* 엔드포인트 핸들러 모듈.
 
 REVISION HISTORY:
 - 2026-03-01 Claude: server.py에서 분리 — git API 핸들러 담당
+- 2026-10-17: import 시 api.router.ROUTER에 GET 경로 등록
+- 2026-10-17: 응답 작성 → src.http_response.send_json (협상 gzip + Content-Length)
 """
 
-import json
 import re
 import subprocess
 import sys
 from pathlib import Path
 
+from api.router import ROUTER
+from src.http_response import send_json
 
-def handle_get(handler, path: str, params: dict, BASE_DIR: Path) -> bool:
+
+def handle_get(handler, path: str, params: dict, BASE_DIR: Path, **_unused) -> bool:
     """GET 요청 처리 — /api/git/status, /api/git/log 담당.
 
     반환값: 경로가 처리됐으면 True, 해당 없으면 False.
@@ -24,10 +28,6 @@ def handle_get(handler, path: str, params: dict, BASE_DIR: Path) -> bool:
 
     # ── /api/git/status ──────────────────────────────────────────────────
     if path == '/api/git/status':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         # ?path= 쿼리 파라미터로 대상 저장소 경로 지정, 없으면 프로젝트 루트
         git_path = params.get('path', [''])[0].strip() or str(BASE_DIR.parent)
         try:
@@ -39,9 +39,7 @@ def handle_get(handler, path: str, params: dict, BASE_DIR: Path) -> bool:
                 creationflags=0x08000000
             )
             if result.returncode != 0:
-                handler.wfile.write(json.dumps(
-                    {'is_git_repo': False, 'error': result.stderr.strip()}
-                ).encode('utf-8'))
+                send_json(handler, {'is_git_repo': False, 'error': result.stderr.strip()})
                 return True
 
             lines = result.stdout.splitlines()
@@ -76,7 +74,7 @@ def handle_get(handler, path: str, params: dict, BASE_DIR: Path) -> bool:
                 elif xy == '??':
                     untracked.append(fname)
 
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'is_git_repo': True,
                 'branch':      branch,
                 'ahead':       ahead,
@@ -85,21 +83,17 @@ def handle_get(handler, path: str, params: dict, BASE_DIR: Path) -> bool:
                 'unstaged':    unstaged,
                 'untracked':   untracked,
                 'conflicts':   conflicts,
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         except subprocess.TimeoutExpired:
-            handler.wfile.write(json.dumps({'is_git_repo': False, 'error': 'git timeout'}).encode('utf-8'))
+            send_json(handler, {'is_git_repo': False, 'error': 'git timeout'})
         except FileNotFoundError:
-            handler.wfile.write(json.dumps({'is_git_repo': False, 'error': 'git not found'}).encode('utf-8'))
+            send_json(handler, {'is_git_repo': False, 'error': 'git not found'})
         except Exception as e:
-            handler.wfile.write(json.dumps({'is_git_repo': False, 'error': str(e)}).encode('utf-8'))
+            send_json(handler, {'is_git_repo': False, 'error': str(e)})
         return True
 
     # ── /api/git/log ─────────────────────────────────────────────────────
     elif path == '/api/git/log':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         git_path = params.get('path', [''])[0].strip() or str(BASE_DIR.parent)
         n = min(int(params.get('n', ['10'])[0]), 50)  # 최대 50개 제한
         try:
@@ -113,9 +107,9 @@ def handle_get(handler, path: str, params: dict, BASE_DIR: Path) -> bool:
                 parts = line.split('\x1f')
                 if len(parts) == 4:
                     commits.append({'hash': parts[0], 'message': parts[1], 'author': parts[2], 'date': parts[3]})
-            handler.wfile.write(json.dumps(commits, ensure_ascii=False).encode('utf-8'))
+            send_json(handler, commits)
         except Exception:
-            handler.wfile.write(json.dumps([]).encode('utf-8'))
+            send_json(handler, [])
         return True
 
     return False
@@ -129,15 +123,11 @@ def handle_post(handler, path: str, data: dict, BASE_DIR: Path) -> bool:
 
     # ── /api/git/rollback ────────────────────────────────────────────────
     if path == '/api/git/rollback':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             file_path = data.get('file')
             repo_path = data.get('repo', str(BASE_DIR.parent))
             if not file_path:
-                handler.wfile.write(json.dumps({"status": "error", "message": "file 필드 필수"}).encode('utf-8'))
+                send_json(handler, {"status": "error", "message": "file 필드 필수"})
                 return True
             result = subprocess.run(
                 ['git', 'checkout', '--', file_path],
@@ -145,21 +135,17 @@ def handle_post(handler, path: str, data: dict, BASE_DIR: Path) -> bool:
                 creationflags=0x08000000
             )
             if result.returncode == 0:
-                handler.wfile.write(json.dumps({"status": "success", "message": f"{file_path} 복구 완료"}).encode('utf-8'))
+                send_json(handler, {"status": "success", "message": f"{file_path} 복구 완료"})
             else:
-                handler.wfile.write(json.dumps({"status": "error", "message": result.stderr.strip()}).encode('utf-8'))
+                send_json(handler, {"status": "error", "message": result.stderr.strip()})
         except Exception as e:
-            handler.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
+            send_json(handler, {"status": "error", "message": str(e)})
         return True
 
     # ── /api/git/diff ────────────────────────────────────────────────────
     # 원본 server.py에서는 do_POST 아래에 있지만 쿼리스트링에서 파라미터를 읽음
     # (POST body 미사용) → params를 함께 전달받아 쿼리스트링 방식으로 처리
     elif path == '/api/git/diff':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             target_file = data.get('path', [''])[0] if isinstance(data, dict) and 'path' in data else ''
             git_dir     = data.get('git_path', [str(BASE_DIR.parent)])[0] if isinstance(data, dict) else str(BASE_DIR.parent)
@@ -168,9 +154,18 @@ def handle_post(handler, path: str, data: dict, BASE_DIR: Path) -> bool:
                 cwd=git_dir, capture_output=True, text=True, timeout=5, encoding='utf-8',
                 creationflags=0x08000000
             )
-            handler.wfile.write(json.dumps({"diff": result.stdout}).encode('utf-8'))
+            send_json(handler, {"diff": result.stdout})
         except Exception as e:
-            handler.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+            send_json(handler, {"error": str(e)})
         return True
 
     return False
+
+
+# ── 라우트 등록 (api.router) ─────────────────────────────────────────────────
+# POST /api/git/rollback, /api/git/diff는 server.py 인라인 구현이 담당 (요청 필드명이 다름)
+def _route_get(handler, req) -> None:
+    handle_get(handler, req.path, req.params, **req.deps)
+
+
+ROUTER.add_many('GET', ('/api/git/status', '/api/git/log'), _route_get, source='git_api')
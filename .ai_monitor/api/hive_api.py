@@ -13,6 +13,10 @@ REVISION HISTORY:
 - 2026-03-11 Claude: knowledge-graph SQL 수정 — thought->>'title' 단독 조회 시
                      MCP 경유 삽입 외 대부분 레코드가 NULL 반환되는 문제 수정.
                      COALESCE(title, task, text) + skill 필드 dict 포함 추가.
+- 2026-10-17: import 시 api.router.ROUTER에 GET/POST 경로 등록 (server.py if/elif 체인 대체)
+- 2026-10-17: _json_response → src.http_response.send_json (협상 gzip + Content-Length)
+- 2026-10-17: hive/activity · orchestrator/status · skill-results — src.jsonl_tail 역방향 tail로 최근 N개만 읽기
+- 2026-10-17: hive/activity — 폴링마다 키워드 재분류하던 것을 src.hive_activity 링 슬라이스로 대체 (?limit=, ?type=)
 """
 
 import json
@@ -24,6 +28,9 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+from api.router import ROUTER
+from src.http_response import send_json
+from src.jsonl_tail import tail_records
 from src.pg_store import (
     ensure_schema,
     get_agent_last_seen,
@@ -38,13 +45,9 @@ def _json_response(handler, data: dict | list, status: int = 200) -> None:
     """JSON 응답을 전송하는 공통 헬퍼 함수.
 
     매 핸들러에서 반복되는 응답 헤더 작성 코드를 단순화합니다.
-    ensure_ascii=False로 한글 깨짐 방지.
+    ensure_ascii=False로 한글 깨짐 방지. 큰 본문은 Accept-Encoding에 따라 gzip (src.http_response).
     """
-    handler.send_response(status)
-    handler.send_header('Content-Type', 'application/json;charset=utf-8')
-    handler.send_header('Access-Control-Allow-Origin', '*')
-    handler.end_headers()
-    handler.wfile.write(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+    send_json(handler, data, status)
 
 
 def _parse_iso_dt(value: str | None) -> datetime | None:
@@ -145,7 +148,7 @@ def handle_get(handler, path: str, params: dict,
                TASKS_FILE: Path, AGENT_STATUS: dict, AGENT_STATUS_LOCK,
                pty_sessions: dict,
                _current_project_root, _parse_session_tail, _parse_gemini_session,
-               run_pg_sql_csv=None) -> bool:
+               run_pg_sql_csv=None, HIVE_ACTIVITY=None, **_unused) -> bool:
     """GET 요청 처리 — /api/hive/*, /api/orchestrator/*, /api/install-skills,
     /api/skill-results, /api/context-usage,
     /api/gemini-context-usage, /api/local-models 를 담당합니다.
@@ -209,10 +212,6 @@ def handle_get(handler, path: str, params: dict,
 
     # ── /api/install-skills ────────────────────────────────────────────────
     if path == '/api/install-skills':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         target_path = params.get('path', [''])[0]
         result = {"status": "error", "message": "Invalid path"}
         if target_path and os.path.exists(target_path) and os.path.isdir(target_path):
@@ -253,26 +252,18 @@ def handle_get(handler, path: str, params: dict,
                 }
             except Exception as e:
                 result = {"status": "error", "message": str(e)}
-        handler.wfile.write(json.dumps(result).encode('utf-8'))
+        send_json(handler, result)
         return True
 
     # ── /api/hive/skill-analysis ──────────────────────────────────────────
     elif path == '/api/hive/skill-analysis':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         ensure_schema(DATA_DIR)
         analysis_data = load_state('skill_analysis', {"proposals": []}) or {"proposals": []}
-        handler.wfile.write(json.dumps(analysis_data, ensure_ascii=False).encode('utf-8'))
+        send_json(handler, analysis_data)
         return True
 
     # ── /api/hive/health/repair ──────────────────────────────────────────
     elif path == '/api/hive/health/repair':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             watchdog_script = SCRIPTS_DIR / "hive_watchdog.py"
             # CREATE_NO_WINDOW: Python 서브프로세스 콘솔 창 방지
@@ -290,86 +281,39 @@ def handle_get(handler, path: str, params: dict,
                 result = {"status": "error", "message": "Failed to parse watchdog output"}
         except Exception as e:
             result = {"status": "error", "message": str(e)}
-        handler.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+        send_json(handler, result)
         return True
 
     # ── /api/hive/activity ──────────────────────────────────────────────
-    # task_logs.jsonl에서 하이브 시스템 사용 이벤트만 필터링하여 반환.
+    # 하이브 시스템 사용 이벤트 (최신순). 분류는 /api/hive/log/pg 기록 시점에 src.hive_activity가
+    # 1회 수행하고 여기서는 링을 잘라 반환만 합니다. ?limit= (기본 100), ?type= 으로 타입별 인덱스 조회.
     # 대시보드 AgentPanel 하이브 탭에서 3초 폴링으로 사용.
     elif path == '/api/hive/activity':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
-            import re as _re
-            log_path = DATA_DIR / 'task_logs.jsonl'
-            hive_events = []
-            _HIVE_KEYWORDS = {
-                'memory_read':  ['하이브 컨텍스트', 'current-work', 'memory.py list', '하이브 컨텍스트 자동 로드'],
-                'memory_write': ['메모리 저장', '하이브 메모리', 'current-work 업데이트', '자동 저장', 'INSERT OR REPLACE'],
-                'orchestrate':  ['오케스트레이션', '스킬 체인', 'vibe-orchestrate', 'skill_orchestrator', '스킬 실행'],
-                'message':      ['메시지 수신', '미읽음 메시지', '→ claude', '→ gemini'],
-                'heal':         ['자기치유', 'heal', '스킬 자동 설치'],
-                'hive_ctx':     ['하이브 컨텍스트 자동 주입', '[하이브 컨텍스트]'],
-                'session':      ['세션 스냅샷', '응답 완료', '─── 응답 완료'],
-            }
-            if log_path.exists():
-                with open(log_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            entry = json.loads(line)
-                        except Exception:
-                            continue
-                        agent = entry.get('agent', '')
-                        task  = entry.get('task', '')
-                        ts    = entry.get('timestamp', '')
-                        if agent not in ('Hive', 'Claude', '사용자', 'Gemini'):
-                            continue
-                        event_type = None
-                        for etype, keywords in _HIVE_KEYWORDS.items():
-                            if any(kw in task for kw in keywords):
-                                event_type = etype
-                                break
-                        if event_type is None and agent == 'Hive':
-                            event_type = 'hive_ctx'
-                        if event_type is None:
-                            continue
-                        hive_events.append({
-                            'timestamp': ts,
-                            'agent': agent,
-                            'type': event_type,
-                            'task': task[:200],
-                        })
-            hive_events = hive_events[-100:]
-            hive_events.reverse()
-            handler.wfile.write(json.dumps(hive_events, ensure_ascii=False).encode('utf-8'))
+            if HIVE_ACTIVITY is None:
+                send_json(handler, [])
+                return True
+            try:
+                limit = max(0, int(params.get('limit', ['100'])[0]))
+            except ValueError:
+                limit = 100
+            event_type = params.get('type', [None])[0] or None
+            send_json(handler, HIVE_ACTIVITY.recent(limit, event_type))
         except Exception as e:
-            handler.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+            send_json(handler, {'error': str(e)})
         return True
 
     # ── /api/hive/logs ──────────────────────────────────────────────────
     elif path == '/api/hive/logs':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             ensure_schema(DATA_DIR)
-            handler.wfile.write(json.dumps(list_session_logs(200), ensure_ascii=False).encode('utf-8'))
+            send_json(handler, list_session_logs(200))
         except Exception as e:
-            handler.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+            send_json(handler, {'error': str(e)})
         return True
 
     # ── /api/hive/health ─────────────────────────────────────────────────
     elif path == '/api/hive/health':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
 
         def check_exists(p):
             return Path(p).exists()
@@ -411,17 +355,13 @@ def handle_get(handler, path: str, params: dict,
                 "postgres":      True
             }
         }
-        handler.wfile.write(json.dumps(health, ensure_ascii=False).encode('utf-8'))
+        send_json(handler, health)
         return True
 
     # ── /api/orchestrator/skill-chain ────────────────────────────────────
     # skill_chain.db(SQLite)에서 스킬 레지스트리 + 터미널별 최신 세션 조회.
     # UI는 skill_registry(①~⑦ 번호 목록)와 terminals(T1~T8 실행 현황) 맵을 수신.
     elif path == '/api/orchestrator/skill-chain':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             import sys as _sys
             _orch_dir = str(DATA_DIR.parent.parent / 'scripts')
@@ -429,22 +369,18 @@ def handle_get(handler, path: str, params: dict,
                 _sys.path.insert(0, _orch_dir)
             from skill_orchestrator import _build_response
             result = _merge_live_pty_skill_chains(_build_response(), pty_sessions)
-            handler.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+            send_json(handler, result)
         except Exception as e:
             # fallback: 빈 응답
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 "skill_registry": [],
                 "terminals": {},
                 "error": str(e)
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         return True
 
     # ── /api/orchestrator/status ─────────────────────────────────────────
     elif path == '/api/orchestrator/status':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             KNOWN_AGENTS = ['claude', 'gemini', 'codex']
             IDLE_SEC = 300  # 5분
@@ -516,27 +452,16 @@ def handle_get(handler, path: str, params: dict,
 
             # 오케스트레이터 최근 액션 로그
             orch_log = DATA_DIR / 'orchestrator_log.jsonl'
-            recent_actions: list = []
-            if orch_log.exists():
-                for line in reversed(orch_log.read_text(encoding='utf-8').strip().splitlines()[-20:]):
-                    try:
-                        recent_actions.append(json.loads(line))
-                    except Exception:
-                        pass
+            recent_actions: list = tail_records(orch_log, 20)
             if not recent_actions:
-                task_log_file = DATA_DIR / 'task_logs.jsonl'
-                if task_log_file.exists():
-                    lines = task_log_file.read_text(encoding='utf-8').strip().splitlines()
-                    for line in reversed(lines[-20:]):
-                        try:
-                            entry = json.loads(line)
-                            recent_actions.append({
-                                'action':    entry.get('agent', 'agent'),
-                                'detail':    entry.get('task', ''),
-                                'timestamp': entry.get('timestamp', ''),
-                            })
-                        except Exception:
-                            pass
+                recent_actions = [
+                    {
+                        'action':    entry.get('agent', 'agent'),
+                        'detail':    entry.get('task', ''),
+                        'timestamp': entry.get('timestamp', ''),
+                    }
+                    for entry in tail_records(DATA_DIR / 'task_logs.jsonl', 20)
+                ]
 
             warnings: list = []
             for agent, st in agent_status.items():
@@ -549,24 +474,20 @@ def handle_get(handler, path: str, params: dict,
                 if active >= 5:
                     warnings.append(f"{agent} overloaded with {active} active tasks")
 
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'agent_status':      agent_status,
                 'task_distribution': task_dist,
                 'recent_actions':    recent_actions,
                 'warnings':          warnings,
                 'terminal_agents':   terminal_agents,
                 'timestamp':         now_dt.strftime('%Y-%m-%dT%H:%M:%S'),
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         except Exception as e:
-            handler.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+            send_json(handler, {'error': str(e)})
         return True
 
     # ── /api/superpowers/status ──────────────────────────────────────────
     elif path == '/api/superpowers/status':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         # Skills 2.0: .claude/skills/<name>/SKILL.md 구조로 감지
         # 구 시스템(.claude/commands/) 설치 여부도 함께 확인하여 마이그레이션 필요 판단
         VIBE_SKILL_NAMES = ['brainstorm', 'debug', 'write-plan', 'execute-plan', 'tdd', 'code-review',
@@ -589,38 +510,21 @@ def handle_get(handler, path: str, params: dict,
                 for skill in VIBE_SKILL_NAMES
             },
         }
-        handler.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+        send_json(handler, result)
         return True
 
     # ── /api/skill-results ────────────────────────────────────────────────
     elif path == '/api/skill-results':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             results_file = DATA_DIR / 'skill_results.jsonl'
-            rows = []
-            if results_file.exists():
-                for line in results_file.read_text(encoding='utf-8').splitlines():
-                    line = line.strip()
-                    if line:
-                        try:
-                            rows.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            pass
-            rows = rows[-50:][::-1]  # 최신 50개만 반환 (최신순)
-            handler.wfile.write(json.dumps(rows, ensure_ascii=False).encode('utf-8'))
+            rows = tail_records(results_file, 50)  # 최신 50개만 반환 (최신순)
+            send_json(handler, rows)
         except Exception as e:
-            handler.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+            send_json(handler, {'error': str(e)})
         return True
 
     # ── /api/context-usage ───────────────────────────────────────────────
     elif path == '/api/context-usage':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             claude_proj_dir = Path.home() / '.claude' / 'projects' / PROJECT_ID
             sessions = []
@@ -633,21 +537,13 @@ def handle_get(handler, path: str, params: dict,
                     except Exception:
                         continue
             sessions.sort(key=lambda s: s.get('last_ts', ''), reverse=True)
-            handler.wfile.write(json.dumps(
-                {'sessions': sessions[:8]}, ensure_ascii=False
-            ).encode('utf-8'))
+            send_json(handler, {'sessions': sessions[:8]})
         except Exception as e:
-            handler.wfile.write(json.dumps(
-                {'sessions': [], 'error': str(e)}
-            ).encode('utf-8'))
+            send_json(handler, {'sessions': [], 'error': str(e)})
         return True
 
     # ── /api/gemini-context-usage ─────────────────────────────────────────
     elif path == '/api/gemini-context-usage':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             gemini_chat_dir = Path.home() / '.gemini' / 'tmp' / PROJECT_ROOT.name / 'chats'
             sessions = []
@@ -660,21 +556,13 @@ def handle_get(handler, path: str, params: dict,
                     except Exception:
                         continue
             sessions.sort(key=lambda s: s.get('last_ts', ''), reverse=True)
-            handler.wfile.write(json.dumps(
-                {'sessions': sessions[:8]}, ensure_ascii=False
-            ).encode('utf-8'))
+            send_json(handler, {'sessions': sessions[:8]})
         except Exception as e:
-            handler.wfile.write(json.dumps(
-                {'sessions': [], 'error': str(e)}
-            ).encode('utf-8'))
+            send_json(handler, {'sessions': [], 'error': str(e)})
         return True
 
     # ── /api/local-models ────────────────────────────────────────────────
     elif path == '/api/local-models':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         import urllib.request as _urllib
         result = {"hardware": {"ram_gb": 0, "gpus": []}, "models": [], "ollama_available": False, "error": None}
         _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
@@ -731,7 +619,7 @@ def handle_get(handler, path: str, params: dict,
                     })
         except Exception as e:
             result["ollama_error"] = str(e)
-        handler.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+        send_json(handler, result)
         return True
 
     # 처리되지 않은 경로
@@ -741,7 +629,7 @@ def handle_get(handler, path: str, params: dict,
 def handle_post(handler, path: str, data: dict,
                 DATA_DIR: Path, SCRIPTS_DIR: Path, BASE_DIR: Path,
                 PROJECT_ROOT: Path,
-                _current_project_root) -> bool:
+                _current_project_root, **_unused) -> bool:
     """POST 요청 처리 — /api/hive/approve-skill, /api/orchestrator/* 담당.
 
     반환값: 처리됐으면 True, 해당 없으면 False.
@@ -749,15 +637,11 @@ def handle_post(handler, path: str, data: dict,
 
     # ── /api/hive/approve-skill ──────────────────────────────────────────
     if path == '/api/hive/approve-skill':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             skill_name = data.get('skill_name')
             keyword    = data.get('keyword', skill_name)
             if not skill_name:
-                handler.wfile.write(json.dumps({"status": "error", "message": "Skill name is required"}).encode('utf-8'))
+                send_json(handler, {"status": "error", "message": "Skill name is required"})
                 return True
             skill_dir  = PROJECT_ROOT / ".gemini" / "skills" / skill_name
             skill_dir.mkdir(parents=True, exist_ok=True)
@@ -781,19 +665,15 @@ def handle_post(handler, path: str, data: dict,
 """
             with open(skill_file, "w", encoding="utf-8") as f:
                 f.write(template)
-            handler.wfile.write(json.dumps({"status": "success", "path": str(skill_file)}).encode('utf-8'))
+            send_json(handler, {"status": "success", "path": str(skill_file)})
         except Exception as e:
-            handler.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
+            send_json(handler, {"status": "error", "message": str(e)})
         return True
 
     # ── /api/orchestrator/skill-chain/update ─────────────────────────────
     # POST body: {"step": 0, "status": "done", "summary": "...", "terminal_id": 1}
     # skill_orchestrator.cmd_update()를 직접 호출하여 DB 갱신
     elif path == '/api/orchestrator/skill-chain/update':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             import sys as _sys
             _orch_dir = str(DATA_DIR.parent.parent / 'scripts')
@@ -805,17 +685,13 @@ def handle_post(handler, path: str, data: dict,
             summary = str(data.get('summary', ''))
             terminal_id = int(data.get('terminal_id', 0))
             _orch_update(terminal_id, step, status, summary)
-            handler.wfile.write(json.dumps({'status': 'success'}, ensure_ascii=False).encode('utf-8'))
+            send_json(handler, {'status': 'success'})
         except Exception as e:
-            handler.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            send_json(handler, {'status': 'error', 'message': str(e)})
         return True
 
     # ── /api/orchestrator/run ─────────────────────────────────────────────
     elif path == '/api/orchestrator/run':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             orch_script = str(SCRIPTS_DIR / 'orchestrator.py')
             result = subprocess.run(
@@ -824,20 +700,16 @@ def handle_post(handler, path: str, data: dict,
                 creationflags=0x08000000
             )
             output = (result.stdout + result.stderr).strip()
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'status': 'success',
                 'output': output or '이상 없음',
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         except Exception as e:
-            handler.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            send_json(handler, {'status': 'error', 'message': str(e)})
         return True
 
     # ── /api/superpowers/install ─────────────────────────────────────────
     elif path == '/api/superpowers/install':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         import shutil as _shutil
         try:
             tool  = str(data.get('tool', 'claude'))
@@ -875,12 +747,12 @@ def handle_post(handler, path: str, data: dict,
                 msg = f"Claude 스킬 설치 완료 ({len(installed)}개): {', '.join(installed)}"
                 if migrated:
                     msg += f" | 구 버전 제거: {', '.join(migrated)}"
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'success',
                     'message': msg,
                     'installed': installed,
                     'migrated': migrated,
-                }, ensure_ascii=False).encode('utf-8'))
+                })
 
             elif tool == 'gemini':
                 skills_src = BASE_DIR / 'skills' / 'gemini'
@@ -893,22 +765,18 @@ def handle_post(handler, path: str, data: dict,
                 if skills_src.resolve() != dest_dir.resolve():
                     _shutil.copytree(str(skills_src), str(dest_dir), dirs_exist_ok=True)
                 installed = [d.name for d in dest_dir.iterdir() if d.is_dir() and (d / 'SKILL.md').exists()]
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'success',
                     'message': f"Gemini 스킬 설치 완료 ({len(installed)}개) → {dest_dir}"
-                }, ensure_ascii=False).encode('utf-8'))
+                })
             else:
-                handler.wfile.write(json.dumps({'status': 'error', 'message': f'지원하지 않는 tool: {tool}'}).encode('utf-8'))
+                send_json(handler, {'status': 'error', 'message': f'지원하지 않는 tool: {tool}'})
         except Exception as e:
-            handler.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            send_json(handler, {'status': 'error', 'message': str(e)})
         return True
 
     # ── /api/superpowers/uninstall ────────────────────────────────────────
     elif path == '/api/superpowers/uninstall':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         import shutil as _shutil
         try:
             tool  = str(data.get('tool', 'claude'))
@@ -928,23 +796,46 @@ def handle_post(handler, path: str, data: dict,
                     for old_file in commands_dir.glob('vibe-*.md'):
                         old_file.unlink(missing_ok=True)
                         removed.append(old_file.name)
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'success',
                     'message': f"Claude 스킬 제거 완료: {', '.join(removed) if removed else '없음'}",
                     'removed': removed
-                }, ensure_ascii=False).encode('utf-8'))
+                })
             elif tool == 'gemini':
                 dest_dir = _proj / '.gemini' / 'skills'
                 if dest_dir.exists():
                     _shutil.rmtree(dest_dir, ignore_errors=True)
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'success',
                     'message': f"Gemini 스킬 제거 완료 → {dest_dir}"
-                }, ensure_ascii=False).encode('utf-8'))
+                })
             else:
-                handler.wfile.write(json.dumps({'status': 'error', 'message': f'지원하지 않는 tool: {tool}'}).encode('utf-8'))
+                send_json(handler, {'status': 'error', 'message': f'지원하지 않는 tool: {tool}'})
         except Exception as e:
-            handler.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            send_json(handler, {'status': 'error', 'message': str(e)})
         return True
 
     return False
+
+
+# ── 라우트 등록 (api.router) ─────────────────────────────────────────────────
+# /api/install-skills는 server.py 인라인 구현이 담당 (GET 등록 대상에서 제외)
+def _route_get(handler, req) -> None:
+    handle_get(handler, req.path, req.params, **req.deps)
+
+
+def _route_post(handler, req) -> None:
+    handle_post(handler, req.path, req.body, **req.deps)
+
+
+ROUTER.add_many('GET', (
+    '/api/hive/knowledge-graph', '/api/hive/skill-analysis', '/api/hive/health/repair',
+    '/api/hive/activity', '/api/hive/logs', '/api/hive/health',
+    '/api/orchestrator/skill-chain', '/api/orchestrator/status',
+    '/api/superpowers/status', '/api/skill-results', '/api/context-usage',
+    '/api/gemini-context-usage', '/api/local-models',
+), _route_get, source='hive_api')
+ROUTER.add_many('POST', (
+    '/api/hive/approve-skill', '/api/orchestrator/skill-chain/update', '/api/orchestrator/run',
+    '/api/superpowers/install', '/api/superpowers/uninstall',
+), _route_post, source='hive_api')
@@ -6,6 +6,8 @@ REVISION HISTORY:
 - 2026-03-01 Claude: split MCP routes out of server.py
 - 2026-03-08 Claude: add Codex CLI catalog entry and custom command/args support
 - 2026-03-08 Codex: switch Codex MCP management to config.toml / `codex mcp`
+- 2026-10-17: register routes with api.router.ROUTER at import (GET no longer runs the POST handler)
+- 2026-10-17: write responses through src.http_response.send_json (negotiated gzip + Content-Length)
 """
 
 from __future__ import annotations
@@ -20,6 +22,9 @@ import urllib.request
 from pathlib import Path
 from urllib.parse import urlencode
 
+from api.router import ROUTER
+from src.http_response import send_json
+
 
 _AI_MONITOR_DIR = Path(__file__).resolve().parent.parent
 
@@ -125,47 +130,33 @@ def _catalog() -> list[dict]:
 def handle_get(handler, path: str, params: dict, _smithery_api_key, _mcp_config_path, **_unused) -> bool:
     """Handle GET requests for MCP APIs."""
     if path == '/api/mcp/catalog':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
-        handler.wfile.write(json.dumps(_catalog(), ensure_ascii=False).encode('utf-8'))
+        send_json(handler, _catalog())
         return True
 
     if path == '/api/mcp/apikey':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         key = _smithery_api_key()
         masked = (key[:6] + '...' + key[-4:]) if len(key) > 12 else ('*' * len(key) if key else '')
-        handler.wfile.write(
-            json.dumps({'has_key': bool(key), 'masked': masked}, ensure_ascii=False).encode('utf-8')
-        )
+        send_json(handler, {'has_key': bool(key), 'masked': masked})
         return True
 
     if path == '/api/mcp/search':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         q = params.get('q', [''])[0].strip()
         page = int(params.get('page', ['1'])[0])
         page_size = int(params.get('pageSize', ['20'])[0])
         api_key = _smithery_api_key()
 
         if not api_key:
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'error': 'NO_KEY',
                 'message': 'Smithery API 키가 설정되지 않았습니다.',
-            }, ensure_ascii=False).encode('utf-8'))
+            })
             return True
 
         if not q:
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'servers': [],
                 'pagination': {'currentPage': 1, 'totalPages': 0, 'totalCount': 0},
-            }, ensure_ascii=False).encode('utf-8'))
+            })
             return True
 
         try:
@@ -176,25 +167,21 @@ def handle_get(handler, path: str, params: dict, _smithery_api_key, _mcp_config_
             )
             with urllib.request.urlopen(req, timeout=10) as resp:
                 data = json.loads(resp.read().decode('utf-8'))
-            handler.wfile.write(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+            send_json(handler, data)
         except urllib.error.HTTPError as e:
             msg = 'API 키가 유효하지 않습니다.' if e.code == 401 else f'Smithery API 오류 ({e.code})'
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'error': f'HTTP_{e.code}',
                 'message': msg,
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         except Exception as e:
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'error': 'NETWORK',
                 'message': str(e),
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         return True
 
     if path == '/api/mcp/installed':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         tool = params.get('tool', ['claude'])[0]
         scope = params.get('scope', ['global'])[0]
         config_path = _mcp_config_path(tool, scope)
@@ -207,12 +194,12 @@ def handle_get(handler, path: str, params: dict, _smithery_api_key, _mcp_config_
                 installed = list(data.get('mcpServers', {}).keys())
             else:
                 installed = []
-            handler.wfile.write(json.dumps({'installed': installed}, ensure_ascii=False).encode('utf-8'))
+            send_json(handler, {'installed': installed})
         except Exception as e:
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'installed': [],
                 'error': str(e),
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         return True
 
     return False
@@ -221,29 +208,21 @@ def handle_get(handler, path: str, params: dict, _smithery_api_key, _mcp_config_
 def handle_post(handler, path: str, data: dict, _smithery_api_key_setter, _mcp_config_path, **_unused) -> bool:
     """Handle POST requests for MCP APIs."""
     if path == '/api/mcp/apikey':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             api_key = str(data.get('api_key') or data.get('apikey') or '').strip()
             _smithery_api_key_setter.write_text(
                 json.dumps({'api_key': api_key}, ensure_ascii=False, indent=2),
                 encoding='utf-8',
             )
-            handler.wfile.write(json.dumps({'status': 'success'}, ensure_ascii=False).encode('utf-8'))
+            send_json(handler, {'status': 'success'})
         except Exception as e:
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'status': 'error',
                 'message': str(e),
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         return True
 
     if path == '/api/mcp/install':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             tool = str(data.get('tool', 'claude'))
             scope = str(data.get('scope', 'global'))
@@ -252,18 +231,18 @@ def handle_post(handler, path: str, data: dict, _smithery_api_key_setter, _mcp_c
             req_env = [str(v) for v in data.get('requiresEnv', [])]
 
             if not name or not package:
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'error',
                     'message': 'name/package required',
-                }, ensure_ascii=False).encode('utf-8'))
+                })
                 return True
 
             if tool == 'codex':
                 if scope != 'global':
-                    handler.wfile.write(json.dumps({
+                    send_json(handler, {
                         'status': 'error',
                         'message': '현재 Codex CLI MCP 설치는 전역(Global) 범위만 지원합니다.',
-                    }, ensure_ascii=False).encode('utf-8'))
+                    })
                     return True
 
                 custom_command = str(data.get('command', '')).strip()
@@ -278,10 +257,10 @@ def handle_post(handler, path: str, data: dict, _smithery_api_key_setter, _mcp_c
                     cmd.extend([_default_npx_command(), '-y', package])
 
                 ok, msg = _run_codex_mcp(cmd)
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'success' if ok else 'error',
                     'message': msg,
-                }, ensure_ascii=False).encode('utf-8'))
+                })
                 return True
 
             config_path = _mcp_config_path(tool, scope)
@@ -307,55 +286,51 @@ def handle_post(handler, path: str, data: dict, _smithery_api_key_setter, _mcp_c
             msg = f"MCP '{name}' 설치 완료 -> {config_path}"
             if req_env:
                 msg += f" | 환경변수 필요: {', '.join(req_env)} | 설치 후 실제 키 값으로 바꾸세요."
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'status': 'success',
                 'message': msg,
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         except Exception as e:
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'status': 'error',
                 'message': str(e),
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         return True
 
     if path == '/api/mcp/uninstall':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             tool = str(data.get('tool', 'claude'))
             scope = str(data.get('scope', 'global'))
             name = str(data.get('name', ''))
 
             if not name:
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'error',
                     'message': 'name required',
-                }, ensure_ascii=False).encode('utf-8'))
+                })
                 return True
 
             if tool == 'codex':
                 if scope != 'global':
-                    handler.wfile.write(json.dumps({
+                    send_json(handler, {
                         'status': 'error',
                         'message': '현재 Codex CLI MCP 삭제는 전역(Global) 범위만 지원합니다.',
-                    }, ensure_ascii=False).encode('utf-8'))
+                    })
                     return True
 
                 ok, msg = _run_codex_mcp(['remove', name])
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'success' if ok else 'error',
                     'message': msg,
-                }, ensure_ascii=False).encode('utf-8'))
+                })
                 return True
 
             config_path = _mcp_config_path(tool, scope)
             if not config_path.exists():
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'error',
                     'message': '설정 파일이 없습니다.',
-                }, ensure_ascii=False).encode('utf-8'))
+                })
                 return True
 
             config = json.loads(config_path.read_text(encoding='utf-8'))
@@ -367,20 +342,35 @@ def handle_post(handler, path: str, data: dict, _smithery_api_key_setter, _mcp_c
                     json.dumps(config, ensure_ascii=False, indent=2),
                     encoding='utf-8',
                 )
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'success',
                     'message': f"MCP '{name}' 제거 완료",
-                }, ensure_ascii=False).encode('utf-8'))
+                })
             else:
-                handler.wfile.write(json.dumps({
+                send_json(handler, {
                     'status': 'error',
                     'message': f"'{name}' 항목이 없습니다.",
-                }, ensure_ascii=False).encode('utf-8'))
+                })
         except Exception as e:
-            handler.wfile.write(json.dumps({
+            send_json(handler, {
                 'status': 'error',
                 'message': str(e),
-            }, ensure_ascii=False).encode('utf-8'))
+            })
         return True
 
     return False
+
+
+# ── 라우트 등록 (api.router) ─────────────────────────────────────────────────
+def _route_get(handler, req) -> None:
+    handle_get(handler, req.path, req.params, **req.deps)
+
+
+def _route_post(handler, req) -> None:
+    handle_post(handler, req.path, req.body, **req.deps)
+
+
+ROUTER.add_many('GET', ('/api/mcp/catalog', '/api/mcp/apikey', '/api/mcp/search', '/api/mcp/installed'),
+                _route_get, source='mcp_api')
+ROUTER.add_many('POST', ('/api/mcp/apikey', '/api/mcp/install', '/api/mcp/uninstall'),
+                _route_post, source='mcp_api')
@@ -1,9 +1,15 @@
 """
 FILE: api/memory_api.py
 DESCRIPTION: Postgres-first memory API handlers.
+
+REVISION HISTORY:
+- 2026-10-17: /api/memory?semantic=1 의미 검색 (src.memory_index) — 저장 시 임베딩 계산, 삭제 시 캐시 제거
+- 2026-10-17: 지연 임베딩 계산에 _embed_batch 전달 (배치 임베딩 워커)
+- 2026-10-17: import 시 api.router.ROUTER에 GET/POST 경로 등록
+- 2026-10-17: 응답 작성 → src.http_response.send_json (협상 gzip + Content-Length)
 """
 
-import json
+import threading
 import time
 from pathlib import Path
 
@@ -14,40 +20,42 @@ from src.pg_store import (
     delete_memory,
     migrate_legacy_data,
 )
+from api.router import ROUTER
+from src import memory_index
+from src.http_response import send_json
 
 
 def handle_get(handler, path: str, params: dict,
                DATA_DIR: Path, PROJECT_ID: str, PROJECT_ROOT: Path,
                _memory_conn, _embed, _cosine_sim,
-               __version__: str) -> bool:
+               __version__: str, _embed_batch=None, **_unused) -> bool:
     if path == '/api/memory':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         q = params.get('q', [''])[0].strip()
         top_k = int(params.get('top', ['20'])[0])
         show_all = params.get('all', ['false'])[0].lower() == 'true'
+        semantic = params.get('semantic', ['0'])[0].lower() in ('1', 'true')
         project = '' if show_all else PROJECT_ID
         try:
             ensure_schema(DATA_DIR)
-            entries = list_memory(q=q, top_k=top_k, project=project, show_all=show_all)
-            handler.wfile.write(json.dumps(entries, ensure_ascii=False).encode('utf-8'))
+            entries = None
+            if semantic and q:
+                # 임베더/NumPy 불가 시 None → 텍스트 검색으로 폴백
+                entries = memory_index.semantic_search(q, _embed, top_k=top_k, project=project,
+                                                       embed_batch_fn=_embed_batch)
+            if entries is None:
+                entries = list_memory(q=q, top_k=top_k, project=project, show_all=show_all)
+            send_json(handler, entries)
         except Exception as e:
-            handler.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+            send_json(handler, {'error': str(e)})
         return True
 
     if path == '/api/project-info':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
-        handler.wfile.write(json.dumps({
+        send_json(handler, {
             'project_id': PROJECT_ID,
             'project_name': PROJECT_ROOT.name,
             'project_root': str(PROJECT_ROOT).replace('\\', '/'),
             'version': __version__,
-        }, ensure_ascii=False).encode('utf-8'))
+        })
         return True
 
     return False
@@ -55,19 +63,13 @@ def handle_get(handler, path: str, params: dict,
 
 def handle_post(handler, path: str, data: dict,
                 DATA_DIR: Path, PROJECT_ID: str,
-                _memory_conn, _embed) -> bool:
+                _memory_conn, _embed, **_unused) -> bool:
     if path == '/api/memory/set':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             key = str(data.get('key', '')).strip()[:200]
             content = str(data.get('content', '')).strip()
             if not key or not content:
-                handler.wfile.write(json.dumps(
-                    {'status': 'error', 'message': 'key and content are required'}
-                ).encode('utf-8'))
+                send_json(handler, {'status': 'error', 'message': 'key and content are required'})
                 return True
 
             now = time.strftime('%Y-%m-%dT%H:%M:%S')
@@ -88,40 +90,50 @@ def handle_post(handler, path: str, data: dict,
                 created_at=now,
                 updated_at=now,
             )
-            handler.wfile.write(json.dumps(
-                {'status': 'success', 'entry': saved or {}}, ensure_ascii=False
-            ).encode('utf-8'))
+            send_json(handler, {'status': 'success', 'entry': saved or {}})
+            if saved:
+                # 임베딩 계산은 모델 추론이 포함되므로 응답과 분리하여 백그라운드에서 수행
+                threading.Thread(
+                    target=memory_index.index_memory,
+                    args=(key, project, title, content, _embed),
+                    daemon=True, name='MemoryEmbed',
+                ).start()
         except Exception as e:
-            handler.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            send_json(handler, {'status': 'error', 'message': str(e)})
         return True
 
     if path == '/api/memory/delete':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             ensure_schema(DATA_DIR)
-            delete_memory(str(data.get('key', '')).strip())
-            handler.wfile.write(json.dumps({'status': 'success'}, ensure_ascii=False).encode('utf-8'))
+            key = str(data.get('key', '')).strip()
+            delete_memory(key)
+            memory_index.MEMORY_INDEX.remove(key)
+            send_json(handler, {'status': 'success'})
         except Exception as e:
-            handler.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            send_json(handler, {'status': 'error', 'message': str(e)})
         return True
 
     if path == '/api/memory/sync':
-        handler.send_response(200)
-        handler.send_header('Content-Type', 'application/json;charset=utf-8')
-        handler.send_header('Access-Control-Allow-Origin', '*')
-        handler.end_headers()
         try:
             ensure_schema(DATA_DIR)
             migrate_legacy_data(DATA_DIR)
-            handler.wfile.write(json.dumps(
-                {'status': 'ok', 'message': 'legacy memory migrated to PostgreSQL', 'merged': 0, 'skipped': 0},
-                ensure_ascii=False
-            ).encode('utf-8'))
+            send_json(handler, {'status': 'ok', 'message': 'legacy memory migrated to PostgreSQL', 'merged': 0, 'skipped': 0})
         except Exception as e:
-            handler.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            send_json(handler, {'status': 'error', 'message': str(e)})
         return True
 
     return False
+
+
+# ── 라우트 등록 (api.router) ─────────────────────────────────────────────────
+def _route_get(handler, req) -> None:
+    handle_get(handler, req.path, req.params, **req.deps)
+
+
+def _route_post(handler, req) -> None:
+    handle_post(handler, req.path, req.body, **req.deps)
+
+
+ROUTER.add_many('GET', ('/api/memory', '/api/project-info'), _route_get, source='memory_api')
+ROUTER.add_many('POST', ('/api/memory/set', '/api/memory/delete', '/api/memory/sync'),
+                _route_post, source='memory_api')
@@ -4,10 +4,15 @@ DESCRIPTION: PTY session status and control endpoints used by remote bridges.
 
 REVISION HISTORY:
 - 2026-03-12 Claude: Initial extraction for Discord PTY-first remote control
+- 2026-10-17: register /api/pty/ prefix routes with api.router.ROUTER at import
+- 2026-10-17: _json_response goes through src.http_response.send_json (negotiated gzip)
 """
 
 import json
 
+from api.router import ROUTER
+from src.http_response import send_json
+
 _pty_sessions_getter = None  # callable: () -> dict
 _pty_output_getter = None  # callable: () -> dict[str, list[dict]]
 
@@ -25,11 +30,7 @@ def set_pty_output_getter(getter) -> None:
 
 
 def _json_response(handler, payload, status=200) -> None:
-    handler.send_response(status)
-    handler.send_header('Content-Type', 'application/json;charset=utf-8')
-    handler.send_header('Access-Control-Allow-Origin', '*')
-    handler.end_headers()
-    handler.wfile.write(json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+    send_json(handler, payload, status)
 
 
 def _read_body(handler):
@@ -179,3 +180,11 @@ def handle_post(handler, path: str) -> None:
         'status': 'terminated',
         'terminal_id': f'T{target}',
     })
+
+
+# ── Route registration (api.router) ───────────────────────────────────────────
+# Prefix routes: unknown /api/pty/* paths get this module's JSON 404.
+ROUTER.add('GET', '/api/pty/', lambda handler, req: handle_get(handler, req.path, req.params),
+           prefix=True, source='pty_api')
+ROUTER.add('POST', '/api/pty/', lambda handler, req: handle_post(handler, req.path),
+           prefix=True, source='pty_api')
@@ -0,0 +1,152 @@
+"""
+FILE: api/router.py
+DESCRIPTION: SSEHandler 요청 라우팅 테이블.
+             (method, path) → 핸들러를 exact dict 한 번 조회로 찾고, 없으면 경로의 '/' 경계를
+             뒤에서부터 잘라 prefix 테이블을 조회합니다 (경로 깊이만큼, 등록 개수와 무관).
+             각 api/* 모듈은 import 시 ROUTER.add()로 자신의 경로를 등록하고,
+             server.py의 인라인 엔드포인트는 @ROUTER.route() 데코레이터로 등록합니다.
+
+             핸들러 시그니처: fn(handler, req) → None
+               req.path / req.parsed  : urlparse 결과
+               req.params             : parse_qs(query) — 처음 접근 시 1회 파싱
+               req.body               : JSON 본문 — POST에서만, 처음 접근 시 1회 읽음 (GET은 항상 {})
+               req.deps               : server.py가 ROUTER.configure()로 주입한 공용 의존성
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — do_GET/do_POST if/elif 체인 대체, GET 요청 본문 파싱 제거
+"""
+
+import json
+from urllib.parse import parse_qs, urlparse
+
+METHODS = ('GET', 'POST')
+
+
+class Request:
+    """라우트 핸들러에 전달되는 요청 정보 (쿼리/본문은 지연 파싱)."""
+
+    __slots__ = ('handler', 'method', 'parsed', 'path', 'deps', '_params', '_body')
+
+    def __init__(self, handler, method: str, deps: dict):
+        self.handler = handler
+        self.method = method
+        self.parsed = urlparse(handler.path)
+        self.path = self.parsed.path
+        self.deps = deps
+        self._params = None
+        self._body = None
+
+    @property
+    def params(self) -> dict:
+        if self._params is None:
+            self._params = parse_qs(self.parsed.query)
+        return self._params
+
+    @property
+    def body(self) -> dict:
+        if self._body is None:
+            self._body = {}
+            if self.method == 'POST':
+                length = int(self.handler.headers.get('Content-Length', 0) or 0)
+                if length > 0:
+                    self._body = json.loads(self.handler.rfile.read(length).decode('utf-8') or '{}')
+        return self._body
+
+
+class Route:
+    __slots__ = ('method', 'path', 'fn', 'prefix', 'source', 'hits')
+
+    def __init__(self, method: str, path: str, fn, prefix: bool, source: str):
+        self.method = method
+        self.path = path
+        self.fn = fn
+        self.prefix = prefix
+        self.source = source
+        self.hits = 0
+
+
+class RouteRegistry:
+    """exact dict + prefix dict를 메서드별로 분리해 보관하는 라우팅 테이블."""
+
+    def __init__(self):
+        self._exact: dict[str, dict[str, Route]] = {m: {} for m in METHODS}
+        self._prefix: dict[str, dict[str, Route]] = {m: {} for m in METHODS}
+        self.deps: dict = {}
+        self.misses = {m: 0 for m in METHODS}
+
+    # ── 등록 ────────────────────────────────────────────────────────────────
+    def add(self, method: str, path: str, fn, prefix: bool = False, source: str = '') -> Route:
+        """경로를 등록합니다. prefix=True면 path는 '/'로 끝나야 하며 그 아래 모든 경로에 매칭됩니다.
+
+        같은 (method, path)를 두 번 등록하면 ValueError — 체인 순서에 의존하던 중복을 막습니다.
+        """
+        method = method.upper()
+        if prefix and not path.endswith('/'):
+            raise ValueError(f"prefix 경로는 '/'로 끝나야 합니다: {path}")
+        table = (self._prefix if prefix else self._exact)[method]
+        if path in table:
+            raise ValueError(f"중복 라우트: {method} {path} ({table[path].source} / {source})")
+        route = Route(method, path, fn, prefix, source or getattr(fn, '__module__', ''))
+        table[path] = route
+        return route
+
+    def add_many(self, method: str, paths, fn, source: str = '') -> None:
+        for path in paths:
+            self.add(method, path, fn, source=source)
+
+    def route(self, method: str, *paths: str, prefix: bool = False):
+        """데코레이터 — @ROUTER.route('GET', '/api/heartbeat')."""
+        def decorator(fn):
+            for path in paths:
+                self.add(method, path, fn, prefix=prefix)
+            return fn
+        return decorator
+
+    def configure(self, **deps) -> None:
+        """모듈 핸들러(handle_get/handle_post)에 넘길 공용 의존성을 설정합니다."""
+        self.deps = deps
+
+    # ── 조회 / 실행 ─────────────────────────────────────────────────────────
+    def resolve(self, method: str, path: str) -> Route | None:
+        route = self._exact[method].get(path)
+        if route is not None:
+            return route
+        prefixes = self._prefix[method]
+        if not prefixes:
+            return None
+        end = path.rfind('/')
+        while end > 0:
+            route = prefixes.get(path[:end + 1])
+            if route is not None:
+                return route
+            end = path.rfind('/', 0, end)
+        return None
+
+    def dispatch(self, handler, method: str) -> bool:
+        """handler.path에 맞는 라우트를 실행합니다. 등록된 경로가 없으면 False."""
+        req = Request(handler, method, self.deps)
+        route = self.resolve(method, req.path)
+        if route is None:
+            self.misses[method] += 1
+            return False
+        route.hits += 1   # GIL 하의 근사 카운터 — 통계용이므로 잠금 없이 갱신
+        route.fn(handler, req)
+        return True
+
+    def table(self) -> list[dict]:
+        """/api/debug/routes 응답 — 메서드/경로 순 정렬, 적중 횟수 포함."""
+        rows = []
+        for kind in (self._exact, self._prefix):
+            for method in METHODS:
+                for route in kind[method].values():
+                    rows.append({
+                        'method': route.method,
+                        'path': route.path + ('*' if route.prefix else ''),
+                        'source': route.source,
+                        'hits': route.hits,
+                    })
+        rows.sort(key=lambda r: (r['method'], r['path']))
+        return rows
+
+
+ROUTER = RouteRegistry()
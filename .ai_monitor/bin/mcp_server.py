@@ -6,6 +6,9 @@ This server exposes a few local helper tools to MCP-capable clients such as
 Codex CLI. Different MCP clients on Windows do not always agree on stdio
 framing, so this server mirrors the transport style used by the client:
 Content-Length framing or line-delimited JSON.
+
+vibe_hive_status reads only the tail of task_logs.jsonl (src.jsonl_tail), so
+its cost follows the requested line count rather than the log size.
 """
 
 import json
@@ -20,6 +23,11 @@ PROJECT_ROOT = AI_MONITOR_DIR.parent
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 PYTHON_BIN = AI_MONITOR_DIR / "venv" / "Scripts" / "python.exe"
 
+if str(AI_MONITOR_DIR) not in sys.path:
+    sys.path.insert(0, str(AI_MONITOR_DIR))
+
+from src.jsonl_tail import tail_lines
+
 
 TOOLS = [
     {
@@ -288,11 +296,10 @@ def handle_tool_call(name: str, args: dict) -> str:
     if name == "vibe_hive_status":
         lines = args.get("lines", 20)
         log_file = AI_MONITOR_DIR / "data" / "task_logs.jsonl"
-        if not log_file.exists():
-            return "(task_logs.jsonl missing)"
         try:
-            all_lines = log_file.read_text(encoding="utf-8").splitlines()
-            return "\n".join(all_lines[-lines:])
+            # 회전 직후 활성 파일이 없어도 세그먼트에서 읽음
+            recent = tail_lines(log_file, int(lines))
+            return "\n".join(reversed(recent)) if recent else "(no task logs)"
         except Exception as exc:
             return f"[error] {exc}"
 
@@ -5,6 +5,90 @@
 #          에이전트 간의 통신 중계, 상태 모니터링, 데이터 영속성을 관리합니다.
 #
 # 🕒 변경 이력 (History):
+# [2026-10-17] - (/stream 중복 제거)
+#   - _hive_log_publish: 마지막 id 이하를 모두 버리던 것 → src.pg_listener.RecentIds(최근 발행 id 집합)
+#     동시 트랜잭션이 id 순서와 다르게 커밋되어 NOTIFY가 역순으로 와도 발행, 재동기화와 겹친 행만 건너뜀
+# [2026-10-17] - (하이브 활동 기록 시점 분류)
+#   - HIVE_ACTIVITY(src.hive_activity): log_to_pg()가 키워드를 컴파일된 정규식 하나로 1회 분류해 링 + 타입별 인덱스에 보관
+#   - /api/hive/activity는 폴링마다 task_logs.jsonl을 재분류하지 않고 링을 잘라 반환 (?limit=, ?type=)
+# [2026-10-17] - (JSONL 로그 세그먼트)
+#   - LOG_SEGMENTS(src.log_segments): task_logs · agent_live · agent_runs · skill_results · orchestrator_log를
+#     크기/기간 기준으로 data/segments/<이름>/ 번호 세그먼트로 회전, 닫힌 세그먼트 gzip/zstd 압축, 보존 정책 적용
+#   - tail 리더와 agent_live 증분 인덱스는 세그먼트까지 이어 읽음
+#   - GET /api/logs/segments: 로그별 정책·크기·회전 통계, ?name= 지정 시 세그먼트별 시간 범위(manifest)
+# [2026-10-17] - (JSONL 역방향 tail)
+#   - /api/task-logs · ThoughtTrace 사전 로드: src.jsonl_tail로 파일 끝에서부터 최근 항목만 읽기
+#     (read_text().splitlines() 전체 읽기 제거 — 비용이 로그 크기가 아니라 요청 개수에 비례)
+# [2026-10-17] - (대시보드 상태 채널)
+#   - GET /api/events/state (SSE): src.state_channel.StateChannel — 구독 시 전체 스냅샷, 이후 변경분만
+#     JSON Patch로 푸시. 소스: agent/terminals · orchestrator/status · skill-chain · tasks/kanban · hive/activity
+#   - 구독자가 없으면 재계산 없음, 쓰기 라우트의 캐시 무효화 태그로 해당 소스 즉시 재계산
+#   - /api/events/stats에 'state' (버전 / patch 수·바이트 / 소스별 갱신·변경 횟수) 추가
+# [2026-10-17] - (폴링 라우트 응답 캐시)
+#   - /api/orchestrator/status · agent/terminals · hive/health · orchestrator/skill-chain · kanban/pg-activity:
+#     src.response_cache.ResponseCache로 (경로, 쿼리) 키 TTL 캐시 — 동시 동일 요청은 계산 1건에 합류
+#   - 태스크 저장/수정/삭제/claim, 메모리 set/delete/sync, 에이전트 stage 갱신 POST 후 태그 무효화
+#   - GET /api/cache/stats: 라우트별 hit / miss / coalesced / 적중률
+# [2026-10-17] - (/stream 공유 LISTEN 리스너)
+#   - HIVE_LOG_LISTENER(src.pg_listener.PgChannelListener): 프로세스 전체에 LISTEN 연결 1개,
+#     끊기면 지수 백오프 재연결 후 마지막 행 id 이후를 재조회해 발행 (끊긴 동안의 행 복구)
+#   - NOTIFY payload는 리스너에서 1회만 디코딩/직렬화 → 모든 구독자가 같은 프레임 공유
+#     (행 JSON / notify_hive_event()의 {table, action, data} 봉투 모두 지원)
+#   - /stream 초기 50행: 클라이언트마다 psql 서브프로세스 조회 → 리스너가 유지하는 메모리 링
+# [2026-10-17] - (SSE 재연결 복구 — Last-Event-ID)
+#   - SSE 4종 모든 프레임에 토픽별 단조 증가 'id:' (EVENT_BUS), 토픽별 replay 링 (VIBE_SSE_REPLAY, 기본 256)
+#   - Last-Event-ID 헤더(또는 ?last_event_id=)가 replay 범위 안이면 놓친 이벤트만 전송:
+#     /api/events/thoughts는 THOUGHT_LOGS 전체 재전송, /stream은 최근 50행 재조회를 생략
+#   - 스냅샷 뒤 data 없는 'id:' 프레임 전송 — 첫 실시간 이벤트 전에 끊겨도 재연결 위치 확보
+# [2026-10-17] - (SSE 이벤트 버스)
+#   - THOUGHT_CLIENTS / FS_CLIENTS / AGENT_CLIENTS 제거 → src.event_bus.EventBus (EVENT_BUS)
+#   - FSChangeHandler / /api/thoughts/add / 에이전트 브로드캐스트 워커: 구독자 소켓 직접 쓰기(1초 settimeout)
+#     → publish() 즉시 반환. 구독자별 고정 링(가장 오래된 프레임 폐기 + lagged 카운터)
+#   - SSE 4종(/api/events/thoughts·agent·fs, /stream): 각 핸들러 스레드(asyncio 모드는 스트림 코루틴)가
+#     자기 링만 비우는 전용 라이터 — 느린 탭이 생산자를 붙잡지 않음
+#   - /stream: 연결마다 LISTEN 하던 것을 공유 리스너 스레드 1개(_hive_log_listener)로
+#   - GET /api/events/stats: 토픽별 구독자 수 / 발행 수 / lagged / 최대 적체
+# [2026-10-17] - (HTTP/1.1 keep-alive)
+#   - SSEHandler: src.http_response.KeepAliveMixin — protocol_version HTTP/1.1, 유휴 연결 15초 유지
+#     (VIBE_KEEPALIVE_TIMEOUT), 길이 없는 응답(SSE 스트림 등)은 자동으로 Connection: close
+#   - OPTIONS / POST 404 / 정적 404·500 / image-file 404에 Content-Length 명시
+#   - do_GET/do_POST: 요청 본문 선버퍼링(buffered_body) — 라우트가 본문을 덜 읽어도 다음 요청 경계 유지
+# [2026-10-17] - (JSON 응답 압축)
+#   - 인라인 라우트의 send_response/send_header/wfile.write(json.dumps(...)) → src.http_response.send_json
+#     (Accept-Encoding 협상 gzip — 1KB 이상, 항상 Content-Length), /api/image-file·/api/heartbeat는 send_body
+#   - GET /api/debug/compression: 응답 수 / 압축 건수 / 원본 대비 전송 바이트 비율
+# [2026-10-17] - (정적 파일 캐시)
+#   - _serve_static: 요청마다 디스크 읽기 + no-store → src.static_assets.StaticAssetStore
+#     (메모리 캐시, gzip/brotli 사전 압축, ETag/If-None-Match 304, 변경 시 재적재)
+#   - Vite 해시 파일(assets/*-<hash>.js|css)은 immutable 1년, index.html은 no-cache 재검증
+#   - 기동 시 StaticPreload 스레드로 dist 전체 preload, GET /api/static/stats
+# [2026-10-17] - (asyncio HTTP 모드)
+#   - VIBE_HTTP_MODE=asyncio: src.async_http.AsyncHTTPServer — 단일 이벤트 루프, 일반 라우트는
+#     VIBE_HTTP_WORKERS(기본 32) 크기 executor에서 실행, SSE 4종은 async generator (연결당 스레드 없음)
+#   - /stream 행 변환/초기 조회 SQL을 _hive_log_frame / _HIVE_LOG_RECENT_SQL로 분리 (두 모드 공용)
+# [2026-10-17] - (라우팅 테이블)
+#   - do_GET/do_POST if/elif 체인 → api.router.ROUTER (exact dict + prefix 테이블, 메서드 분리)
+#   - 인라인 엔드포인트는 @ROUTER.route 메서드, api/* 모듈은 import 시 자체 등록
+#   - do_GET이 매 요청 본문을 읽어 mcp_api.handle_post에 넘기던 처리 제거 (본문은 POST에서만)
+#   - 앞선 분기에 가려 도달 불가했던 중복 인라인 분기 삭제, GET /api/debug/routes: 라우트별 적중 횟수
+# [2026-10-17] - (메모리 근사 최근접 검색)
+#   - 기동 시 DATA_DIR/ann/memory IVF-flat 인덱스를 memory_index에 연결 (mmap 로드, 증분 put/delete)
+#   - GET /api/embedding/stats 응답에 ann 항목 (단편화율 / 재구축 횟수)
+# [2026-10-17] - (write-behind 그룹 커밋)
+#   - log_to_pg / thought_to_pg: psql 직접 실행 → WriteBehindQueue 적재 (200행/50ms 배치 INSERT)
+#   - thought id는 시퀀스 블록 선점으로 즉시 응답, 큐 포화 시 503 (백프레셔)
+#   - GET /api/pg/writer-stats: 큐 깊이 / flush 지연 카운터, 종료 경로에서 잔여 레코드 flush
+# [2026-10-17] - (배치 임베딩 워커)
+#   - _get_embedder/_embed: 호출 스레드 단건 동기 변환 → src.embedder.EmbeddingService (32개 배치, SHA-256 캐시)
+#   - 기동 후 warm_up(), GET /api/embedding/stats: texts/sec, 캐시 적중률
+# [2026-10-17] - (parent_id 소급 연결 청크화)
+#   - _backfill_thought_parent_ids: 모듈 로드 시 전체 LAG UPDATE → HTTP 리스닝 후 청크 단위 실행
+#     hive_state 워터마크 이후 행만 처리 (pg_store.backfill_thought_parents)
+# [2026-10-17] - (thought 체인 헤드 캐시)
+#   - thought_to_pg: parent_id 미지정 시 에이전트별 인메모리 체인 헤드 사용 (기동 시 시드, 삽입마다 갱신)
+#   - GET /api/hive/thought/head?agent=: 체인 헤드 조회 (hive_bridge 훅 프로세스용)
+# [2026-10-17] - (ITCP 롱폴링)
+#   - GET /api/itcp/wait: itcp.wait_for_messages() 위임 — 단일 LISTEN 연결 공유, 도착 즉시 응답
 # [2026-03-12] - Claude (지식 그래프 연결선 자동 생성)
 #   - thought_to_pg(): parent_id 미지정 시 같은 에이전트 직전 thought를 자동 부모로 연결
 #     → hive_bridge.py 새 프로세스 호출마다 체인이 끊기던 근본 원인 수정
@@ -94,7 +178,6 @@
 import json
 import time
 import os
-import mimetypes
 import webbrowser
 import shutil
 import subprocess
@@ -102,37 +185,49 @@ import re
 import threading
 import sys
 import asyncio
-import api.mcp_api as mcp_api
-import api.hive_api as hive_api
-import api.git_api as git_api
-import api.memory_api as memory_api
+import api.mcp_api as mcp_api  # noqa: F401 — import 시 ROUTER에 경로 등록
+import api.hive_api as hive_api  # noqa: F401 — import 시 ROUTER에 경로 등록
+import api.git_api as git_api  # noqa: F401 — import 시 ROUTER에 경로 등록
+import api.memory_api as memory_api  # noqa: F401 — import 시 ROUTER에 경로 등록
 import api.agent_api as agent_api
 import api.pty_api as pty_api
-import api.config_api as config_api
+import api.config_api as config_api  # noqa: F401 — import 시 ROUTER에 경로 등록
+from api.router import ROUTER
 import string
 import socket
 from collections import deque
 from pathlib import Path
-from src.file_store import (
-    delete_memory_entry,
-    ensure_legacy_store,
-    get_agent_last_seen_from_sessions,
-    get_memory_entry,
-    merge_memory_files,
-    upsert_memory_entry,
-)
+from src.file_store import ensure_legacy_store
 from src.pg_store import (
     ensure_schema,
-    get_agent_last_seen,
     get_memory,
+    insert_pg_logs,
+    insert_pg_thoughts,
     list_memory,
+    load_thought_heads,
     list_tasks,
     query_rows,
+    reserve_thought_ids,
+    backfill_thought_parents,
     save_task,
     set_memory,
     update_task,
     delete_task,
 )
+from src.pg_writer import WriteBehindQueue
+from src.embedder import EmbeddingService, PgEmbeddingCache
+from src import memory_index
+from src.async_http import AsyncHTTPServer
+from src.event_bus import EventBus, parse_last_event_id, sse_frame
+from src.pg_listener import PgChannelListener, RecentIds
+from src.static_assets import StaticAssetStore
+from src.response_cache import ResponseCache
+from src.state_channel import StateChannel, route_source
+from src.jsonl_tail import iter_records, tail_records
+from src.log_segments import LogSegmentManager, SegmentPolicy
+from src.hive_activity import HiveActivityFeed
+from src import http_response
+from src.http_response import KeepAliveMixin, send_body, send_json
 
 # ── PostgreSQL 18 연동 헬퍼 (Postgres-First 고도화) ─────────────────────────
 # [수정] frozen(배포) 모드에서는 exe 옆의 pgsql\ 폴더를 사용하고,
@@ -291,62 +386,138 @@ def run_pg_sql(sql: str, db: str = "postgres"):
         print(f"[Postgres ERROR] {e}")
         return None
 
-def log_to_pg(agent: str, terminal_id: str, task: str, status: str = "success"):
-    """pg_logs 테이블에 로그 기록"""
-    # 따옴표 이스케이프 (단순 SQL 인젝션 방지)
-    safe_task = task.replace("'", "''")
-    sql = f"INSERT INTO pg_logs (agent, terminal_id, task, status) VALUES ('{agent}', '{terminal_id}', '{safe_task}', '{status}');"
-    run_pg_sql(sql)
-    # PGMQ에도 동시에 쌓기 (실시간 큐)
-    mq_msg = json.dumps({"agent": agent, "tid": terminal_id, "task": task, "status": status}, ensure_ascii=False).replace("'", "''")
-    run_pg_sql(f"SELECT pgmq.send('hive_queue', '{mq_msg}');")
+# ── write-behind 그룹 커밋 (log_to_pg / thought_to_pg) ──────────────────────
+# 핸들러는 레코드를 큐에 넣고 즉시 응답하며, 백그라운드 라이터가 200행/50ms 단위로
+# 다중 행 INSERT를 실행합니다. 8개 터미널 훅 폭주 시에도 psql 기동 비용에 직렬화되지 않음.
+def _flush_rows(insert_fn, batch: list, on_failed=None) -> bool:
+    """배치 INSERT 실패 시 행 단위로 재시도 — 잘못된 행 하나가 배치 전체를 버리지 않도록.
+
+    on_failed(row)는 끝내 기록하지 못한 행마다 나중 행부터 역순으로 호출됩니다.
+    """
+    if insert_fn(batch):
+        return True
+    failed = [row for row in batch if not insert_fn([row])] if len(batch) > 1 else list(batch)
+    if on_failed is not None:
+        for row in reversed(failed):
+            on_failed(row)
+    return not failed
+
+
+def _rollback_thought_head(row: dict) -> None:
+    """기록 실패한 thought가 아직 체인 헤드이면 그 부모로 되돌립니다 (다음 thought가 없는 행을 가리키지 않도록)."""
+    with _thought_heads_lock:
+        if _THOUGHT_HEADS.get(row['agent']) != row['id']:
+            return
+        if row.get('parent_id'):
+            _THOUGHT_HEADS[row['agent']] = row['parent_id']
+        else:
+            _THOUGHT_HEADS.pop(row['agent'], None)
+
+
+PG_LOG_WRITER = WriteBehindQueue('pg_logs', lambda batch: _flush_rows(insert_pg_logs, batch))
+PG_THOUGHT_WRITER = WriteBehindQueue(
+    'pg_thoughts', lambda batch: _flush_rows(insert_pg_thoughts, batch, _rollback_thought_head))
+
+# 선점된 pg_thoughts id 블록 — 기록 전에 새 id를 응답하기 위해 사용
+_THOUGHT_ID_BLOCK = 64
+_thought_ids: deque = deque()
+_thought_ids_lock = threading.Lock()
+
+
+def _next_thought_id() -> int:
+    with _thought_ids_lock:
+        if not _thought_ids:
+            _thought_ids.extend(reserve_thought_ids(_THOUGHT_ID_BLOCK))
+        return _thought_ids.popleft() if _thought_ids else 0
+
+
+def _flush_pg_writers(timeout: float = 5.0) -> None:
+    """종료 경로에서 호출: 큐에 남은 로그/사고 레코드를 모두 기록."""
+    for writer in (PG_LOG_WRITER, PG_THOUGHT_WRITER):
+        try:
+            writer.stop(timeout)
+        except Exception as e:
+            print(f"[WriteBehind] {writer.name} 종료 flush 실패: {e}")
+
+
+def log_to_pg(agent: str, terminal_id: str, task: str, status: str = "success") -> bool:
+    """pg_logs 테이블(+ PGMQ hive_queue)에 로그 기록을 예약합니다.
+
+    Returns:
+        bool: 큐 적재 성공 여부. 큐가 가득 차 1초 내 자리가 나지 않으면 False (백프레셔)
+    """
+    HIVE_ACTIVITY.add(agent, task)   # 하이브 활동 분류는 기록 시점에 1회 (/api/hive/activity는 링 슬라이스만)
+    return PG_LOG_WRITER.put({
+        'agent': agent, 'terminal_id': terminal_id, 'task': task, 'status': status,
+    })
+
+# ── 에이전트별 thought 체인 헤드 캐시 ────────────────────────────────────────
+# parent_id 미지정 시 DB 조회 없이 같은 에이전트의 직전 thought id를 부모로 사용.
+# 기동 시 load_thought_heads()로 시드하고 thought_to_pg()가 매 삽입마다 갱신합니다.
+# 시드 전(또는 처음 보는 에이전트)에는 parent_id=None으로 넘겨 insert_pg_thoughts의
+# (agent, id DESC) 인덱스 서브쿼리가 처리합니다.
+_THOUGHT_HEADS: dict[str, int] = {}
+_thought_heads_lock = threading.Lock()
+
+
+def _seed_thought_heads() -> None:
+    try:
+        heads = load_thought_heads()
+    except Exception as e:
+        print(f"[ThoughtHeads] 시드 실패: {e}")
+        return
+    with _thought_heads_lock:
+        for agent, head_id in heads.items():
+            # 시드 중 이미 삽입된 더 최신 id는 유지
+            if head_id > _THOUGHT_HEADS.get(agent, 0):
+                _THOUGHT_HEADS[agent] = head_id
+
+
+def get_thought_head(agent: str) -> int:
+    """agent의 마지막 thought id (없으면 0)."""
+    with _thought_heads_lock:
+        return _THOUGHT_HEADS.get(agent, 0)
+
 
 def thought_to_pg(agent: str, skill: str, thought: dict, parent_id: int = None) -> int:
-    """pg_thoughts 테이블에 사고 과정 기록 (JSONB).
+    """pg_thoughts 테이블에 사고 과정 기록을 예약합니다 (JSONB).
 
     parent_id를 지정하면 이전 thought와 연결선이 생성되어 지식 그래프에 계보 표시.
-    parent_id가 없으면 같은 에이전트의 마지막 thought를 자동으로 부모로 연결
+    parent_id가 없으면 같은 에이전트의 마지막 thought(체인 헤드 캐시)를 자동으로 부모로 연결
     → hive_bridge.py가 매 호출마다 새 프로세스로 실행되어 인메모리 체인이 깨지는 문제 해결.
-    ensure_ascii=True: 한글을 \\uXXXX 이스케이프로 변환하여 psql.exe -c 인수 인코딩 오류 방지.
-    JSONB는 유니코드 이스케이프를 정상 처리하므로 조회 시 한글이 정상 표시됩니다.
+    id는 시퀀스에서 미리 선점하므로 실제 INSERT(백그라운드 배치) 전에 반환됩니다.
+
+    헤드는 큐 적재 시점에 전진하고, 배경 기록이 실패하면 _rollback_thought_head가 되돌립니다.
+    단, 되돌리기 전에 이미 큐에 들어간 같은 에이전트의 다음 thought는 없는 행을 parent_id로 가질 수 있으며
+    (지식 그래프에서 연결선 하나가 빠질 뿐) 이는 허용합니다.
 
     Returns:
-        int: 삽입된 행의 id (RETURNING id), 실패 시 0
+        int: 새 행의 id, 실패(id 선점 불가 또는 큐 포화) 시 0
     """
-    safe_thought = json.dumps(thought, ensure_ascii=True).replace("'", "''")
-
-    # parent_id 미지정 시 같은 에이전트의 직전 thought를 자동으로 부모로 설정
-    # 이 덕분에 hive_bridge.py가 매번 새 프로세스로 호출되어도 연결선이 끊기지 않음
-    if not parent_id:
-        safe_agent = agent.replace("'", "''")
-        prev_result = run_pg_sql(
-            f"SELECT id FROM pg_thoughts WHERE agent='{safe_agent}' ORDER BY id DESC LIMIT 1;"
-        )
-        try:
-            for line in (prev_result or '').splitlines():
-                line = line.strip()
-                if line.isdigit():
-                    parent_id = int(line)
-                    break
-        except Exception:
-            pass
-
-    if parent_id:
-        sql = (f"INSERT INTO pg_thoughts (agent, skill, thought, parent_id) "
-               f"VALUES ('{agent}', '{skill}', '{safe_thought}'::jsonb, {int(parent_id)}) RETURNING id;")
-    else:
-        sql = (f"INSERT INTO pg_thoughts (agent, skill, thought) "
-               f"VALUES ('{agent}', '{skill}', '{safe_thought}'::jsonb) RETURNING id;")
-    result = run_pg_sql(sql)
-    # RETURNING id 출력 파싱: psql --csv가 아닌 기본 출력 형식 → " id\n----\n 42\n(1 row)" 형태
-    try:
-        for line in (result or '').splitlines():
-            line = line.strip()
-            if line.isdigit():
-                return int(line)
-    except Exception:
-        pass
-    return 0
+    # id 선점은 잠금 밖에서 — 블록 소진 시 reserve_thought_ids DB 왕복이 다른 thought 기록을 막지 않도록
+    new_id = _next_thought_id()
+    if not new_id:
+        return 0
+    with _thought_heads_lock:
+        previous_head = _THOUGHT_HEADS.get(agent)
+        if not parent_id:
+            parent_id = previous_head
+        # 동시 요청에서 더 큰 id가 먼저 헤드가 됐으면 헤드는 유지 (체인 헤드는 항상 가장 최근 id)
+        if new_id > (previous_head or 0):
+            _THOUGHT_HEADS[agent] = new_id
+    queued = PG_THOUGHT_WRITER.put({
+        'id': new_id, 'agent': agent, 'skill': skill, 'thought': thought,
+        'parent_id': int(parent_id) if parent_id else None,
+    })
+    if not queued:
+        with _thought_heads_lock:
+            if _THOUGHT_HEADS.get(agent) == new_id:
+                if previous_head:
+                    _THOUGHT_HEADS[agent] = previous_head
+                else:
+                    _THOUGHT_HEADS.pop(agent, None)
+        return 0
+    return new_id
 
 def run_pg_sql_csv(sql: str, db: str = "postgres") -> list:
     """CSV 형식으로 Postgres 쿼리 결과를 dict 리스트로 반환 (칸반/대시보드 조회용)"""
@@ -375,6 +546,10 @@ try:
     import skill_orchestrator
 except ImportError:
     skill_orchestrator = None
+try:
+    import itcp
+except ImportError:
+    itcp = None
 
 # Windows 터미널(CP949 등)에서 이모지/한글 출력 시 UnicodeEncodeError 방지
 if sys.stdout and sys.stdout.encoding and sys.stdout.encoding.lower() not in ("utf-8", "utf8"):
@@ -445,7 +620,12 @@ except ImportError:
 
 # 전역 상태 관리
 THOUGHT_LOGS = [] # AI 사고 과정 로그 (최근 50개 유지)
-THOUGHT_CLIENTS = set() # SSE 클라이언트 연결 리스트
+# SSE 이벤트 버스 — 토픽: thoughts / agent / fs / hive_logs
+# 에이전트 출력은 한 번에 수백 줄이 몰릴 수 있어 링을 넉넉히 (done 이벤트는 최신이라 폐기되지 않음)
+# replay 링: 재연결(Last-Event-ID) 시 놓친 프레임을 다시 보낼 수 있는 토픽별 최근 프레임 수
+SSE_REPLAY_SIZE = max(1, int(os.getenv('VIBE_SSE_REPLAY', '256')))
+EVENT_BUS = EventBus({'agent': 1024, 'hive_logs': 512},
+                     replay_sizes={'agent': max(SSE_REPLAY_SIZE, 1024)}, default_replay_size=SSE_REPLAY_SIZE)
 
 def _load_task_logs_into_thoughts():
     """서버 시작 시 task_logs.jsonl의 최근 20개 항목을 THOUGHT_LOGS에 미리 로드합니다.
@@ -466,14 +646,11 @@ def _load_task_logs_into_thoughts():
     else:
         _early_data_dir = _self.parent / 'data'
     log_path = _early_data_dir / 'task_logs.jsonl'
-    if not log_path.exists():
-        return
     try:
-        lines = [l.strip() for l in log_path.read_text(encoding='utf-8').splitlines() if l.strip()]
-        recent = lines[-20:] # 최근 20개만 로드
-        for line in recent:
+        # 회전 직후 활성 파일이 없어도 세그먼트에서 읽음
+        recent = tail_records(log_path, 20)[::-1]  # 최근 20개만 로드 (시간순)
+        for obj in recent:
             try:
-                obj = json.loads(line)
                 THOUGHT_LOGS.append({
                     'agent':     obj.get('agent', 'System'),
                     'thought':   obj.get('task', ''),
@@ -499,18 +676,12 @@ except ImportError:
     Observer = None
     FileSystemEventHandler = object
 
-FS_CLIENTS = set() # SSE 클라이언트 연결 세트
-THOUGHT_CLIENTS = set() # 사고 과정 SSE 클라이언트 연결 세트
-# 자율 에이전트 SSE: 클라이언트별 개별 Queue 세트 (브로드캐스트 방식)
-# 단일 Queue 방식은 다중 연결 시 이벤트를 한 클라이언트만 소비하는 버그가 있어 교체
-AGENT_CLIENTS: set = set()
-
 
 def _agent_broadcast_worker():
-    """cli_agent._output_queue를 읽어 모든 연결된 SSE 클라이언트에게 팬아웃합니다.
+    """cli_agent._output_queue를 읽어 EVENT_BUS 'agent' 토픽으로 발행합니다.
 
     단일 생산자(cli_agent) → 다중 소비자(SSE 클라이언트) 패턴 구현.
-    cli_agent가 Queue에 이벤트를 넣으면 이 워커가 즉시 모든 클라이언트 큐에 복사합니다.
+    cli_agent가 Queue에 이벤트를 넣으면 이 워커가 즉시 모든 구독자 링에 복사합니다.
     """
     from queue import Empty as _Empty
     _scripts = str(Path(__file__).resolve().parent.parent / 'scripts')
@@ -524,12 +695,7 @@ def _agent_broadcast_worker():
     while True:
         try:
             msg = _ca._output_queue.get(timeout=1.0)
-            # 연결된 모든 클라이언트 큐에 동일 메시지 복사 전송
-            for cq in list(AGENT_CLIENTS):
-                try:
-                    cq.put_nowait(msg)
-                except Exception:
-                    pass  # 클라이언트 큐 가득 참 등 무시
+            EVENT_BUS.publish('agent', sse_frame(msg))
         except _Empty:
             pass  # 1초 타임아웃 — 정상, 계속 대기
         except Exception:
@@ -550,23 +716,8 @@ class FSChangeHandler(FileSystemEventHandler):
         if data_dir_str and path.startswith(data_dir_str):
             return  # DATA_DIR 하위 파일 전체 제외 (DB, 로그 등 런타임 데이터)
         
-        # 브로드캐스트 메시지 생성
-        msg_obj = {'type': 'fs_change', 'path': path, 'event': event.event_type}
-        msg = f"data: {json.dumps(msg_obj, ensure_ascii=False)}\n\n"
-        
-        # 연결된 모든 클라이언트에게 전송 (비정상 연결 조기 제거)
-        disconnected = []
-        for client in list(FS_CLIENTS):
-            try:
-                # 소켓 타임아웃 설정 (1초 내에 전송 못하면 실패 처리)
-                client.connection.settimeout(1.0)
-                client.wfile.write(msg.encode('utf-8'))
-                client.wfile.flush()
-            except Exception:
-                disconnected.append(client)
-        
-        for d in disconnected:
-            FS_CLIENTS.discard(d)
+        # 구독자 링에 넣기만 함 — 소켓 쓰기는 각 SSE 라이터가 (옵저버 스레드 블로킹 없음)
+        EVENT_BUS.publish_json('fs', {'type': 'fs_change', 'path': path, 'event': event.event_type})
 
 def start_fs_watcher(root_path):
     if Observer is None:
@@ -605,7 +756,6 @@ from pathlib import Path
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from socketserver import ThreadingMixIn
 from urllib.parse import urlparse, parse_qs, urlencode
-import urllib.request
 from _version import __version__
 
 # 데이터 디렉토리 설정 (BASE_DIR 설정 이후로 이동)
@@ -630,6 +780,9 @@ if not DATA_DIR.exists():
         DATA_DIR = Path(sys.executable).resolve().parent / "data"
         os.makedirs(DATA_DIR, exist_ok=True)
 
+# 하이브 활동 피드 — log_to_pg()가 기록 시점에 분류해 넣고, 첫 조회 때 기존 task_logs.jsonl로 1회 시드
+HIVE_ACTIVITY = HiveActivityFeed(seed_path=DATA_DIR / 'task_logs.jsonl')
+
 # 현재 서버가 서비스하는 프로젝트 루트 + 식별자
 def _find_project_root(start: Path) -> Path:
     """배포 모드에서 실제 프로젝트 루트를 탐색합니다.
@@ -731,31 +884,21 @@ ensure_legacy_store(DATA_DIR)
 # Postgres-backed state schema 초기화
 ensure_schema(DATA_DIR)
 
-# ── 지식 그래프: 기존 고아 노드 parent_id 소급 연결 (서버 기동 시 1회) ────────
+# ── 지식 그래프: 기존 고아 노드 parent_id 소급 연결 (서버 기동 후 백그라운드) ──
 # hive_bridge.py가 새 프로세스로 호출될 때마다 인메모리 체인이 끊겨
 # parent_id 없이 삽입된 고아 노드들을 동일 에이전트의 이전 thought와 연결.
+# 전체 테이블 LAG 한 번 대신 id 구간 청크로 나눠 실행하고 워터마크 이후 행만 처리합니다.
 def _backfill_thought_parent_ids():
     """pg_thoughts에서 parent_id가 NULL인 노드를 같은 에이전트의 직전 id로 소급 연결."""
     try:
-        backfill_sql = (
-            "UPDATE pg_thoughts t "
-            "SET parent_id = prev.id "
-            "FROM ("
-            "  SELECT id, agent, "
-            "         LAG(id) OVER (PARTITION BY agent ORDER BY id) AS prev_id "
-            "  FROM pg_thoughts"
-            ") prev "
-            "WHERE t.id = prev.id "
-            "  AND prev.prev_id IS NOT NULL "
-            "  AND t.parent_id IS NULL;"
-        )
-        run_pg_sql(backfill_sql)
-    except Exception:
-        pass
+        linked = backfill_thought_parents()
+        if linked:
+            print(f"[Backfill] 고아 thought {linked}건 parent_id 연결")
+    except Exception as e:
+        print(f"[Backfill] parent_id 소급 연결 실패: {e}")
 
-# [성능] 모듈 로드 시 동기 실행 시 psql.exe subprocess 생성 ~400ms 소요
-# → 백그라운드 스레드로 지연 실행하여 서버 기동 시간 단축
-threading.Thread(target=_backfill_thought_parent_ids, daemon=True, name='BackfillParentIds').start()
+# 체인 헤드 캐시 시드 — 백그라운드 (시드 전 삽입은 insert_pg_thoughts 서브쿼리로 처리)
+threading.Thread(target=_seed_thought_heads, daemon=True, name='SeedThoughtHeads').start()
 
 # ── 파일 기반 레거시 메모리 저장소 초기화 ─────────────────────────────────────
 def _legacy_memory_data_dir() -> Path:
@@ -785,37 +928,25 @@ _init_memory_db()
 # ─────────────────────────────────────────────────────────────────────────────
 
 # ── 임베딩 헬퍼 (fastembed 기반, 한국어 포함 다국어 지원) ────────────────────
-_embedder = None
-_embedder_lock = threading.Lock()
+# 모든 모델 호출은 EmbeddingService 워커 스레드에서 32개 단위 배치로 실행되며,
+# 정규화 텍스트 SHA-256 캐시(hive_embedding_cache)에 있으면 모델을 호출하지 않습니다.
+# 모델 로드는 HTTP 리스닝 이후 EMBEDDER.warm_up()으로 백그라운드에서 수행.
 _EMBED_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+EMBEDDER = EmbeddingService(_EMBED_MODEL, batch_size=32, store=PgEmbeddingCache())
 
-def _get_embedder():
-    """fastembed 모델 lazy 초기화 — 첫 호출 시 한 번만 로드"""
-    global _embedder
-    if _embedder is None:
-        with _embedder_lock:
-            if _embedder is None:
-                try:
-                    from fastembed import TextEmbedding
-                    _embedder = TextEmbedding(model_name=_EMBED_MODEL)
-                    print(f"[Embedding] 모델 로드 완료: {_EMBED_MODEL}")
-                except Exception as e:
-                    print(f"[Embedding] 모델 로드 실패: {e}")
-                    _embedder = False  # 실패 표시 (재시도 방지)
-    return _embedder if _embedder else None
+# 메모리 2만 건 이상이면 디스크 IVF 인덱스로 근사 검색 (그 아래는 전수 비교)
+try:
+    memory_index.attach_ann(DATA_DIR / "ann" / "memory")
+except Exception as _e:
+    print(f"[ANN] 메모리 인덱스 열기 실패: {_e}")
 
 def _embed(text: str) -> bytes | None:
     """텍스트 → float32 벡터 bytes 변환. 실패 시 None 반환."""
-    try:
-        import numpy as np
-        embedder = _get_embedder()
-        if embedder is None:
-            return None
-        vec = list(embedder.embed([text[:512]]))[0]  # 512자 제한
-        return np.array(vec, dtype=np.float32).tobytes()
-    except Exception as e:
-        print(f"[Embedding] 변환 실패: {e}")
-        return None
+    return EMBEDDER.embed(text)
+
+def _embed_batch(texts: list) -> list:
+    """여러 텍스트를 한 번에 제출 → 워커가 배치로 묶어 처리."""
+    return EMBEDDER.embed_many(texts)
 
 def _cosine_sim(a_bytes: bytes, b_bytes: bytes) -> float:
     """두 float32 벡터 bytes 간 코사인 유사도 (0~1)"""
@@ -1355,6 +1486,99 @@ if not STATIC_DIR.exists():
         STATIC_DIR = alt_dist
         print(f"[*] Found alternative static directory at {alt_dist}")
 
+# 정적 파일 캐시 — 첫 요청/변경 시 한 번 읽고 gzip(+brotli) 변형을 만들어 둠 (기동 시 preload)
+STATIC_ASSETS = StaticAssetStore(STATIC_DIR)
+
+
+# ── /stream (hive_log_channel) 공유 리스너 — 스레드/asyncio 모드 공통 ─────────
+# LISTEN 연결 1개가 NOTIFY를 한 번 디코딩해 EVENT_BUS 'hive_logs'로 발행하고,
+# 새 클라이언트용 최근 50행 프레임을 메모리에 유지합니다 (클라이언트마다 LISTEN/psql 조회 없음).
+_HIVE_LOG_COLUMNS = (
+    "id, agent, level, message as trigger, task_id as session_id, "
+    "metadata->>'terminal_id' as terminal_id, metadata->>'project' as project, "
+    "metadata->>'raw_status' as status, to_char(timestamp, 'YYYY-MM-DD HH24:MI:SS') as timestamp"
+)
+_HIVE_LOG_RECENT_SQL = f"SELECT {_HIVE_LOG_COLUMNS} FROM hive_logs ORDER BY id DESC LIMIT 50"
+_HIVE_LOG_SINCE_SQL = f"SELECT {_HIVE_LOG_COLUMNS} FROM hive_logs WHERE id > %s ORDER BY id LIMIT 1000"
+
+_HIVE_LOG_LOCK = threading.Lock()        # 최근 링 갱신+발행 ↔ 구독+스냅샷을 원자적으로 (중복/누락 없음)
+_HIVE_LOG_RECENT: deque = deque(maxlen=50)
+_HIVE_LOG_SEEN = RecentIds()             # 최근 발행한 hive_logs.id (+ 최대 id — 재연결 시 재동기화 기준)
+
+
+def _hive_log_row(raw_payload: str) -> dict | None:
+    """NOTIFY payload → 프론트엔드 호환 행 (id 포함). hive_logs 외 테이블 이벤트는 None."""
+    payload = json.loads(raw_payload)
+    if 'table' in payload and 'data' in payload:
+        # notify_hive_event() 봉투: {"table", "action", "data": row}
+        if payload['table'] != 'hive_logs':
+            return None
+        payload = payload['data'] or {}
+    meta = payload.get('metadata') or {}
+    if isinstance(meta, str): meta = json.loads(meta)
+    return {
+        "id": payload.get('id'),
+        "agent": payload.get('agent'),
+        "level": payload.get('level'),
+        "trigger": payload.get('message'),
+        "session_id": payload.get('task_id'),
+        "terminal_id": meta.get('terminal_id'),
+        "project": meta.get('project'),
+        "status": meta.get('raw_status'),
+        "timestamp": payload.get('timestamp')
+    }
+
+
+def _hive_log_publish(rows, publish: bool = True) -> None:
+    """행을 프레임으로 1회 직렬화해 최근 링에 넣고 발행. 이미 발행한 id는 건너뜀 (도착 순서는 무관)."""
+    with _HIVE_LOG_LOCK:
+        for row in rows:
+            row_id = row.pop('id', None)
+            if row_id is not None and not _HIVE_LOG_SEEN.add(int(row_id)):
+                continue   # 재동기화 조회와 NOTIFY가 겹친 행
+            frame = sse_frame(row)
+            _HIVE_LOG_RECENT.append(frame)
+            if publish:
+                EVENT_BUS.publish('hive_logs', frame)
+
+
+def _hive_log_on_notify(raw_payload: str) -> None:
+    row = _hive_log_row(raw_payload)
+    if row is not None:
+        _hive_log_publish([row])
+
+
+def _hive_log_resync(pg_conn) -> None:
+    """(재)연결 직후 LISTEN 다음에 호출 — 첫 연결은 최근 50행으로 링을 채우고,
+    재연결은 마지막으로 본 id 이후 행(끊긴 동안 놓친 행)을 발행합니다."""
+    import psycopg2.extras
+    with pg_conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        if _HIVE_LOG_SEEN.high:
+            cur.execute(_HIVE_LOG_SINCE_SQL, (_HIVE_LOG_SEEN.high,))
+            _hive_log_publish([dict(r) for r in cur.fetchall()])
+        else:
+            cur.execute(_HIVE_LOG_RECENT_SQL)
+            _hive_log_publish([dict(r) for r in reversed(cur.fetchall())], publish=False)
+
+
+def _connect_hive_log_listener():
+    import psycopg2
+    pg_conn = psycopg2.connect(host="localhost", port=5433, user="postgres", database="postgres")
+    pg_conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+    return pg_conn
+
+
+HIVE_LOG_LISTENER = PgChannelListener('hive_log_channel', _connect_hive_log_listener,
+                                      _hive_log_on_notify, on_connect=_hive_log_resync)
+
+
+def _hive_log_subscribe(last_event_id: int | None):
+    """/stream 구독 + 스냅샷 프레임 (재연결 복구 시 빈 목록). 리스너 첫 연결 후 호출."""
+    with _HIVE_LOG_LOCK:
+        sub = EVENT_BUS.subscribe('hive_logs', last_event_id=last_event_id)
+        snapshot = [] if sub.resumed else list(_HIVE_LOG_RECENT) + [sub.cursor_frame()]
+    return sub, snapshot
+
 
 class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
     """멀티 스레드 지원 HTTP 서버 (SSE 등 지속적 연결 동시 처리용)"""
@@ -1368,2417 +1592,1668 @@ AGENT_STATUS = {}
 AGENT_STATUS_LOCK = threading.Lock()
 # ─────────────────────────────────────────────────────────────────────────────
 
-class SSEHandler(BaseHTTPRequestHandler):
+class SSEHandler(KeepAliveMixin, BaseHTTPRequestHandler):
+    # HTTP/1.1 keep-alive — 대시보드/브리지 폴링이 요청마다 TCP 연결을 새로 맺지 않도록
     def do_GET(self):
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
+        # 라우팅 테이블 조회 (exact dict → prefix) — 본문은 읽지 않음, 미등록 경로는 정적 파일
+        with self.buffered_body():
+            if not ROUTER.dispatch(self, 'GET'):
+                self._serve_static()
 
-        # MCP API 연동 (POST)
-        try:
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else '{}'
-            data = json.loads(post_data)
-            if mcp_api.handle_post(self, path, data, _smithery_api_key_setter=_SMITHERY_CFG, _mcp_config_path=_mcp_config_path):
-                return
-        except Exception as e: print(f'[MCP Router Error] {e}')
+    def do_OPTIONS(self):
+        self.send_response(200)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
 
-        # MCP API 연동 (GET)
-        if mcp_api.handle_get(self, path, urllib.parse.parse_qs(parsed_path.query), _smithery_api_key=_smithery_api_key, _mcp_config_path=_mcp_config_path):
-            return
+    def do_POST(self):
+        # 라우팅 테이블 조회 — 본문은 각 라우트가 필요할 때 읽음 (req.body / rfile)
+        # keep-alive: 본문을 미리 버퍼링해 라우트가 읽지 않은 바이트가 다음 요청으로 새지 않게 함
+        with self.buffered_body():
+            if not ROUTER.dispatch(self, 'POST'):
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+    def _serve_static(self):
+        # 정적 파일 서비스 로직 (Vite 빌드 결과물) — src.static_assets 캐시/사전 압축/ETag
+        # 요청 경로를 정리
+        path = self.path
+        if path == '/':
+            path = '/index.html'
+
+        # /monitor → 에이전트 상황판 독립 페이지
+        if path.rstrip('/') == '/monitor':
+            path = '/monitor.html'
         
-        # ─── 신규: 사고 과정 실시간 스트리밍 ───
-        if path == '/api/events/thoughts':
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/event-stream')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Cache-Control', 'no-cache')
-            self.send_header('Connection', 'keep-alive')
-            self.end_headers()
-            
-            # 초기 데이터 전송 (메모리에 쌓인 로그)
-            for log in THOUGHT_LOGS:
-                self.wfile.write(f"data: {json.dumps(log, ensure_ascii=False)}\n\n".encode('utf-8'))
+        # 쿼리스트링 제거
+        path = path.split('?')[0]
+        
+        # 없는 파일은 lookup()이 index.html로 대체 (SPA 특성) — None은 index.html조차 없을 때만
+        asset = STATIC_ASSETS.lookup(path)
+        if asset is None:
+            send_body(self, b"Not Found", 'text/plain;charset=utf-8', 404, cors=False)
+            return
+        try:
+            status, headers, body = STATIC_ASSETS.respond(
+                asset, self.headers.get('Accept-Encoding'), self.headers.get('If-None-Match'))
+        except Exception as e:
+            send_body(self, str(e).encode('utf-8'), 'text/plain;charset=utf-8', 500, cors=False)
+            return
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    # ── GET 라우트 ──────────────────────────────────────────────────────────
+
+    # ─── 신규: 사고 과정 실시간 스트리밍 ───
+    @ROUTER.route('GET', '/api/events/thoughts')
+    def _get_events_thoughts(self, req):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+
+        # 구독 먼저 — 초기 데이터 전송 중 발행된 사고도 링에 쌓임
+        # Last-Event-ID가 replay 범위 안이면 놓친 사고만 링에 채워짐 (THOUGHT_LOGS 재전송 생략)
+        sub = EVENT_BUS.subscribe('thoughts', last_event_id=parse_last_event_id(self.headers, req.params))
+        try:
+            if not sub.resumed:
+                # 초기 데이터 전송 (메모리에 쌓인 로그) + 재연결 위치
+                for log in list(THOUGHT_LOGS):
+                    self.wfile.write(sse_frame(log))
+                self.wfile.write(sub.cursor_frame())
+            self.wfile.flush()
+            # SSE 연결 타임아웃 완화 (60초) — 이 스레드가 구독자 전용 라이터, 하트비트 30초
+            self.connection.settimeout(60.0)
+            sub.write_to(self.wfile, heartbeat=30.0)
+        except Exception:
+            pass
+        finally:
+            sub.close()
+
+    # ─── 자율 에이전트 출력 실시간 스트리밍 ───
+    # _agent_broadcast_worker가 cli_agent 큐를 읽어 EVENT_BUS 'agent' 토픽으로 발행
+    # → 연결마다 고정 크기 링 (무제한 큐 대신, 넘치면 가장 오래된 줄부터 폐기)
+    @ROUTER.route('GET', '/api/events/agent')
+    def _get_events_agent(self, req):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+        sub = EVENT_BUS.subscribe('agent', last_event_id=parse_last_event_id(self.headers, req.params))
+        try:
+            self.connection.settimeout(None)
+            if not sub.resumed:
+                self.wfile.write(sub.cursor_frame())
                 self.wfile.flush()
-            
-            # 실시간 업데이트를 위해 클라이언트 등록
-            THOUGHT_CLIENTS.add(self)
+            # 링이 비어있으면 1초마다 하트비트 (연결 유지), 쓰기 실패 = 클라이언트 연결 끊김
+            sub.write_to(self.wfile, heartbeat=1.0)
+        except Exception:
+            pass
+        finally:
+            sub.close()  # 연결 종료 시 구독 해제
+
+    # ─── 신규: 파일 시스템 변경 이벤트 스트리밍 ───
+    @ROUTER.route('GET', '/api/events/fs')
+    def _get_events_fs(self, req):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+
+        sub = EVENT_BUS.subscribe('fs', last_event_id=parse_last_event_id(self.headers, req.params))
+        try:
+            # SSE 연결 타임아웃 완화 (60초) — 하트비트 30초
+            self.connection.settimeout(60.0)
+            if not sub.resumed:
+                self.wfile.write(sub.cursor_frame())
+                self.wfile.flush()
+            sub.write_to(self.wfile, heartbeat=30.0)
+        except Exception:
+            pass
+        finally:
+            sub.close()
+
+    # ─── 대시보드 상태 채널 — 스냅샷 1회 + 변경분(JSON Patch)만 푸시 ───
+    # 패널별 3~5초 폴링(/api/agent/terminals, /api/orchestrator/status 등)을 대체
+    @ROUTER.route('GET', '/api/events/state')
+    def _get_events_state(self, req):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+        sub, initial = STATE_CHANNEL.subscribe(parse_last_event_id(self.headers, req.params))
+        try:
+            for frame in initial:
+                self.wfile.write(frame)
+            self.wfile.flush()
+            # 상태가 안 바뀌면 하트비트만 (30초)
+            self.connection.settimeout(60.0)
+            sub.write_to(self.wfile, heartbeat=30.0)
+        except Exception:
+            pass
+        finally:
+            sub.close()
+
+    @ROUTER.route('GET', '/stream')
+    def _get_stream(self, req):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+
+        # 실시간 행과 최근 50행은 공유 LISTEN 리스너가 관리 (연결마다 LISTEN/psql 조회 없음)
+        HIVE_LOG_LISTENER.start()
+        HIVE_LOG_LISTENER.ready.wait(3.0)   # 첫 연결 직후엔 최근 행 적재까지 대기
+        sub, snapshot = _hive_log_subscribe(parse_last_event_id(self.headers, req.params))
+        try:
+            # 1. 초기 데이터 전송 (메모리 링) — 재연결 복구 시 생략
+            for frame in snapshot:
+                self.wfile.write(frame)
+            self.wfile.flush()
+
+            # 2. 실시간 전송 — 이 스레드는 자기 링만 비움, 하트비트 5초
+            self.connection.settimeout(60.0) # SSE 연결 타임아웃
+            sub.write_to(self.wfile, heartbeat=5.0)
+        except (BrokenPipeError, ConnectionResetError, socket.timeout):
+            pass
+        except Exception as e:
+            print(f"[SSE-PG] Stream Error: {e}")
+        finally:
+            sub.close()
+
+    @ROUTER.route('GET', '/api/heartbeat')
+    def _get_heartbeat(self, req):
+        # 하트비트 수신 — 자동 종료 로직 제거됨 (밤새 실행 지원)
+        send_body(self, b"OK", 'text/plain;charset=utf-8')
+
+    @ROUTER.route('GET', '/api/projects')
+    def _get_projects(self, req):
+        projects = []
+        if PROJECTS_FILE.exists():
             try:
-                # SSE 연결 타임아웃 완화 (60초)
-                self.connection.settimeout(60.0)
-                while True:
-                    time.sleep(30) # 하트비트 주기를 30초로 완화
-                    self.wfile.write(b": heartbeat\n\n")
-                    self.wfile.flush()
-            except Exception:
-                pass
-            finally:
-                THOUGHT_CLIENTS.discard(self)
-            return
+                with open(PROJECTS_FILE, 'r', encoding='utf-8') as f:
+                    projects = json.load(f)
+            except: pass
+        
+        # GET 요청이면 목록 반환, POST 처리는 아래 do_POST에서 함
+        send_json(self, projects)
+
+    @ROUTER.route('GET', '/api/agents')
+    def _get_agents(self, req):
+        # 실시간 에이전트 상태 목록 반환 (오케스트레이터용)
+        with AGENT_STATUS_LOCK:
+            send_json(self, AGENT_STATUS)
+
+    @ROUTER.route('GET', '/api/pg/writer-stats')
+    def _get_pg_writer_stats(self, req):
+        # write-behind 큐 깊이 / flush 지연 카운터
+        send_json(self, {
+            'pg_logs': PG_LOG_WRITER.stats(),
+            'pg_thoughts': PG_THOUGHT_WRITER.stats(),
+        })
+
+    @ROUTER.route('GET', '/api/debug/routes')
+    def _get_debug_routes(self, req):
+        # 등록된 라우트 목록과 적중 횟수 — 미등록(정적 파일/404) 요청 수 포함
+        send_json(self, {'routes': ROUTER.table(), 'misses': ROUTER.misses})
+
+    @ROUTER.route('GET', '/api/debug/compression')
+    def _get_debug_compression(self, req):
+        # 공용 응답 작성기 집계 — 압축 건수 / 원본 대비 전송 바이트 비율
+        send_json(self, http_response.stats())
+
+    @ROUTER.route('GET', '/api/events/stats')
+    def _get_events_stats(self, req):
+        # SSE 이벤트 버스 — 토픽별 구독자 수 / 발행 수 / lagged(링 초과 폐기) / 최대 적체
+        # + hive_log_channel 공유 리스너 연결 상태 / 재연결 횟수
+        # + 대시보드 상태 채널 버전 / patch 수·바이트 / 소스별 갱신·변경 횟수
+        send_json(self, {'topics': EVENT_BUS.stats(), 'hive_log_listener': HIVE_LOG_LISTENER.stats(),
+                         'state': STATE_CHANNEL.stats()})
+
+    @ROUTER.route('GET', '/api/cache/stats')
+    def _get_cache_stats(self, req):
+        # 폴링 라우트 응답 캐시 — 라우트별 TTL / hit / miss / coalesced(동시 요청 합류) / 적중률
+        send_json(self, RESPONSE_CACHE.stats())
+
+    @ROUTER.route('GET', '/api/logs/segments')
+    def _get_log_segments(self, req):
+        # JSONL 로그 세그먼트 — 로그별 정책 / 활성 파일 크기 / 세그먼트 수·원본·저장 바이트 / 회전·압축·삭제 횟수
+        # ?name=task_logs 지정 시 해당 로그의 manifest 항목(세그먼트별 시간 범위)까지 반환
+        name = req.params.get('name', [''])[0]
+        if not name:
+            send_json(self, LOG_SEGMENTS.stats())
+        elif name in LOG_SEGMENTS.logs:
+            log = LOG_SEGMENTS.logs[name]
+            send_json(self, {**log.stats(), 'manifest': log.segments()})
+        else:
+            send_json(self, {'error': f'unknown log: {name}'}, status=404)
+
+    @ROUTER.route('GET', '/api/static/stats')
+    def _get_static_stats(self, req):
+        # 정적 파일 캐시 — 파일 수 / 원본·압축 바이트 / immutable 파일 수 / 재적재 횟수
+        send_json(self, STATIC_ASSETS.stats())
+
+    @ROUTER.route('GET', '/api/embedding/stats')
+    def _get_embedding_stats(self, req):
+        # 임베딩 워커 처리량(texts/sec) / 캐시 적중률
+        stats = EMBEDDER.stats()
+        stats['ann'] = memory_index.MEMORY_INDEX.ann_stats()
+        send_json(self, stats)
+
+    @ROUTER.route('GET', '/api/hive/thought/head')
+    def _get_hive_thought_head(self, req):
+        parsed_path = req.parsed
+        # 에이전트별 마지막 thought id — 단명 훅 프로세스가 parent_id 체인을 이어가는 데 사용
+        agent = parse_qs(parsed_path.query).get('agent', [''])[0].strip()
+        if agent:
+            code, result = 200, {'agent': agent, 'id': get_thought_head(agent)}
+        else:
+            code, result = 400, {'error': 'agent parameter required'}
+        send_json(self, result, code)
+
+    @ROUTER.route('GET', '/api/itcp/wait')
+    def _get_itcp_wait(self, req):
+        parsed_path = req.parsed
+        # ITCP 롱폴링 — 공유 LISTEN 연결(hive_messages)로 새 메시지 도착 즉시 반환
+        # ?terminal=claude&timeout=25  (timeout 최대 60초, 메시지 없으면 빈 배열)
+        params = parse_qs(parsed_path.query)
+        terminal = params.get('terminal', [''])[0].strip()
+        try:
+            wait_sec = min(60.0, max(0.0, float(params.get('timeout', ['25'])[0])))
+        except ValueError:
+            wait_sec = 25.0
+        mark_read = params.get('mark_read', ['true'])[0].lower() != 'false'
+        if not terminal or itcp is None:
+            code, result = 400, {'error': 'terminal parameter required' if terminal else 'itcp unavailable'}
+        else:
+            try:
+                code, result = 200, {'messages': itcp.wait_for_messages(terminal, wait_sec, mark_read)}
+            except Exception as e:
+                code, result = 500, {'error': str(e)}
+        send_json(self, result, code)
 
-        # ─── 자율 에이전트 출력 실시간 스트리밍 ───
-        # _agent_broadcast_worker가 cli_agent 큐를 읽어 AGENT_CLIENTS 세트의
-        # 각 클라이언트 전용 큐로 팬아웃 — 다중 연결/재연결 시 이벤트 손실 없음
-        if path == '/api/events/agent':
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/event-stream')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Cache-Control', 'no-cache')
-            self.send_header('Connection', 'keep-alive')
-            self.end_headers()
-            from queue import Queue as _ClientQueue, Empty as _QEmpty
-            client_q = _ClientQueue(maxsize=0)  # 클라이언트별 전용 큐 (무제한 — done 이벤트 드롭 방지)
-            AGENT_CLIENTS.add(client_q)
+    @ROUTER.route('GET', '/api/browse-folder')
+    def _get_browse_folder(self, req):
+        try:
+            # PowerShell을 사용하여 폴더 선택창 띄우기
+            ps_cmd = (
+                "$app = New-Object -ComObject Shell.Application; "
+                "$folder = $app.BrowseForFolder(0, '프로젝트 폴더를 선택하세요', 0, 0); "
+                "if ($folder) { $folder.Self.Path } else { '' }"
+            )
+            # CREATE_NO_WINDOW: PowerShell 콘솔 창이 화면에 잠깐 뜨는 문제 방지
+            _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
+            res = subprocess.run(
+                ['powershell', '-WindowStyle', 'Hidden', '-Command', ps_cmd],
+                capture_output=True, text=True, encoding='utf-8',
+                creationflags=_no_window
+            )
+            selected_path = res.stdout.strip().replace('\\', '/')
+            send_json(self, {"path": selected_path})
+        except Exception as e:
+            send_json(self, {"error": str(e)})
+
+    @ROUTER.route('GET', '/api/config')
+    def _get_config(self, req):
+        config = {}
+        if CONFIG_FILE.exists():
             try:
-                self.connection.settimeout(None)
-                while True:
-                    try:
-                        msg = client_q.get(timeout=1.0)
+                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+            except: pass
+        send_json(self, config)
+
+    @ROUTER.route('GET', '/api/drives')
+    def _get_drives(self, req):
+        drives = []
+        if os.name == 'nt':
+            for letter in string.ascii_uppercase:
+                drive = f"{letter}:/"  # 경로 일관성: 항상 포워드 슬래시 사용 (2026-02-27)
+                if os.path.exists(drive):
+                    drives.append(drive)
+        else:
+            drives = ['/']
+        send_json(self, drives)
+
+    @ROUTER.route('GET', '/api/install-gemini-cli')
+    def _get_install_gemini_cli(self, req):
+        try:
+            # Gemini CLI 설치 (전역)
+            subprocess.Popen('cmd.exe /k "echo Installing Gemini CLI... && npm install -g @google/gemini-cli"', shell=True)
+            result = {"status": "success", "message": "Gemini CLI installation started in a new window."}
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        send_json(self, result)
+
+    @ROUTER.route('GET', '/api/install-claude-code')
+    def _get_install_claude_code(self, req):
+        try:
+            # Claude Code 설치 (전역)
+            subprocess.Popen('cmd.exe /k "echo Installing Claude Code... && npm install -g @anthropic-ai/claude-code"', shell=True)
+            result = {"status": "success", "message": "Claude Code installation started in a new window."}
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        send_json(self, result)
+
+    @ROUTER.route('GET', '/api/install-codex-cli')
+    def _get_install_codex_cli(self, req):
+        try:
+            subprocess.Popen('cmd.exe /k "echo Installing Codex CLI... && npm install -g @openai/codex"', shell=True)
+            result = {"status": "success", "message": "Codex CLI installation started in a new window."}
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        send_json(self, result)
+
+    @ROUTER.route('GET', '/api/register-codex-to-ai')
+    def _get_register_codex_to_ai(self, req):
+        try:
+            python_cmds = _python_runner_cmds()
+            wrapper_script = str(BASE_DIR / 'bin' / 'codex_wrapper.py')
+            last_error = ''
+            for python_cmd in python_cmds:
+                proc = subprocess.run(
+                    [python_cmd, wrapper_script, '--install'],
+                    input='all\n',
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                    cwd=str(PROJECT_ROOT),
+                )
+                output = proc.stdout.strip() or proc.stderr.strip()
+                if proc.returncode == 0:
+                    result = {"status": "success", "message": f"Gemini CLI & Claude Desktop에 vibe-coding MCP 등록 완료!\n{output}"}
+                    break
+                last_error = output or f"등록 실패 (exit code {proc.returncode})"
+            else:
+                result = {"status": "error", "message": last_error or "사용 가능한 Python 실행기를 찾지 못했습니다."}
+        except subprocess.TimeoutExpired:
+            result = {"status": "error", "message": "등록 시간 초과 (30초)"}
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        send_json(self, result)
+
+    @ROUTER.route('GET', '/api/shutdown-disabled')
+    def _get_shutdown_disabled(self, req):
+        # 24시간 가동을 위해 셧다운 기능 비활성화
+        send_json(self, {"status": "error", "message": "Shutdown is disabled for 24/7 operation."}, 403, cors=False)
+
+    @ROUTER.route('GET', '/api/files')
+    def _get_files(self, req):
+        parsed_path = req.parsed
+        # [수정] Windows 경로(드라이브 루트 등) 처리 및 응답 안정성 강화.
+        # 1. 경로 구분자 표준화 및 드라이브 루트(/) 유효성 보정.
+        # 2. 예외 발생 시 빈 배열([])을 안전하게 반환하여 연결 끊김 방지.
+        query = parse_qs(parsed_path.query)
+        target_path = query.get('path', [''])[0].replace('\\', '/')
+
+        # [핵심] 경로가 비어있을 경우 기본값으로 PROJECT_ROOT(문자열) 사용
+        if not target_path:
+            target_path = str(PROJECT_ROOT).replace('\\', '/')
+
+        # 드라이브 루트(예: D:) 처리 보정
+        if target_path and len(target_path) == 2 and target_path[1] == ':':
+            target_path += '/'
+
+        items = []
+        try:
+            # 실제 경로 존재 여부 및 디렉터리 여부 재검증
+            p = Path(target_path)
+            if p.exists() and p.is_dir():
+                for entry in os.scandir(target_path):
+                    # 숨김 항목 필터링 (주요 설정 파일 제외)
+                    if not entry.name.startswith('.') or entry.name in ('.claude', '.ai_monitor', '.gemini', '.github', '.gitignore', '.env'):
+                        items.append({
+                            "name": entry.name,
+                            "path": entry.path.replace('\\', '/'),
+                            "isDir": entry.is_dir()
+                        })
+        except Exception as e:
+            # 권한 문제 등으로 인한 실패 시 로그 기록 후 빈 목록 반환 (서버 중단 방지)
+            print(f"[ERROR] /api/files failed for {target_path}: {e}")
+
+        # 폴더 우선 정렬
+        try:
+            items.sort(key=lambda x: (not x['isDir'], x['name'].lower()))
+        except Exception:
+            pass
+
+        send_json(self, items)
+
+    @ROUTER.route('GET', '/api/install-skills')
+    def _get_install_skills(self, req):
+        parsed_path = req.parsed
+        query = parse_qs(parsed_path.query)
+        target_path = query.get('path', [''])[0]
+        
+        result = {"status": "error", "message": "Invalid path"}
+        if target_path and os.path.exists(target_path) and os.path.isdir(target_path):
+            try:
+                # [수정] 배포 여부에 따라 소스 경로 결정
+                # .gemini, scripts, GEMINI.md 등을 복사
+                source_base = BASE_DIR if getattr(sys, 'frozen', False) else BASE_DIR.parent
+                
+                # .gemini 복사
+                gemini_src = source_base / ".gemini"
+                if gemini_src.exists():
+                    shutil.copytree(gemini_src, Path(target_path) / ".gemini", dirs_exist_ok=True)
+                
+                # scripts 복사
+                scripts_src = SCRIPTS_DIR
+                if scripts_src.exists():
+                    shutil.copytree(scripts_src, Path(target_path) / "scripts", dirs_exist_ok=True)
+                    
+                # GEMINI.md 복사
+                gemini_md_src = source_base / "GEMINI.md"
+                if gemini_md_src.exists():
+                    shutil.copy(gemini_md_src, Path(target_path) / "GEMINI.md")
+                    
+                # CLAUDE.md 복사
+                claude_md_src = source_base / "CLAUDE.md"
+                if claude_md_src.exists():
+                    shutil.copy(claude_md_src, Path(target_path) / "CLAUDE.md")
+                    
+                # RULES.md 복사 (누락 방지)
+                rules_md_src = source_base / "RULES.md"
+                if rules_md_src.exists():
+                    shutil.copy(rules_md_src, Path(target_path) / "RULES.md")
+                    
+                # PROJECT_MAP.md 복사 — 소스에 없으면 파일 구조 자동 분석으로 생성
+                # [배포 버전] exe 번들에 PROJECT_MAP.md가 없을 때 빨간불 방지
+                project_map_dst = Path(target_path) / "PROJECT_MAP.md"
+                project_map_src = source_base / "PROJECT_MAP.md"
+                if project_map_src.exists():
+                    shutil.copy(project_map_src, project_map_dst)
+                elif not project_map_dst.exists():
+                    # 실제 프로젝트 파일 구조를 분석하여 PROJECT_MAP.md 자동 생성
+                    # LLM 없이도 유용한 맵을 만들 수 있도록 구조 탐색
+                    proj_name = Path(target_path).name
+                    proj_root = Path(target_path)
+
+                    # 무시할 디렉터리/패턴 목록
+                    IGNORE_DIRS = {
+                        '.git', '.ai_monitor', 'node_modules', '__pycache__',
+                        '.venv', 'venv', '.ruff_cache', 'dist', 'build',
+                        '.cache', '.tox', 'coverage', '.pytest_cache',
+                    }
+                    IGNORE_EXTS = {'.pyc', '.pyo', '.db', '.db-shm', '.db-wal',
+                                   '.log', '.tmp', '.exe', '.dll', '.so'}
+
+                    # 기술 스택 감지 (특정 파일 존재 여부로 판단)
+                    tech_hints = []
+                    if (proj_root / 'package.json').exists():
                         try:
-                            self.wfile.write(f"data: {msg}\n\n".encode('utf-8'))
-                            self.wfile.flush()
-                        except Exception:
-                            break  # 클라이언트 연결 끊김
-                    except _QEmpty:
-                        # 큐 비어있으면 하트비트 전송 (연결 유지)
+                            pkg = json.loads((proj_root / 'package.json').read_text(encoding='utf-8'))
+                            deps = list((pkg.get('dependencies', {}) or {}).keys())
+                            if 'react' in deps: tech_hints.append('React')
+                            if 'vue' in deps: tech_hints.append('Vue')
+                            if 'next' in deps: tech_hints.append('Next.js')
+                            if 'vite' in deps or 'vite' in str(pkg.get('devDependencies', {})): tech_hints.append('Vite')
+                            if 'typescript' in str(pkg.get('devDependencies', {})): tech_hints.append('TypeScript')
+                        except Exception: pass
+                        if not tech_hints: tech_hints.append('Node.js')
+                    if (proj_root / 'requirements.txt').exists() or (proj_root / 'pyproject.toml').exists():
+                        tech_hints.append('Python')
+                    if (proj_root / 'Cargo.toml').exists(): tech_hints.append('Rust')
+                    if (proj_root / 'go.mod').exists(): tech_hints.append('Go')
+                    if (proj_root / '.claude').is_dir(): tech_hints.append('Claude Code')
+                    if (proj_root / '.gemini').is_dir(): tech_hints.append('Gemini')
+
+                    # 파일 역할 추론 (파일명 패턴 → 설명)
+                    FILE_ROLES = {
+                        'server.py': 'HTTP/WebSocket 서버 진입점',
+                        'main.py': '메인 진입점',
+                        'app.py': '앱 진입점',
+                        'index.ts': '메인 진입점',
+                        'index.js': '메인 진입점',
+                        'App.tsx': 'React 루트 컴포넌트',
+                        'App.vue': 'Vue 루트 컴포넌트',
+                        'package.json': 'Node.js 패키지 설정',
+                        'requirements.txt': 'Python 패키지 목록',
+                        'pyproject.toml': 'Python 프로젝트 설정',
+                        'Cargo.toml': 'Rust 패키지 설정',
+                        'go.mod': 'Go 모듈 설정',
+                        'CLAUDE.md': 'Claude AI 지침',
+                        'GEMINI.md': 'Gemini AI 지침',
+                        'RULES.md': 'AI 에이전트 공통 규칙',
+                        '.env': '환경 변수 (민감 정보 포함)',
+                        'docker-compose.yml': 'Docker Compose 설정',
+                        'Dockerfile': 'Docker 빌드 설정',
+                    }
+
+                    # 최상위 구조 탐색 (2레벨)
+                    structure_lines = []
+                    key_files = []
+
+                    def _scan_dir(path: Path, depth: int, prefix: str = '') -> None:
+                        if depth > 2: return
                         try:
-                            self.wfile.write(b": heartbeat\n\n")
-                            self.wfile.flush()
-                        except Exception:
-                            break  # 클라이언트 연결 끊김
-            except Exception:
-                pass
-            finally:
-                AGENT_CLIENTS.discard(client_q)  # 연결 종료 시 세트에서 제거
-            return
+                            items = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name.lower()))
+                        except PermissionError:
+                            return
+                        for item in items:
+                            if item.name.startswith('.') and item.name not in ('.claude', '.gemini'):
+                                continue
+                            if item.is_dir() and item.name in IGNORE_DIRS:
+                                continue
+                            if item.is_file() and item.suffix in IGNORE_EXTS:
+                                continue
+                            rel = f"{prefix}{'📁 ' if item.is_dir() else '📄 '}{item.name}"
+                            role = FILE_ROLES.get(item.name, '')
+                            structure_lines.append(f"- {rel}" + (f" — {role}" if role else ''))
+                            if item.is_file() and role:
+                                key_files.append((str(item.relative_to(proj_root)), role))
+                            if item.is_dir() and depth < 2:
+                                _scan_dir(item, depth + 1, prefix + '  ')
+
+                    _scan_dir(proj_root, 1)
+
+                    # PROJECT_MAP.md 내용 조립
+                    tech_str = ' + '.join(tech_hints) if tech_hints else '미확인'
+                    now_str = datetime.now().strftime('%Y-%m-%d')
+                    map_content = (
+                        f"# 📁 {proj_name} — PROJECT MAP\n\n"
+                        f"> **자동 생성:** {now_str} (Vibe Coding 스킬 복구)\n"
+                        f"> 이 파일은 프로젝트 파일 구조를 분석하여 자동으로 생성되었습니다.\n"
+                        f"> 내용을 검토하고 필요한 부분을 보완해주세요.\n\n"
+                        f"## 기술 스택\n\n"
+                        f"- **감지된 기술:** {tech_str}\n\n"
+                        f"## 프로젝트 구조\n\n"
+                        + ('\n'.join(structure_lines[:60]) or '- (파일 없음)')
+                        + '\n\n'
+                        + (
+                            "## 핵심 파일\n\n"
+                            + '\n'.join(f"- `{f}` — {r}" for f, r in key_files[:20])
+                            + '\n'
+                            if key_files else
+                            "## 핵심 파일\n\n- (자동 감지 없음 — 직접 기록해주세요)\n"
+                        )
+                    )
+                    project_map_dst.write_text(map_content, encoding='utf-8')
 
-        # ─── 신규: 파일 시스템 변경 이벤트 스트리밍 ───
-        if path == '/api/events/fs':
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/event-stream')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Cache-Control', 'no-cache')
-            self.send_header('Connection', 'keep-alive')
-            self.end_headers()
-            
-            FS_CLIENTS.add(self)
+                # 대상 프로젝트의 .ai_monitor/data 폴더와 DB 초기화
+                # — 스킬 설치 후 하이브 워치독이 정상 동작하려면 DB가 있어야 함
+                target_data = Path(target_path) / ".ai_monitor" / "data"
+                target_data.mkdir(parents=True, exist_ok=True)
+                ensure_schema(target_data)
+
+                result = {"status": "success", "message": f"Skills installed to {target_path}"}
+            except Exception as e:
+                result = {"status": "error", "message": str(e)}
+        
+        send_json(self, result)
+
+    @ROUTER.route('GET', '/api/dirs')
+    def _get_dirs(self, req):
+        parsed_path = req.parsed
+        query = parse_qs(parsed_path.query)
+        target_path = query.get('path', [''])[0]
+        dirs = []
+        if target_path and os.path.exists(target_path) and os.path.isdir(target_path):
             try:
-                # SSE 연결 타임아웃 완화 (60초)
-                self.connection.settimeout(60.0)
-                # 연결 유지를 위한 하트비트 루프
-                while True:
-                    time.sleep(30) # 하트비트 주기를 30초로 완화
-                    self.wfile.write(b": heartbeat\n\n")
-                    self.wfile.flush()
+                for entry in os.scandir(target_path):
+                    # .으로 시작하는 숨김 폴더 중 주요 설정 폴더는 허용
+                    if entry.is_dir() and (not entry.name.startswith('.') or entry.name in ('.claude', '.ai_monitor', '.gemini', '.github')):
+                        dirs.append({"name": entry.name, "path": entry.path.replace('\\', '/')})
             except Exception:
                 pass
-            finally:
-                FS_CLIENTS.discard(self)
+        dirs.sort(key=lambda x: x['name'].lower())
+        try:
+            send_json(self, dirs)
+            self.wfile.flush()
+        except Exception as _e:
+            print(f'[/api/dirs write ERROR] {_e}', flush=True)
+
+    @ROUTER.route('GET', '/api/help')
+    def _get_help(self, req):
+        parsed_path = req.parsed
+        query = parse_qs(parsed_path.query)
+        topic = query.get('topic', [''])[0]
+        docs_dir = Path(__file__).parent / 'docs'
+        help_file = docs_dir / f'help-{topic}.md'
+        if help_file.exists():
+            content = help_file.read_text(encoding='utf-8')
+            send_json(self, {"content": content})
+        else:
+            send_json(self, {"error": "Help topic not found"})
+
+    @ROUTER.route('GET', '/api/image-file')
+    def _get_image_file(self, req):
+        parsed_path = req.parsed
+        query = parse_qs(parsed_path.query)
+        target_path = query.get('path', [''])[0]
+        IMAGE_MIME = {
+            'png': 'image/png', 'jpg': 'image/jpeg', 'jpeg': 'image/jpeg',
+            'gif': 'image/gif', 'webp': 'image/webp', 'svg': 'image/svg+xml',
+            'bmp': 'image/bmp', 'ico': 'image/x-icon',
+        }
+        ext = target_path.rsplit('.', 1)[-1].lower() if '.' in target_path else ''
+        mime = IMAGE_MIME.get(ext, 'application/octet-stream')
+        if not target_path or not os.path.exists(target_path) or not os.path.isfile(target_path):
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
             return
+        with open(target_path, 'rb') as f:
+            send_body(self, f.read(), mime)
 
-        if parsed_path.path == '/stream':
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/event-stream')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Cache-Control', 'no-cache')
-            self.send_header('Connection', 'keep-alive')
-            self.end_headers()
-            
-            import psycopg2
-            import select
-            
-            # 1. 초기 데이터 전송 (최근 50개 - PostgreSQL에서 조회)
-            try:
-                rows = run_pg_sql_csv(
-                    "SELECT agent, level, message as trigger, task_id as session_id, "
-                    "metadata->>'terminal_id' as terminal_id, metadata->>'project' as project, "
-                    "metadata->>'raw_status' as status, to_char(timestamp, 'YYYY-MM-DD HH24:MI:SS') as timestamp "
-                    "FROM hive_logs ORDER BY id DESC LIMIT 50"
-                )
-                if rows:
-                    for row in reversed(rows):
-                        self.wfile.write(f"data: {json.dumps(row, ensure_ascii=False)}\n\n".encode('utf-8'))
-                        self.wfile.flush()
-            except Exception as e:
-                print(f"[SSE-PG] Initial Read Error: {e}")
+    @ROUTER.route('GET', '/api/read-file')
+    def _get_read_file(self, req):
+        parsed_path = req.parsed
+        query = parse_qs(parsed_path.query)
+        target_path = query.get('path', [''])[0]
+
+        if not target_path or not os.path.exists(target_path) or not os.path.isfile(target_path):
+            send_json(self, {"error": "File not found or invalid path"})
+            return
+
+        try:
+            # Try reading as UTF-8
+            with open(target_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            send_json(self, {"content": content})
+        except UnicodeDecodeError:
+            send_json(self, {"error": "Binary file cannot be displayed."})
+        except Exception as e:
+            send_json(self, {"error": str(e)})
 
-            # 2. 실시간 LISTEN 루프
+    @ROUTER.route('GET', '/api/check-update-ready')
+    def _get_check_update_ready(self, req):
+        update_file = DATA_DIR / "update_ready.json"
+        if update_file.exists():
             try:
-                pg_conn = psycopg2.connect(host="localhost", port=5433, user="postgres", database="postgres")
-                pg_conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
-                cursor = pg_conn.cursor()
-                cursor.execute("LISTEN hive_log_channel;")
-                
-                self.connection.settimeout(60.0) # SSE 연결 타임아웃
-                
-                while True:
-                    if select.select([pg_conn], [], [], 5) == ([], [], []):
-                        # 하트비트 전송
-                        self.wfile.write(b": heartbeat\n\n")
-                        self.wfile.flush()
-                        continue
-                    
-                    pg_conn.poll()
-                    while pg_conn.notifies:
-                        notify = pg_conn.notifies.pop(0)
-                        payload = json.loads(notify.payload)
-                        
-                        # 프론트엔드 호환 포맷 변환
-                        meta = payload.get('metadata', {})
-                        if isinstance(meta, str): meta = json.loads(meta)
-                        
-                        out_row = {
-                            "agent": payload.get('agent'),
-                            "level": payload.get('level'),
-                            "trigger": payload.get('message'),
-                            "session_id": payload.get('task_id'),
-                            "terminal_id": meta.get('terminal_id'),
-                            "project": meta.get('project'),
-                            "status": meta.get('raw_status'),
-                            "timestamp": payload.get('timestamp')
-                        }
-                        
-                        self.wfile.write(f"data: {json.dumps(out_row, ensure_ascii=False)}\n\n".encode('utf-8'))
-                        self.wfile.flush()
-            except (BrokenPipeError, ConnectionResetError, socket.timeout):
-                pass
+                with open(update_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                # update_ready.json에 저장된 버전이 현재 실행 중인 버전보다
+                # 낮거나 같으면 → 이미 해당 버전 이상으로 업데이트된 것이므로
+                # 파일을 삭제하고 "업데이트 없음" 상태로 반환한다.
+                # [버그수정] 이전 코드는 == 비교만 했기 때문에 v3.6.9 캐시가
+                # v3.6.10에서도 "업데이트 있음"으로 잘못 표시되는 문제가 있었음.
+                file_ver = data.get("version", "").lstrip("v").strip()
+                cur_ver  = __version__.lstrip("v").strip()
+
+                def _parse_ver(v):
+                    """'3.6.10' → (3, 6, 10) 정수 튜플로 변환"""
+                    parts = v.split(".")
+                    result = []
+                    for p in parts:
+                        try: result.append(int(p))
+                        except ValueError: result.append(0)
+                    while len(result) < 3:
+                        result.append(0)
+                    return tuple(result)
+
+                # 저장된 업데이트 버전이 현재 버전보다 실제로 높을 때만 알림 표시
+                if file_ver and _parse_ver(file_ver) > _parse_ver(cur_ver):
+                    send_json(self, data)
+                else:
+                    # 같거나 낮은 버전 → 오래된 캐시이므로 삭제
+                    update_file.unlink(missing_ok=True)
+                    send_json(self, {"ready": False, "downloading": False})
             except Exception as e:
-                print(f"[SSE-PG] Stream Error: {e}")
-            finally:
-                try: pg_conn.close()
-                except: pass
-        elif parsed_path.path == '/api/heartbeat':
-            # 하트비트 수신 — 자동 종료 로직 제거됨 (밤새 실행 지원)
-            self.send_response(200)
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(b"OK")
-        elif parsed_path.path == '/api/projects':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            projects = []
-            if PROJECTS_FILE.exists():
-                try:
-                    with open(PROJECTS_FILE, 'r', encoding='utf-8') as f:
-                        projects = json.load(f)
-                except: pass
-            
-            # GET 요청이면 목록 반환, POST 처리는 아래 do_POST에서 함
-            self.wfile.write(json.dumps(projects).encode('utf-8'))
-        elif parsed_path.path == '/api/agents':
-            # 실시간 에이전트 상태 목록 반환 (오케스트레이터용)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            with AGENT_STATUS_LOCK:
-                self.wfile.write(json.dumps(AGENT_STATUS, ensure_ascii=False).encode('utf-8'))
-        elif parsed_path.path == '/api/browse-folder':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                # PowerShell을 사용하여 폴더 선택창 띄우기
-                ps_cmd = (
-                    "$app = New-Object -ComObject Shell.Application; "
-                    "$folder = $app.BrowseForFolder(0, '프로젝트 폴더를 선택하세요', 0, 0); "
-                    "if ($folder) { $folder.Self.Path } else { '' }"
-                )
-                # CREATE_NO_WINDOW: PowerShell 콘솔 창이 화면에 잠깐 뜨는 문제 방지
+                send_json(self, {"error": str(e)})
+        else:
+            send_json(self, {"ready": False, "downloading": False})
+
+    @ROUTER.route('GET', '/api/trigger-update-check')
+    def _get_trigger_update_check(self, req):
+        if not getattr(sys, 'frozen', False):
+            send_json(self, {"started": False, "reason": "dev build"})
+            return
+        try:
+            from updater import check_and_update
+            threading.Thread(target=check_and_update, args=(DATA_DIR,), daemon=True).start()
+            send_json(self, {"started": True})
+        except Exception as e:
+            send_json(self, {"started": False, "reason": str(e)})
+
+    @ROUTER.route('GET', '/api/copy-path')
+    def _get_copy_path(self, req):
+        parsed_path = req.parsed
+        query = parse_qs(parsed_path.query)
+        target_path = query.get('path', [''])[0]
+        try:
+            # Windows 클립보드에 경로 복사
+            # CREATE_NO_WINDOW: PowerShell 콘솔 창이 순간 깜빡이는 문제 방지
+            if os.name == 'nt':
                 _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
-                res = subprocess.run(
-                    ['powershell', '-WindowStyle', 'Hidden', '-Command', ps_cmd],
-                    capture_output=True, text=True, encoding='utf-8',
-                    creationflags=_no_window
+                subprocess.run(
+                    ['powershell', '-WindowStyle', 'Hidden', '-Command', f'Set-Clipboard -Value "{target_path}"'],
+                    check=True, encoding='utf-8', creationflags=_no_window
                 )
-                selected_path = res.stdout.strip().replace('\\', '/')
-                self.wfile.write(json.dumps({"path": selected_path}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/config':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            config = {}
-            if CONFIG_FILE.exists():
-                try:
-                    with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                except: pass
-            self.wfile.write(json.dumps(config).encode('utf-8'))
-        elif parsed_path.path == '/api/drives':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            drives = []
-            if os.name == 'nt':
-                for letter in string.ascii_uppercase:
-                    drive = f"{letter}:/"  # 경로 일관성: 항상 포워드 슬래시 사용 (2026-02-27)
-                    if os.path.exists(drive):
-                        drives.append(drive)
-            else:
-                drives = ['/']
-            self.wfile.write(json.dumps(drives).encode('utf-8'))
-        elif parsed_path.path == '/api/install-gemini-cli':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                # Gemini CLI 설치 (전역)
-                subprocess.Popen('cmd.exe /k "echo Installing Gemini CLI... && npm install -g @google/gemini-cli"', shell=True)
-                result = {"status": "success", "message": "Gemini CLI installation started in a new window."}
-            except Exception as e:
-                result = {"status": "error", "message": str(e)}
-            self.wfile.write(json.dumps(result).encode('utf-8'))
-        elif parsed_path.path == '/api/install-claude-code':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                # Claude Code 설치 (전역)
-                subprocess.Popen('cmd.exe /k "echo Installing Claude Code... && npm install -g @anthropic-ai/claude-code"', shell=True)
-                result = {"status": "success", "message": "Claude Code installation started in a new window."}
-            except Exception as e:
-                result = {"status": "error", "message": str(e)}
-            self.wfile.write(json.dumps(result).encode('utf-8'))
-        elif parsed_path.path == '/api/install-codex-cli':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                subprocess.Popen('cmd.exe /k "echo Installing Codex CLI... && npm install -g @openai/codex"', shell=True)
-                result = {"status": "success", "message": "Codex CLI installation started in a new window."}
-            except Exception as e:
-                result = {"status": "error", "message": str(e)}
-            self.wfile.write(json.dumps(result).encode('utf-8'))
-        elif parsed_path.path == '/api/register-codex-to-ai':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                python_cmds = _python_runner_cmds()
-                wrapper_script = str(BASE_DIR / 'bin' / 'codex_wrapper.py')
-                last_error = ''
-                for python_cmd in python_cmds:
-                    proc = subprocess.run(
-                        [python_cmd, wrapper_script, '--install'],
-                        input='all\n',
-                        capture_output=True,
-                        text=True,
-                        timeout=30,
-                        cwd=str(PROJECT_ROOT),
-                    )
-                    output = proc.stdout.strip() or proc.stderr.strip()
-                    if proc.returncode == 0:
-                        result = {"status": "success", "message": f"Gemini CLI & Claude Desktop에 vibe-coding MCP 등록 완료!\n{output}"}
-                        break
-                    last_error = output or f"등록 실패 (exit code {proc.returncode})"
-                else:
-                    result = {"status": "error", "message": last_error or "사용 가능한 Python 실행기를 찾지 못했습니다."}
-            except subprocess.TimeoutExpired:
-                result = {"status": "error", "message": "등록 시간 초과 (30초)"}
-            except Exception as e:
-                result = {"status": "error", "message": str(e)}
-            self.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
-        elif parsed_path.path == '/api/shutdown-disabled':
-            # 24시간 가동을 위해 셧다운 기능 비활성화
-            self.send_response(403)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.end_headers()
-            self.wfile.write(json.dumps({"status": "error", "message": "Shutdown is disabled for 24/7 operation."}).encode('utf-8'))
-        elif parsed_path.path == '/api/files':
-            # [수정] Windows 경로(드라이브 루트 등) 처리 및 응답 안정성 강화.
-            # 1. 경로 구분자 표준화 및 드라이브 루트(/) 유효성 보정.
-            # 2. 예외 발생 시 빈 배열([])을 안전하게 반환하여 연결 끊김 방지.
-            query = parse_qs(parsed_path.query)
-            target_path = query.get('path', [''])[0].replace('\\', '/')
-
-            # [핵심] 경로가 비어있을 경우 기본값으로 PROJECT_ROOT(문자열) 사용
-            if not target_path:
-                target_path = str(PROJECT_ROOT).replace('\\', '/')
+            send_json(self, {"status": "success", "message": "Path copied to clipboard"})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-            # 드라이브 루트(예: D:) 처리 보정
-            if target_path and len(target_path) == 2 and target_path[1] == ':':
-                target_path += '/'
+    @ROUTER.route('GET', '/api/messages')
+    def _get_messages(self, req):
+        # 에이전트 간 메시지 채널 목록 반환 (최신 100개, SQLite 연동)
+        try:
+            msgs = get_messages(100)
+            send_json(self, msgs)
+        except Exception as e:
+            send_json(self, {'error': str(e)})
 
-            items = []
-            try:
-                # 실제 경로 존재 여부 및 디렉터리 여부 재검증
-                p = Path(target_path)
-                if p.exists() and p.is_dir():
-                    for entry in os.scandir(target_path):
-                        # 숨김 항목 필터링 (주요 설정 파일 제외)
-                        if not entry.name.startswith('.') or entry.name in ('.claude', '.ai_monitor', '.gemini', '.github', '.gitignore', '.env'):
-                            items.append({
-                                "name": entry.name,
-                                "path": entry.path.replace('\\', '/'),
-                                "isDir": entry.is_dir()
-                            })
-            except Exception as e:
-                # 권한 문제 등으로 인한 실패 시 로그 기록 후 빈 목록 반환 (서버 중단 방지)
-                print(f"[ERROR] /api/files failed for {target_path}: {e}")
+    @ROUTER.route('GET', '/api/tasks')
+    def _get_tasks(self, req):
+        # 공유 작업 큐 전체 목록 반환
+        try:
+            tasks = list_tasks()
+        except Exception:
+            tasks = []
+        send_json(self, tasks)
 
-            # 폴더 우선 정렬
+    @ROUTER.route('GET', '/api/tasks/kanban')
+    def _get_tasks_kanban(self, req):
+        # 칸반 보드 데이터 — 태스크를 5컬럼으로 그룹화하여 반환
+        # kanban_status 필드 우선, 없으면 status에서 매핑 (pending→todo 하위 호환)
+        try:
+            tasks = list_tasks()
+        except Exception:
+            tasks = []
+        columns: dict = {'todo': [], 'claimed': [], 'in_progress': [], 'review': [], 'done': []}
+        for t in tasks:
+            # kanban_status 우선 적용, 없으면 status 필드에서 변환
+            st = t.get('kanban_status') or t.get('status', 'todo')
+            if st == 'pending':
+                st = 'todo'
+            if st in columns:
+                columns[st].append(t)
+            else:
+                columns['todo'].append(t)
+        total = len(tasks)
+        done_cnt = len(columns['done'])
+        active = total - done_cnt
+        rate = round(done_cnt / total * 100) if total > 0 else 0
+        result = {**columns, 'stats': {'total': total, 'active': active, 'done': done_cnt, 'rate': rate}}
+        send_json(self, result)
+
+    @ROUTER.route('GET', '/api/task-logs')
+    def _get_task_logs(self, req):
+        parsed_path = req.parsed
+        # task_logs.jsonl에서 최근 로그 반환 — 모니터링 뷰 직접 폴링용
+        # ?agent=claude  ?terminal_id=T1  ?limit=20
+        # SSE 스트림과 달리 JSONL 파일을 직접 읽어 즉시 반환합니다.
+        params    = parse_qs(parsed_path.query)
+        _agent_f  = params.get('agent',       [''])[0].lower()
+        _tid_f    = params.get('terminal_id', [''])[0].upper()
+        _limit    = int(params.get('limit',   ['20'])[0])
+        _log_file = DATA_DIR / 'task_logs.jsonl'
+        _results: list = []
+        # 최근 500줄까지만 역방향으로 훑고 limit개가 차면 중단
+        for _entry in iter_records(_log_file, max_lines=500):
             try:
-                items.sort(key=lambda x: (not x['isDir'], x['name'].lower()))
+                # 에이전트 필터 (대소문자 무시)
+                if _agent_f and _entry.get('agent', '').lower() != _agent_f:
+                    continue
+                # 터미널 ID 필터 (T1/1 모두 허용)
+                if _tid_f:
+                    _raw_tid = _entry.get('terminal_id', '')
+                    _norm = f'T{_raw_tid}' if _raw_tid.isdigit() else _raw_tid.upper()
+                    if _norm != _tid_f and _raw_tid.upper() != _tid_f:
+                        continue
+                _results.append(_entry)
+                if len(_results) >= _limit:
+                    break
             except Exception:
                 pass
+        # 시간순으로 정렬하여 반환 (최신 순 → 오래된 순)
+        send_json(self, _results)
 
-            body = json.dumps(items).encode('utf-8')
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Content-Length', str(len(body)))
-            self.end_headers()
-            self.wfile.write(body)
-        elif parsed_path.path == '/api/install-skills':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            query = parse_qs(parsed_path.query)
-            target_path = query.get('path', [''])[0]
-            
-            result = {"status": "error", "message": "Invalid path"}
-            if target_path and os.path.exists(target_path) and os.path.isdir(target_path):
-                try:
-                    # [수정] 배포 여부에 따라 소스 경로 결정
-                    # .gemini, scripts, GEMINI.md 등을 복사
-                    source_base = BASE_DIR if getattr(sys, 'frozen', False) else BASE_DIR.parent
-                    
-                    # .gemini 복사
-                    gemini_src = source_base / ".gemini"
-                    if gemini_src.exists():
-                        shutil.copytree(gemini_src, Path(target_path) / ".gemini", dirs_exist_ok=True)
-                    
-                    # scripts 복사
-                    scripts_src = SCRIPTS_DIR
-                    if scripts_src.exists():
-                        shutil.copytree(scripts_src, Path(target_path) / "scripts", dirs_exist_ok=True)
-                        
-                    # GEMINI.md 복사
-                    gemini_md_src = source_base / "GEMINI.md"
-                    if gemini_md_src.exists():
-                        shutil.copy(gemini_md_src, Path(target_path) / "GEMINI.md")
-                        
-                    # CLAUDE.md 복사
-                    claude_md_src = source_base / "CLAUDE.md"
-                    if claude_md_src.exists():
-                        shutil.copy(claude_md_src, Path(target_path) / "CLAUDE.md")
-                        
-                    # RULES.md 복사 (누락 방지)
-                    rules_md_src = source_base / "RULES.md"
-                    if rules_md_src.exists():
-                        shutil.copy(rules_md_src, Path(target_path) / "RULES.md")
-                        
-                    # PROJECT_MAP.md 복사 — 소스에 없으면 파일 구조 자동 분석으로 생성
-                    # [배포 버전] exe 번들에 PROJECT_MAP.md가 없을 때 빨간불 방지
-                    project_map_dst = Path(target_path) / "PROJECT_MAP.md"
-                    project_map_src = source_base / "PROJECT_MAP.md"
-                    if project_map_src.exists():
-                        shutil.copy(project_map_src, project_map_dst)
-                    elif not project_map_dst.exists():
-                        # 실제 프로젝트 파일 구조를 분석하여 PROJECT_MAP.md 자동 생성
-                        # LLM 없이도 유용한 맵을 만들 수 있도록 구조 탐색
-                        proj_name = Path(target_path).name
-                        proj_root = Path(target_path)
-
-                        # 무시할 디렉터리/패턴 목록
-                        IGNORE_DIRS = {
-                            '.git', '.ai_monitor', 'node_modules', '__pycache__',
-                            '.venv', 'venv', '.ruff_cache', 'dist', 'build',
-                            '.cache', '.tox', 'coverage', '.pytest_cache',
-                        }
-                        IGNORE_EXTS = {'.pyc', '.pyo', '.db', '.db-shm', '.db-wal',
-                                       '.log', '.tmp', '.exe', '.dll', '.so'}
-
-                        # 기술 스택 감지 (특정 파일 존재 여부로 판단)
-                        tech_hints = []
-                        if (proj_root / 'package.json').exists():
-                            try:
-                                pkg = json.loads((proj_root / 'package.json').read_text(encoding='utf-8'))
-                                deps = list((pkg.get('dependencies', {}) or {}).keys())
-                                if 'react' in deps: tech_hints.append('React')
-                                if 'vue' in deps: tech_hints.append('Vue')
-                                if 'next' in deps: tech_hints.append('Next.js')
-                                if 'vite' in deps or 'vite' in str(pkg.get('devDependencies', {})): tech_hints.append('Vite')
-                                if 'typescript' in str(pkg.get('devDependencies', {})): tech_hints.append('TypeScript')
-                            except Exception: pass
-                            if not tech_hints: tech_hints.append('Node.js')
-                        if (proj_root / 'requirements.txt').exists() or (proj_root / 'pyproject.toml').exists():
-                            tech_hints.append('Python')
-                        if (proj_root / 'Cargo.toml').exists(): tech_hints.append('Rust')
-                        if (proj_root / 'go.mod').exists(): tech_hints.append('Go')
-                        if (proj_root / '.claude').is_dir(): tech_hints.append('Claude Code')
-                        if (proj_root / '.gemini').is_dir(): tech_hints.append('Gemini')
-
-                        # 파일 역할 추론 (파일명 패턴 → 설명)
-                        FILE_ROLES = {
-                            'server.py': 'HTTP/WebSocket 서버 진입점',
-                            'main.py': '메인 진입점',
-                            'app.py': '앱 진입점',
-                            'index.ts': '메인 진입점',
-                            'index.js': '메인 진입점',
-                            'App.tsx': 'React 루트 컴포넌트',
-                            'App.vue': 'Vue 루트 컴포넌트',
-                            'package.json': 'Node.js 패키지 설정',
-                            'requirements.txt': 'Python 패키지 목록',
-                            'pyproject.toml': 'Python 프로젝트 설정',
-                            'Cargo.toml': 'Rust 패키지 설정',
-                            'go.mod': 'Go 모듈 설정',
-                            'CLAUDE.md': 'Claude AI 지침',
-                            'GEMINI.md': 'Gemini AI 지침',
-                            'RULES.md': 'AI 에이전트 공통 규칙',
-                            '.env': '환경 변수 (민감 정보 포함)',
-                            'docker-compose.yml': 'Docker Compose 설정',
-                            'Dockerfile': 'Docker 빌드 설정',
-                        }
-
-                        # 최상위 구조 탐색 (2레벨)
-                        structure_lines = []
-                        key_files = []
-
-                        def _scan_dir(path: Path, depth: int, prefix: str = '') -> None:
-                            if depth > 2: return
-                            try:
-                                items = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name.lower()))
-                            except PermissionError:
-                                return
-                            for item in items:
-                                if item.name.startswith('.') and item.name not in ('.claude', '.gemini'):
-                                    continue
-                                if item.is_dir() and item.name in IGNORE_DIRS:
-                                    continue
-                                if item.is_file() and item.suffix in IGNORE_EXTS:
-                                    continue
-                                rel = f"{prefix}{'📁 ' if item.is_dir() else '📄 '}{item.name}"
-                                role = FILE_ROLES.get(item.name, '')
-                                structure_lines.append(f"- {rel}" + (f" — {role}" if role else ''))
-                                if item.is_file() and role:
-                                    key_files.append((str(item.relative_to(proj_root)), role))
-                                if item.is_dir() and depth < 2:
-                                    _scan_dir(item, depth + 1, prefix + '  ')
-
-                        _scan_dir(proj_root, 1)
-
-                        # PROJECT_MAP.md 내용 조립
-                        tech_str = ' + '.join(tech_hints) if tech_hints else '미확인'
-                        now_str = datetime.now().strftime('%Y-%m-%d')
-                        map_content = (
-                            f"# 📁 {proj_name} — PROJECT MAP\n\n"
-                            f"> **자동 생성:** {now_str} (Vibe Coding 스킬 복구)\n"
-                            f"> 이 파일은 프로젝트 파일 구조를 분석하여 자동으로 생성되었습니다.\n"
-                            f"> 내용을 검토하고 필요한 부분을 보완해주세요.\n\n"
-                            f"## 기술 스택\n\n"
-                            f"- **감지된 기술:** {tech_str}\n\n"
-                            f"## 프로젝트 구조\n\n"
-                            + ('\n'.join(structure_lines[:60]) or '- (파일 없음)')
-                            + '\n\n'
-                            + (
-                                "## 핵심 파일\n\n"
-                                + '\n'.join(f"- `{f}` — {r}" for f, r in key_files[:20])
-                                + '\n'
-                                if key_files else
-                                "## 핵심 파일\n\n- (자동 감지 없음 — 직접 기록해주세요)\n"
-                            )
-                        )
-                        project_map_dst.write_text(map_content, encoding='utf-8')
-
-                    # 대상 프로젝트의 .ai_monitor/data 폴더와 DB 초기화
-                    # — 스킬 설치 후 하이브 워치독이 정상 동작하려면 DB가 있어야 함
-                    target_data = Path(target_path) / ".ai_monitor" / "data"
-                    target_data.mkdir(parents=True, exist_ok=True)
-                    ensure_schema(target_data)
-
-                    result = {"status": "success", "message": f"Skills installed to {target_path}"}
-                except Exception as e:
-                    result = {"status": "error", "message": str(e)}
-            
-            self.wfile.write(json.dumps(result).encode('utf-8'))
-
-        # ── [모듈 위임] hive_api — /api/hive/*, /api/orchestrator/*, /api/superpowers/status,
-        #    /api/skill-results, /api/context-usage, /api/gemini-context-usage, /api/local-models ──
-        elif (parsed_path.path.startswith('/api/hive/') or
-              parsed_path.path.startswith('/api/orchestrator/') or
-              parsed_path.path in ('/api/superpowers/status', '/api/skill-results',
-                                   '/api/context-usage', '/api/gemini-context-usage',
-                                   '/api/local-models')):
-            _params = parse_qs(parsed_path.query)
-            hive_api.handle_get(
-                self, parsed_path.path, _params,
-                DATA_DIR=DATA_DIR, SCRIPTS_DIR=SCRIPTS_DIR, BASE_DIR=BASE_DIR,
-                PROJECT_ROOT=PROJECT_ROOT, PROJECT_ID=PROJECT_ID,
-                TASKS_FILE=TASKS_FILE, AGENT_STATUS=AGENT_STATUS,
-                AGENT_STATUS_LOCK=AGENT_STATUS_LOCK,
-                pty_sessions=pty_sessions,
-                _current_project_root=_current_project_root,
-                _parse_session_tail=_parse_session_tail,
-                _parse_gemini_session=_parse_gemini_session,
-                run_pg_sql_csv=run_pg_sql_csv
-            )
-
-        elif parsed_path.path.startswith('/api/git/'):
-            _params = parse_qs(parsed_path.query)
-            git_api.handle_get(self, parsed_path.path, _params, BASE_DIR=BASE_DIR)
-
-        # ── [모듈 위임] mcp_api — /api/mcp/* ─────────────────────────────
-        elif parsed_path.path.startswith('/api/mcp/'):
-            _params = parse_qs(parsed_path.query)
-            mcp_api.handle_get(
-                self, parsed_path.path, _params,
-                _smithery_api_key=_smithery_api_key,
-                _mcp_config_path=_mcp_config_path,
-            )
-
-        # ── [모듈 위임] agent_api — /api/agent/* ─────────────────────────
-        elif parsed_path.path.startswith('/api/agent/'):
-            agent_api.handle_get(self, parsed_path.path)
-        elif parsed_path.path.startswith('/api/pty/'):
-            pty_api.handle_get(self, parsed_path.path, parse_qs(parsed_path.query))
-        elif parsed_path.path == '/api/config/discord':
-            config_api.handle_get_config(self)
-
-        # ── [모듈 위임] memory_api — /api/memory, /api/project-info ──────
-        elif parsed_path.path in ('/api/memory', '/api/project-info'):
-            _params = parse_qs(parsed_path.query)
-            memory_api.handle_get(
-                self, parsed_path.path, _params,
-                DATA_DIR=DATA_DIR, PROJECT_ID=PROJECT_ID, PROJECT_ROOT=PROJECT_ROOT,
-                _memory_conn=_memory_conn, _embed=_embed, _cosine_sim=_cosine_sim,
-                __version__=__version__,
+    @ROUTER.route('GET', '/api/kanban/pg-activity')
+    def _get_kanban_pg_activity(self, req):
+        # Postgres-First 칸반 데이터: pg_logs에서 최근 8시간 터미널별 활동 조회
+        # 응답: { "T1": [{agent, task, status, ts}, ...], "T2": [...], ... }
+        try:
+            rows = run_pg_sql_csv(
+                "SELECT terminal_id, agent, task, status, "
+                "to_char(ts, 'HH24:MI:SS') AS ts "
+                "FROM pg_logs "
+                "WHERE ts > NOW() - INTERVAL '8 hours' "
+                "ORDER BY ts DESC LIMIT 300"
             )
+            # 터미널별 그룹화 (최대 15개/터미널)
+            by_terminal: dict = {}
+            for row in rows:
+                tid = row.get('terminal_id') or 'T0'
+                if tid not in by_terminal:
+                    by_terminal[tid] = []
+                if len(by_terminal[tid]) < 15:
+                    by_terminal[tid].append(row)
+            send_json(self, by_terminal)
+        except Exception as e:
+            send_json(self, {"error": str(e)})
 
-        elif parsed_path.path == '/api/hive/health/repair':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                watchdog_script = SCRIPTS_DIR / "hive_watchdog.py"
-                # CREATE_NO_WINDOW: Python 서브프로세스 콘솔 창 방지
-                _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
-                result_proc = subprocess.run(
-                    [sys.executable, str(watchdog_script), "--check"],
-                    capture_output=True, text=True, encoding='utf-8',
-                    creationflags=_no_window
-                )
-                output = result_proc.stdout
-                json_start = output.find('{')
-                if json_start != -1:
-                    result = json.loads(output[json_start:])
-                else:
-                    result = {"status": "error", "message": "Failed to parse watchdog output"}
-            except Exception as e:
-                result = {"status": "error", "message": str(e)}
-            self.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
-        elif parsed_path.path == '/api/dirs':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            query = parse_qs(parsed_path.query)
-            target_path = query.get('path', [''])[0]
-            dirs = []
-            if target_path and os.path.exists(target_path) and os.path.isdir(target_path):
-                try:
-                    for entry in os.scandir(target_path):
-                        # .으로 시작하는 숨김 폴더 중 주요 설정 폴더는 허용
-                        if entry.is_dir() and (not entry.name.startswith('.') or entry.name in ('.claude', '.ai_monitor', '.gemini', '.github')):
-                            dirs.append({"name": entry.name, "path": entry.path.replace('\\', '/')})
-                except Exception:
-                    pass
-            dirs.sort(key=lambda x: x['name'].lower())
-            try:
-                self.wfile.write(json.dumps(dirs).encode('utf-8'))
-                self.wfile.flush()
-            except Exception as _e:
-                print(f'[/api/dirs write ERROR] {_e}', flush=True)
-        elif parsed_path.path == '/api/help':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            query = parse_qs(parsed_path.query)
-            topic = query.get('topic', [''])[0]
-            docs_dir = Path(__file__).parent / 'docs'
-            help_file = docs_dir / f'help-{topic}.md'
-            if help_file.exists():
-                content = help_file.read_text(encoding='utf-8')
-                self.wfile.write(json.dumps({"content": content}).encode('utf-8'))
-            else:
-                self.wfile.write(json.dumps({"error": "Help topic not found"}).encode('utf-8'))
-            return
-
-        elif parsed_path.path == '/api/image-file':
-            query = parse_qs(parsed_path.query)
-            target_path = query.get('path', [''])[0]
-            IMAGE_MIME = {
-                'png': 'image/png', 'jpg': 'image/jpeg', 'jpeg': 'image/jpeg',
-                'gif': 'image/gif', 'webp': 'image/webp', 'svg': 'image/svg+xml',
-                'bmp': 'image/bmp', 'ico': 'image/x-icon',
+    @ROUTER.route('GET', '/api/memory/db-info')
+    def _get_memory_db_info(self, req):
+        # 현재 사용 중인 공유 메모리 DB 경로 및 항목 수 반환
+        # 배포 버전에서 어떤 DB를 바라보고 있는지 UI에서 확인할 수 있게 함
+        try:
+            ensure_schema(DATA_DIR)
+            rows = query_rows("SELECT COUNT(*) AS count FROM hive_memory;")
+            count = int(rows[0].get('count', 0)) if rows else 0
+            result = {
+                'db_path': 'postgres://localhost:5433/postgres',
+                'is_local': False,
+                'backend': 'postgres',
+                'count': count,
             }
-            ext = target_path.rsplit('.', 1)[-1].lower() if '.' in target_path else ''
-            mime = IMAGE_MIME.get(ext, 'application/octet-stream')
-            if not target_path or not os.path.exists(target_path) or not os.path.isfile(target_path):
-                self.send_response(404)
-                self.end_headers()
-                return
-            self.send_response(200)
-            self.send_header('Content-Type', mime)
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            with open(target_path, 'rb') as f:
-                self.wfile.write(f.read())
-
-        elif parsed_path.path == '/api/read-file':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            query = parse_qs(parsed_path.query)
-            target_path = query.get('path', [''])[0]
+        except Exception as e:
+            result = {'error': str(e), 'count': 0}
+        send_json(self, result)
 
-            if not target_path or not os.path.exists(target_path) or not os.path.isfile(target_path):
-                self.wfile.write(json.dumps({"error": "File not found or invalid path"}).encode('utf-8'))
-                return
+    # ── POST 라우트 ─────────────────────────────────────────────────────────
 
-            try:
-                # Try reading as UTF-8
-                with open(target_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.wfile.write(json.dumps({"content": content}).encode('utf-8'))
-            except UnicodeDecodeError:
-                self.wfile.write(json.dumps({"error": "Binary file cannot be displayed."}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-        
-        elif parsed_path.path == '/api/check-update-ready':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            update_file = DATA_DIR / "update_ready.json"
-            if update_file.exists():
-                try:
-                    with open(update_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    # update_ready.json에 저장된 버전이 현재 실행 중인 버전보다
-                    # 낮거나 같으면 → 이미 해당 버전 이상으로 업데이트된 것이므로
-                    # 파일을 삭제하고 "업데이트 없음" 상태로 반환한다.
-                    # [버그수정] 이전 코드는 == 비교만 했기 때문에 v3.6.9 캐시가
-                    # v3.6.10에서도 "업데이트 있음"으로 잘못 표시되는 문제가 있었음.
-                    file_ver = data.get("version", "").lstrip("v").strip()
-                    cur_ver  = __version__.lstrip("v").strip()
-
-                    def _parse_ver(v):
-                        """'3.6.10' → (3, 6, 10) 정수 튜플로 변환"""
-                        parts = v.split(".")
-                        result = []
-                        for p in parts:
-                            try: result.append(int(p))
-                            except ValueError: result.append(0)
-                        while len(result) < 3:
-                            result.append(0)
-                        return tuple(result)
-
-                    # 저장된 업데이트 버전이 현재 버전보다 실제로 높을 때만 알림 표시
-                    if file_ver and _parse_ver(file_ver) > _parse_ver(cur_ver):
-                        self.wfile.write(json.dumps(data).encode('utf-8'))
-                    else:
-                        # 같거나 낮은 버전 → 오래된 캐시이므로 삭제
-                        update_file.unlink(missing_ok=True)
-                        self.wfile.write(json.dumps({"ready": False, "downloading": False}).encode('utf-8'))
-                except Exception as e:
-                    self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
+    @ROUTER.route('POST', '/api/dashboard/launch')
+    def _post_dashboard_launch(self, req):
+        try:
+            tab = 'agent'
+            content_length = int(self.headers.get('Content-Length', 0))
+            if content_length > 0:
+                body = self.rfile.read(content_length).decode('utf-8')
+                payload = json.loads(body or '{}')
+                if isinstance(payload, dict):
+                    tab = str(payload.get('tab', 'agent')).strip().lower() or 'agent'
+
+            _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
+            if getattr(sys, 'frozen', False):
+                # 배포(frozen) 모드: vibe-coding.exe 옆의 vibe-dashboard.exe 직접 실행
+                exe_dir = Path(sys.executable).resolve().parent
+                launch_exe = exe_dir / 'vibe-dashboard.exe'
+                if not launch_exe.exists():
+                    raise RuntimeError(f'vibe-dashboard.exe 없음: {launch_exe}')
+                subprocess.Popen(
+                    [str(launch_exe), str(HTTP_PORT), tab],
+                    creationflags=_no_window,
+                    close_fds=True,
+                )
             else:
-                self.wfile.write(json.dumps({"ready": False, "downloading": False}).encode('utf-8'))
-
-        elif parsed_path.path == '/api/trigger-update-check':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            if not getattr(sys, 'frozen', False):
-                self.wfile.write(json.dumps({"started": False, "reason": "dev build"}).encode('utf-8'))
-                return
-            try:
-                from updater import check_and_update
-                threading.Thread(target=check_and_update, args=(DATA_DIR,), daemon=True).start()
-                self.wfile.write(json.dumps({"started": True}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"started": False, "reason": str(e)}).encode('utf-8'))
-
-        elif parsed_path.path == '/api/copy-path':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            query = parse_qs(parsed_path.query)
-            target_path = query.get('path', [''])[0]
-            try:
-                # Windows 클립보드에 경로 복사
-                # CREATE_NO_WINDOW: PowerShell 콘솔 창이 순간 깜빡이는 문제 방지
-                if os.name == 'nt':
-                    _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
-                    subprocess.run(
-                        ['powershell', '-WindowStyle', 'Hidden', '-Command', f'Set-Clipboard -Value "{target_path}"'],
-                        check=True, encoding='utf-8', creationflags=_no_window
-                    )
-                self.wfile.write(json.dumps({"status": "success", "message": "Path copied to clipboard"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-
-        elif parsed_path.path == '/api/messages':
-            # 에이전트 간 메시지 채널 목록 반환 (최신 100개, SQLite 연동)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                msgs = get_messages(100)
-                self.wfile.write(json.dumps(msgs, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/tasks':
-            # 공유 작업 큐 전체 목록 반환
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                tasks = list_tasks()
-            except Exception:
-                tasks = []
-            self.wfile.write(json.dumps(tasks, ensure_ascii=False).encode('utf-8'))
-        elif parsed_path.path == '/api/tasks/kanban':
-            # 칸반 보드 데이터 — 태스크를 5컬럼으로 그룹화하여 반환
-            # kanban_status 필드 우선, 없으면 status에서 매핑 (pending→todo 하위 호환)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                tasks = list_tasks()
-            except Exception:
-                tasks = []
-            columns: dict = {'todo': [], 'claimed': [], 'in_progress': [], 'review': [], 'done': []}
-            for t in tasks:
-                # kanban_status 우선 적용, 없으면 status 필드에서 변환
-                st = t.get('kanban_status') or t.get('status', 'todo')
-                if st == 'pending':
-                    st = 'todo'
-                if st in columns:
-                    columns[st].append(t)
-                else:
-                    columns['todo'].append(t)
-            total = len(tasks)
-            done_cnt = len(columns['done'])
-            active = total - done_cnt
-            rate = round(done_cnt / total * 100) if total > 0 else 0
-            result = {**columns, 'stats': {'total': total, 'active': active, 'done': done_cnt, 'rate': rate}}
-            self.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
-        elif parsed_path.path == '/api/task-logs':
-            # task_logs.jsonl에서 최근 로그 반환 — 모니터링 뷰 직접 폴링용
-            # ?agent=claude  ?terminal_id=T1  ?limit=20
-            # SSE 스트림과 달리 JSONL 파일을 직접 읽어 즉시 반환합니다.
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            params    = parse_qs(parsed_path.query)
-            _agent_f  = params.get('agent',       [''])[0].lower()
-            _tid_f    = params.get('terminal_id', [''])[0].upper()
-            _limit    = int(params.get('limit',   ['20'])[0])
-            _log_file = DATA_DIR / 'task_logs.jsonl'
-            _results: list = []
-            if _log_file.exists():
-                _lines = _log_file.read_text(encoding='utf-8').strip().splitlines()
-                for _ln in reversed(_lines[-500:]):
-                    try:
-                        _entry = json.loads(_ln)
-                        # 에이전트 필터 (대소문자 무시)
-                        if _agent_f and _entry.get('agent', '').lower() != _agent_f:
-                            continue
-                        # 터미널 ID 필터 (T1/1 모두 허용)
-                        if _tid_f:
-                            _raw_tid = _entry.get('terminal_id', '')
-                            _norm = f'T{_raw_tid}' if _raw_tid.isdigit() else _raw_tid.upper()
-                            if _norm != _tid_f and _raw_tid.upper() != _tid_f:
-                                continue
-                        _results.append(_entry)
-                        if len(_results) >= _limit:
-                            break
-                    except Exception:
-                        pass
-            # 시간순으로 정렬하여 반환 (최신 순 → 오래된 순)
-            self.wfile.write(json.dumps(_results, ensure_ascii=False).encode('utf-8'))
-        elif parsed_path.path == '/api/kanban/pg-activity':
-            # Postgres-First 칸반 데이터: pg_logs에서 최근 8시간 터미널별 활동 조회
-            # 응답: { "T1": [{agent, task, status, ts}, ...], "T2": [...], ... }
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                rows = run_pg_sql_csv(
-                    "SELECT terminal_id, agent, task, status, "
-                    "to_char(ts, 'HH24:MI:SS') AS ts "
-                    "FROM pg_logs "
-                    "WHERE ts > NOW() - INTERVAL '8 hours' "
-                    "ORDER BY ts DESC LIMIT 300"
+                # 개발(dev) 모드: Python 스크립트 서브프로세스로 실행
+                dashboard_script = BASE_DIR / 'dashboard_window.py'
+                python_cmds = _python_runner_cmds()
+                if not python_cmds:
+                    raise RuntimeError('Python interpreter not found for dashboard launch')
+                subprocess.Popen(
+                    [python_cmds[0], str(dashboard_script), str(HTTP_PORT), tab],
+                    creationflags=_no_window,
+                    close_fds=True,
                 )
-                # 터미널별 그룹화 (최대 15개/터미널)
-                by_terminal: dict = {}
-                for row in rows:
-                    tid = row.get('terminal_id') or 'T0'
-                    if tid not in by_terminal:
-                        by_terminal[tid] = []
-                    if len(by_terminal[tid]) < 15:
-                        by_terminal[tid].append(row)
-                self.wfile.write(json.dumps(by_terminal, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        elif parsed_path.path == '/api/orchestrator/skill-chain':
-            # 스킬 체인 실행 상태 반환 — skill_chain.db(SQLite) 조회
-            # 응답: {skill_registry: [...], terminals: {T1: {steps:[...]}, ...}}
-            # 대시보드가 3초마다 폴링하여 터미널별 스킬 실행 흐름을 실시간 표시
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                _orch_dir = str(SCRIPTS_DIR)
-                if _orch_dir not in sys.path:
-                    sys.path.insert(0, _orch_dir)
-                from skill_orchestrator import _build_response
-                result = _build_response()
-                self.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({
-                    "skill_registry": [], "terminals": {}, "error": str(e)
-                }, ensure_ascii=False).encode('utf-8'))
-
-        elif parsed_path.path == '/api/orchestrator/status':
-            # 오케스트레이터 현황 — 에이전트 활동 상태, 태스크 분배, 최근 액션 로그 반환
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                KNOWN_AGENTS = ['claude', 'gemini', 'codex']
-                IDLE_SEC = 300  # 5분
-
-                # 에이전트 마지막 활동 시각 (Postgres 우선, 파일 레거시 폴백)
-                agent_last_seen: dict = get_agent_last_seen(KNOWN_AGENTS)
-                for agent_name, last_seen in get_agent_last_seen_from_sessions(DATA_DIR, KNOWN_AGENTS).items():
-                    if last_seen and (agent_last_seen.get(agent_name) is None or last_seen > agent_last_seen[agent_name]):
-                        agent_last_seen[agent_name] = last_seen
-
-                # 메모리 작성 시각으로 보완 — 더 최신 활동 기록 포함
-                for row in list_memory(top_k=100, show_all=True):
-                    author_lower = str(row.get('author', '')).lower()
-                    last = row.get('updated_at')
-                    for agent_name in KNOWN_AGENTS:
-                        if agent_name in author_lower:
-                            current = agent_last_seen.get(agent_name)
-                            if last and (current is None or last > current):
-                                agent_last_seen[agent_name] = last
-
-                # in-memory AGENT_STATUS 로 보완 (가장 실시간 하트비트)
-                with AGENT_STATUS_LOCK:
-                    for a_name, st in AGENT_STATUS.items():
-                        a_key = (
-                            'claude' if 'claude' in a_name.lower()
-                            else 'gemini' if 'gemini' in a_name.lower()
-                            else 'codex' if 'codex' in a_name.lower()
-                            else None
-                        )
-                        if a_key and st.get('last_seen'):
-                            hb_dt = datetime.fromtimestamp(st['last_seen'])
-                            hb_iso = hb_dt.isoformat()
-                            if agent_last_seen.get(a_key) is None or hb_iso > agent_last_seen[a_key]:
-                                agent_last_seen[a_key] = hb_iso
-
-                # ── 터미널별 실시간 에이전트 현황 (PTY 세션 기반) ────────────────
-                # pty_sessions에 저장된 실제 실행 중인 에이전트를 슬롯 1~8 기준으로 반환.
-                # 슬롯이 비어 있으면 빈 문자열, 에이전트 이름이 없으면 'shell'로 표시.
-                terminal_agents: dict = {}
-                pty_active_agents: set = set()  # 현재 PTY에 살아 있는 에이전트 집합
-                for slot_num in range(1, 9):
-                    info = pty_sessions.get(str(slot_num))
-                    if info:
-                        a = info.get('agent', '') or 'shell'
-                        terminal_agents[str(slot_num)] = a
-                        if a in KNOWN_AGENTS:
-                            pty_active_agents.add(a)
-                    else:
-                        terminal_agents[str(slot_num)] = ''
-
-                # 에이전트 상태 — PTY 실행 중이면 무조건 active, 아니면 DB 타임스탬프 fallback
-                now_dt = datetime.now()
-                agent_status = {}
-                for agent, seen in agent_last_seen.items():
-                    if agent in pty_active_agents:
-                        # 현재 PTY 터미널에서 실행 중 → 즉시 active
-                        agent_status[agent] = {'state': 'active', 'last_seen': now_dt.isoformat(), 'idle_sec': 0}
-                    elif seen is None:
-                        agent_status[agent] = {'state': 'unknown', 'last_seen': None, 'idle_sec': None}
-                    else:
-                        try:
-                            seen_dt = datetime.fromisoformat(seen.replace('Z', ''))
-                            idle = int((now_dt - seen_dt).total_seconds())
-                            agent_status[agent] = {
-                                'state': 'idle' if idle > IDLE_SEC else 'active',
-                                'last_seen': seen, 'idle_sec': idle
-                            }
-                        except Exception:
-                            agent_status[agent] = {'state': 'unknown', 'last_seen': seen, 'idle_sec': None}
-
-                # 태스크 분배 현황
-                tasks_list: list = []
-                if TASKS_FILE.exists():
-                    with open(TASKS_FILE, 'r', encoding='utf-8') as f:
-                        tasks_list = json.load(f)
-                task_dist: dict = {a: {'pending': 0, 'in_progress': 0, 'done': 0} for a in KNOWN_AGENTS + ['all']}
-                for t in tasks_list:
-                    key = t.get('assigned_to', 'all') if t.get('assigned_to') in task_dist else 'all'
-                    s = t.get('status', 'pending')
-                    if s in task_dist[key]:
-                        task_dist[key][s] += 1
-
-                # 오케스트레이터 최근 액션 로그
-                # orchestrator_log.jsonl 없으면 task_logs.jsonl 폴백으로 표시
-                orch_log = DATA_DIR / 'orchestrator_log.jsonl'
-                recent_actions: list = []
-                if orch_log.exists():
-                    for line in reversed(orch_log.read_text(encoding='utf-8').strip().splitlines()[-20:]):
-                        try:
-                            recent_actions.append(json.loads(line))
-                        except Exception:
-                            pass
-                if not recent_actions:
-                    # task_logs.jsonl에서 최근 20개 폴백 — 에이전트 활동 이력으로 표시
-                    task_log_file = DATA_DIR / 'task_logs.jsonl'
-                    if task_log_file.exists():
-                        lines = task_log_file.read_text(encoding='utf-8').strip().splitlines()
-                        for line in reversed(lines[-20:]):
-                            try:
-                                entry = json.loads(line)
-                                recent_actions.append({
-                                    'action': entry.get('agent', 'agent'),
-                                    'detail': entry.get('task', ''),
-                                    'timestamp': entry.get('timestamp', ''),
-                                })
-                            except Exception:
-                                pass
-
-                # 현재 경고
-                warnings: list = []
-                for agent, st in agent_status.items():
-                    if st['state'] == 'idle' and st.get('idle_sec'):
-                        warnings.append(f"{agent} {st['idle_sec'] // 60}분째 비활성")
-                for agent, dist in task_dist.items():
-                    if agent == 'all': continue
-                    active = dist['pending'] + dist['in_progress']
-                    if active >= 5:
-                        warnings.append(f"{agent} 태스크 {active}개 (과부하)")
-
-                self.wfile.write(json.dumps({
-                    'agent_status': agent_status,
-                    'task_distribution': task_dist,
-                    'recent_actions': recent_actions,
-                    'warnings': warnings,
-                    'terminal_agents': terminal_agents,  # 슬롯별 실시간 에이전트
-                    'timestamp': now_dt.strftime('%Y-%m-%dT%H:%M:%S'),
-                }, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/memory/db-info':
-            # 현재 사용 중인 공유 메모리 DB 경로 및 항목 수 반환
-            # 배포 버전에서 어떤 DB를 바라보고 있는지 UI에서 확인할 수 있게 함
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                ensure_schema(DATA_DIR)
-                rows = query_rows("SELECT COUNT(*) AS count FROM hive_memory;")
-                count = int(rows[0].get('count', 0)) if rows else 0
-                self.wfile.write(json.dumps({
-                    'db_path': 'postgres://localhost:5433/postgres',
-                    'is_local': False,
-                    'backend': 'postgres',
-                    'count': count,
-                }, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'error': str(e), 'count': 0}).encode('utf-8'))
+            send_json(self, {"status": "launched", "tab": tab})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-        else:
-            # 정적 파일 서비스 로직 (Vite 빌드 결과물)
-            # 요청 경로를 정리
-            path = self.path
-            if path == '/':
-                path = '/index.html'
-
-            # /monitor → 에이전트 상황판 독립 페이지
-            if path.rstrip('/') == '/monitor':
-                path = '/monitor.html'
-            
-            # 쿼리스트링 제거
-            path = path.split('?')[0]
-            
-            filepath = STATIC_DIR / path.lstrip('/')
-            
-            # 파일이 없으면 index.html로 Fallback (SPA 특성)
-            if not filepath.exists() or not filepath.is_file():
-                filepath = STATIC_DIR / 'index.html'
-                
-            if filepath.exists() and filepath.is_file():
-                try:
-                    with open(filepath, 'rb') as f:
-                        content = f.read()
-                    self.send_response(200)
-                    mimetype, _ = mimetypes.guess_type(str(filepath))
-                    if filepath.suffix == '.js':
-                        mimetype = 'application/javascript'
-                    elif filepath.suffix == '.css':
-                        mimetype = 'text/css'
-                    elif filepath.suffix == '.svg':
-                        mimetype = 'image/svg+xml'
-                    self.send_header('Content-Type', mimetype or 'application/octet-stream')
-                    self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                    self.send_header('Pragma', 'no-cache')
-                    self.send_header('Expires', '0')
-                    self.end_headers()
-                    self.wfile.write(content)
-                except Exception as e:
-                    self.send_response(500)
-                    self.end_headers()
-                    self.wfile.write(str(e).encode('utf-8'))
+    @ROUTER.route('POST', '/api/kanban/launch')
+    def _post_kanban_launch(self, req):
+        # B안 통합: kanban_board.py(PySide6 네이티브) 제거 →
+        # dashboard_window.py + React TaskBoardPanel(?kanban=1)으로 일원화.
+        # 동일한 API(/api/orchestrator/skill-chain 등)를 통해 데이터 일관성 확보.
+        try:
+            _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
+            if getattr(sys, 'frozen', False):
+                # 배포(frozen) 모드: vibe-dashboard.exe를 kanban 탭으로 실행
+                exe_dir = Path(sys.executable).resolve().parent
+                launch_exe = exe_dir / 'vibe-dashboard.exe'
+                if not launch_exe.exists():
+                    raise RuntimeError(f'vibe-dashboard.exe 없음: {launch_exe}')
+                subprocess.Popen(
+                    [str(launch_exe), str(HTTP_PORT), 'kanban'],
+                    creationflags=_no_window,
+                    close_fds=True,
+                )
             else:
-                self.send_response(404)
-                self.end_headers()
-                self.wfile.write(b"Not Found")
-
-    def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
-
-    def do_POST(self):
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-
-        # ─── 칸반 보드 네이티브 창 실행 ──────────────────────────────────────
-        # window.open() 대신 PySide6 네이티브 프로세스를 직접 실행하여
-        # 인터넷 브라우저 창이 아닌 OS 네이티브 데스크톱 창으로 띄웁니다.
-        if path == '/api/dashboard/launch':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                tab = 'agent'
-                content_length = int(self.headers.get('Content-Length', 0))
-                if content_length > 0:
-                    body = self.rfile.read(content_length).decode('utf-8')
-                    payload = json.loads(body or '{}')
-                    if isinstance(payload, dict):
-                        tab = str(payload.get('tab', 'agent')).strip().lower() or 'agent'
-
-                _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
-                if getattr(sys, 'frozen', False):
-                    # 배포(frozen) 모드: vibe-coding.exe 옆의 vibe-dashboard.exe 직접 실행
-                    exe_dir = Path(sys.executable).resolve().parent
-                    launch_exe = exe_dir / 'vibe-dashboard.exe'
-                    if not launch_exe.exists():
-                        raise RuntimeError(f'vibe-dashboard.exe 없음: {launch_exe}')
-                    subprocess.Popen(
-                        [str(launch_exe), str(HTTP_PORT), tab],
-                        creationflags=_no_window,
-                        close_fds=True,
-                    )
-                else:
-                    # 개발(dev) 모드: Python 스크립트 서브프로세스로 실행
-                    dashboard_script = BASE_DIR / 'dashboard_window.py'
-                    python_cmds = _python_runner_cmds()
-                    if not python_cmds:
-                        raise RuntimeError('Python interpreter not found for dashboard launch')
-                    subprocess.Popen(
-                        [python_cmds[0], str(dashboard_script), str(HTTP_PORT), tab],
-                        creationflags=_no_window,
-                        close_fds=True,
-                    )
-                self.wfile.write(json.dumps({"status": "launched", "tab": tab}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-            return
-
-        if path == '/api/kanban/launch':
-            # B안 통합: kanban_board.py(PySide6 네이티브) 제거 →
-            # dashboard_window.py + React TaskBoardPanel(?kanban=1)으로 일원화.
-            # 동일한 API(/api/orchestrator/skill-chain 등)를 통해 데이터 일관성 확보.
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
-                if getattr(sys, 'frozen', False):
-                    # 배포(frozen) 모드: vibe-dashboard.exe를 kanban 탭으로 실행
-                    exe_dir = Path(sys.executable).resolve().parent
-                    launch_exe = exe_dir / 'vibe-dashboard.exe'
-                    if not launch_exe.exists():
-                        raise RuntimeError(f'vibe-dashboard.exe 없음: {launch_exe}')
-                    subprocess.Popen(
-                        [str(launch_exe), str(HTTP_PORT), 'kanban'],
-                        creationflags=_no_window,
-                        close_fds=True,
-                    )
-                else:
-                    # 개발(dev) 모드: dashboard_window.py kanban 탭으로 실행
-                    dashboard_script = BASE_DIR / 'dashboard_window.py'
-                    python_cmds = _python_runner_cmds()
-                    if not python_cmds:
-                        raise RuntimeError('Python interpreter not found for kanban launch')
-                    subprocess.Popen(
-                        [python_cmds[0], str(dashboard_script), str(HTTP_PORT), 'kanban'],
-                        creationflags=_no_window,
-                        close_fds=True,
-                    )
-                self.wfile.write(json.dumps({"status": "launched"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-            return
-
-        # ── 지식 그래프 독립 창 실행 — PySide6 QWebEngineView (?graph=1 모드) ──
-        if path == '/api/graph/launch':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
-                if getattr(sys, 'frozen', False):
-                    # 배포(frozen) 모드: vibe-coding.exe 옆의 vibe-graph.exe 직접 실행
-                    exe_dir = Path(sys.executable).resolve().parent
-                    launch_exe = exe_dir / 'vibe-graph.exe'
-                    if not launch_exe.exists():
-                        raise RuntimeError(f'vibe-graph.exe 없음: {launch_exe}')
-                    subprocess.Popen(
-                        [str(launch_exe), str(HTTP_PORT)],
-                        creationflags=_no_window,
-                        close_fds=True,
-                    )
-                else:
-                    # 개발(dev) 모드: Python 스크립트 서브프로세스로 실행
-                    graph_script = BASE_DIR / 'knowledge_graph_window.py'
-                    python_cmds = _python_runner_cmds()
-                    if not python_cmds:
-                        raise RuntimeError('Python interpreter not found for graph launch')
-                    subprocess.Popen(
-                        [python_cmds[0], str(graph_script), str(HTTP_PORT)],
-                        creationflags=_no_window,
-                        close_fds=True,
-                    )
-                self.wfile.write(json.dumps({"status": "launched"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-            return
-
-        # ─── 신규: 사고 과정 로그 추가 (v5.0) ───
-        # ─── 신규: PostgreSQL 통합 로깅 API (v5.0) ───
-        if path == '/api/hive/log/pg':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                log_to_pg(
-                    agent=data.get('agent', 'unknown'),
-                    terminal_id=data.get('terminal_id', 'T0'),
-                    task=data.get('task', ''),
-                    status=data.get('status', 'success')
+                # 개발(dev) 모드: dashboard_window.py kanban 탭으로 실행
+                dashboard_script = BASE_DIR / 'dashboard_window.py'
+                python_cmds = _python_runner_cmds()
+                if not python_cmds:
+                    raise RuntimeError('Python interpreter not found for kanban launch')
+                subprocess.Popen(
+                    [python_cmds[0], str(dashboard_script), str(HTTP_PORT), 'kanban'],
+                    creationflags=_no_window,
+                    close_fds=True,
                 )
-                self.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-            return
+            send_json(self, {"status": "launched"})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-        if path == '/api/hive/thought/pg':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                # parent_id를 받아 지식 그래프 연결선 생성 지원
-                new_id = thought_to_pg(
-                    agent=data.get('agent', 'unknown'),
-                    skill=data.get('skill', 'general'),
-                    thought=data.get('thought', {}),
-                    parent_id=data.get('parent_id')
+    # ── 지식 그래프 독립 창 실행 — PySide6 QWebEngineView (?graph=1 모드) ──
+    @ROUTER.route('POST', '/api/graph/launch')
+    def _post_graph_launch(self, req):
+        try:
+            _no_window = getattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000)
+            if getattr(sys, 'frozen', False):
+                # 배포(frozen) 모드: vibe-coding.exe 옆의 vibe-graph.exe 직접 실행
+                exe_dir = Path(sys.executable).resolve().parent
+                launch_exe = exe_dir / 'vibe-graph.exe'
+                if not launch_exe.exists():
+                    raise RuntimeError(f'vibe-graph.exe 없음: {launch_exe}')
+                subprocess.Popen(
+                    [str(launch_exe), str(HTTP_PORT)],
+                    creationflags=_no_window,
+                    close_fds=True,
                 )
-                self.wfile.write(json.dumps({"status": "success", "id": new_id}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-            return
+            else:
+                # 개발(dev) 모드: Python 스크립트 서브프로세스로 실행
+                graph_script = BASE_DIR / 'knowledge_graph_window.py'
+                python_cmds = _python_runner_cmds()
+                if not python_cmds:
+                    raise RuntimeError('Python interpreter not found for graph launch')
+                subprocess.Popen(
+                    [python_cmds[0], str(graph_script), str(HTTP_PORT)],
+                    creationflags=_no_window,
+                    close_fds=True,
+                )
+            send_json(self, {"status": "launched"})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-        if path == '/api/thoughts/add':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-
-                # 데이터 유효성 검사 및 타임스탬프 추가
-                data['timestamp'] = datetime.now().isoformat()
-                THOUGHT_LOGS.append(data)
-                if len(THOUGHT_LOGS) > 100:
-                    THOUGHT_LOGS.pop(0)
-
-                # ── 실시간 SSE 브로드캐스트 ──────────────────────────────
-                msg = f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
-                disconnected = []
-                for client in list(THOUGHT_CLIENTS):
-                    try:
-                        client.connection.settimeout(1.0)
-                        client.wfile.write(msg.encode('utf-8'))
-                        client.wfile.flush()
-                    except Exception:
-                        disconnected.append(client)
-                for client in disconnected:
-                    THOUGHT_CLIENTS.discard(client)
+    # ─── 신규: 사고 과정 로그 추가 (v5.0) ───
+    # ─── 신규: PostgreSQL 통합 로깅 API (v5.0) ───
+    @ROUTER.route('POST', '/api/hive/log/pg')
+    def _post_hive_log_pg(self, req):
+        # write-behind 큐에 적재 후 즉시 응답. 큐 포화 시 503 → 호출측(hive_bridge)이 psql 폴백
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            queued = log_to_pg(
+                agent=data.get('agent', 'unknown'),
+                terminal_id=data.get('terminal_id', 'T0'),
+                task=data.get('task', ''),
+                status=data.get('status', 'success')
+            )
+            code, result = (200, {"status": "success"}) if queued else \
+                (503, {"status": "error", "message": "pg_logs write queue full"})
+        except Exception as e:
+            code, result = 200, {"status": "error", "message": str(e)}
+        send_json(self, result, code)
 
-                # ── 벡터 DB에 영구 저장 ──────────────────────────────────
-                try:
-                    agent   = data.get('agent', 'unknown')
-                    thought = data.get('thought', '')
-                    level   = data.get('level', 'info')
-                    tool    = data.get('tool', '')
-                    step    = data.get('step', '')
-                    ts_ms   = str(int(time.time() * 1000))
-
-                    key     = f"thought:{agent}:{ts_ms}"
-                    title   = f"[{level}] {thought[:80]}"
-                    content = thought
-                    if tool:  content += f"\n🔧 tool: {tool}"
-                    if step:  content += f"\n📍 step: {step}"
-
-                    tags = ['thought', level, agent]
-                    set_memory(
-                        key=key,
-                        title=title,
-                        content=content,
-                        tags=tags,
-                        author=agent,
-                        project=PROJECT_ID,
-                        created_at=data['timestamp'],
-                        updated_at=data['timestamp'],
-                    )
+    @ROUTER.route('POST', '/api/hive/thought/pg')
+    def _post_hive_thought_pg(self, req):
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            # parent_id를 받아 지식 그래프 연결선 생성 지원
+            new_id = thought_to_pg(
+                agent=data.get('agent', 'unknown'),
+                skill=data.get('skill', 'general'),
+                thought=data.get('thought', {}),
+                parent_id=data.get('parent_id')
+            )
+            code, result = (200, {"status": "success", "id": new_id}) if new_id else \
+                (503, {"status": "error", "message": "pg_thoughts write unavailable"})
+        except Exception as e:
+            code, result = 200, {"status": "error", "message": str(e)}
+        send_json(self, result, code)
 
-                    print(f"🧠 [Thought→DB] {key}")
-                except Exception as db_err:
-                    print(f"[Thought→DB] 저장 실패 (무시): {db_err}")
-                # ─────────────────────────────────────────────────────────
+    @ROUTER.route('POST', '/api/thoughts/add')
+    def _post_thoughts_add(self, req):
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
 
-                print(f"🧠 [Thought Trace] New thought captured: {data.get('thought', '')[:50]}...")
-                self.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
-            except Exception as e:
-                print(f"[Error] /api/thoughts/add failed: {e}")
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-            return
+            # 데이터 유효성 검사 및 타임스탬프 추가
+            data['timestamp'] = datetime.now().isoformat()
+            THOUGHT_LOGS.append(data)
+            if len(THOUGHT_LOGS) > 100:
+                THOUGHT_LOGS.pop(0)
 
-        if parsed_path.path == '/api/save-file':
-            # [파일 저장] 프론트엔드 VibeEditor/App.tsx 에서 POST로 호출
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                raw_path = data.get('path')
-                content = data.get('content', '')
-                
-                if not raw_path:
-                    self.wfile.write(json.dumps({"status": "error", "message": "Path is required"}).encode('utf-8'))
-                    return
-                
-                target_path = Path(raw_path).resolve()
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                print(f"💾 [File Saved] {target_path}")
-                self.wfile.write(json.dumps({"status": "success", "path": str(target_path)}).encode('utf-8'))
-            except Exception as e:
-                print(f"❌ [Save Error] {e}")
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-
-        elif parsed_path.path == '/api/file-rename':
-            # [이름 변경] src -> dest
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                src = data.get('src')
-                dest = data.get('dest')
-                if not src or not dest:
-                    self.wfile.write(json.dumps({"status": "error", "message": "src and dest are required"}).encode('utf-8'))
-                    return
-                # 경로 정규화 및 이름 변경
-                os.rename(Path(src), Path(dest))
-                self.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
+            # ── 실시간 SSE 브로드캐스트 (구독자 링에 넣고 즉시 반환) ──
+            EVENT_BUS.publish_json('thoughts', data)
 
-        elif parsed_path.path == '/api/files/create':
-            # [생성] path, is_dir
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            # ── 벡터 DB에 영구 저장 ──────────────────────────────────
             try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                target_path = data.get('path')
-                is_dir = data.get('is_dir', False)
-                
-                if not target_path:
-                    self.wfile.write(json.dumps({"status": "error", "message": "Path is required"}).encode('utf-8'))
-                    return
-                
-                p = Path(target_path)
-                if is_dir:
-                    p.mkdir(parents=True, exist_ok=True)
-                else:
-                    p.parent.mkdir(parents=True, exist_ok=True)
-                    if not p.exists():
-                        p.write_text("", encoding="utf-8")
-                
-                self.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
+                agent   = data.get('agent', 'unknown')
+                thought = data.get('thought', '')
+                level   = data.get('level', 'info')
+                tool    = data.get('tool', '')
+                step    = data.get('step', '')
+                ts_ms   = str(int(time.time() * 1000))
+
+                key     = f"thought:{agent}:{ts_ms}"
+                title   = f"[{level}] {thought[:80]}"
+                content = thought
+                if tool:  content += f"\n🔧 tool: {tool}"
+                if step:  content += f"\n📍 step: {step}"
+
+                tags = ['thought', level, agent]
+                set_memory(
+                    key=key,
+                    title=title,
+                    content=content,
+                    tags=tags,
+                    author=agent,
+                    project=PROJECT_ID,
+                    created_at=data['timestamp'],
+                    updated_at=data['timestamp'],
+                )
 
-        elif parsed_path.path == '/api/files/delete':
-            # [삭제] path
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                target_path = data.get('path')
-                
-                if not target_path or not os.path.exists(target_path):
-                    self.wfile.write(json.dumps({"status": "error", "message": "Path not found"}).encode('utf-8'))
-                    return
-                
-                if os.path.isdir(target_path):
-                    shutil.rmtree(target_path)
-                else:
-                    os.remove(target_path)
-                
-                self.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
+                print(f"🧠 [Thought→DB] {key}")
+            except Exception as db_err:
+                print(f"[Thought→DB] 저장 실패 (무시): {db_err}")
+            # ─────────────────────────────────────────────────────────
 
-        elif parsed_path.path == '/api/apply-update':
-            # [업데이트 적용] — 응답 전송 후 비동기로 exe 교체 실행
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            print(f"🧠 [Thought Trace] New thought captured: {data.get('thought', '')[:50]}...")
+            result = {"status": "success"}
+        except Exception as e:
+            print(f"[Error] /api/thoughts/add failed: {e}")
+            result = {"status": "error", "message": str(e)}
+        send_json(self, result)
 
-            update_file = DATA_DIR / "update_ready.json"
-            if not update_file.exists():
-                self.wfile.write(json.dumps({"success": False, "error": "No update ready"}).encode('utf-8'))
-                self.wfile.flush()
+    @ROUTER.route('POST', '/api/save-file')
+    def _post_save_file(self, req):
+        # [파일 저장] 프론트엔드 VibeEditor/App.tsx 에서 POST로 호출
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            raw_path = data.get('path')
+            content = data.get('content', '')
+            
+            if not raw_path:
+                send_json(self, {"status": "error", "message": "Path is required"})
                 return
+            
+            target_path = Path(raw_path).resolve()
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(target_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            
+            print(f"💾 [File Saved] {target_path}")
+            send_json(self, {"status": "success", "path": str(target_path)})
+        except Exception as e:
+            print(f"❌ [Save Error] {e}")
+            send_json(self, {"status": "error", "message": str(e)})
 
-            try:
-                with open(update_file, "r", encoding="utf-8") as f:
-                    update_data = json.load(f)
-
-                exe_path = update_data.get("exe_path")
-                if not exe_path or not os.path.exists(exe_path):
-                    self.wfile.write(json.dumps({"success": False, "error": "New executable not found", "path": exe_path}).encode('utf-8'))
-                    self.wfile.flush()
-                    return
-
-                # 응답을 먼저 완전히 전송 — os._exit() 전에 클라이언트가 수신하도록 보장
-                self.wfile.write(json.dumps({"success": True}).encode('utf-8'))
-                self.wfile.flush()
-                try:
-                    update_file.unlink()
-                except OSError: pass
-
-                from updater import apply_update_from_temp
-                _exe = Path(exe_path)
-
-                def _do_apply():
-                    """응답 전송 완료 후 실행되는 업데이트 스레드.
-                    오류 발생 시 update_error.json에 기록 — UI가 폴링으로 확인 가능.
-                    """
-                    # 소켓 버퍼 플러시 대기 (0.3s) — 응답이 클라이언트에 도달할 시간 확보
-                    time.sleep(0.3)
-                    try:
-                        apply_update_from_temp(_exe)
-                    except Exception as ex:
-                        print(f"[!] apply_update_from_temp 실패: {ex}")
-                        # 실패 시 update_ready.json 복원 — UI에 버튼 다시 표시
-                        try:
-                            _update_info = {"ready": True, "downloading": False,
-                                            "version": _exe.stem, "exe_path": str(_exe),
-                                            "error": str(ex)}
-                            with open(DATA_DIR / "update_ready.json", "w", encoding="utf-8") as ef:
-                                json.dump(_update_info, ef)
-                        except OSError:
-                            pass
-
-                # daemon=False: 메인 프로세스가 종료되어도 업데이트 스레드는 완료까지 실행
-                threading.Thread(target=_do_apply, daemon=False).start()
-            except Exception as e:
-                self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode('utf-8'))
-                self.wfile.flush()
-
-        elif parsed_path.path == '/api/agents/heartbeat':
-            # 에이전트 실시간 상태 보고 수신
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                agent_name = data.get('agent')
-                if not agent_name:
-                    self.wfile.write(json.dumps({"status": "error", "message": "Agent name is required"}).encode('utf-8'))
-                    return
-                
-                with AGENT_STATUS_LOCK:
-                    AGENT_STATUS[agent_name] = {
-                        "status": data.get("status", "active"),
-                        "task": data.get("task"),
-                        "last_seen": time.time()
-                    }
-                self.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/trigger-update-check':
-            # 업데이트 확인 트리거 — do_GET과 동일 로직 (프론트엔드가 POST로 호출)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            if not getattr(sys, 'frozen', False):
-                self.wfile.write(json.dumps({"started": False, "reason": "dev build"}).encode('utf-8'))
-            else:
-                try:
-                    from updater import check_and_update
-                    threading.Thread(target=check_and_update, args=(DATA_DIR,), daemon=True).start()
-                    self.wfile.write(json.dumps({"started": True}).encode('utf-8'))
-                except Exception as e:
-                    self.wfile.write(json.dumps({"started": False, "reason": str(e)}).encode('utf-8'))
+    @ROUTER.route('POST', '/api/file-rename')
+    def _post_file_rename(self, req):
+        # [이름 변경] src -> dest
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            src = data.get('src')
+            dest = data.get('dest')
+            if not src or not dest:
+                send_json(self, {"status": "error", "message": "src and dest are required"})
+                return
+            # 경로 정규화 및 이름 변경
+            os.rename(Path(src), Path(dest))
+            send_json(self, {"status": "success"})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-        elif parsed_path.path == '/api/git/rollback':
-            # 특정 파일 변경사항 원상복구 (git checkout -- 파일)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                file_path = data.get('file')
-                git_dir = data.get('path', str(BASE_DIR.parent))
-                
-                if not file_path:
-                    self.wfile.write(json.dumps({"status": "error", "message": "File path required"}).encode('utf-8'))
-                    return
-                
-                # git checkout -- "파일명" 실행
-                result = subprocess.run(
-                    ['git', 'checkout', '--', file_path],
-                    cwd=git_dir, capture_output=True, text=True, timeout=10, encoding='utf-8',
-                    creationflags=0x08000000
-                )
-                
-                if result.returncode == 0:
-                    self.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({"status": "error", "message": result.stderr.strip()}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/git/diff':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            query = parse_qs(parsed_path.query)
-            target_file = query.get('path', [''])[0]
-            git_dir = query.get('git_path', [str(BASE_DIR.parent)])[0]
-            
-            try:
-                # git diff "파일명" 실행
-                result = subprocess.run(
-                    ['git', 'diff', '--', target_file],
-                    cwd=git_dir, capture_output=True, text=True, timeout=5, encoding='utf-8',
-                    creationflags=0x08000000
-                )
-                self.wfile.write(json.dumps({"diff": result.stdout}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/projects':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                data = json.loads(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
-                new_path = data.get('path', '').strip().replace('\\', '/')
-                if not new_path:
-                    self.wfile.write(json.dumps({"error": "Invalid path"}).encode('utf-8'))
-                    return
-                
-                projects = []
-                if PROJECTS_FILE.exists():
-                    with open(PROJECTS_FILE, 'r', encoding='utf-8') as f:
-                        projects = json.load(f)
-                
-                if new_path in projects:
-                    projects.remove(new_path)
-                projects.insert(0, new_path) # 최신 프로젝트를 위로
-                projects = projects[:20] # 최대 20개 저장
-                with open(PROJECTS_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(projects, f, ensure_ascii=False, indent=2)
-                
-                self.wfile.write(json.dumps({"status": "success", "projects": projects}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-
-        # ── [모듈 위임 - POST] hive_api ──────────────────────────────────
-        # /api/hive/approve-skill, /api/orchestrator/skill-chain/update,
-        # /api/orchestrator/run, /api/superpowers/install|uninstall
-        elif (parsed_path.path.startswith('/api/hive/') or
-              parsed_path.path.startswith('/api/orchestrator/') or
-              parsed_path.path.startswith('/api/superpowers/')):
-            from api import hive_api
-            content_length = int(self.headers.get('Content-Length', 0))
-            _body = json.loads(self.rfile.read(content_length).decode('utf-8')) if content_length else {}
-            hive_api.handle_post(
-                self, parsed_path.path, _body,
-                DATA_DIR=DATA_DIR, SCRIPTS_DIR=SCRIPTS_DIR, BASE_DIR=BASE_DIR,
-                PROJECT_ROOT=PROJECT_ROOT,
-                _current_project_root=_current_project_root,
-            )
+    @ROUTER.route('POST', '/api/files/create')
+    def _post_files_create(self, req):
+        # [생성] path, is_dir
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            target_path = data.get('path')
+            is_dir = data.get('is_dir', False)
+            
+            if not target_path:
+                send_json(self, {"status": "error", "message": "Path is required"})
+                return
+            
+            p = Path(target_path)
+            if is_dir:
+                p.mkdir(parents=True, exist_ok=True)
+            else:
+                p.parent.mkdir(parents=True, exist_ok=True)
+                if not p.exists():
+                    p.write_text("", encoding="utf-8")
+            
+            send_json(self, {"status": "success"})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-        # ── [모듈 위임 - POST] git_api ────────────────────────────────────
-        # /api/git/rollback, /api/git/diff (쿼리스트링 방식)
-        elif parsed_path.path.startswith('/api/git/'):
-            from api import git_api
-            from urllib.parse import parse_qs as _parse_qs
-            # /api/git/diff는 query string 방식이므로 query dict를 data로 전달
-            _qs = _parse_qs(parsed_path.query)
-            if parsed_path.path == '/api/git/diff':
-                git_api.handle_post(self, parsed_path.path, _qs, BASE_DIR=BASE_DIR)
+    @ROUTER.route('POST', '/api/files/delete')
+    def _post_files_delete(self, req):
+        # [삭제] path
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            target_path = data.get('path')
+            
+            if not target_path or not os.path.exists(target_path):
+                send_json(self, {"status": "error", "message": "Path not found"})
+                return
+            
+            if os.path.isdir(target_path):
+                shutil.rmtree(target_path)
             else:
-                content_length = int(self.headers.get('Content-Length', 0))
-                _body = json.loads(self.rfile.read(content_length).decode('utf-8')) if content_length else {}
-                git_api.handle_post(self, parsed_path.path, _body, BASE_DIR=BASE_DIR)
-
-        # ── [모듈 위임 - POST] mcp_api ────────────────────────────────────
-        # /api/mcp/apikey, /api/mcp/install, /api/mcp/uninstall, /api/mcp/rpc
-        elif parsed_path.path.startswith('/api/mcp/'):
-            from api import mcp_api
-            content_length = int(self.headers.get('Content-Length', 0))
-            _body = json.loads(self.rfile.read(content_length).decode('utf-8')) if content_length else {}
-            mcp_api.handle_post(
-                self, parsed_path.path, _body,
-                _smithery_api_key_setter=_SMITHERY_CFG,
-                _mcp_config_path=_mcp_config_path,
-                DATA_DIR=DATA_DIR
-            )
+                os.remove(target_path)
+            
+            send_json(self, {"status": "success"})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-        # ── [모듈 위임 - POST] agent_api — /api/agent/run, /api/agent/stop ─
-        elif parsed_path.path.startswith('/api/agent/'):
-            agent_api.handle_post(self, parsed_path.path)
-        elif parsed_path.path.startswith('/api/pty/'):
-            pty_api.handle_post(self, parsed_path.path)
+    @ROUTER.route('POST', '/api/apply-update')
+    def _post_apply_update(self, req):
+        # [업데이트 적용] — 응답 전송 후 비동기로 exe 교체 실행
 
-        # ── [모듈 위임 - POST] memory_api ────────────────────────────────
-        # /api/memory/set, /api/memory/delete
-        elif parsed_path.path.startswith('/api/memory/'):
-            from api import memory_api
-            content_length = int(self.headers.get('Content-Length', 0))
-            _body = json.loads(self.rfile.read(content_length).decode('utf-8')) if content_length else {}
-            memory_api.handle_post(
-                self, parsed_path.path, _body,
-                DATA_DIR=DATA_DIR, PROJECT_ID=PROJECT_ID,
-                _memory_conn=_memory_conn, _embed=_embed,
-            )
+        update_file = DATA_DIR / "update_ready.json"
+        if not update_file.exists():
+            send_json(self, {"success": False, "error": "No update ready"})
+            self.wfile.flush()
+            return
 
-        elif parsed_path.path == '/api/hive/approve-skill':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                skill_name = data.get('skill_name')
-                keyword = data.get('keyword', skill_name)
-                
-                if not skill_name:
-                    self.wfile.write(json.dumps({"status": "error", "message": "Skill name is required"}).encode('utf-8'))
-                    return
+        try:
+            with open(update_file, "r", encoding="utf-8") as f:
+                update_data = json.load(f)
 
-                skill_dir = PROJECT_ROOT / ".gemini" / "skills" / skill_name
-                skill_dir.mkdir(parents=True, exist_ok=True)
-                
-                skill_file = skill_dir / "SKILL.md"
-                template = f"""# 🧠 스킬: {skill_name}
-
-이 스킬은 '{keyword}' 관련 작업을 최적화하기 위해 자동으로 제안된 스킬입니다.
-
-## 🏁 사용 시점
-- '{keyword}' 키워드가 포함된 작업 요청 시
-- 반복적인 {keyword} 관련 파일 수정이 필요할 때
-
-## 🛠️ 핵심 패턴
-1. 관련 파일 분석
-2. {keyword} 표준 가이드라인 적용
-3. 변경 사항 검증
-
----
-**생성일**: {datetime.now().strftime("%Y-%m-%d")}
-**상태**: 초안 (Draft)
-"""
-                with open(skill_file, "w", encoding="utf-8") as f:
-                    f.write(template)
-                
-                self.wfile.write(json.dumps({"status": "success", "path": str(skill_file)}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/config/update':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            exe_path = update_data.get("exe_path")
+            if not exe_path or not os.path.exists(exe_path):
+                send_json(self, {"success": False, "error": "New executable not found", "path": exe_path})
+                self.wfile.flush()
+                return
+
+            # 응답을 먼저 완전히 전송 — os._exit() 전에 클라이언트가 수신하도록 보장
+            send_json(self, {"success": True})
+            self.wfile.flush()
             try:
-                content_length = int(self.headers['Content-Length'])
-                data = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                config = {}
-                if CONFIG_FILE.exists():
-                    try:
-                        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                            config = json.load(f)
-                    except: pass
-                config.update(data)
-                with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, ensure_ascii=False, indent=2)
-
-                # last_path 변경 시 projects.json에도 동기화 → 다음 서버 시작 시 PROJECT_ROOT 정확히 설정
-                # 배포 버전에서 프로젝트 전환 후 재시작해도 올바른 PROJECT_ROOT를 사용하기 위함
-                if 'last_path' in data and data['last_path']:
+                update_file.unlink()
+            except OSError: pass
+
+            from updater import apply_update_from_temp
+            _exe = Path(exe_path)
+
+            def _do_apply():
+                """응답 전송 완료 후 실행되는 업데이트 스레드.
+                오류 발생 시 update_error.json에 기록 — UI가 폴링으로 확인 가능.
+                """
+                # 소켓 버퍼 플러시 대기 (0.3s) — 응답이 클라이언트에 도달할 시간 확보
+                time.sleep(0.3)
+                try:
+                    apply_update_from_temp(_exe)
+                except Exception as ex:
+                    print(f"[!] apply_update_from_temp 실패: {ex}")
+                    # 실패 시 update_ready.json 복원 — UI에 버튼 다시 표시
                     try:
-                        _lp = str(data['last_path']).replace('\\', '/')
-                        _projs = []
-                        if PROJECTS_FILE.exists():
-                            _projs = json.loads(PROJECTS_FILE.read_text(encoding='utf-8'))
-                        if _lp in _projs:
-                            _projs.remove(_lp)
-                        _projs.insert(0, _lp)  # 가장 최근 경로를 0번으로
-                        PROJECTS_FILE.write_text(
-                            json.dumps(_projs[:20], ensure_ascii=False, indent=2),
-                            encoding='utf-8'
-                        )
-                    except Exception:
+                        _update_info = {"ready": True, "downloading": False,
+                                        "version": _exe.stem, "exe_path": str(_exe),
+                                        "error": str(ex)}
+                        with open(DATA_DIR / "update_ready.json", "w", encoding="utf-8") as ef:
+                            json.dump(_update_info, ef)
+                    except OSError:
                         pass
 
-                self.wfile.write(json.dumps({"status": "success"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
+            # daemon=False: 메인 프로세스가 종료되어도 업데이트 스레드는 완료까지 실행
+            threading.Thread(target=_do_apply, daemon=False).start()
+        except Exception as e:
+            send_json(self, {"success": False, "error": str(e)})
+            self.wfile.flush()
 
-        elif parsed_path.path == '/api/select-folder':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                import webview
-                # main_window가 활성화된 상태에서만 다이얼로그 가능
-                if main_window:
-                    selected = main_window.create_file_dialog(webview.FOLDER_DIALOG)
-                    if selected and len(selected) > 0:
-                        path = selected[0].replace('\\', '/')
-                        # 선택된 경로를 설정에도 즉시 저장
-                        config = {}
-                        if CONFIG_FILE.exists():
-                            try:
-                                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                                    config = json.load(f)
-                            except: pass
-                        config['last_path'] = path
-                        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                            json.dump(config, f, ensure_ascii=False, indent=2)
-                        self.wfile.write(json.dumps({"status": "success", "path": path}).encode('utf-8'))
-                    else:
-                        self.wfile.write(json.dumps({"status": "cancelled"}).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({"status": "error", "message": "Window not ready"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
+    @ROUTER.route('POST', '/api/agents/heartbeat')
+    def _post_agents_heartbeat(self, req):
+        # 에이전트 실시간 상태 보고 수신
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            agent_name = data.get('agent')
+            if not agent_name:
+                send_json(self, {"status": "error", "message": "Agent name is required"})
+                return
+            
+            with AGENT_STATUS_LOCK:
+                AGENT_STATUS[agent_name] = {
+                    "status": data.get("status", "active"),
+                    "task": data.get("task"),
+                    "last_seen": time.time()
+                }
+            send_json(self, {"status": "success"})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-        elif parsed_path.path == '/api/launch':
-            try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
-                
-                agent = data.get('agent')
-                target_dir = data.get('path', 'C:\\')
-                is_yolo = data.get('yolo', False)
-                
-                if agent == 'claude':
-                    yolo_flag = " --dangerously-skip-permissions" if is_yolo else ""
-                    cmd = f'start "Claude Code" cmd.exe /k "cd /d {target_dir} && title [Claude Code] && echo Launching Claude Code... && claude{yolo_flag}"'
-                elif agent == 'gemini':
-                    yolo_flag = " --yolo" if is_yolo else ""
-                    cmd = f'start "Gemini CLI" cmd.exe /k "cd /d {target_dir} && title [Gemini CLI] && echo Launching Gemini CLI... && gemini{yolo_flag}"'
-                elif agent == 'codex':
-                    yolo_flag = " --dangerously-bypass-approvals-and-sandbox" if is_yolo else ""
-                    model_name = _codex_main_model()
-                    model_flag = f' --model {model_name}' if model_name else ""
-                    cmd = f'start "Codex CLI" cmd.exe /k "cd /d {target_dir} && title [Codex CLI] && echo Launching Codex CLI... && codex{yolo_flag}{model_flag}"'
-                else:
-                    cmd = f'start "Terminal" cmd.exe /k "cd /d {target_dir}"'
-                
-                subprocess.Popen(cmd, shell=True)
-                
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json;charset=utf-8')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({"status": "launched", "agent": agent}).encode('utf-8'))
-            except Exception as e:
-                self.send_response(500)
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/send-command':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
-                
-                target_slot = str(data.get('target'))
-                command = data.get('command', '')
-                
-                if target_slot in pty_sessions:
-                    pty = pty_sessions[target_slot]['pty']
-                    # 명령어 중간의 \n을 \r\n으로 치환하고 끝에 개행이 없으면 추가하여 즉시 실행 유도
-                    processed_cmd = command.replace('\r\n', '\r').replace('\n', '\r')
-                    final_cmd = processed_cmd if processed_cmd.endswith('\r') else processed_cmd + '\r'
-                    pty.write(final_cmd)
-                    self.wfile.write(json.dumps({"status": "success", "message": f"Command sent to Terminal {target_slot}"}).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({"status": "error", "message": f"Terminal {target_slot} is not running."}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/locks':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+    @ROUTER.route('POST', '/api/trigger-update-check')
+    def _post_trigger_update_check(self, req):
+        # 업데이트 확인 트리거 — do_GET과 동일 로직 (프론트엔드가 POST로 호출)
+        if not getattr(sys, 'frozen', False):
+            send_json(self, {"started": False, "reason": "dev build"})
+        else:
             try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
-                
-                file_path = data.get('file')
-                agent = data.get('agent', 'Unknown')
-                action = data.get('action', 'lock') # 'lock' or 'unlock'
-                
-                with open(LOCKS_FILE, 'r', encoding='utf-8') as f:
-                    locks = json.load(f)
-                
-                if action == 'lock':
-                    if file_path in locks and locks[file_path] != agent:
-                        self.wfile.write(json.dumps({"status": "conflict", "owner": locks[file_path]}).encode('utf-8'))
-                        return
-                    locks[file_path] = agent
-                    log_msg = f"Locked file: {file_path}"
-                elif action == 'unlock':
-                    if file_path in locks:
-                        del locks[file_path]
-                        log_msg = f"Unlocked file: {file_path}"
-                    else:
-                        log_msg = None
-                
-                with open(LOCKS_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(locks, f, ensure_ascii=False, indent=2)
-                
-                # 하이브 로그에 기록
-                if log_msg:
-                    try:
-                        sys.path.append(str(BASE_DIR))
-                        from src.secure import mask_sensitive_data
-                        from src.db_helper import insert_log
-                        safe_msg = mask_sensitive_data(log_msg)
-                        
-                        insert_log(
-                            session_id=f"lock_{int(time.time())}_{agent}",
-                            terminal_id="LOCK_API",
-                            agent=agent,
-                            trigger_msg=safe_msg,
-                            project="hive",
-                            status="success"
-                        )
-                    except Exception as e:
-                        print(f"Error logging lock to session_logs: {e}")
-                
-                self.wfile.write(json.dumps({"status": "success", "locks": locks}).encode('utf-8'))
+                from updater import check_and_update
+                threading.Thread(target=check_and_update, args=(DATA_DIR,), daemon=True).start()
+                send_json(self, {"started": True})
             except Exception as e:
-                self.wfile.write(json.dumps({"status": "error", "message": str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/message':
-            # 에이전트 간 메시지 전송 (SQLite 기반)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
-
-                # 메시지 객체 생성 (ID: 밀리초 타임스탬프)
-                msg = {
-                    'id': str(int(time.time() * 1000)),
-                    'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
-                    'from': str(data.get('from', 'unknown')),
-                    'to': str(data.get('to', 'all')),
-                    'type': str(data.get('type', 'info')),
-                    'content': str(data.get('content', '')),
-                    'read': False,
-                }
+                send_json(self, {"started": False, "reason": str(e)})
 
-                # SQLite 에 삽입
-                send_message(msg['id'], msg['from'], msg['to'], msg['type'], msg['content'])
+    @ROUTER.route('POST', '/api/git/rollback')
+    def _post_git_rollback(self, req):
+        # 특정 파일 변경사항 원상복구 (git checkout -- 파일)
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            file_path = data.get('file')
+            git_dir = data.get('path', str(BASE_DIR.parent))
+            
+            if not file_path:
+                send_json(self, {"status": "error", "message": "File path required"})
+                return
+            
+            # git checkout -- "파일명" 실행
+            result = subprocess.run(
+                ['git', 'checkout', '--', file_path],
+                cwd=git_dir, capture_output=True, text=True, timeout=10, encoding='utf-8',
+                creationflags=0x08000000
+            )
+            
+            if result.returncode == 0:
+                send_json(self, {"status": "success"})
+            else:
+                send_json(self, {"status": "error", "message": result.stderr.strip()})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
+
+    @ROUTER.route('POST', '/api/git/diff')
+    def _post_git_diff(self, req):
+        parsed_path = req.parsed
+        query = parse_qs(parsed_path.query)
+        target_file = query.get('path', [''])[0]
+        git_dir = query.get('git_path', [str(BASE_DIR.parent)])[0]
+        
+        try:
+            # git diff "파일명" 실행
+            result = subprocess.run(
+                ['git', 'diff', '--', target_file],
+                cwd=git_dir, capture_output=True, text=True, timeout=5, encoding='utf-8',
+                creationflags=0x08000000
+            )
+            send_json(self, {"diff": result.stdout})
+        except Exception as e:
+            send_json(self, {"error": str(e)})
 
-                # 활성화된 모든 PTY 세션에 메시지 전송 (터미널 화면에 출력)
-                # 터미널은 \r\n (CRLF)을 필요로 하므로 변환하여 전송합니다.
-                content_to_send = msg['content']
-                content_display = content_to_send.replace('\n', '\r\n')
-                terminal_msg = f"\r\n\x1b[38;5;39m[{msg['from']} \u2192 {msg['to']}] {content_display}\x1b[0m\r\n"
-                
-                # [개선] 메시지가 '>'로 시작하면 명령어로 간주하여 즉시 실행 유도
-                is_manual_cmd = content_to_send.startswith('>')
-                if is_manual_cmd:
-                    cmd_to_exec = content_to_send[1:].strip() + '\r\n'
+    @ROUTER.route('POST', '/api/projects')
+    def _post_projects(self, req):
+        try:
+            data = json.loads(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+            new_path = data.get('path', '').strip().replace('\\', '/')
+            if not new_path:
+                send_json(self, {"error": "Invalid path"})
+                return
+            
+            projects = []
+            if PROJECTS_FILE.exists():
+                with open(PROJECTS_FILE, 'r', encoding='utf-8') as f:
+                    projects = json.load(f)
+            
+            if new_path in projects:
+                projects.remove(new_path)
+            projects.insert(0, new_path) # 최신 프로젝트를 위로
+            projects = projects[:20] # 최대 20개 저장
+            with open(PROJECTS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(projects, f, ensure_ascii=False, indent=2)
+            
+            send_json(self, {"status": "success", "projects": projects})
+        except Exception as e:
+            send_json(self, {"error": str(e)})
+
+    @ROUTER.route('POST', '/api/config/update')
+    def _post_config_update(self, req):
+        try:
+            content_length = int(self.headers['Content-Length'])
+            data = json.loads(self.rfile.read(content_length).decode('utf-8'))
+            config = {}
+            if CONFIG_FILE.exists():
+                try:
+                    with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                        config = json.load(f)
+                except: pass
+            config.update(data)
+            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+                json.dump(config, f, ensure_ascii=False, indent=2)
+
+            # last_path 변경 시 projects.json에도 동기화 → 다음 서버 시작 시 PROJECT_ROOT 정확히 설정
+            # 배포 버전에서 프로젝트 전환 후 재시작해도 올바른 PROJECT_ROOT를 사용하기 위함
+            if 'last_path' in data and data['last_path']:
+                try:
+                    _lp = str(data['last_path']).replace('\\', '/')
+                    _projs = []
+                    if PROJECTS_FILE.exists():
+                        _projs = json.loads(PROJECTS_FILE.read_text(encoding='utf-8'))
+                    if _lp in _projs:
+                        _projs.remove(_lp)
+                    _projs.insert(0, _lp)  # 가장 최근 경로를 0번으로
+                    PROJECTS_FILE.write_text(
+                        json.dumps(_projs[:20], ensure_ascii=False, indent=2),
+                        encoding='utf-8'
+                    )
+                except Exception:
+                    pass
+
+            send_json(self, {"status": "success"})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
+
+    @ROUTER.route('POST', '/api/select-folder')
+    def _post_select_folder(self, req):
+        try:
+            import webview
+            # main_window가 활성화된 상태에서만 다이얼로그 가능
+            if main_window:
+                selected = main_window.create_file_dialog(webview.FOLDER_DIALOG)
+                if selected and len(selected) > 0:
+                    path = selected[0].replace('\\', '/')
+                    # 선택된 경로를 설정에도 즉시 저장
+                    config = {}
+                    if CONFIG_FILE.exists():
+                        try:
+                            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                                config = json.load(f)
+                        except: pass
+                    config['last_path'] = path
+                    with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+                        json.dump(config, f, ensure_ascii=False, indent=2)
+                    send_json(self, {"status": "success", "path": path})
                 else:
-                    cmd_to_exec = None
+                    send_json(self, {"status": "cancelled"})
+            else:
+                send_json(self, {"status": "error", "message": "Window not ready"})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-                for info in pty_sessions.values():
-                    try:
-                        pty = info['pty']
-                        if is_manual_cmd:
-                            pty.write(cmd_to_exec)
-                        else:
-                            pty.write(terminal_msg)
-                    except:
-                        pass
+    @ROUTER.route('POST', '/api/launch')
+    def _post_launch(self, req):
+        try:
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+            data = json.loads(post_data.decode('utf-8'))
+            
+            agent = data.get('agent')
+            target_dir = data.get('path', 'C:\\')
+            is_yolo = data.get('yolo', False)
+            
+            if agent == 'claude':
+                yolo_flag = " --dangerously-skip-permissions" if is_yolo else ""
+                cmd = f'start "Claude Code" cmd.exe /k "cd /d {target_dir} && title [Claude Code] && echo Launching Claude Code... && claude{yolo_flag}"'
+            elif agent == 'gemini':
+                yolo_flag = " --yolo" if is_yolo else ""
+                cmd = f'start "Gemini CLI" cmd.exe /k "cd /d {target_dir} && title [Gemini CLI] && echo Launching Gemini CLI... && gemini{yolo_flag}"'
+            elif agent == 'codex':
+                yolo_flag = " --dangerously-bypass-approvals-and-sandbox" if is_yolo else ""
+                model_name = _codex_main_model()
+                model_flag = f' --model {model_name}' if model_name else ""
+                cmd = f'start "Codex CLI" cmd.exe /k "cd /d {target_dir} && title [Codex CLI] && echo Launching Codex CLI... && codex{yolo_flag}{model_flag}"'
+            else:
+                cmd = f'start "Terminal" cmd.exe /k "cd /d {target_dir}"'
+            
+            subprocess.Popen(cmd, shell=True)
+            
+            send_json(self, {"status": "launched", "agent": agent})
+        except Exception as e:
+            send_json(self, {"error": str(e)}, 500)
+
+    @ROUTER.route('POST', '/api/send-command')
+    def _post_send_command(self, req):
+        try:
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+            data = json.loads(post_data.decode('utf-8'))
+            
+            target_slot = str(data.get('target'))
+            command = data.get('command', '')
+            
+            if target_slot in pty_sessions:
+                pty = pty_sessions[target_slot]['pty']
+                # 명령어 중간의 \n을 \r\n으로 치환하고 끝에 개행이 없으면 추가하여 즉시 실행 유도
+                processed_cmd = command.replace('\r\n', '\r').replace('\n', '\r')
+                final_cmd = processed_cmd if processed_cmd.endswith('\r') else processed_cmd + '\r'
+                pty.write(final_cmd)
+                send_json(self, {"status": "success", "message": f"Command sent to Terminal {target_slot}"})
+            else:
+                send_json(self, {"status": "error", "message": f"Terminal {target_slot} is not running."})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-                # SSE 스트림 (session_logs 테이블) 에도 알림 기록하여 로그 뷰에 반영
+    @ROUTER.route('POST', '/api/locks')
+    def _post_locks(self, req):
+        try:
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+            data = json.loads(post_data.decode('utf-8'))
+            
+            file_path = data.get('file')
+            agent = data.get('agent', 'Unknown')
+            action = data.get('action', 'lock') # 'lock' or 'unlock'
+            
+            with open(LOCKS_FILE, 'r', encoding='utf-8') as f:
+                locks = json.load(f)
+            
+            if action == 'lock':
+                if file_path in locks and locks[file_path] != agent:
+                    send_json(self, {"status": "conflict", "owner": locks[file_path]})
+                    return
+                locks[file_path] = agent
+                log_msg = f"Locked file: {file_path}"
+            elif action == 'unlock':
+                if file_path in locks:
+                    del locks[file_path]
+                    log_msg = f"Unlocked file: {file_path}"
+                else:
+                    log_msg = None
+            
+            with open(LOCKS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(locks, f, ensure_ascii=False, indent=2)
+            
+            # 하이브 로그에 기록
+            if log_msg:
                 try:
                     sys.path.append(str(BASE_DIR))
                     from src.secure import mask_sensitive_data
                     from src.db_helper import insert_log
-                    safe_content = mask_sensitive_data(msg['content'])
+                    safe_msg = mask_sensitive_data(log_msg)
                     
                     insert_log(
-                        session_id=f"msg_{int(time.time())}",
-                        terminal_id="MSG_CHANNEL",
-                        agent=msg['from'],
-                        trigger_msg=f"[메시지→{msg['to']}] {safe_content[:100]}",
+                        session_id=f"lock_{int(time.time())}_{agent}",
+                        terminal_id="LOCK_API",
+                        agent=agent,
+                        trigger_msg=safe_msg,
                         project="hive",
                         status="success"
                     )
                 except Exception as e:
-                    print(f"Error logging message to session_logs: {e}")
+                    print(f"Error logging lock to session_logs: {e}")
+            
+            send_json(self, {"status": "success", "locks": locks})
+        except Exception as e:
+            send_json(self, {"status": "error", "message": str(e)})
 
-                self.wfile.write(json.dumps({'status': 'success', 'msg': msg}, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/messages/clear':
-            # 메시지 채널 전체 삭제 (대시보드 UI 초기화용)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            ok = clear_messages()
-            self.wfile.write(json.dumps({'status': 'ok' if ok else 'error'}).encode('utf-8'))
-        elif parsed_path.path == '/api/tasks':
-            # 새 작업 생성 — tasks.json 배열에 추가
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
+    @ROUTER.route('POST', '/api/message')
+    def _post_message(self, req):
+        # 에이전트 간 메시지 전송 (SQLite 기반)
+        try:
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+            data = json.loads(post_data.decode('utf-8'))
+
+            # 메시지 객체 생성 (ID: 밀리초 타임스탬프)
+            msg = {
+                'id': str(int(time.time() * 1000)),
+                'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+                'from': str(data.get('from', 'unknown')),
+                'to': str(data.get('to', 'all')),
+                'type': str(data.get('type', 'info')),
+                'content': str(data.get('content', '')),
+                'read': False,
+            }
 
-                now = time.strftime('%Y-%m-%dT%H:%M:%S')
-                # tags 필드 — 리스트 타입 검증 (문자열이면 쉼표 분리)
-                raw_tags = data.get('tags', [])
-                if isinstance(raw_tags, str):
-                    raw_tags = [t.strip() for t in raw_tags.split(',') if t.strip()]
-                task = {
-                    'id': str(int(time.time() * 1000)),
-                    'timestamp': now,
-                    'updated_at': now,
-                    'title': str(data.get('title', '제목 없음')),
-                    'description': str(data.get('description', '')),
-                    'status': 'pending',
-                    'assigned_to': str(data.get('assigned_to', 'all')),
-                    'priority': str(data.get('priority', 'medium')),
-                    'created_by': str(data.get('created_by', 'user')),
-                    # ── 칸반 확장 필드 ──
-                    'kanban_status': str(data.get('kanban_status', 'todo')),
-                    'role': str(data.get('role', '')),
-                    'claimed_by': str(data.get('claimed_by', '')),
-                    'tags': raw_tags,
-                }
-                save_task(task)
+            # SQLite 에 삽입
+            send_message(msg['id'], msg['from'], msg['to'], msg['type'], msg['content'])
+
+            # 활성화된 모든 PTY 세션에 메시지 전송 (터미널 화면에 출력)
+            # 터미널은 \r\n (CRLF)을 필요로 하므로 변환하여 전송합니다.
+            content_to_send = msg['content']
+            content_display = content_to_send.replace('\n', '\r\n')
+            terminal_msg = f"\r\n\x1b[38;5;39m[{msg['from']} \u2192 {msg['to']}] {content_display}\x1b[0m\r\n"
+            
+            # [개선] 메시지가 '>'로 시작하면 명령어로 간주하여 즉시 실행 유도
+            is_manual_cmd = content_to_send.startswith('>')
+            if is_manual_cmd:
+                cmd_to_exec = content_to_send[1:].strip() + '\r\n'
+            else:
+                cmd_to_exec = None
 
-                # SSE 로그에도 반영 (태스크 보드 알림)
+            for info in pty_sessions.values():
                 try:
-                    log_entry = {
-                        'timestamp': now,
-                        'agent': task['created_by'],
-                        'terminal_id': 'TASK_BOARD',
-                        'project': 'hive',
-                        'status': 'success',
-                        'trigger': f"[새 작업] {task['title']} → {task['assigned_to']}",
-                        'ts_start': now,
-                    }
-                    with open(SESSIONS_FILE, 'a', encoding='utf-8') as lf:
-                        lf.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
-                except Exception:
+                    pty = info['pty']
+                    if is_manual_cmd:
+                        pty.write(cmd_to_exec)
+                    else:
+                        pty.write(terminal_msg)
+                except:
                     pass
 
-                self.wfile.write(json.dumps({'status': 'success', 'task': task}, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/tasks/update':
-            # 기존 작업 상태/담당자 등 업데이트
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            # SSE 스트림 (session_logs 테이블) 에도 알림 기록하여 로그 뷰에 반영
             try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
-
-                task_id = str(data.get('id', ''))
-                updates = {}
-                for key in ('status', 'assigned_to', 'priority', 'title',
-                            'description', 'kanban_status', 'role', 'claimed_by'):
-                    if key in data:
-                        updates[key] = str(data[key])
-                if 'tags' in data:
-                    raw_tags = data['tags']
-                    if isinstance(raw_tags, str):
-                        raw_tags = [t.strip() for t in raw_tags.split(',') if t.strip()]
-                    updates['tags'] = list(raw_tags) if isinstance(raw_tags, list) else []
-                updates['updated_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
-                updated_task = update_task(task_id, updates)
-
-                self.wfile.write(json.dumps({'status': 'success', 'task': updated_task}, ensure_ascii=False).encode('utf-8'))
+                sys.path.append(str(BASE_DIR))
+                from src.secure import mask_sensitive_data
+                from src.db_helper import insert_log
+                safe_content = mask_sensitive_data(msg['content'])
+                
+                insert_log(
+                    session_id=f"msg_{int(time.time())}",
+                    terminal_id="MSG_CHANNEL",
+                    agent=msg['from'],
+                    trigger_msg=f"[메시지→{msg['to']}] {safe_content[:100]}",
+                    project="hive",
+                    status="success"
+                )
             except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/tasks/delete':
-            # 작업 삭제 (id 기준 필터링)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
+                print(f"Error logging message to session_logs: {e}")
 
-                task_id = str(data.get('id', ''))
-                delete_task(task_id)
+            send_json(self, {'status': 'success', 'msg': msg})
+        except Exception as e:
+            send_json(self, {'status': 'error', 'message': str(e)})
 
-                self.wfile.write(json.dumps({'status': 'success'}, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/tasks/claim':
-            # 터미널이 태스크를 Claim — kanban_status=claimed, claimed_by=terminal_id로 업데이트
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
-                task_id = str(data.get('id', ''))
-                terminal_id = str(data.get('terminal_id', ''))
-                claimed_task = update_task(task_id, {
-                    'kanban_status': 'claimed',
-                    'claimed_by': terminal_id,
-                    'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
-                })
-                self.wfile.write(json.dumps({'status': 'success', 'task': claimed_task}, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/memory/sync':
-            # APPDATA DB → 현재 프로젝트 로컬 DB 동기화
-            # 배포 버전에서 APPDATA DB에 있는 항목을 로컬 DB로 가져옴 (updated_at 기준 최신 우선)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                src_data_dir = DATA_DIR
-                tgt_data_dir = _legacy_memory_data_dir()
-                merged = 0
-                skipped = 0
-                if src_data_dir != tgt_data_dir:
-                    merged, skipped = merge_memory_files(src_data_dir, tgt_data_dir)
-                    msg = f'동기화 완료: {merged}개 병합, {skipped}개 최신 유지'
-                else:
-                    msg = '로컬 저장소와 활성 프로젝트 저장소가 동일하여 동기화 불필요'
-                self.wfile.write(json.dumps(
-                    {'status': 'ok', 'message': msg, 'merged': merged, 'skipped': skipped},
-                    ensure_ascii=False
-                ).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps(
-                    {'status': 'error', 'message': str(e)}
-                ).encode('utf-8'))
-
-        elif parsed_path.path == '/api/memory/set':
-            # 공유 메모리 항목 저장/갱신 — key 기준 UPSERT (file store)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
-
-                key     = str(data.get('key', '')).strip()[:200]
-                content = str(data.get('content', '')).strip()
-                if not key or not content:
-                    self.wfile.write(json.dumps({'status': 'error', 'message': 'key와 content는 필수입니다'}).encode('utf-8'))
-                    return
+    @ROUTER.route('POST', '/api/messages/clear')
+    def _post_messages_clear(self, req):
+        # 메시지 채널 전체 삭제 (대시보드 UI 초기화용)
+        ok = clear_messages()
+        send_json(self, {'status': 'ok' if ok else 'error'})
 
-                now     = time.strftime('%Y-%m-%dT%H:%M:%S')
-                title   = str(data.get('title', key)).strip()[:300]
-                project = str(data.get('project', PROJECT_ID)).strip() or PROJECT_ID
-                legacy_dir = _legacy_memory_data_dir()
-                existing = get_memory_entry(legacy_dir, key)
-                entry = upsert_memory_entry(legacy_dir, {
-                    'key': key,
-                    'title': title,
-                    'content': content,
-                    'tags': data.get('tags', []),
-                    'author': str(data.get('author', 'unknown')),
-                    'project': project,
-                    'created_at': existing.get('created_at', now) if existing else now,
-                    'updated_at': now,
-                })
-                self.wfile.write(json.dumps({'status': 'success', 'entry': entry}, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/memory/delete':
-            # 공유 메모리 항목 삭제 (key 기준)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode('utf-8'))
-                key = str(data.get('key', '')).strip()
-                delete_memory_entry(_legacy_memory_data_dir(), key)
-                self.wfile.write(json.dumps({'status': 'success'}, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
-        elif parsed_path.path == '/api/mcp/apikey':
-            # Smithery API 키 저장
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                body = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                api_key = str(body.get('api_key', '')).strip()
-                _SMITHERY_CFG.write_text(
-                    json.dumps({'api_key': api_key}, ensure_ascii=False, indent=2),
-                    encoding='utf-8'
-                )
-                self.wfile.write(json.dumps({'status': 'success'}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+    @ROUTER.route('POST', '/api/tasks')
+    def _post_tasks(self, req):
+        # 새 작업 생성 — tasks.json 배열에 추가
+        try:
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+            data = json.loads(post_data.decode('utf-8'))
+
+            now = time.strftime('%Y-%m-%dT%H:%M:%S')
+            # tags 필드 — 리스트 타입 검증 (문자열이면 쉼표 분리)
+            raw_tags = data.get('tags', [])
+            if isinstance(raw_tags, str):
+                raw_tags = [t.strip() for t in raw_tags.split(',') if t.strip()]
+            task = {
+                'id': str(int(time.time() * 1000)),
+                'timestamp': now,
+                'updated_at': now,
+                'title': str(data.get('title', '제목 없음')),
+                'description': str(data.get('description', '')),
+                'status': 'pending',
+                'assigned_to': str(data.get('assigned_to', 'all')),
+                'priority': str(data.get('priority', 'medium')),
+                'created_by': str(data.get('created_by', 'user')),
+                # ── 칸반 확장 필드 ──
+                'kanban_status': str(data.get('kanban_status', 'todo')),
+                'role': str(data.get('role', '')),
+                'claimed_by': str(data.get('claimed_by', '')),
+                'tags': raw_tags,
+            }
+            save_task(task)
 
-        elif parsed_path.path == '/api/mcp/install':
-            # MCP 설치 — config 파일의 mcpServers 키에 엔트리 추가
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            # SSE 로그에도 반영 (태스크 보드 알림)
             try:
-                content_length = int(self.headers['Content-Length'])
-                body = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                tool    = str(body.get('tool',  'claude'))
-                scope   = str(body.get('scope', 'global'))
-                name    = str(body.get('name',  ''))
-                package = str(body.get('package', ''))
-                req_env = body.get('requiresEnv', [])  # 필수 환경변수 목록
-
-                if not name or not package:
-                    self.wfile.write(json.dumps({'status': 'error', 'message': 'name·package 필수'}).encode('utf-8'))
-                    return
+                log_entry = {
+                    'timestamp': now,
+                    'agent': task['created_by'],
+                    'terminal_id': 'TASK_BOARD',
+                    'project': 'hive',
+                    'status': 'success',
+                    'trigger': f"[새 작업] {task['title']} → {task['assigned_to']}",
+                    'ts_start': now,
+                }
+                with open(SESSIONS_FILE, 'a', encoding='utf-8') as lf:
+                    lf.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+            except Exception:
+                pass
 
-                config_path = _mcp_config_path(tool, scope)
-                # 디렉토리 없으면 생성
-                config_path.parent.mkdir(parents=True, exist_ok=True)
-                # 기존 설정 읽기 (없으면 빈 객체)
-                if config_path.exists():
-                    config = json.loads(config_path.read_text(encoding='utf-8'))
-                else:
-                    config = {}
-                if 'mcpServers' not in config:
-                    config['mcpServers'] = {}
-
-                # mcpServers 엔트리 구성 (환경변수가 필요하면 플레이스홀더 삽입)
-                entry: dict = {"command": "npx", "args": ["-y", package]}
-                if req_env:
-                    entry["env"] = {k: f"<YOUR_{k}>" for k in req_env}
-                config['mcpServers'][name] = entry
-
-                # JSON 쓰기 (들여쓰기 2칸, 한글 깨짐 방지)
-                config_path.write_text(
-                    json.dumps(config, ensure_ascii=False, indent=2),
-                    encoding='utf-8'
-                )
-                msg = f"MCP '{name}' 설치 완료 → {config_path}"
-                if req_env:
-                    msg += f" | 환경변수 필요: {', '.join(req_env)}"
-                self.wfile.write(json.dumps({'status': 'success', 'message': msg}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            send_json(self, {'status': 'success', 'task': task})
+        except Exception as e:
+            send_json(self, {'status': 'error', 'message': str(e)})
 
-        elif parsed_path.path == '/api/mcp/uninstall':
-            # MCP 제거 — config 파일의 mcpServers 에서 해당 키 삭제
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                body = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                tool  = str(body.get('tool',  'claude'))
-                scope = str(body.get('scope', 'global'))
-                name  = str(body.get('name',  ''))
-
-                if not name:
-                    self.wfile.write(json.dumps({'status': 'error', 'message': 'name 필수'}).encode('utf-8'))
-                    return
+    @ROUTER.route('POST', '/api/tasks/update')
+    def _post_tasks_update(self, req):
+        # 기존 작업 상태/담당자 등 업데이트
+        try:
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+            data = json.loads(post_data.decode('utf-8'))
+
+            task_id = str(data.get('id', ''))
+            updates = {}
+            for key in ('status', 'assigned_to', 'priority', 'title',
+                        'description', 'kanban_status', 'role', 'claimed_by'):
+                if key in data:
+                    updates[key] = str(data[key])
+            if 'tags' in data:
+                raw_tags = data['tags']
+                if isinstance(raw_tags, str):
+                    raw_tags = [t.strip() for t in raw_tags.split(',') if t.strip()]
+                updates['tags'] = list(raw_tags) if isinstance(raw_tags, list) else []
+            updates['updated_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+            updated_task = update_task(task_id, updates)
 
-                config_path = _mcp_config_path(tool, scope)
-                if not config_path.exists():
-                    self.wfile.write(json.dumps({'status': 'error', 'message': '설정 파일 없음'}).encode('utf-8'))
-                    return
+            send_json(self, {'status': 'success', 'task': updated_task})
+        except Exception as e:
+            send_json(self, {'status': 'error', 'message': str(e)})
 
-                config = json.loads(config_path.read_text(encoding='utf-8'))
-                servers = config.get('mcpServers', {})
-                if name in servers:
-                    del servers[name]
-                    config['mcpServers'] = servers
-                    config_path.write_text(
-                        json.dumps(config, ensure_ascii=False, indent=2),
-                        encoding='utf-8'
-                    )
-                    self.wfile.write(json.dumps({'status': 'success', 'message': f"MCP '{name}' 제거 완료"}).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({'status': 'error', 'message': f"'{name}' 항목 없음"}).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
-
-        elif parsed_path.path == '/api/superpowers/install':
-            # Vibe Coding 자체 스킬 설치 — 외부 GitHub 의존 없이 내장 파일 복사
-            # Claude: skills/claude/vibe-*.md → PROJECT_ROOT/.claude/commands/ (프로젝트별)
-            # Gemini: BASE_DIR 내장 → PROJECT_ROOT/.gemini/skills/ (프로젝트별)
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                body = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                tool = str(body.get('tool', 'claude'))
-                home = Path.home()
-
-                # 현재 활성 프로젝트 경로 동적 조회 (배포 버전 호환)
-                _proj = _current_project_root()
-
-                if tool == 'claude':
-                    # 내장 스킬 소스 경로: exe 기준 BASE_DIR/../skills/claude/ 또는 개발 환경
-                    import shutil as _shutil
-                    skills_src = BASE_DIR / 'skills' / 'claude'
-                    if not skills_src.exists():
-                        skills_src = _proj / 'skills' / 'claude'
-                    if not skills_src.exists():
-                        raise Exception('내장 스킬 파일을 찾을 수 없습니다 (skills/claude/)')
-                    cmd_dir = _proj / '.claude' / 'commands'
-                    cmd_dir.mkdir(parents=True, exist_ok=True)
-                    installed = []
-                    for md in skills_src.glob('vibe-*.md'):
-                        _shutil.copy(md, cmd_dir / md.name)
-                        installed.append(md.name)
-                    if not installed:
-                        raise Exception('설치할 스킬 파일이 없습니다')
-                    self.wfile.write(json.dumps({
-                        'status': 'success',
-                        'message': f'Claude 스킬 설치 완료 ({len(installed)}개): {", ".join(installed)}'
-                    }, ensure_ascii=False).encode('utf-8'))
-
-                elif tool == 'gemini':
-                    # 빌드 버전: BASE_DIR(sys._MEIPASS)에 내장된 스킬을 현재 프로젝트에 복사
-                    # 개발 버전: _proj/.gemini/skills/ 가 이미 존재하므로 소스=대상
-                    import shutil as _shutil
-                    gemini_skills_src = BASE_DIR / '.gemini' / 'skills'
-                    if not gemini_skills_src.exists():
-                        gemini_skills_src = _proj / '.gemini' / 'skills'
-                    if not gemini_skills_src.exists():
-                        raise Exception('내장 Gemini 스킬을 찾을 수 없습니다 (.gemini/skills/)')
-                    target_dir = _proj / '.gemini' / 'skills'
-                    # 소스와 대상이 다를 때만 복사 (설치 버전에서 실제 파일 배포)
-                    if gemini_skills_src.resolve() != target_dir.resolve():
-                        _shutil.copytree(str(gemini_skills_src), str(target_dir), dirs_exist_ok=True)
-                    installed = [d.name for d in target_dir.iterdir() if d.is_dir() and (d / 'SKILL.md').exists()]
-                    self.wfile.write(json.dumps({
-                        'status': 'success',
-                        'message': f'Gemini 스킬 설치 완료 ({len(installed)}개): {", ".join(installed)}'
-                    }, ensure_ascii=False).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({'status': 'error', 'message': '알 수 없는 tool'}, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}, ensure_ascii=False).encode('utf-8'))
+    @ROUTER.route('POST', '/api/tasks/delete')
+    def _post_tasks_delete(self, req):
+        # 작업 삭제 (id 기준 필터링)
+        try:
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+            data = json.loads(post_data.decode('utf-8'))
 
-        elif parsed_path.path == '/api/superpowers/uninstall':
-            # Superpowers 제거 — tool: 'claude' | 'gemini'
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers['Content-Length'])
-                body = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                tool = str(body.get('tool', 'claude'))
-                home = Path.home()
-                _proj = _current_project_root()  # 현재 활성 프로젝트 경로
-                if tool == 'claude':
-                    # 프로젝트별 설치 경로에서 제거 (배포 버전 호환)
-                    cmd_dir = _proj / '.claude' / 'commands'
-                    removed = []
-                    for md in cmd_dir.glob('vibe-*.md'):
-                        md.unlink()
-                        removed.append(md.name)
-                    msg = f"제거 완료: {', '.join(removed)}" if removed else '삭제할 파일 없음'
-                    self.wfile.write(json.dumps({'status': 'success', 'message': msg}, ensure_ascii=False).encode('utf-8'))
-
-                elif tool == 'gemini':
-                    # Gemini 스킬은 프로젝트 내에 있어 실제 삭제하지 않고 상태만 반환
-                    self.wfile.write(json.dumps({'status': 'success', 'message': 'Gemini 스킬은 프로젝트 내장형입니다 (삭제 불필요)'}, ensure_ascii=False).encode('utf-8'))
-                else:
-                    self.wfile.write(json.dumps({'status': 'error', 'message': '알 수 없는 tool'}, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}, ensure_ascii=False).encode('utf-8'))
-
-        elif parsed_path.path == '/api/orchestrator/skill-chain/update':
-            # 스킬 체인 단계 상태 갱신 — skill_chain.db에 직접 UPDATE
-            # body: {"step": 0, "status": "done", "summary": "...", "terminal_id": 1}
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                content_length = int(self.headers.get('Content-Length', 0))
-                body = json.loads(self.rfile.read(content_length).decode('utf-8'))
-                step = int(body.get('step', 0))
-                status = body.get('status', 'done')
-                summary = body.get('summary', '')
-                terminal_id = int(body.get('terminal_id', 0))
-                _orch_dir = str(SCRIPTS_DIR)
-                if _orch_dir not in sys.path:
-                    sys.path.insert(0, _orch_dir)
-                from skill_orchestrator import cmd_update as _orch_update
-                _orch_update(terminal_id, step, status, summary)
-                self.wfile.write(json.dumps({'status': 'success'}, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            task_id = str(data.get('id', ''))
+            delete_task(task_id)
 
-        elif parsed_path.path == '/api/orchestrator/run':
-            # 오케스트레이터 수동 트리거 — 즉시 한 사이클 조율 수행
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json;charset=utf-8')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                # scripts/orchestrator.py를 subprocess로 실행
-                orch_script = str(SCRIPTS_DIR / 'orchestrator.py')
-                result = subprocess.run(
-                    [sys.executable, orch_script],
-                    capture_output=True, text=True, timeout=15, encoding='utf-8',
-                    creationflags=0x08000000
-                )
-                output = (result.stdout + result.stderr).strip()
-                self.wfile.write(json.dumps({
-                    'status': 'success',
-                    'output': output or '이상 없음',
-                }, ensure_ascii=False).encode('utf-8'))
-            except Exception as e:
-                self.wfile.write(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
-        else:
-            self.send_response(404)
-            self.end_headers()
+            send_json(self, {'status': 'success'})
+        except Exception as e:
+            send_json(self, {'status': 'error', 'message': str(e)})
+
+    @ROUTER.route('POST', '/api/tasks/claim')
+    def _post_tasks_claim(self, req):
+        # 터미널이 태스크를 Claim — kanban_status=claimed, claimed_by=terminal_id로 업데이트
+        try:
+            content_length = int(self.headers['Content-Length'])
+            post_data = self.rfile.read(content_length)
+            data = json.loads(post_data.decode('utf-8'))
+            task_id = str(data.get('id', ''))
+            terminal_id = str(data.get('terminal_id', ''))
+            claimed_task = update_task(task_id, {
+                'kanban_status': 'claimed',
+                'claimed_by': terminal_id,
+                'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            })
+            send_json(self, {'status': 'success', 'task': claimed_task})
+        except Exception as e:
+            send_json(self, {'status': 'error', 'message': str(e)})
 
     def log_message(self, format, *args):
         # 불필요한 콘솔 로그 제거하여 터미널 깔끔하게 유지
@@ -4225,12 +3700,14 @@ def _cleanup_child_procs():
 import atexit, signal as _signal
 atexit.register(_cleanup_all_pty_sessions)
 atexit.register(_cleanup_child_procs)
+atexit.register(_flush_pg_writers)
 
 def _signal_exit_handler(sig, frame):
     """SIGTERM / SIGBREAK(Ctrl+Break) 수신 시 PTY + 자식 프로세스 정리 후 즉시 종료."""
     print(f"[*] 시그널 {sig} 수신 — PTY 및 자식 프로세스 정리 후 종료합니다.")
     _cleanup_all_pty_sessions()
     _cleanup_child_procs()
+    _flush_pg_writers()
     os._exit(0)
 
 _signal.signal(_signal.SIGTERM, _signal_exit_handler)
@@ -4271,6 +3748,157 @@ def start_ws_server():
     except Exception as e:
         print(f"WebSockets Server Error: {e}")
 
+# ── api/* 모듈 라우트에 넘길 공용 의존성 (모듈은 import 시 ROUTER에 경로를 등록) ──
+ROUTER.configure(
+    DATA_DIR=DATA_DIR, SCRIPTS_DIR=SCRIPTS_DIR, BASE_DIR=BASE_DIR,
+    PROJECT_ROOT=PROJECT_ROOT, PROJECT_ID=PROJECT_ID,
+    TASKS_FILE=TASKS_FILE, AGENT_STATUS=AGENT_STATUS, AGENT_STATUS_LOCK=AGENT_STATUS_LOCK,
+    pty_sessions=pty_sessions,
+    _current_project_root=_current_project_root,
+    _parse_session_tail=_parse_session_tail,
+    _parse_gemini_session=_parse_gemini_session,
+    run_pg_sql_csv=run_pg_sql_csv,
+    HIVE_ACTIVITY=HIVE_ACTIVITY,
+    _smithery_api_key=_smithery_api_key,
+    _smithery_api_key_setter=_SMITHERY_CFG,
+    _mcp_config_path=_mcp_config_path,
+    _memory_conn=_memory_conn, _embed=_embed, _embed_batch=_embed_batch, _cosine_sim=_cosine_sim,
+    __version__=__version__,
+)
+
+# ── 폴링 라우트 응답 캐시 (UI마다 ~3초 주기 폴링) ────────────────────────────
+# (경로, TTL초, 태그) — TTL 안의 반복 요청과 동시 요청은 한 번만 계산.
+# 태그가 겹치는 쓰기 라우트가 실행되면 즉시 무효화되어 다음 폴링이 새 값을 계산합니다.
+RESPONSE_CACHE = ResponseCache()
+_CACHED_ROUTES = (
+    ('/api/orchestrator/status',      2.0, ('tasks', 'memory', 'stage')),
+    ('/api/agent/terminals',          1.0, ('stage',)),
+    ('/api/hive/health',              5.0, ()),
+    ('/api/orchestrator/skill-chain', 2.0, ('stage', 'skill_chain')),
+    ('/api/kanban/pg-activity',       3.0, ()),
+)
+_CACHE_INVALIDATORS = (
+    (('/api/tasks', '/api/tasks/update', '/api/tasks/delete', '/api/tasks/claim'), ('tasks',)),
+    (('/api/memory/set', '/api/memory/delete', '/api/memory/sync'), ('memory',)),
+    (('/api/agent/stage',), ('stage',)),
+    (('/api/orchestrator/skill-chain/update',), ('skill_chain',)),
+)
+for _path, _ttl, _tags in _CACHED_ROUTES:
+    RESPONSE_CACHE.cache_route(ROUTER, _path, _ttl, _tags)
+for _paths, _tags in _CACHE_INVALIDATORS:
+    RESPONSE_CACHE.invalidate_after(ROUTER, 'POST', _paths, _tags)
+
+# ── 대시보드 상태 채널 (/api/events/state) ──────────────────────────────────
+# (상태 키, 원본 GET 라우트, 갱신 주기초, 태그, 제외 키) — 값은 라우트 응답 JSON 그대로 (폴링 응답과 같은 형태,
+# 응답 생성 시각처럼 매번 바뀌는 최상위 키만 제외).
+# 구독자가 있을 때만 주기마다 재계산하고, 쓰기 라우트의 캐시 무효화 태그가 오면 즉시 재계산합니다.
+STATE_CHANNEL = StateChannel(EVENT_BUS, 'state')
+_STATE_SOURCES = (
+    ('terminals',     '/api/agent/terminals',          2.0, ('stage',),                   ()),
+    ('orchestrator',  '/api/orchestrator/status',      3.0, ('tasks', 'memory', 'stage'), ('timestamp',)),
+    ('skill_chain',   '/api/orchestrator/skill-chain', 3.0, ('stage', 'skill_chain'),     ()),
+    ('kanban',        '/api/tasks/kanban',             5.0, ('tasks',),                   ()),
+    ('hive_activity', '/api/hive/activity',            5.0, (),                           ()),
+)
+for _name, _path, _interval, _tags, _volatile in _STATE_SOURCES:
+    STATE_CHANNEL.add_source(_name, route_source(ROUTER, _path), _interval, _tags, _volatile)
+RESPONSE_CACHE.add_listener(STATE_CHANNEL.mark_dirty)
+
+# ── JSONL 로그 세그먼트 회전 / 압축 / 보존 (data/segments/<이름>/) ─────────────
+# (이름, 최대 크기 MB, 최대 기간 시간, 압축, 보존 세그먼트 수, 보존 일수) — 60초마다 점검.
+# 읽는 쪽(src.jsonl_tail, src.live_index)은 활성 파일 다음으로 세그먼트를 이어 읽습니다.
+LOG_SEGMENTS = LogSegmentManager(interval=60.0)
+_LOG_SEGMENT_POLICIES = (
+    ('task_logs',        8, 24,      'gzip', 30, 30),
+    ('agent_live',      16, 6,       'zstd', 20, 7),    # 출력 줄까지 기록 — 가장 빨리 커짐
+    ('agent_runs',       8, 24 * 7,  'gzip', 30, 90),
+    ('skill_results',    4, 24 * 30, 'gzip', 12, 180),
+    ('orchestrator_log', 4, 24 * 7,  'gzip', 12, 30),
+)
+for _name, _mb, _hours, _compress, _keep, _days in _LOG_SEGMENT_POLICIES:
+    LOG_SEGMENTS.add(_name, DATA_DIR / f'{_name}.jsonl',
+                     SegmentPolicy(max_bytes=_mb * 1024 * 1024, max_age=_hours * 3600, compress=_compress,
+                                   keep_segments=_keep, keep_days=_days))
+
+# ── asyncio 모드 SSE 스트림 (VIBE_HTTP_MODE=asyncio) ─────────────────────────
+# 스레드 모드의 _get_events_* / _get_stream 과 같은 프레임을 내보내는 async generator.
+# 각 스트림이 EVENT_BUS를 구독하고 Subscriber.aframes()로 자기 링만 비웁니다 (생산자 스레드는
+# call_soon_threadsafe로 루프만 깨움). client(SSEClient)에서는 요청 헤더(Last-Event-ID)만 읽습니다.
+HTTP_MODE = os.getenv('VIBE_HTTP_MODE', 'threaded').strip().lower()
+HTTP_WORKERS = max(4, int(os.getenv('VIBE_HTTP_WORKERS', '32')))
+
+
+def _astream_subscribe(topic, client, target):
+    query = parse_qs(urlparse(target).query)
+    return EVENT_BUS.subscribe(topic, last_event_id=parse_last_event_id(client.headers, query))
+
+
+async def _astream_thoughts(client, target):
+    with _astream_subscribe('thoughts', client, target) as sub:
+        if not sub.resumed:
+            for log in list(THOUGHT_LOGS):
+                yield sse_frame(log)
+            yield sub.cursor_frame()
+        async for frame in sub.aframes(heartbeat=30.0):
+            yield frame
+
+
+async def _astream_agent(client, target):
+    with _astream_subscribe('agent', client, target) as sub:
+        if not sub.resumed:
+            yield sub.cursor_frame()
+        async for frame in sub.aframes(heartbeat=1.0):
+            yield frame
+
+
+async def _astream_fs(client, target):
+    with _astream_subscribe('fs', client, target) as sub:
+        if not sub.resumed:
+            yield sub.cursor_frame()
+        async for frame in sub.aframes(heartbeat=30.0):
+            yield frame
+
+
+async def _astream_hive_logs(client, target):
+    HIVE_LOG_LISTENER.start()
+    await asyncio.get_running_loop().run_in_executor(None, HIVE_LOG_LISTENER.ready.wait, 3.0)
+    last_event_id = parse_last_event_id(client.headers, parse_qs(urlparse(target).query))
+    sub, snapshot = _hive_log_subscribe(last_event_id)
+    with sub:
+        for frame in snapshot:
+            yield frame
+        async for frame in sub.aframes(heartbeat=5.0):
+            yield frame
+
+
+async def _astream_state(client, target):
+    last_event_id = parse_last_event_id(client.headers, parse_qs(urlparse(target).query))
+    # 첫 구독 시 소스 계산이 스레드풀에서 돌도록 (이벤트 루프 블로킹 방지)
+    sub, initial = await asyncio.get_running_loop().run_in_executor(None, STATE_CHANNEL.subscribe, last_event_id)
+    with sub:
+        for frame in initial:
+            yield frame
+        async for frame in sub.aframes(heartbeat=30.0):
+            yield frame
+
+
+ASYNC_SSE_STREAMS = {
+    '/api/events/thoughts': _astream_thoughts,
+    '/api/events/agent': _astream_agent,
+    '/api/events/fs': _astream_fs,
+    '/stream': _astream_hive_logs,
+    '/api/events/state': _astream_state,
+}
+
+
+def _make_http_server(port: int):
+    """VIBE_HTTP_MODE에 따라 스레드(기본) 또는 단일 이벤트 루프 HTTP 서버 생성."""
+    if HTTP_MODE == 'asyncio':
+        return AsyncHTTPServer(('0.0.0.0', port), SSEHandler, streams=ASYNC_SSE_STREAMS,
+                               max_workers=HTTP_WORKERS)
+    return ThreadedHTTPServer(('0.0.0.0', port), SSEHandler)
+
+
 def open_app_window(url):
     """GUI 실행 실패 시 기본 브라우저로 대시보드를 엽니다."""
     import webbrowser
@@ -4381,6 +4009,12 @@ if __name__ == '__main__':
     # 1. 백그라운드 스레드 시작
     threading.Thread(target=start_ws_server, daemon=True).start()
 
+    # JSONL 로그 세그먼트 회전/압축/보존 — 60초 주기
+    LOG_SEGMENTS.start()
+
+    # 정적 파일 사전 적재/압축 — 첫 대시보드 로드에서 brotli/gzip 압축 지연이 생기지 않도록
+    threading.Thread(target=STATIC_ASSETS.preload, daemon=True, name='StaticPreload').start()
+
     # 자율 에이전트 브로드캐스트 워커: cli_agent 큐 → 다중 SSE 클라이언트 팬아웃
     threading.Thread(target=_agent_broadcast_worker, daemon=True,
                      name='AgentBroadcast').start()
@@ -4484,12 +4118,17 @@ if __name__ == '__main__':
 
     # 2. HTTP 서버 시작 (포트 충돌 시 자동 탐색된 포트로 재시도)
     try:
-        server = ThreadedHTTPServer(('0.0.0.0', HTTP_PORT), SSEHandler)
-        print(f"[*] Server running on http://localhost:{HTTP_PORT}")
+        server = _make_http_server(HTTP_PORT)
+        print(f"[*] Server running on http://localhost:{HTTP_PORT} ({HTTP_MODE})")
         threading.Thread(target=server.serve_forever, daemon=True).start()
         # [v3.7.62] task_logs 사전 로드 — 서버 시작 후 백그라운드에서 실행 (기동 시간 단축)
         threading.Thread(target=_load_task_logs_into_thoughts, daemon=True,
                          name='ThoughtPreload').start()
+        # 임베딩 모델 로드 — 첫 의미 검색 요청이 모델 로드를 기다리지 않도록 미리 수행
+        EMBEDDER.warm_up()
+        # 고아 thought parent_id 소급 연결 — 리스닝 이후 청크 단위로 실행 (기동 지연 없음)
+        threading.Thread(target=_backfill_thought_parent_ids, daemon=True,
+                         name='BackfillParentIds').start()
         # 브로드캐스트 워커는 HTTP 서버 시작 전(4097~4099)에서 이미 시작됨 — 중복 시작 금지
     except Exception as e:
         print(f"[!] Server Start Error on port {HTTP_PORT}: {e}")
@@ -4598,6 +4237,7 @@ border-radius:50%;animation:spin 0.9s linear infinite;margin:0 auto}}
         print("[*] GUI 창이 닫혔습니다. 좀비 프로세스 방지 — 모든 자식 프로세스 정리 중...")
         _cleanup_all_pty_sessions()          # Claude/Gemini/Codex 터미널 자식 프로세스 종료
         _cleanup_child_procs()               # hive_watchdog / heal_daemon / discord_bridge 종료
+        _flush_pg_writers()                  # write-behind 큐 잔여 로그/사고 기록
         try:
             server.shutdown()                # HTTP 요청 처리 스레드 정지
             server.server_close()            # 포트 소켓 해제 (TIME_WAIT 방지)
@@ -4622,6 +4262,7 @@ border-radius:50%;animation:spin 0.9s linear infinite;margin:0 auto}}
             print("[*] Ctrl+C 감지 — PTY 세션 및 서버 정리 후 종료합니다.")
             _cleanup_all_pty_sessions()
             _cleanup_child_procs()           # 좀비 방지: watchdog/heal/discord 종료
+            _flush_pg_writers()
             try:
                 server.shutdown()
                 server.server_close()
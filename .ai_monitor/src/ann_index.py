@@ -0,0 +1,389 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/ann_index.py
+# 📝 설명: 디스크 기반 근사 최근접 이웃(ANN) 인덱스 — NumPy IVF-flat
+#          - 기본 세그먼트: 구형 k-means 중심(centroids)별로 정렬된 벡터 행렬을 .npy로 저장하고
+#            mmap_mode='r'로 열어 검색 시 선택된 리스트 구간만 페이지인
+#          - 증분 변경: 새 벡터는 델타 버퍼(전수 비교), 삭제는 툼스톤 — 둘 다 즉시 디스크에 기록
+#          - 단편화율 (툼스톤 + 델타) / 기본 행 수가 임계값을 넘으면 백그라운드 재구축 후 원자적 교체
+#          - 디스크 구조: CURRENT(포인터) → base.<세대>/ 안에 기본 세그먼트 + 툼스톤/델타 파일.
+#            재구축은 다음 세대 디렉터리를 완성(재구축 중 변경분까지 델타로 기록)한 뒤 CURRENT만 os.replace
+#          키는 문자열 (hive_memory key, pg_thoughts id 등). 벡터는 L2 정규화하여 내적 = 코사인.
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: 메모리/사고 임베딩 근사 검색
+# [2026-10-17] — 재구축 교체를 세대 디렉터리 + CURRENT 포인터 교체로 변경 (중간 실패 시 이전 세대 유지)
+# ────────────────────────────────────────────────────────────────────────────
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+_BASE_FILES = ('vectors.npy', 'centroids.npy', 'offsets.npy', 'keys.json', 'meta.json')
+_DELTA_FILES = ('tombstones.json', 'delta_vectors.npy', 'delta_keys.json')
+_POINTER = 'CURRENT'
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms < 1e-10] = 1.0
+    return matrix / norms
+
+
+def _write_json(path: Path, payload) -> None:
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def _write_npy(path: Path, array: np.ndarray) -> None:
+    tmp = path.with_suffix('.tmp.npy')
+    np.save(tmp, array)
+    os.replace(tmp, path)
+
+
+def train_ivf(vectors: np.ndarray, nlist: int, iterations: int = 10,
+              sample_size: int = 50000, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """구형 k-means로 중심을 학습하고 전체 벡터의 리스트 번호를 반환합니다.
+
+    Returns:
+        (centroids (nlist, D), assignments (N,))
+    """
+    rng = np.random.default_rng(seed)
+    n = vectors.shape[0]
+    nlist = max(1, min(int(nlist), n))
+    sample = vectors if n <= sample_size else vectors[rng.choice(n, sample_size, replace=False)]
+    centroids = sample[rng.choice(sample.shape[0], nlist, replace=False)].copy()
+    for _ in range(iterations):
+        labels = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+        counts = np.bincount(labels, minlength=nlist)
+        empty = counts == 0
+        if empty.any():  # 빈 리스트는 임의 표본으로 재시드
+            sums[empty] = sample[rng.choice(sample.shape[0], int(empty.sum()))]
+        centroids = _normalize_rows(sums)
+    assignments = np.empty(n, dtype=np.int32)
+    for start in range(0, n, 65536):
+        chunk = vectors[start:start + 65536]
+        assignments[start:start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return centroids, assignments
+
+
+class IVFFlatIndex:
+    """디렉터리 하나에 저장되는 IVF-flat 인덱스 (스레드 안전).
+
+    - put(key, vector) / delete(key): 증분 변경, 델타/툼스톤 파일에 즉시 반영
+    - search(vector, k): nprobe개 리스트 + 델타 버퍼에서 코사인 상위 k
+    - rebuild(): 살아있는 전체 벡터로 재학습 (단편화율 초과 시 자동, 백그라운드)
+    """
+
+    def __init__(self, path: Path, nprobe: int = 8, rebuild_ratio: float = 0.2,
+                 min_rebuild_rows: int = 1000, auto_rebuild: bool = True):
+        self.path = Path(path)
+        self.nprobe = max(1, int(nprobe))
+        self.rebuild_ratio = float(rebuild_ratio)
+        self.min_rebuild_rows = int(min_rebuild_rows)
+        self.auto_rebuild = auto_rebuild
+        self._lock = threading.RLock()
+        self._rebuilding = False
+        self._journal: list | None = None   # 재구축 중 발생한 변경 (교체 후 재적용)
+        self._rebuild_thread: threading.Thread | None = None
+        self.rebuilds = 0
+        self._generation = 0
+        self._base_dir = self.path   # CURRENT 포인터가 없으면 세대 도입 전 구조 (파일이 path 바로 아래)
+        self._reset_base()
+        self._delta_keys: list[str] = []
+        self._delta_vectors = np.zeros((0, 0), dtype=np.float32)
+        self._delta_pos: dict[str, int] = {}
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    # ── 상태 ────────────────────────────────────────────────────────────────
+    def _reset_base(self) -> None:
+        self._vectors = None        # mmap (N, D), 리스트 순서로 정렬
+        self._centroids = None      # (nlist, D)
+        self._offsets = None        # (nlist + 1,) 리스트 l = vectors[offsets[l]:offsets[l+1]]
+        self._base_keys: list[str] = []
+        self._base_pos: dict[str, int] = {}
+        self._dead = np.zeros(0, dtype=bool)
+        self._dim = 0
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(len(self._base_keys) - self._dead.sum()) + len(self._delta_keys)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            i = self._base_pos.get(key)
+            return key in self._delta_pos or (i is not None and not self._dead[i])
+
+    def fragmentation(self) -> float:
+        with self._lock:
+            base = len(self._base_keys)
+            changed = int(self._dead.sum()) + len(self._delta_keys)
+            if not base:
+                return 1.0 if changed else 0.0
+            return changed / base
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'path': str(self.path),
+                'dim': self._dim,
+                'base_rows': len(self._base_keys),
+                'tombstones': int(self._dead.sum()),
+                'delta_rows': len(self._delta_keys),
+                'live_rows': len(self),
+                'nlist': 0 if self._centroids is None else int(self._centroids.shape[0]),
+                'nprobe': self.nprobe,
+                'fragmentation': round(self.fragmentation(), 4),
+                'rebuilding': self._rebuilding,
+                'rebuilds': self.rebuilds,
+            }
+
+    # ── 디스크 ──────────────────────────────────────────────────────────────
+    def _load(self, base_dir: Path | None = None) -> None:
+        """base_dir(기본: CURRENT가 가리키는 세대)의 기본 세그먼트와 델타를 읽습니다."""
+        with self._lock:
+            if base_dir is None:
+                try:
+                    pointer = json.loads((self.path / _POINTER).read_text(encoding='utf-8'))
+                    self._generation = int(pointer['generation'])
+                    base_dir = self.path / pointer['dir']
+                except (OSError, ValueError, KeyError, TypeError):
+                    self._generation, base_dir = 0, self.path
+            self._base_dir = base_dir
+            self._reset_base()
+            self._delta_keys, self._delta_pos = [], {}
+            self._delta_vectors = np.zeros((0, 0), dtype=np.float32)
+            meta_path = base_dir / 'meta.json'
+            if meta_path.exists():
+                self._vectors = np.load(base_dir / 'vectors.npy', mmap_mode='r')
+                self._centroids = np.load(base_dir / 'centroids.npy')
+                self._offsets = np.load(base_dir / 'offsets.npy')
+                self._base_keys = json.loads((base_dir / 'keys.json').read_text(encoding='utf-8'))
+                self._base_pos = {key: i for i, key in enumerate(self._base_keys)}
+                self._dead = np.zeros(len(self._base_keys), dtype=bool)
+                self._dim = int(json.loads(meta_path.read_text(encoding='utf-8')).get('dim', 0))
+            tomb_path = base_dir / 'tombstones.json'
+            if tomb_path.exists():
+                for key in json.loads(tomb_path.read_text(encoding='utf-8')):
+                    i = self._base_pos.get(key)
+                    if i is not None:
+                        self._dead[i] = True
+            delta_keys_path = base_dir / 'delta_keys.json'
+            if delta_keys_path.exists():
+                self._delta_keys = json.loads(delta_keys_path.read_text(encoding='utf-8'))
+                self._delta_vectors = np.load(base_dir / 'delta_vectors.npy')
+                self._delta_pos = {key: i for i, key in enumerate(self._delta_keys)}
+                if not self._dim and self._delta_vectors.size:
+                    self._dim = int(self._delta_vectors.shape[1])
+
+    def _save_delta(self) -> None:
+        dead_keys = [self._base_keys[i] for i in np.flatnonzero(self._dead)]
+        _write_json(self._base_dir / 'tombstones.json', dead_keys)
+        _write_npy(self._base_dir / 'delta_vectors.npy', self._delta_vectors)
+        _write_json(self._base_dir / 'delta_keys.json', self._delta_keys)
+
+    def _current_dir(self) -> Path:
+        try:
+            return self.path / json.loads((self.path / _POINTER).read_text(encoding='utf-8'))['dir']
+        except (OSError, ValueError, KeyError, TypeError):
+            return self.path
+
+    # ── 증분 변경 ───────────────────────────────────────────────────────────
+    def put(self, key: str, vector) -> bool:
+        vec = _normalize_rows(np.asarray(vector, dtype=np.float32).reshape(1, -1))
+        with self._lock:
+            if self._dim and vec.shape[1] != self._dim:
+                return False
+            self._dim = vec.shape[1]
+            self._put_locked(key, vec)
+            if self._journal is not None:
+                self._journal.append(('put', key, vec))
+            self._save_delta()
+        self._maybe_rebuild()
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            removed = self._delete_locked(key)
+            if self._journal is not None:
+                self._journal.append(('delete', key, None))
+            if removed:
+                self._save_delta()
+        if removed:
+            self._maybe_rebuild()
+        return removed
+
+    def _put_locked(self, key: str, vec: np.ndarray) -> None:
+        i = self._base_pos.get(key)
+        if i is not None:
+            self._dead[i] = True
+        j = self._delta_pos.get(key)
+        if j is not None:
+            self._delta_vectors[j] = vec[0]
+            return
+        self._delta_pos[key] = len(self._delta_keys)
+        self._delta_keys.append(key)
+        self._delta_vectors = vec.copy() if not self._delta_vectors.size else np.vstack([self._delta_vectors, vec])
+
+    def _delete_locked(self, key: str) -> bool:
+        removed = False
+        i = self._base_pos.get(key)
+        if i is not None and not self._dead[i]:
+            self._dead[i] = True
+            removed = True
+        j = self._delta_pos.pop(key, None)
+        if j is not None:
+            last = len(self._delta_keys) - 1
+            if j != last:
+                self._delta_keys[j] = self._delta_keys[last]
+                self._delta_vectors[j] = self._delta_vectors[last]
+                self._delta_pos[self._delta_keys[j]] = j
+            self._delta_keys.pop()
+            self._delta_vectors = self._delta_vectors[:last]
+            removed = True
+        return removed
+
+    # ── 검색 ────────────────────────────────────────────────────────────────
+    def search(self, vector, k: int = 10, nprobe: int | None = None) -> list[tuple[str, float]]:
+        query = _normalize_rows(np.asarray(vector, dtype=np.float32).reshape(1, -1))[0]
+        k = max(1, int(k))
+        with self._lock:
+            if not self._dim or query.shape[0] != self._dim:
+                return []
+            keys: list[str] = []
+            score_parts: list[np.ndarray] = []
+            if self._vectors is not None and len(self._base_keys):
+                nlist = self._centroids.shape[0]
+                probe = min(nlist, int(nprobe or self.nprobe))
+                centroid_scores = self._centroids @ query
+                lists = np.argpartition(-centroid_scores, probe - 1)[:probe]
+                rows = np.concatenate([
+                    np.arange(self._offsets[l], self._offsets[l + 1]) for l in lists
+                ]) if probe else np.zeros(0, dtype=np.int64)
+                rows = rows[~self._dead[rows]]
+                if rows.size:
+                    score_parts.append(np.asarray(self._vectors[rows]) @ query)
+                    keys.extend(self._base_keys[i] for i in rows)
+            if self._delta_keys:
+                score_parts.append(self._delta_vectors @ query)
+                keys.extend(self._delta_keys)
+        if not keys:
+            return []
+        scores = np.concatenate(score_parts)
+        k = min(k, len(keys))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(keys[i], float(scores[i])) for i in top]
+
+    # ── 재구축 ──────────────────────────────────────────────────────────────
+    def _live_snapshot(self) -> tuple[list[str], np.ndarray]:
+        alive = np.flatnonzero(~self._dead)
+        keys = [self._base_keys[i] for i in alive]
+        parts = []
+        if alive.size:
+            parts.append(np.asarray(self._vectors[alive], dtype=np.float32))
+        if self._delta_keys:
+            keys.extend(self._delta_keys)
+            parts.append(self._delta_vectors.copy())
+        vectors = np.vstack(parts) if parts else np.zeros((0, self._dim), dtype=np.float32)
+        return keys, vectors
+
+    def _maybe_rebuild(self) -> None:
+        if not self.auto_rebuild or self._rebuilding:
+            return
+        if len(self) < self.min_rebuild_rows or self.fragmentation() <= self.rebuild_ratio:
+            return
+        self.rebuild_async()
+
+    def rebuild_async(self) -> threading.Thread | None:
+        with self._lock:
+            if self._rebuilding:
+                return self._rebuild_thread
+            self._rebuilding = True
+            self._journal = []
+            keys, vectors = self._live_snapshot()
+            self._rebuild_thread = threading.Thread(
+                target=self._rebuild, args=(keys, vectors), daemon=True, name='ANNRebuild'
+            )
+            self._rebuild_thread.start()
+            return self._rebuild_thread
+
+    def rebuild(self, keys: list[str] | None = None, vectors=None) -> None:
+        """동기 재구축. keys/vectors를 주면 그 집합으로 인덱스를 새로 만듭니다 (초기 적재)."""
+        with self._lock:
+            if self._rebuilding:
+                thread = self._rebuild_thread
+            else:
+                thread = None
+                self._rebuilding = True
+                self._journal = []
+                if keys is None:
+                    keys, vectors = self._live_snapshot()
+        if thread is not None:
+            thread.join()
+            return
+        self._rebuild(list(keys), _normalize_rows(vectors) if len(keys) else None)
+
+    def _rebuild(self, keys: list[str], vectors) -> None:
+        try:
+            with self._lock:
+                generation = self._generation + 1
+            staging = self.path / f'base.{generation:06d}'
+            shutil.rmtree(staging, ignore_errors=True)   # 중단된 이전 시도의 잔해
+            staging.mkdir(parents=True)
+            if keys:
+                nlist = max(1, min(4096, int(np.sqrt(len(keys)))))
+                centroids, assignments = train_ivf(vectors, nlist)
+                order = np.argsort(assignments, kind='stable')
+                counts = np.bincount(assignments, minlength=centroids.shape[0])
+                offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+                np.save(staging / 'vectors.npy', vectors[order])
+                np.save(staging / 'centroids.npy', centroids)
+                np.save(staging / 'offsets.npy', offsets)
+                (staging / 'keys.json').write_text(
+                    json.dumps([keys[i] for i in order], ensure_ascii=False), encoding='utf-8')
+                (staging / 'meta.json').write_text(json.dumps({
+                    'dim': int(vectors.shape[1]), 'count': len(keys), 'nlist': int(centroids.shape[0]),
+                    'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                }), encoding='utf-8')
+            with self._lock:
+                previous = self._base_dir
+                # 새 세대를 읽고 재구축 중 변경분을 델타로 기록까지 마친 뒤에 CURRENT를 교체 —
+                # 어느 단계에서 실패해도 CURRENT는 완결된 이전 세대를 가리킴
+                # (mmap 참조를 먼저 해제해야 Windows에서 이전 세대 삭제 가능)
+                self._load(staging)
+                for op, key, vec in self._journal or []:
+                    if op == 'put':
+                        self._dim = self._dim or vec.shape[1]
+                        self._put_locked(key, vec)
+                    else:
+                        self._delete_locked(key)
+                self._save_delta()
+                _write_json(self.path / _POINTER, {'generation': generation, 'dir': staging.name})
+                self._generation = generation
+                self._journal = None
+                self.rebuilds += 1
+            if previous == self.path:   # 세대 도입 전 구조의 파일 정리
+                for name in _BASE_FILES + _DELTA_FILES:
+                    (self.path / name).unlink(missing_ok=True)
+            else:
+                shutil.rmtree(previous, ignore_errors=True)
+        except Exception as e:
+            print(f"[ANN] 재구축 실패 ({self.path.name}): {e}")
+            with self._lock:
+                self._journal = None
+                if self._base_dir != self._current_dir():
+                    self._load()   # 새 세대를 읽다가 실패 — CURRENT가 가리키는 이전 세대로 복귀
+        finally:
+            self._rebuilding = False
@@ -0,0 +1,256 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/async_http.py
+# 📝 설명: 단일 이벤트 루프 HTTP/SSE 서버 (VIBE_HTTP_MODE=asyncio 선택 시 ThreadedHTTPServer 대체)
+#          - 연결 수락/요청 파싱/응답 전송은 이벤트 루프 하나에서 처리
+#          - 일반 라우트는 기존 SSEHandler를 그대로 크기 제한 ThreadPoolExecutor에서 실행
+#            (소켓 대신 BytesIO를 rfile/wfile로 주고, 완성된 응답 바이트를 루프가 전송)
+#          - SSE 라우트는 async generator — 연결당 스레드 없이 asyncio.Queue를 await
+#          - SSEClient: 기존 브로드캐스터(wfile.write / put_nowait)가 스레드에서 호출해도
+#            call_soon_threadsafe로 루프 큐에 넘기는 어댑터 (server.py 스트림은 src.event_bus 구독을 사용)
+#          serve_forever()/shutdown()/server_close()는 socketserver와 같은 이름으로 제공합니다.
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: SSE 연결당 OS 스레드 고정 문제 해소
+# [2026-10-17] — HTTP/1.1 keep-alive: 핸들러가 close_connection을 끄면 같은 연결에서 다음 요청 처리
+# [2026-10-17] — SSE 스트림에 요청 헤더 전달 (client.headers — Last-Event-ID 재연결 복구용)
+# ────────────────────────────────────────────────────────────────────────────
+import asyncio
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable
+from urllib.parse import urlparse
+
+from src.http_response import KEEPALIVE_TIMEOUT
+
+MAX_HEADER_BYTES = 64 * 1024
+HEARTBEAT = b": heartbeat\n\n"
+
+StreamFactory = Callable[['SSEClient', str], AsyncIterator[bytes]]
+
+
+class _NullConnection:
+    """executor에서 실행되는 핸들러의 self.connection 대용 (settimeout 등 무시)."""
+
+    def settimeout(self, _timeout) -> None:
+        pass
+
+
+class SSEClient:
+    """스레드 안전 SSE 싱크 — 생산자 스레드 → 이벤트 루프 큐.
+
+    기존 브로드캐스트 코드가 기대하는 두 가지 인터페이스를 모두 제공합니다.
+      - client.wfile.write(bytes) / flush()
+      - client.put_nowait(msg)                ("data: {msg}" 프레임으로 변환)
+    연결이 닫힌 뒤 쓰기는 BrokenPipeError를 내어 브로드캐스터가 세트에서 제거하게 합니다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int = 1000):
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self.closed = False
+        self.dropped = 0
+        self.headers: dict[str, str] = {}   # 요청 헤더 (소문자 이름) — 스트림이 Last-Event-ID 등 참조
+        self.wfile = self
+        self.connection = _NullConnection()
+
+    # ── 생산자 측 (임의 스레드) ─────────────────────────────────────────────
+    def write(self, data: bytes) -> int:
+        if self.closed:
+            raise BrokenPipeError('SSE client closed')
+        self._loop.call_soon_threadsafe(self._offer, bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def put_nowait(self, msg: str) -> None:
+        self.write(f"data: {msg}\n\n".encode('utf-8'))
+
+    def _offer(self, data: bytes) -> None:
+        try:
+            self._queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self.dropped += 1   # 느린 클라이언트 — 가장 최근 프레임을 버림
+
+    # ── 소비자 측 (이벤트 루프) ─────────────────────────────────────────────
+    async def frames(self, heartbeat: float = 30.0) -> AsyncIterator[bytes]:
+        """큐에 들어온 프레임을 내보내고, heartbeat초 동안 없으면 주석 프레임을 보냅니다."""
+        while True:
+            try:
+                yield await asyncio.wait_for(self._queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT
+
+
+class AsyncHTTPServer:
+    """SSEHandler(BaseHTTPRequestHandler 하위 클래스)를 이벤트 루프 위에서 서비스합니다."""
+
+    def __init__(self, address: tuple[str, int], handler_class, streams: dict[str, StreamFactory] | None = None,
+                 max_workers: int = 32):
+        self.server_address = address
+        self.RequestHandlerClass = handler_class
+        self.streams = dict(streams or {})
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='HTTPWorker')
+        # Windows 기본 Proactor 루프는 add_reader를 지원하지 않음 — 스트림(LISTEN 소켓 감시)용으로 Selector 고정
+        self._loop = asyncio.SelectorEventLoop()
+        self._server: asyncio.base_events.Server | None = None
+        self._stopped = threading.Event()
+        self._shutdown_requested: asyncio.Event | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.active_streams = 0
+        self.active_requests = 0
+        # 포트 바인드는 생성 시점에 수행 (ThreadedHTTPServer처럼 충돌이 생성자에서 드러나도록)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, address[0], address[1], reuse_address=True,
+                                 limit=MAX_HEADER_BYTES)
+        )
+        self.server_address = self._server.sockets[0].getsockname()[:2]
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def stats(self) -> dict:
+        return {
+            'mode': 'asyncio',
+            'active_streams': self.active_streams,
+            'active_requests': self.active_requests,
+            'max_workers': self._executor._max_workers,
+        }
+
+    # ── socketserver 호환 수명 주기 ─────────────────────────────────────────
+    def serve_forever(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._serve())
+        finally:
+            self._stopped.set()
+
+    async def _serve(self) -> None:
+        self._shutdown_requested = asyncio.Event()
+        await self._shutdown_requested.wait()
+        self._server.close()
+        # 열린 SSE/요청 처리 태스크를 취소하고 정리(finally)가 끝날 때까지 대기
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def shutdown(self) -> None:
+        if self._loop.is_running() and self._shutdown_requested is not None:
+            self._loop.call_soon_threadsafe(self._shutdown_requested.set)
+            self._stopped.wait(timeout=5)
+
+    def server_close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if not self._loop.is_running() and not self._loop.is_closed():
+            self._server.close()
+            self._loop.close()
+
+    # ── 요청 처리 ───────────────────────────────────────────────────────────
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            await self._handle_request(reader, writer)
+        finally:
+            self._tasks.discard(task)
+
+    async def _handle_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            # HTTP/1.1 keep-alive — 핸들러가 연결 유지를 허용한 동안 같은 연결에서 다음 요청을 읽음
+            while await self._handle_one(reader, writer):
+                pass
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_one(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """요청 1건 처리. 같은 연결에서 다음 요청을 계속 받을 수 있으면 True."""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), timeout=KEEPALIVE_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+            return False
+        request_line, _, header_block = head.decode('iso-8859-1').partition('\r\n')
+        parts = request_line.split()
+        method = parts[0].upper() if parts else ''
+        target = parts[1] if len(parts) > 1 else '/'
+        length = 0
+        headers: dict[str, str] = {}
+        for line in header_block.split('\r\n'):
+            name, _, value = line.partition(':')
+            name = name.strip().lower()
+            headers[name] = value.strip()
+            if name == 'content-length':
+                length = int(value.strip() or 0)
+            elif name == 'transfer-encoding':
+                return False   # chunked 요청 본문 미지원 — 경계를 알 수 없으므로 연결 종료
+        body = await reader.readexactly(length) if length > 0 else b''
+
+        path = urlparse(target).path
+        factory = self.streams.get(path) if method == 'GET' else None
+        if factory is not None:
+            await self._serve_stream(factory, target, headers, reader, writer)
+            return False
+        self.active_requests += 1
+        try:
+            response, close = await self._loop.run_in_executor(
+                self._executor, self._run_blocking, head + body, writer.get_extra_info('peername'))
+        finally:
+            self.active_requests -= 1
+        writer.write(response)
+        await writer.drain()
+        return not close
+
+    def _run_blocking(self, raw: bytes, client_address) -> tuple[bytes, bool]:
+        """기존 SSEHandler를 소켓 없이 실행 — rfile/wfile을 BytesIO로 대체하여 응답 바이트를 수집.
+
+        반환: (응답 바이트, 연결 종료 여부). 핸들러의 close_connection(HTTP 버전·Connection 헤더·
+        길이 없는 응답)을 그대로 따릅니다.
+        """
+        handler = self.RequestHandlerClass.__new__(self.RequestHandlerClass)
+        handler.server = self
+        handler.client_address = client_address or ('', 0)
+        handler.request = handler.connection = _NullConnection()
+        handler.rfile = io.BytesIO(raw)
+        handler.wfile = io.BytesIO()
+        handler.close_connection = True
+        try:
+            handler.handle_one_request()
+        except Exception as e:
+            print(f"[AsyncHTTP] 핸들러 오류: {e}")
+            return handler.wfile.getvalue(), True
+        return handler.wfile.getvalue(), bool(handler.close_connection)
+
+    async def _serve_stream(self, factory: StreamFactory, target: str, headers: dict[str, str],
+                            reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = SSEClient(self._loop)
+        client.headers = headers
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Access-Control-Allow-Origin: *\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: keep-alive\r\n\r\n"
+        )
+        frames = factory(client, target)
+
+        async def _pump() -> None:
+            async for frame in frames:
+                writer.write(frame)
+                await writer.drain()
+
+        # 클라이언트가 끊으면 reader가 EOF — 다음 프레임(최대 하트비트 주기)까지 기다리지 않고 즉시 정리
+        pump = asyncio.ensure_future(_pump())
+        eof = asyncio.ensure_future(reader.read())
+        self.active_streams += 1
+        try:
+            await asyncio.wait({pump, eof}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            client.closed = True
+            self.active_streams -= 1
+            for task in (pump, eof):
+                task.cancel()
+            await asyncio.gather(pump, eof, return_exceptions=True)
+            await frames.aclose()   # 스트림의 finally(클라이언트 세트 제거, LISTEN 해제) 즉시 실행
@@ -0,0 +1,251 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/embedder.py
+# 📝 설명: 배치 임베딩 서비스 — fastembed TextEmbedding 호출을 전용 워커 스레드로 모읍니다.
+#          - 요청 텍스트를 큐에 넣고 워커가 최대 32개씩 묶어 embed() 한 번으로 처리
+#          - 정규화 텍스트의 SHA-256을 키로 하는 캐시 (메모리 LRU + hive_embedding_cache 테이블)
+#            → 내용이 바뀌지 않은 메모리는 다시 임베딩하지 않음
+#          - warm_up(): 서버 기동 후 백그라운드에서 모델 로드 (첫 요청이 로드를 기다리지 않도록)
+#          - stats(): 처리량(texts/sec), 캐시 적중률 카운터
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: server.py _embed() 단건 동기 호출 대체
+# ────────────────────────────────────────────────────────────────────────────
+import hashlib
+import queue
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Callable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAX_TEXT_CHARS = 512
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키/모델 입력용 정규화 — NFC, 공백 축약, 512자 제한."""
+    return ' '.join(unicodedata.normalize('NFC', text or '').split())[:MAX_TEXT_CHARS]
+
+
+def text_hash(normalized: str) -> str:
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+class PgEmbeddingCache:
+    """hive_embedding_cache 테이블 기반 영속 캐시 (pg_store 헬퍼 위임)."""
+
+    def get_many(self, model: str, hashes: list[str]) -> dict[str, bytes]:
+        from src.pg_store import load_cached_embeddings
+        return load_cached_embeddings(model, hashes)
+
+    def put_many(self, model: str, items: dict[str, bytes]) -> None:
+        from src.pg_store import save_cached_embeddings
+        save_cached_embeddings(model, items)
+
+
+class _Request:
+    __slots__ = ('normalized', 'digest', 'result', 'done')
+
+    def __init__(self, normalized: str, digest: str):
+        self.normalized = normalized
+        self.digest = digest
+        self.result: bytes | None = None
+        self.done = threading.Event()
+
+
+class EmbeddingService:
+    """텍스트 → float32 벡터 bytes. 스레드 안전하며 모든 모델 호출은 워커 스레드 하나에서만 수행."""
+
+    def __init__(self, model_name: str, batch_size: int = 32, max_delay: float = 0.02,
+                 memory_cache_size: int = 10000, store: PgEmbeddingCache | None = None,
+                 model_factory: Callable | None = None):
+        self.model_name = model_name
+        self._batch_size = max(1, int(batch_size))
+        self._max_delay = max(0.0, float(max_delay))
+        self._store = store
+        self._model_factory = model_factory or self._load_fastembed
+        self._model = None
+        self._model_failed = False
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._lru: OrderedDict[str, bytes] = OrderedDict()
+        self._lru_size = max(1, int(memory_cache_size))
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._embedded = 0
+        self._batches = 0
+        self._embed_seconds = 0.0
+        self._model_load_ms = 0.0
+
+    # ── 공개 API ────────────────────────────────────────────────────────────
+    def embed(self, text: str, timeout: float | None = 30.0) -> bytes | None:
+        """단건 임베딩. 모델 불가 또는 timeout 시 None."""
+        return self.embed_many([text], timeout=timeout)[0]
+
+    def embed_many(self, texts: list[str], timeout: float | None = 30.0) -> list[bytes | None]:
+        """여러 텍스트를 한 번에 제출 — 캐시 적중분은 즉시, 나머지는 워커 배치로 계산."""
+        results: list[bytes | None] = [None] * len(texts)
+        pending: list[tuple[int, _Request]] = []
+        for i, text in enumerate(texts):
+            normalized = normalize_text(text)
+            if not normalized:
+                continue
+            digest = text_hash(normalized)
+            cached = self._lru_get(digest)
+            if cached is not None:
+                self._count(hits=1)
+                results[i] = cached
+                continue
+            request = _Request(normalized, digest)
+            pending.append((i, request))
+        if not pending:
+            return results
+        self._ensure_worker()
+        for _, request in pending:
+            self._queue.put(request)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for i, request in pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if request.done.wait(remaining):
+                results[i] = request.result
+        return results
+
+    def warm_up(self) -> None:
+        """모델 로드를 워커 스레드에서 미리 수행 (반환을 기다리지 않음)."""
+        self._ensure_worker()
+        self._queue.put(None)
+
+    @property
+    def ready(self) -> bool:
+        return self._model is not None
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                'model': self.model_name,
+                'model_loaded': self._model is not None,
+                'model_failed': self._model_failed,
+                'model_load_ms': round(self._model_load_ms, 1),
+                'queue_depth': self._queue.qsize(),
+                'cache_size': len(self._lru),
+                'cache_hits': self._hits,
+                'cache_misses': self._misses,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0,
+                'texts_embedded': self._embedded,
+                'batches': self._batches,
+                'avg_batch_size': round(self._embedded / self._batches, 2) if self._batches else 0.0,
+                'texts_per_sec': round(self._embedded / self._embed_seconds, 1) if self._embed_seconds else 0.0,
+            }
+
+    # ── 내부 ────────────────────────────────────────────────────────────────
+    def _load_fastembed(self):
+        from fastembed import TextEmbedding
+        return TextEmbedding(model_name=self.model_name)
+
+    def _count(self, hits: int = 0, misses: int = 0) -> None:
+        with self._stats_lock:
+            self._hits += hits
+            self._misses += misses
+
+    def _lru_get(self, digest: str) -> bytes | None:
+        with self._stats_lock:
+            value = self._lru.get(digest)
+            if value is not None:
+                self._lru.move_to_end(digest)
+            return value
+
+    def _lru_put(self, items: dict[str, bytes]) -> None:
+        with self._stats_lock:
+            for digest, value in items.items():
+                self._lru[digest] = value
+                self._lru.move_to_end(digest)
+            while len(self._lru) > self._lru_size:
+                self._lru.popitem(last=False)
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name='EmbeddingWorker')
+                self._thread.start()
+
+    def _get_model(self):
+        if self._model is None and not self._model_failed:
+            started = time.perf_counter()
+            try:
+                self._model = self._model_factory()
+                print(f"[Embedding] 모델 로드 완료: {self.model_name}")
+            except Exception as e:
+                print(f"[Embedding] 모델 로드 실패: {e}")
+                self._model_failed = True  # 실패 표시 (재시도 방지)
+            self._model_load_ms = (time.perf_counter() - started) * 1000
+        return self._model
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            batch = [] if first is None else [first]   # None = warm-up 신호
+            deadline = time.monotonic() + self._max_delay
+            while batch and len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    batch.append(item)
+            model = self._get_model()
+            if batch:
+                self._process(model, batch)
+
+    def _process(self, model, batch: list[_Request]) -> None:
+        try:
+            resolved = self._resolve(model, batch)
+        except Exception as e:
+            print(f"[Embedding] 배치 변환 실패: {e}")
+            resolved = {}
+        for request in batch:
+            request.result = resolved.get(request.digest)
+            request.done.set()
+
+    def _resolve(self, model, batch: list[_Request]) -> dict[str, bytes]:
+        unique = OrderedDict((r.digest, r.normalized) for r in batch)
+        resolved: dict[str, bytes] = {}
+        for digest in unique:            # 대기 중 다른 배치가 채운 항목
+            cached = self._lru_get(digest)
+            if cached is not None:
+                resolved[digest] = cached
+        missing = [d for d in unique if d not in resolved]
+        if missing and self._store is not None:
+            try:
+                resolved.update(self._store.get_many(self.model_name, missing))
+            except Exception as e:
+                print(f"[Embedding] 캐시 조회 실패: {e}")
+        to_embed = [d for d in unique if d not in resolved]
+        missed = sum(1 for r in batch if r.digest not in resolved)
+        self._count(hits=len(batch) - missed, misses=missed)
+        fresh: dict[str, bytes] = {}
+        if to_embed and model is not None and np is not None:
+            started = time.perf_counter()
+            vectors = list(model.embed([unique[d] for d in to_embed], batch_size=self._batch_size))
+            elapsed = time.perf_counter() - started
+            fresh = {d: np.asarray(v, dtype=np.float32).tobytes() for d, v in zip(to_embed, vectors)}
+            with self._stats_lock:
+                self._embedded += len(fresh)
+                self._batches += 1
+                self._embed_seconds += elapsed
+            if fresh and self._store is not None:
+                try:
+                    self._store.put_many(self.model_name, fresh)
+                except Exception as e:
+                    print(f"[Embedding] 캐시 저장 실패: {e}")
+        resolved.update(fresh)
+        self._lru_put(resolved)
+        return resolved
@@ -0,0 +1,260 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/event_bus.py
+# 📝 설명: SSE 이벤트 버스 — 생산자 무블로킹 발행 + 구독자별 고정 크기 링 버퍼
+#          FSChangeHandler / /api/thoughts/add / 에이전트 브로드캐스트 워커 / hive_log LISTEN 리스너가
+#          구독자 소켓에 직접 쓰던 것을 publish()로 대체합니다. 소켓 쓰기는 구독자마다 전용 라이터
+#          (스레드 모드: 해당 SSE 핸들러 스레드, asyncio 모드: 스트림 코루틴)만 수행하므로
+#          느린 브라우저 탭 하나가 watchdog 옵저버나 POST 핸들러를 붙잡지 않습니다.
+#          - 링이 가득 차면 가장 오래된 프레임을 버리고 lagged 카운터 증가 (최신 상태 우선)
+#          - 프레임은 발행 시 한 번만 직렬화되어 모든 구독자가 같은 bytes를 공유
+#          - 재연결 복구: 토픽별 단조 증가 id('id:' 필드) + 최근 프레임 재전송 링(replay).
+#            subscribe(last_event_id=...)가 놓친 프레임만 구독자 링에 미리 채우고 resumed=True.
+#            id는 서버 시작 시각(ms)에서 출발 — 이전 실행의 id나 링보다 오래된 id는 스냅샷 재전송 대상
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: SSE 4종 브로드캐스트 통합
+# [2026-10-17] — Last-Event-ID 재연결 복구: 이벤트 id + 토픽별 replay 링
+# ────────────────────────────────────────────────────────────────────────────
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import AsyncIterator, Iterator
+
+DEFAULT_RING_SIZE = 256
+DEFAULT_REPLAY_SIZE = 256
+HEARTBEAT = b": heartbeat\n\n"
+
+
+def sse_frame(data) -> bytes:
+    """dict/list → JSON, str → 그대로 — 'data: ...' SSE 프레임 bytes."""
+    text = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False)
+    return f"data: {text}\n\n".encode('utf-8')
+
+
+def parse_last_event_id(headers, query: dict | None = None) -> int | None:
+    """Last-Event-ID 헤더(EventSource 자동 재연결) 또는 ?last_event_id= (수동 재연결) → int."""
+    value = None
+    if headers is not None:
+        value = headers.get('Last-Event-ID') or headers.get('last-event-id')
+    if not value and query:
+        value = (query.get('last_event_id') or [None])[0]
+    try:
+        return int(str(value).strip()) if value else None
+    except ValueError:
+        return None
+
+
+class Subscriber:
+    """구독자 1명의 링 버퍼. offer()는 어느 스레드에서나 즉시 반환합니다."""
+
+    def __init__(self, bus: 'EventBus', topic: str, ring_size: int):
+        self.bus = bus
+        self.topic = topic
+        self.ring_size = ring_size
+        self._ring: deque = deque()
+        self._cond = threading.Condition()
+        self._waker = None          # asyncio 소비자 깨우기 콜백 (aframes 실행 중에만)
+        self.closed = False
+        self.delivered = 0
+        self.lagged = 0             # 링 초과로 버려진 프레임 수
+        self.cursor = 0             # 구독 시점의 토픽 마지막 id
+        self.resumed = False        # Last-Event-ID 이후 프레임을 replay 링에서 모두 복구했는지
+
+    # ── 생산자 측 ───────────────────────────────────────────────────────────
+    def offer(self, frame: bytes) -> None:
+        with self._cond:
+            if self.closed:
+                return
+            was_empty = not self._ring
+            if len(self._ring) >= self.ring_size:
+                self._ring.popleft()
+                self.lagged += 1
+            self._ring.append(frame)
+            self._cond.notify()
+            waker = self._waker if was_empty else None
+        if waker is not None:
+            waker()
+
+    # ── 소비자 측 ───────────────────────────────────────────────────────────
+    def drain(self, timeout: float | None = None) -> list[bytes] | None:
+        """쌓인 프레임 전체를 꺼냄. timeout 동안 없으면 [], 구독 종료 시 None."""
+        with self._cond:
+            if not self._ring and not self.closed:
+                self._cond.wait(timeout)
+            if self.closed:
+                return None
+            batch = list(self._ring)
+            self._ring.clear()
+            self.delivered += len(batch)
+            return batch
+
+    def frames(self, heartbeat: float = 30.0) -> Iterator[bytes]:
+        """스레드 소비자 — 프레임을 내보내고 heartbeat초 동안 없으면 주석 프레임."""
+        while True:
+            batch = self.drain(heartbeat)
+            if batch is None:
+                return
+            if not batch:
+                yield HEARTBEAT
+            yield from batch
+
+    async def aframes(self, heartbeat: float = 30.0) -> AsyncIterator[bytes]:
+        """asyncio 소비자 — 생산자 스레드는 call_soon_threadsafe로 루프만 깨웁니다."""
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+
+        def _wake():
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                pass   # 루프 종료 후 발행
+
+        self._waker = _wake
+        try:
+            while True:
+                ready.clear()
+                batch = self.drain(0)
+                if batch is None:
+                    return
+                if batch:
+                    for frame in batch:
+                        yield frame
+                    continue
+                try:
+                    await asyncio.wait_for(ready.wait(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+        finally:
+            self._waker = None
+
+    def cursor_frame(self) -> bytes:
+        """data 없는 'id:' 프레임 — id 없는 스냅샷 뒤에 보내 브라우저의 lastEventId를 현재 위치로 맞춤."""
+        return f"id: {self.cursor}\n\n".encode('ascii')
+
+    def write_to(self, wfile, heartbeat: float = 30.0) -> None:
+        """스레드 모드 전용 라이터 — 소켓 쓰기 실패(연결 종료) 또는 close()까지 전송."""
+        for frame in self.frames(heartbeat):
+            wfile.write(frame)
+            wfile.flush()
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._ring.clear()
+            self._cond.notify_all()
+            waker = self._waker
+        self.bus._remove(self)
+        if waker is not None:
+            waker()
+
+    def __enter__(self) -> 'Subscriber':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EventBus:
+    """토픽별 구독자 집합. publish()는 구독자 링에 넣기만 하고 소켓 I/O를 하지 않습니다."""
+
+    def __init__(self, ring_sizes: dict[str, int] | None = None, default_ring_size: int = DEFAULT_RING_SIZE,
+                 replay_sizes: dict[str, int] | None = None, default_replay_size: int = DEFAULT_REPLAY_SIZE):
+        self._ring_sizes = dict(ring_sizes or {})
+        self._default_ring_size = default_ring_size
+        self._replay_sizes = dict(replay_sizes or {})
+        self._default_replay_size = default_replay_size
+        self._topics: dict[str, set[Subscriber]] = {}
+        self._lock = threading.Lock()
+        self._id_base = int(time.time() * 1000)     # 재시작 후에도 이전 실행의 id보다 커지도록
+        self._last_id: dict[str, int] = {}
+        self._replay: dict[str, deque] = {}         # topic → deque[(id, frame)]
+        self._published: dict[str, int] = {}
+        self._lagged_closed: dict[str, int] = {}   # 이미 끊긴 구독자의 lagged 누적
+        self._resumed: dict[str, int] = {}
+        self._snapshots: dict[str, int] = {}
+
+    def subscribe(self, topic: str, ring_size: int | None = None, last_event_id: int | None = None) -> Subscriber:
+        """구독 등록. last_event_id가 replay 링 범위 안이면 그 이후 프레임을 미리 채우고 resumed=True.
+
+        resumed가 False면 호출자가 스냅샷(초기 데이터)을 보내야 합니다.
+        """
+        sub = Subscriber(self, topic, ring_size or self._ring_sizes.get(topic, self._default_ring_size))
+        with self._lock:
+            last = self._last_id.get(topic, self._id_base)
+            sub.cursor = last
+            if last_event_id is not None:
+                replay = self._replay.get(topic, ())
+                oldest = replay[0][0] if replay else last + 1
+                if oldest - 1 <= last_event_id <= last:
+                    for event_id, frame in replay:
+                        if event_id > last_event_id:
+                            sub.offer(frame)
+                    sub.resumed = True
+            counter = self._resumed if sub.resumed else self._snapshots
+            counter[topic] = counter.get(topic, 0) + 1
+            self._topics.setdefault(topic, set()).add(sub)
+        return sub
+
+    def _remove(self, sub: Subscriber) -> None:
+        with self._lock:
+            subs = self._topics.get(sub.topic)
+            if subs is not None and sub in subs:
+                subs.discard(sub)
+                self._lagged_closed[sub.topic] = self._lagged_closed.get(sub.topic, 0) + sub.lagged
+
+    def publish(self, topic: str, frame: bytes) -> int:
+        """'data:' 프레임에 다음 id를 붙여 replay 링과 구독자 전원의 링에 넣고 구독자 수를 반환.
+
+        id 부여와 링 삽입을 한 락 안에서 처리해 모든 구독자가 id 오름차순으로 받습니다
+        (offer는 deque 조작뿐이라 소켓 I/O 없음).
+        """
+        with self._lock:
+            event_id = self._last_id.get(topic, self._id_base) + 1
+            self._last_id[topic] = event_id
+            framed = b'id: %d\n' % event_id + frame
+            replay = self._replay.get(topic)
+            if replay is None:
+                replay = self._replay[topic] = deque(
+                    maxlen=max(1, self._replay_sizes.get(topic, self._default_replay_size)))
+            replay.append((event_id, framed))
+            self._published[topic] = self._published.get(topic, 0) + 1
+            subs = list(self._topics.get(topic, ()))
+            for sub in subs:
+                sub.offer(framed)
+        return len(subs)
+
+    def publish_json(self, topic: str, data) -> int:
+        return self.publish(topic, sse_frame(data))
+
+    def last_id(self, topic: str) -> int:
+        with self._lock:
+            return self._last_id.get(topic, self._id_base)
+
+    def subscriber_count(self, topic: str) -> int:
+        with self._lock:
+            return len(self._topics.get(topic, ()))
+
+    def stats(self) -> dict:
+        with self._lock:
+            topics = {name: list(subs) for name, subs in self._topics.items()}
+            published = dict(self._published)
+            lagged_closed = dict(self._lagged_closed)
+            last_ids = dict(self._last_id)
+            replay_lens = {name: len(replay) for name, replay in self._replay.items()}
+            resumed, snapshots = dict(self._resumed), dict(self._snapshots)
+        result = {}
+        for name in set(topics) | set(published) | set(snapshots) | set(resumed):
+            subs = topics.get(name, [])
+            result[name] = {
+                'subscribers': len(subs),
+                'published': published.get(name, 0),
+                'lagged': lagged_closed.get(name, 0) + sum(s.lagged for s in subs),
+                'max_backlog': max((len(s._ring) for s in subs), default=0),
+                'ring_size': self._ring_sizes.get(name, self._default_ring_size),
+                'last_id': last_ids.get(name, self._id_base),
+                'replay': replay_lens.get(name, 0),
+                'resumed': resumed.get(name, 0),      # Last-Event-ID로 놓친 프레임만 받은 재연결
+                'snapshots': snapshots.get(name, 0),  # 스냅샷(초기 데이터) 전송이 필요했던 연결
+            }
+        return result
@@ -1,15 +1,35 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/file_store.py
+# 📝 설명: PostgreSQL 없이 동작하는 레거시 파일 저장소 — 공유 메모리 / 세션 로그 / 스킬 체인
+# 🕒 변경 이력:
+# [2026-10-17] — 공유 메모리를 append-only 레코드 로그 + key→오프셋 인덱스로 전환
+#   - 기존: upsert 1건마다 shared_memory.json 전체 로드 → 정렬 → 들여쓰기 JSON 전체 재기록,
+#           get은 전체 로드 + 정렬 + 선형 탐색 (merge_memory_files / MemoryWatcher 폭주 시 O(n²))
+#   - shared_memory.jsonl: 한 줄 = {"k": 키, "v": 항목} (삭제는 "v": null). 쓰기는 한 줄 추가만
+#   - 열 때 한 번 훑어 인덱스 재구성, 이후에는 추가된 꼬리만 반영 (다른 프로세스의 추가 / 교체도 감지)
+#   - 죽은 레코드가 임계값을 넘으면 백그라운드 스레드가 살아 있는 항목만 새 파일로 써서 os.replace
+#   - 추가와 압축은 shared_memory.jsonl.lock(filelock)으로 프로세스 간 직렬화 — 압축이 읽은 뒤
+#     교체하기 전에 다른 프로세스(훅, MemoryWatcher)가 추가한 레코드가 사라지지 않도록
+#   - 로그가 없고 기존 shared_memory.json이 있으면 최초 1회 가져옴. 공개 함수 시그니처는 그대로
+# ────────────────────────────────────────────────────────────────────────────
 import json
+import os
 import threading
 import time
 from pathlib import Path
 
+from filelock import FileLock
 
-MEMORY_FILE_NAME = 'shared_memory.json'
+MEMORY_FILE_NAME = 'shared_memory.jsonl'
+LEGACY_MEMORY_FILE_NAME = 'shared_memory.json'   # 레코드 로그 이전 형식 (최초 1회 가져옴)
 SESSION_LOGS_FILE_NAME = 'session_logs.jsonl'
 SKILL_CHAIN_FILE_NAME = 'skill_chain.json'
 
 _LOCKS: dict[str, threading.Lock] = {}
 _LOCKS_GUARD = threading.Lock()
+_STORES: dict[str, 'MemoryLog'] = {}
+
+COMPACT_MIN_DEAD = 256   # 죽은 레코드가 이 수 이상이면서 살아 있는 항목 수보다 많으면 압축
 
 
 def _lock_for(path: Path) -> threading.Lock:
@@ -28,6 +48,10 @@ def memory_file(data_dir: Path) -> Path:
     return data_dir / MEMORY_FILE_NAME
 
 
+def legacy_memory_file(data_dir: Path) -> Path:
+    return data_dir / LEGACY_MEMORY_FILE_NAME
+
+
 def session_logs_file(data_dir: Path) -> Path:
     return data_dir / SESSION_LOGS_FILE_NAME
 
@@ -38,9 +62,7 @@ def skill_chain_file(data_dir: Path) -> Path:
 
 def ensure_legacy_store(data_dir: Path) -> None:
     data_dir.mkdir(parents=True, exist_ok=True)
-    memory_path = memory_file(data_dir)
-    if not memory_path.exists():
-        _write_json(memory_path, [])
+    memory_log(data_dir)
     sessions_path = session_logs_file(data_dir)
     if not sessions_path.exists():
         sessions_path.write_text('', encoding='utf-8')
@@ -68,40 +90,237 @@ def _write_json(path: Path, payload) -> None:
         tmp_path.replace(path)
 
 
+class MemoryLog:
+    """공유 메모리 레코드 로그 1개. key → (오프셋, 길이, created_at, updated_at) 인덱스를 메모리에 유지합니다."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(str(path) + '.lock')   # 프로세스 간 (추가 / 압축 / 최초 생성)
+        self._index: dict[str, tuple[int, int, str, str]] = {}
+        self._ino = None
+        self._end = 0          # 마지막 완결된 줄 다음 오프셋
+        self.records = 0       # 파일 안의 레코드 수 (죽은 레코드 포함)
+        self.compactions = 0
+        self._compacting = False
+
+    # ── 인덱스 ──────────────────────────────────────────────────────────────
+    def _reset(self) -> None:
+        self._index.clear()
+        self._ino = None
+        self._end = 0
+        self.records = 0
+
+    def _ingest(self, data: bytes, base: int) -> None:
+        pos = 0
+        while True:
+            newline = data.find(b'\n', pos)
+            if newline < 0:
+                break
+            raw = data[pos:newline]
+            offset = base + pos
+            pos = newline + 1
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                continue   # 빈 줄 / 중단된 쓰기의 잔해
+            if not isinstance(record, dict) or not isinstance(record.get('k'), str):
+                continue
+            self.records += 1
+            value = record.get('v')
+            if isinstance(value, dict):
+                self._index[record['k']] = (offset, len(raw), str(value.get('created_at', '')),
+                                            str(value.get('updated_at', '')))
+            else:
+                self._index.pop(record['k'], None)
+        self._end = base + pos
+
+    def _refresh(self) -> None:
+        """파일 변경을 인덱스에 반영 — 교체/잘림이면 처음부터, 늘었으면 꼬리만."""
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            self._reset()
+            return
+        with f:
+            st = os.fstat(f.fileno())
+            ino = (st.st_dev, st.st_ino)
+            if ino != self._ino or st.st_size < self._end:
+                self._reset()
+                self._ino = ino
+            if st.st_size == self._end:
+                return
+            f.seek(self._end)
+            data = f.read(st.st_size - self._end)
+        self._ingest(data, self._end)
+
+    def open(self, legacy_path: Path | None = None) -> None:
+        """로그가 없으면 생성 (기존 JSON 배열 파일이 있으면 그 항목으로)."""
+        if self.path.exists():
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._file_lock:
+            if self.path.exists():
+                return
+            entries = _read_json(legacy_path, []) if legacy_path is not None else []
+            latest: dict[str, dict] = {}
+            for entry in entries if isinstance(entries, list) else []:
+                if not isinstance(entry, dict) or not entry.get('key'):
+                    continue
+                current = latest.get(entry['key'])
+                if current is None or str(entry.get('updated_at', '')) > str(current.get('updated_at', '')):
+                    latest[entry['key']] = entry
+            self._rewrite(latest.items())
+
+    # ── 읽기 ────────────────────────────────────────────────────────────────
+    def _read(self, f, offset: int, length: int) -> dict:
+        f.seek(offset)
+        return json.loads(f.read(length))['v']
+
+    def _open_indexed(self):
+        """인덱스와 같은 파일을 엽니다 — 그 사이 다른 프로세스가 압축으로 교체했으면 다시 인덱싱."""
+        for _ in range(3):
+            f = open(self.path, 'rb')
+            st = os.fstat(f.fileno())
+            if (st.st_dev, st.st_ino) == self._ino:
+                return f
+            f.close()
+            self._refresh()
+        raise OSError(f'{self.path}: 파일이 계속 교체되는 중')
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            self._refresh()
+            if key not in self._index:
+                return None
+            with self._open_indexed() as f:
+                slot = self._index.get(key)
+                return None if slot is None else self._read(f, slot[0], slot[1])
+
+    def meta(self, key: str) -> tuple[str, str] | None:
+        """(created_at, updated_at) — 파일을 읽지 않음."""
+        with self._lock:
+            self._refresh()
+            slot = self._index.get(key)
+            return None if slot is None else (slot[2], slot[3])
+
+    def entries(self) -> list[dict]:
+        """살아 있는 항목 전체 (updated_at 내림차순)."""
+        with self._lock:
+            self._refresh()
+            if not self._index:
+                return []
+            with self._open_indexed() as f:
+                slots = sorted(self._index.values(), key=lambda slot: slot[3], reverse=True)
+                return [self._read(f, offset, length) for offset, length, _, _ in slots]
+
+    # ── 쓰기 ────────────────────────────────────────────────────────────────
+    def write(self, items: list[tuple[str, dict | None]]) -> None:
+        """(키, 항목 또는 None=삭제) 레코드들을 한 번에 추가합니다."""
+        if not items:
+            return
+        with self._lock, self._file_lock:
+            self._refresh()
+            payload = b''.join(
+                json.dumps({'k': key, 'v': value}, ensure_ascii=False).encode('utf-8') + b'\n'
+                for key, value in items
+            )
+            try:
+                size = self.path.stat().st_size
+            except OSError:
+                size = 0
+            if size != self._end:
+                payload = b'\n' + payload   # 중단된 쓰기가 남긴 미완결 줄과 분리
+            with open(self.path, 'ab') as f:
+                f.write(payload)
+            self._refresh()
+            self._maybe_compact()
+
+    # ── 압축 ────────────────────────────────────────────────────────────────
+    def dead_records(self) -> int:
+        return self.records - len(self._index)
+
+    def _maybe_compact(self) -> None:
+        dead = self.dead_records()
+        if self._compacting or dead < COMPACT_MIN_DEAD or dead <= len(self._index):
+            return
+        self._compacting = True
+        threading.Thread(target=self.compact, daemon=True, name='MemoryLogCompact').start()
+
+    def compact(self) -> None:
+        """살아 있는 항목만 새 파일로 옮겨 교체합니다 (updated_at 내림차순)."""
+        with self._lock, self._file_lock:
+            try:
+                self._refresh()
+                with self._open_indexed() as f:
+                    slots = sorted(self._index.items(), key=lambda item: item[1][3], reverse=True)
+                    live = [(key, self._read(f, offset, length)) for key, (offset, length, _, _) in slots]
+                self._rewrite(live)
+                self.compactions += 1
+            finally:
+                self._compacting = False
+
+    def _rewrite(self, items) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            for key, entry in items:
+                f.write(json.dumps({'k': key, 'v': entry}, ensure_ascii=False).encode('utf-8') + b'\n')
+        tmp_path.replace(self.path)
+        self._reset()
+        self._refresh()
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._refresh()
+            return {'live': len(self._index), 'dead': self.dead_records(), 'bytes': self._end,
+                    'compactions': self.compactions}
+
+
+def memory_log(data_dir: Path) -> MemoryLog:
+    """data_dir의 공유 메모리 로그 (프로세스 안에서 경로당 1개)."""
+    path = memory_file(data_dir)
+    key = str(path.resolve())
+    with _LOCKS_GUARD:
+        store = _STORES.get(key)
+        if store is None:
+            store = _STORES[key] = MemoryLog(path)
+    store.open(legacy_memory_file(data_dir))
+    return store
+
+
+def _normalize_tags(tags) -> list:
+    if isinstance(tags, str):
+        try:
+            tags = json.loads(tags)
+        except Exception:
+            tags = [tag.strip() for tag in tags.split(',') if tag.strip()]
+    return tags if isinstance(tags, list) else []
+
+
 def load_memory_entries(data_dir: Path) -> list[dict]:
     ensure_legacy_store(data_dir)
-    entries = _read_json(memory_file(data_dir), [])
-    if not isinstance(entries, list):
-        return []
     result = []
-    for entry in entries:
-        if not isinstance(entry, dict):
-            continue
+    for entry in memory_log(data_dir).entries():
         item = dict(entry)
-        tags = item.get('tags', [])
-        if isinstance(tags, str):
-            try:
-                tags = json.loads(tags)
-            except Exception:
-                tags = [tag.strip() for tag in tags.split(',') if tag.strip()]
-        if not isinstance(tags, list):
-            tags = []
-        item['tags'] = tags
+        item['tags'] = _normalize_tags(item.get('tags', []))
         result.append(item)
-    result.sort(key=lambda row: row.get('updated_at', ''), reverse=True)
     return result
 
 
 def get_memory_entry(data_dir: Path, key: str) -> dict | None:
-    for entry in load_memory_entries(data_dir):
-        if entry.get('key') == key:
-            return entry
-    return None
+    ensure_legacy_store(data_dir)
+    entry = memory_log(data_dir).get(key)
+    if entry is None:
+        return None
+    item = dict(entry)
+    item['tags'] = _normalize_tags(item.get('tags', []))
+    return item
 
 
 def upsert_memory_entry(data_dir: Path, entry: dict) -> dict:
     ensure_legacy_store(data_dir)
-    entries = load_memory_entries(data_dir)
+    store = memory_log(data_dir)
     payload = dict(entry)
     payload['key'] = str(payload.get('key', '')).strip()
     payload['title'] = str(payload.get('title', '') or payload['key'])
@@ -110,34 +329,22 @@ def upsert_memory_entry(data_dir: Path, entry: dict) -> dict:
     payload['project'] = str(payload.get('project', ''))
     payload['created_at'] = str(payload.get('created_at', '') or payload.get('updated_at', '') or _now_iso())
     payload['updated_at'] = str(payload.get('updated_at', '') or _now_iso())
-    tags = payload.get('tags', [])
-    if isinstance(tags, str):
-        try:
-            tags = json.loads(tags)
-        except Exception:
-            tags = [tag.strip() for tag in tags.split(',') if tag.strip()]
-    payload['tags'] = tags if isinstance(tags, list) else []
-    replaced = False
-    for index, current in enumerate(entries):
-        if current.get('key') == payload['key']:
-            payload['created_at'] = current.get('created_at', payload['created_at'])
-            entries[index] = payload
-            replaced = True
-            break
-    if not replaced:
-        entries.append(payload)
-    entries.sort(key=lambda row: row.get('updated_at', ''), reverse=True)
-    _write_json(memory_file(data_dir), entries)
+    payload['tags'] = _normalize_tags(payload.get('tags', []))
+    with store._lock:   # 기존 created_at 조회와 기록 사이에 다른 upsert가 끼지 않도록
+        current = store.meta(payload['key'])
+        if current is not None:
+            payload['created_at'] = current[0] or payload['created_at']
+        store.write([(payload['key'], payload)])
     return payload
 
 
 def delete_memory_entry(data_dir: Path, key: str) -> bool:
     ensure_legacy_store(data_dir)
-    entries = load_memory_entries(data_dir)
-    filtered = [entry for entry in entries if entry.get('key') != key]
-    if len(filtered) == len(entries):
-        return False
-    _write_json(memory_file(data_dir), filtered)
+    store = memory_log(data_dir)
+    with store._lock:
+        if store.meta(key) is None:
+            return False
+        store.write([(key, None)])
     return True
 
 
@@ -146,20 +353,20 @@ def merge_memory_files(source_dir: Path, target_dir: Path) -> tuple[int, int]:
     ensure_legacy_store(target_dir)
     merged = 0
     skipped = 0
-    target_entries = {entry.get('key'): entry for entry in load_memory_entries(target_dir)}
-    for entry in load_memory_entries(source_dir):
-        key = entry.get('key')
-        if not key:
-            continue
-        current = target_entries.get(key)
-        if current is None or str(current.get('updated_at', '')) < str(entry.get('updated_at', '')):
-            target_entries[key] = entry
-            merged += 1
-        else:
-            skipped += 1
-    rows = list(target_entries.values())
-    rows.sort(key=lambda row: row.get('updated_at', ''), reverse=True)
-    _write_json(memory_file(target_dir), rows)
+    target = memory_log(target_dir)
+    with target._lock:   # 비교와 기록 사이에 다른 upsert가 끼지 않도록
+        updates = []
+        for entry in load_memory_entries(source_dir):
+            key = entry.get('key')
+            if not key:
+                continue
+            current = target.meta(key)
+            if current is None or current[1] < str(entry.get('updated_at', '')):
+                updates.append((key, entry))
+                merged += 1
+            else:
+                skipped += 1
+        target.write(updates)   # 한 번의 추가로 기록
     return merged, skipped
 
 
@@ -0,0 +1,127 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/hive_activity.py
+# 📝 설명: 하이브 활동 피드 — 로그 기록 시점에 한 번 분류해 고정 크기 링 + 타입별 인덱스에 보관
+#          /api/hive/activity가 3초 폴링마다 task_logs.jsonl 전 줄을 _HIVE_KEYWORDS로 any(kw in task)
+#          재분류하던 것을 대체합니다. 분류는 /api/hive/log/pg(hive_bridge.log_task) 수신 시 1회.
+#          - 키워드 전체를 정규식 하나로 컴파일: 위치마다 0폭 lookahead 교대식으로 "그 위치에서 시작하는
+#            가장 우선순위 높은 타입"을 얻고, 전체 최소 우선순위 = 기존 dict 순서 첫 일치와 동일한 결과
+#          - 링(최신 maxlen개)과 타입별 deque 인덱스 — 조회는 슬라이스만
+#          - 서버 재시작 직후에도 이전 활동이 보이도록 첫 조회 때 task_logs.jsonl(세그먼트 포함)에서 1회 시드
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: 하이브 활동 읽기 시점 재분류 제거
+# ────────────────────────────────────────────────────────────────────────────
+import re
+import threading
+from collections import deque
+from datetime import datetime
+
+from src.jsonl_tail import iter_records
+
+# 타입 → 키워드 (dict 순서 = 우선순위, 대소문자 구분)
+HIVE_KEYWORDS = {
+    'memory_read':  ['하이브 컨텍스트', 'current-work', 'memory.py list', '하이브 컨텍스트 자동 로드'],
+    'memory_write': ['메모리 저장', '하이브 메모리', 'current-work 업데이트', '자동 저장', 'INSERT OR REPLACE'],
+    'orchestrate':  ['오케스트레이션', '스킬 체인', 'vibe-orchestrate', 'skill_orchestrator', '스킬 실행'],
+    'message':      ['메시지 수신', '미읽음 메시지', '→ claude', '→ gemini'],
+    'heal':         ['자기치유', 'heal', '스킬 자동 설치'],
+    'hive_ctx':     ['하이브 컨텍스트 자동 주입', '[하이브 컨텍스트]'],
+    'session':      ['세션 스냅샷', '응답 완료', '─── 응답 완료'],
+}
+HIVE_AGENTS = frozenset({'Hive', 'Claude', '사용자', 'Gemini'})
+DEFAULT_RING_SIZE = 500
+SEED_MAX_LINES = 20000   # 시드 시 역방향으로 훑는 최대 줄 수
+TASK_PREVIEW = 200
+
+_TYPES = list(HIVE_KEYWORDS)
+_GROUPS = [f't{i}' for i in range(len(_TYPES))]
+# 같은 타입 안에서는 긴 키워드 먼저 — 그룹 일치 여부만 쓰므로 결과에는 영향 없음
+_MATCHER = re.compile('(?=' + '|'.join(
+    f'(?P<{group}>' + '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)) + ')'
+    for group, keywords in zip(_GROUPS, HIVE_KEYWORDS.values())
+) + ')')
+
+
+def classify(agent: str, task: str) -> str | None:
+    """하이브 이벤트 타입. 대상 에이전트가 아니거나 어떤 키워드도 없으면 None (Hive는 hive_ctx)."""
+    if agent not in HIVE_AGENTS:
+        return None
+    best = len(_TYPES)
+    for match in _MATCHER.finditer(task or ''):
+        best = min(best, _GROUPS.index(match.lastgroup))
+        if best == 0:
+            break
+    if best < len(_TYPES):
+        return _TYPES[best]
+    return 'hive_ctx' if agent == 'Hive' else None
+
+
+class HiveActivityFeed:
+    """분류된 하이브 이벤트 링 + 타입별 인덱스 (스레드 안전)."""
+
+    def __init__(self, seed_path=None, maxlen: int = DEFAULT_RING_SIZE):
+        self.maxlen = maxlen
+        self._ring: deque = deque(maxlen=maxlen)
+        self._by_type: dict[str, deque] = {t: deque(maxlen=maxlen) for t in _TYPES}
+        self._lock = threading.Lock()
+        self._seed_path = seed_path
+        self._seeded = seed_path is None
+        self.ingested = 0
+        self.classified = 0
+
+    def add(self, agent: str, task: str, timestamp: str | None = None) -> dict | None:
+        """로그 1건을 분류해 보관합니다. 하이브 이벤트가 아니면 None."""
+        event_type = classify(agent, task)
+        with self._lock:
+            self.ingested += 1
+            if event_type is None:
+                return None
+            self.classified += 1
+            event = {
+                'timestamp': timestamp or datetime.now().isoformat(),
+                'agent': agent,
+                'type': event_type,
+                'task': (task or '')[:TASK_PREVIEW],
+            }
+            self._ring.append(event)
+            self._by_type[event_type].append(event)
+            return event
+
+    def _seed(self) -> None:
+        """task_logs.jsonl 최근 기록으로 링 앞쪽(더 오래된 쪽)을 채웁니다. 최초 조회 시 1회."""
+        older = []
+        room = self.maxlen - len(self._ring)
+        for entry in iter_records(self._seed_path, lambda r: isinstance(r, dict), max_lines=SEED_MAX_LINES):
+            if len(older) >= room:
+                break
+            agent, task = entry.get('agent', ''), entry.get('task', '')
+            if not isinstance(agent, str) or not isinstance(task, str):
+                continue
+            event_type = classify(agent, task)
+            if event_type is not None:
+                older.append({'timestamp': entry.get('timestamp', ''), 'agent': agent,
+                              'type': event_type, 'task': task[:TASK_PREVIEW]})
+        for event in older:                      # 최신순 → 왼쪽에 붙이면 시간순이 됨
+            self._ring.appendleft(event)
+            self._by_type[event['type']].appendleft(event)
+
+    def recent(self, limit: int = 100, event_type: str | None = None) -> list[dict]:
+        """최근 이벤트 최대 limit개 (최신순). event_type 지정 시 타입별 인덱스에서."""
+        with self._lock:
+            if not self._seeded:
+                self._seeded = True
+                self._seed()
+            source = self._ring if event_type is None else self._by_type.get(event_type, ())
+            result = []
+            for event in reversed(source):
+                if len(result) >= limit:
+                    break
+                result.append(event)
+            return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'size': len(self._ring), 'maxlen': self.maxlen,
+                'ingested': self.ingested, 'classified': self.classified,
+                'by_type': {t: len(q) for t, q in self._by_type.items()},
+            }
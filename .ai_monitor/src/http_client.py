@@ -0,0 +1,132 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/http_client.py
+# 📝 설명: 스크립트용 keep-alive HTTP 클라이언트 — 호스트별 연결 풀
+#          orchestrator.py / task.py의 api_get·api_post, hive_bridge / hook_bridge의 _call_api가
+#          요청마다 urllib로 TCP 연결을 새로 맺던 것을 http.client 연결 재사용으로 대체합니다.
+#          - (host, port)별 유휴 연결을 최대 MAX_IDLE_PER_HOST개 보관, 스레드 안전
+#          - 서버가 유휴 연결을 먼저 닫은 경우(재사용 연결에서 끊김) 새 연결로 1회 재시도
+#            (응답 대기 중 끊김은 서버가 이미 처리했을 수 있으므로 GET/HEAD/OPTIONS만, 전송 중 끊김은 모든 메서드)
+#          - Accept-Encoding: gzip — 서버의 협상 압축(src.http_response) 응답을 자동 해제
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: 서버 HTTP/1.1 keep-alive 도입과 함께 클라이언트 연결 재사용
+# [2026-10-17] — 요청을 보낸 뒤의 끊김은 안전한 메서드만 재시도 (POST 중복 전송 방지)
+# ────────────────────────────────────────────────────────────────────────────
+import gzip
+import http.client
+import json
+import threading
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+MAX_IDLE_PER_HOST = 4
+DEFAULT_TIMEOUT = 3.0
+
+# 재사용 연결이 서버 측 유휴 타임아웃으로 이미 닫혔을 때 나타나는 오류 — 새 연결로 재시도 대상
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                 ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+# 응답을 받기 전에 끊겨도 다시 보내도 되는 메서드 — 나머지는 전송 단계 실패만 재시도
+_RETRY_AFTER_SEND = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+@dataclass
+class Response:
+    status: int
+    headers: dict
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body.decode('utf-8')) if self.body else None
+
+
+class HTTPPool:
+    """http.client.HTTPConnection 풀 — request()마다 유휴 연결을 꺼내 쓰고 돌려놓습니다."""
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple[str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.created = 0   # 새로 맺은 TCP 연결 수 — 재사용 효과 확인용
+        self.reused = 0
+
+    def _acquire(self, host: str, port: int, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get((host, port))
+            if idle:
+                self.reused += 1
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            self.created += 1
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _release(self, host: str, port: int, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((host, port), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, url: str, body: bytes | None = None,
+                headers: dict | None = None, timeout: float = DEFAULT_TIMEOUT) -> Response:
+        """요청을 보내고 응답 전체를 읽어 반환. 연결 실패는 OSError / http.client.HTTPException."""
+        parts = urlsplit(url)
+        host, port = parts.hostname or 'localhost', parts.port or 80
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        send_headers = {'Accept-Encoding': 'gzip', **(headers or {})}
+        retry_after_send = method.upper() in _RETRY_AFTER_SEND
+        for attempt in (0, 1):
+            conn, reused = self._acquire(host, port, timeout)
+            sent = False
+            try:
+                conn.request(method, target, body=body, headers=send_headers)
+                sent = True
+                resp = conn.getresponse()
+                data = resp.read()
+            except _STALE_ERRORS:
+                conn.close()
+                if reused and attempt == 0 and (retry_after_send or not sent):
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if resp.getheader('Content-Encoding', '').lower() == 'gzip':
+                data = gzip.decompress(data)
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(host, port, conn)
+            return Response(resp.status, {k.lower(): v for k, v in resp.getheaders()}, data)
+        raise ConnectionError(f'{method} {url}: 재시도 후에도 연결 실패')
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            idle = sum(len(conns) for conns in self._idle.values())
+        return {'created': self.created, 'reused': self.reused, 'idle': idle}
+
+
+POOL = HTTPPool()
+
+
+def get(url: str, timeout: float = DEFAULT_TIMEOUT) -> Response:
+    """GET → Response (본문은 .json()으로 파싱)."""
+    return POOL.request('GET', url, timeout=timeout)
+
+
+def post_json(url: str, data, timeout: float = DEFAULT_TIMEOUT) -> Response:
+    """JSON 본문 POST → Response. ensure_ascii=False(UTF-8)로 직렬화합니다."""
+    payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    return POOL.request('POST', url, body=payload,
+                        headers={'Content-Type': 'application/json'}, timeout=timeout)
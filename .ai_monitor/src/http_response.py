@@ -0,0 +1,162 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/http_response.py
+# 📝 설명: 공용 HTTP 응답 작성기 — JSON 직렬화 + Accept-Encoding 협상 gzip + Content-Length
+#          api/hive_api·agent_api·pty_api의 _json_response와 server.py 인라인 핸들러가 함께 사용합니다.
+#          - 본문이 COMPRESS_MIN_BYTES 이상이고 클라이언트가 gzip을 받으면 압축
+#            (폴링 UI / Discord 브리지가 수 초마다 받는 대용량 JSON 대상)
+#          - 압축 여부와 관계없이 항상 Content-Length를 보냄 (연결 재사용·스트림 경계 명확화)
+#          - KeepAliveMixin: BaseHTTPRequestHandler를 HTTP/1.1 지속 연결로 — 길이 없는 응답(SSE 등)은
+#            자동으로 연결 종료로 본문 끝을 표시해 어떤 라우트도 프레이밍이 깨지지 않게 함
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: 핸들러별 무압축/무길이 JSON 응답 통합
+# [2026-10-17] — KeepAliveMixin: HTTP/1.1 keep-alive + 프레이밍 안전망
+# ────────────────────────────────────────────────────────────────────────────
+import gzip
+import io
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+COMPRESS_MIN_BYTES = 1024   # 이보다 작으면 gzip 헤더/CPU 비용이 이득보다 큼
+GZIP_LEVEL = 5              # 동적 응답 — 압축률보다 지연 우선 (6~9는 JSON에서 이득이 작음)
+_COMPRESSIBLE_TYPES = ('application/json', 'text/', 'application/javascript', 'image/svg+xml')
+
+KEEPALIVE_TIMEOUT = float(os.environ.get('VIBE_KEEPALIVE_TIMEOUT', '15'))   # 유휴 연결 유지 시간 (초)
+_BODYLESS_STATUS = (204, 304)
+
+_stats_lock = threading.Lock()
+_stats = {'responses': 0, 'compressed': 0, 'bytes_in': 0, 'bytes_out': 0}
+
+
+def accepted_encodings(header: str | None) -> set[str]:
+    """Accept-Encoding 헤더에서 q>0인 코딩 집합 (identity는 항상 포함)."""
+    result = {'identity'}
+    for item in (header or '').split(','):
+        name, _, params = item.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            result.add(name)
+    if '*' in result:
+        result.update(('gzip', 'br'))
+    return result
+
+
+def negotiate(body: bytes, content_type: str, accept_encoding: str | None) -> tuple[bytes, str | None]:
+    """압축 조건을 만족하면 (gzip 본문, 'gzip'), 아니면 (원본, None)."""
+    if len(body) < COMPRESS_MIN_BYTES or not content_type.startswith(_COMPRESSIBLE_TYPES):
+        return body, None
+    if 'gzip' not in accepted_encodings(accept_encoding):
+        return body, None
+    compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if len(compressed) >= len(body):
+        return body, None
+    return compressed, 'gzip'
+
+
+def send_body(handler, body: bytes, content_type: str, status: int = 200,
+              headers: dict | None = None, cors: bool = True) -> None:
+    """본문 전체를 한 번에 전송 — 협상 압축 + Content-Length."""
+    request_headers = getattr(handler, 'headers', None)
+    accept_encoding = request_headers.get('Accept-Encoding') if request_headers is not None else None
+    payload, encoding = negotiate(body, content_type, accept_encoding)
+    handler.send_response(status)
+    handler.send_header('Content-Type', content_type)
+    if cors:
+        handler.send_header('Access-Control-Allow-Origin', '*')
+    for name, value in (headers or {}).items():
+        handler.send_header(name, value)
+    if len(body) >= COMPRESS_MIN_BYTES:
+        handler.send_header('Vary', 'Accept-Encoding')
+    if encoding:
+        handler.send_header('Content-Encoding', encoding)
+    handler.send_header('Content-Length', str(len(payload)))
+    handler.end_headers()
+    handler.wfile.write(payload)
+    with _stats_lock:
+        _stats['responses'] += 1
+        _stats['bytes_in'] += len(body)
+        _stats['bytes_out'] += len(payload)
+        if encoding:
+            _stats['compressed'] += 1
+
+
+def send_json(handler, data, status: int = 200, headers: dict | None = None, cors: bool = True) -> None:
+    """JSON 응답 — ensure_ascii=False(한글 그대로)로 직렬화 후 send_body."""
+    body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    send_body(handler, body, 'application/json;charset=utf-8', status, headers, cors)
+
+
+def stats() -> dict:
+    with _stats_lock:
+        snapshot = dict(_stats)
+    snapshot['ratio'] = round(snapshot['bytes_out'] / snapshot['bytes_in'], 3) if snapshot['bytes_in'] else None
+    return snapshot
+
+
+class KeepAliveMixin:
+    """BaseHTTPRequestHandler 앞에 섞어 HTTP/1.1 지속 연결을 켭니다.
+
+    Content-Length(또는 Transfer-Encoding)를 보내지 않은 응답은 end_headers()에서
+    close_connection을 켜고 'Connection: close'를 붙입니다 — SSE 스트림이나 길이를 모르는
+    레거시 응답도 다음 요청과 섞이지 않습니다. 유휴 연결은 KEEPALIVE_TIMEOUT 후 닫힙니다.
+    요청 본문은 buffered_body() 안에서 미리 읽어, 라우트가 본문을 읽지 않거나 일부만 읽어도
+    다음 요청의 시작 위치가 어긋나지 않게 합니다.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEPALIVE_TIMEOUT
+    # 헤더와 본문이 별도 write — 지속 연결에서 Nagle + 지연 ACK가 겹치면 요청마다 ~40ms 정체
+    disable_nagle_algorithm = True
+
+    def send_response(self, code, message=None):
+        self._framed = code in _BODYLESS_STATUS or 100 <= code < 200
+        self._connection_header = False
+        super().send_response(code, message)
+
+    def send_header(self, keyword, value):
+        name = keyword.lower()
+        if name in ('content-length', 'transfer-encoding'):
+            self._framed = True
+        elif name == 'connection':
+            self._connection_header = True
+        super().send_header(keyword, value)
+
+    def end_headers(self):
+        if not getattr(self, '_framed', True):
+            # 본문 길이를 모름 → 연결 종료가 본문 끝 (RFC 9112 6.3)
+            self.close_connection = True
+            if not getattr(self, '_connection_header', False):
+                super().send_header('Connection', 'close')
+        super().end_headers()
+
+    @contextmanager
+    def buffered_body(self):
+        """요청 본문 전체를 BytesIO로 옮겨 둔 채 라우트를 실행하고, 끝나면 소켓 rfile로 복원."""
+        if 'chunked' in (self.headers.get('Transfer-Encoding') or '').lower():
+            self.close_connection = True   # chunked 요청 본문은 지원하지 않음 — 경계를 알 수 없으니 닫음
+            yield
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = 0
+        if length <= 0:
+            yield
+            return
+        raw_rfile = self.rfile
+        self.rfile = io.BytesIO(raw_rfile.read(length))
+        try:
+            yield
+        finally:
+            self.rfile = raw_rfile
@@ -0,0 +1,108 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/jsonl_tail.py
+# 📝 설명: JSONL 로그 역방향 tail 리더 — 파일 끝에서부터 고정 크기 블록을 거꾸로 읽어 최신 레코드부터 반환
+#          /api/task-logs · /api/hive/activity · /api/orchestrator/status · /api/skill-results,
+#          MCP vibe_hive_status, hive_watchdog, cli_agent.get_recent_runs가 "최근 N개"를 얻으려고
+#          read_text().splitlines()로 파일 전체를 읽던 것을 대체합니다. 비용은 파일 크기가 아니라
+#          실제로 훑은 줄 수에 비례합니다 (limit을 채우거나 max_lines에 닿으면 즉시 중단).
+#          - b'\n' 기준으로 자른 뒤 디코딩 — UTF-8 다바이트 문자가 블록 경계에 걸려도 안전
+#          - 빈 줄 / 깨진 JSON(쓰기 도중인 마지막 줄 포함)은 건너뜀
+#          - 파일이 없으면 빈 결과
+#          - 활성 파일 다음으로 src.log_segments의 닫힌 세그먼트(압축 포함)까지 이어서 읽음
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: 최근 N개 조회의 전체 파일 읽기 제거
+# [2026-10-17] — 회전된 세그먼트까지 투명하게 이어 읽기
+# ────────────────────────────────────────────────────────────────────────────
+import json
+import os
+from typing import Callable, Iterator
+
+from src.log_segments import closed_segments, read_segment_bytes
+
+BLOCK_SIZE = 64 * 1024
+
+
+def _reverse_file(path, block_size: int) -> Iterator[str]:
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b''   # 아직 줄 시작을 만나지 못한 앞쪽 조각
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step) + tail
+            parts = chunk.split(b'\n')
+            tail = parts[0]
+            for raw in reversed(parts[1:]):
+                line = raw.strip()
+                if line:
+                    yield line.decode('utf-8', errors='replace')
+        line = tail.strip()
+        if line:
+            yield line.decode('utf-8', errors='replace')
+
+
+def iter_lines_reverse(path, block_size: int = BLOCK_SIZE, segments: bool = True) -> Iterator[str]:
+    """path의 비어 있지 않은 줄을 마지막 줄부터 (앞뒤 공백 제거 후) 반환합니다.
+
+    segments=True면 활성 파일을 다 읽은 뒤 src.log_segments의 닫힌 세그먼트로 이어서 (최신 세그먼트부터)
+    읽습니다. 압축 세그먼트는 통째로 풀어서 읽으므로 필요한 만큼 읽고 멈추는 것은 세그먼트 단위입니다.
+    """
+    yield from _reverse_file(path, block_size)
+    if not segments:
+        return
+    for segment in closed_segments(path):
+        if segment.suffix == '.jsonl':
+            yield from _reverse_file(segment, block_size)
+            continue
+        try:
+            data = read_segment_bytes(segment)
+        except Exception:
+            continue   # 보존 정책으로 방금 삭제됐거나 손상된 세그먼트
+        for raw in reversed(data.split(b'\n')):
+            line = raw.strip()
+            if line:
+                yield line.decode('utf-8', errors='replace')
+
+
+def iter_records(path, predicate: Callable | None = None, max_lines: int | None = None,
+                 block_size: int = BLOCK_SIZE) -> Iterator:
+    """최신순 JSON 레코드. predicate(record)가 참인 것만, 최대 max_lines줄까지만 훑습니다."""
+    for scanned, line in enumerate(iter_lines_reverse(path, block_size), 1):
+        if max_lines is not None and scanned > max_lines:
+            return
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if predicate is None or predicate(record):
+            yield record
+
+
+def tail_records(path, limit: int, predicate: Callable | None = None,
+                 max_lines: int | None = None) -> list:
+    """최근 레코드 최대 limit개 (최신순)."""
+    records = []
+    if limit <= 0:
+        return records
+    for record in iter_records(path, predicate, max_lines):
+        records.append(record)
+        if len(records) >= limit:
+            break
+    return records
+
+
+def tail_lines(path, limit: int) -> list[str]:
+    """최근 비어 있지 않은 줄 최대 limit개 (최신순, 파싱하지 않음)."""
+    lines = []
+    if limit <= 0:
+        return lines
+    for line in iter_lines_reverse(path):
+        lines.append(line)
+        if len(lines) >= limit:
+            break
+    return lines
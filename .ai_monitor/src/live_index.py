@@ -0,0 +1,265 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/live_index.py
+# 📝 설명: agent_live.jsonl 증분 tail 인덱서 — 프로세스 전역 1개, 새로 추가된 줄만 파싱
+#          /api/agent/terminals(_merge_live_file_status)와 /api/agent/live-runs(handle_live_runs)가
+#          폴링마다 파일 전체를 다시 읽고 started 이벤트마다 정규식 4개를 돌리던 것을 대체합니다.
+#          - 마지막 바이트 오프셋 + inode를 기억하고 refresh() 때 os.stat 한 번으로 변경 여부 확인,
+#            늘어난 구간만 읽어 완결된 줄(b'\n'로 끝난)까지만 반영 — 쓰기 도중인 마지막 줄은 다음 refresh에서
+#          - 잘림(size < offset) / 교체(inode 변경) / 같은 경로에 다시 쓰기(앞부분 또는
+#            오프셋 직전 바이트 불일치)는 인덱스를 비우고 처음부터 다시 읽음. 파일이 없으면 빈 상태
+#          - 단, 이전 inode가 src.log_segments의 최신 세그먼트이면(정상 회전) 그 나머지 줄을 읽고
+#            집계를 유지한 채 새 활성 파일을 처음부터 이어 읽음
+#          - 터미널별 집계: 최신 started / ts가 가장 큰 done·stopped·error (epoch 미리 계산)
+#          - run_id별 집계: 정리된 task, cli, terminal_id, status, ts, 출력 미리보기 3줄
+#            (최초 started 순서 유지, MAX_RUNS 초과 시 가장 오래된 run부터 버림)
+#          - live_runs() 결과는 인덱스가 바뀔 때만 다시 만들고 그 외에는 캐시 반환
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: agent_live.jsonl 전체 재파싱 제거
+# [2026-10-17] — src.log_segments 회전을 따라가며 집계 유지
+# ────────────────────────────────────────────────────────────────────────────
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from src.log_segments import closed_segments
+
+MAX_RUNS = 2000           # 메모리에 유지하는 run_id 수 상한
+RUNS_PER_TERMINAL = 20    # live_runs() 터미널별 반환 개수
+PREVIEW_LINES = 3
+_HEAD_BYTES = 64          # 같은 경로 재작성 감지용 앞부분 지문 길이
+_DONE_TYPES = ('done', 'stopped', 'error')
+
+# started task 정리 — ANSI/VT 이스케이프 + OSC 시퀀스 제거 후 의미 있는 텍스트만 남김
+_CSI = re.compile(r'\x1b\[[^a-zA-Z]*[a-zA-Z]')                 # ESC CSI (\x1b[31m 등)
+_OSC = re.compile(r']\d+;[^"\n]*?(?=]|\[|\Z)')                 # ]11;rgb:1e1e/...\ — 다음 OSC/CSI 시작까지
+_BARE_CSI = re.compile(r'\[[\?]?[0-9;]*[a-zA-Z]')               # 이스케이프 없는 CSI ([?1;2c, [O 등)
+_CONTROL = re.compile(r'[\x00-\x1f\x7f\x5c]')                   # 나머지 제어문자 + 백슬래시
+_KOREAN = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
+_WORD = re.compile(r'[a-zA-Z]{5,}')                            # 3자 이하 영문은 'rgb', 'I' 같은 노이즈
+
+
+def clean_task(raw: str) -> str:
+    """started 이벤트의 task 문자열 정리. 의미 있는 텍스트(한글 또는 5자 이상 영문 단어)가 없으면 ''."""
+    s = _CONTROL.sub('', _BARE_CSI.sub('', _OSC.sub('', _CSI.sub('', raw))))
+    s = s.strip(" '\"")
+    if not _KOREAN.search(s) and not _WORD.search(s):
+        return ''
+    return s
+
+
+def _epoch(ts) -> float | None:
+    if not ts or not isinstance(ts, str):
+        return None
+    try:
+        return datetime.fromisoformat(ts).timestamp()
+    except ValueError:
+        return None
+
+
+class LiveRunIndex:
+    """agent_live.jsonl 증분 인덱스. 읽기 메서드는 호출 시 refresh()로 새 줄만 반영합니다."""
+
+    def __init__(self, path, max_runs: int = MAX_RUNS):
+        self.path = path
+        self.max_runs = max_runs
+        self._lock = threading.Lock()
+        self._reset()
+        self.resets = 0
+        self.rotations_followed = 0
+
+    def _reset(self) -> None:
+        self._ino = None
+        self._offset = 0
+        self._head = b''
+        self._terminals: dict[str, dict] = {}
+        self._runs: OrderedDict[str, dict] = OrderedDict()
+        self._generation = getattr(self, '_generation', 0) + 1
+        self._live_runs_cache = None
+        self.lines_parsed = 0
+
+    # ── 파일 추적 ──────────────────────────────────────────────────────────
+    def refresh(self) -> None:
+        """파일에 새로 추가된 완결된 줄만 파싱해 집계에 반영합니다."""
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                # 회전 직후 다음 기록 전까지는 활성 파일이 없음 — 세그먼트로 옮겨진 것이면 집계 유지
+                if self._ino is not None and self._follow_rotation():
+                    return
+                if self._ino is not None or self._offset:
+                    self._reset()
+                    self.resets += 1
+                return
+            ino = (st.st_dev, st.st_ino)
+            if self._ino is not None and ino != self._ino and self._follow_rotation():
+                pass   # 세그먼트로 회전된 이전 파일의 나머지를 반영 — 집계는 유지하고 새 파일을 처음부터
+            elif self._ino is not None and (ino != self._ino or st.st_size < self._offset):
+                self._reset()
+                self.resets += 1
+            if st.st_size == self._offset and self._ino is not None:
+                return
+            try:
+                with open(self.path, 'rb') as f:
+                    if self._offset and not self._same_prefix(f):
+                        self._reset()
+                        self.resets += 1
+                    f.seek(self._offset)
+                    data = f.read(st.st_size - self._offset)
+            except OSError:
+                return
+            self._ino = ino
+            end = data.rfind(b'\n')
+            if end < 0:
+                return   # 아직 완결된 줄 없음
+            if not self._offset:
+                self._head = data[:_HEAD_BYTES]
+            self._offset += end + 1
+            self._ingest_lines(data[:end])
+
+    def _ingest_lines(self, data: bytes) -> None:
+        changed = False
+        for raw in data.split(b'\n'):
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                ev = json.loads(raw.decode('utf-8', errors='replace'))
+            except ValueError:
+                continue
+            if isinstance(ev, dict):
+                self.lines_parsed += 1
+                changed |= self._ingest(ev)
+        if changed:
+            self._generation += 1
+            self._live_runs_cache = None
+
+    def _follow_rotation(self) -> bool:
+        """이전 inode가 src.log_segments 세그먼트로 옮겨졌으면 남은 줄을 읽고 True (새 파일은 처음부터)."""
+        for segment in closed_segments(self.path)[:2]:
+            try:
+                st = os.stat(segment)
+                if (st.st_dev, st.st_ino) != self._ino or st.st_size < self._offset:
+                    continue
+                with open(segment, 'rb') as f:
+                    f.seek(self._offset)
+                    rest = f.read()
+            except OSError:
+                continue
+            self._ingest_lines(rest)
+            self._ino, self._offset, self._head = None, 0, b''
+            self.rotations_followed += 1
+            return True
+        return False
+
+    def _same_prefix(self, f) -> bool:
+        """기억한 앞부분 지문과 오프셋 직전 개행이 그대로인지 — 같은 경로에 새로 쓴 파일 감지."""
+        head = f.read(len(self._head))
+        if head != self._head:
+            return False
+        f.seek(self._offset - 1)
+        return f.read(1) == b'\n'
+
+    def _ingest(self, ev: dict) -> bool:
+        etype = ev.get('type', '')
+        changed = False
+
+        # 터미널 집계 — agent_shell.py는 'terminal' 키를, cli_agent.py는 'terminal_id' 키를 사용
+        tid = ev.get('terminal') or ev.get('terminal_id', '')
+        if isinstance(tid, str) and tid.startswith('T') and (etype == 'started' or etype in _DONE_TYPES):
+            epoch = _epoch(ev.get('ts', ''))
+            if epoch is not None:
+                agg = self._terminals.setdefault(tid, {'started': None, 'started_epoch': 0.0,
+                                                       'done': None, 'done_epoch': 0.0})
+                if etype == 'started':
+                    agg['started'], agg['started_epoch'] = ev, epoch
+                    changed = True
+                elif agg['done'] is None or ev['ts'] > agg['done'].get('ts', ''):
+                    agg['done'], agg['done_epoch'] = ev, epoch
+                    changed = True
+
+        # run_id 집계 — started로 열고 done/error로 닫음, output은 미리보기만
+        rid = ev.get('run_id')
+        if not rid:
+            return changed
+        if etype == 'started':
+            task = clean_task(ev.get('task', '') or '')
+            if not task:
+                return changed
+            self._runs[rid] = {
+                'run_id': rid,
+                'task': task,
+                'cli': ev.get('cli', ''),
+                'terminal_id': ev.get('terminal_id', ''),
+                'status': 'running',
+                'ts': ev.get('ts', ''),
+                'output': [],
+            }
+            if len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+            return True
+        run = self._runs.get(rid)
+        if run is None:
+            return changed
+        if etype in ('done', 'error'):
+            run['status'] = ev.get('status', etype)
+            if ev.get('terminal_id'):
+                run['terminal_id'] = ev['terminal_id']
+            return True
+        if etype == 'output' and len(run['output']) < PREVIEW_LINES:
+            text = (ev.get('line', '') or '').strip()
+            if text:
+                run['output'].append(text)
+                return True
+        return changed
+
+    # ── 조회 ────────────────────────────────────────────────────────────────
+    def terminal_events(self, cutoff: float = 600, now: float | None = None) -> dict:
+        """터미널별 {'last_started', 'last_done'} — cutoff초보다 오래된 이벤트는 None."""
+        self.refresh()
+        now = time.time() if now is None else now
+        result = {}
+        with self._lock:
+            for tid, agg in self._terminals.items():
+                started = agg['started'] if now - agg['started_epoch'] <= cutoff else None
+                done = agg['done'] if now - agg['done_epoch'] <= cutoff else None
+                if started is not None or done is not None:
+                    result[tid] = {'last_started': started, 'last_done': done}
+        return result
+
+    def live_runs(self, per_terminal: int = RUNS_PER_TERMINAL) -> dict:
+        """{터미널: [run, ...]} — 터미널별 최근 per_terminal개, 최신순. 인덱스가 그대로면 캐시 반환."""
+        self.refresh()
+        with self._lock:
+            if self._live_runs_cache is not None and self._live_runs_cache[0] == per_terminal:
+                return self._live_runs_cache[1]
+            result: dict[str, list[dict]] = {}
+            for run in reversed(self._runs.values()):
+                tid = run.get('terminal_id') or 'unknown'
+                bucket = result.setdefault(tid, [])
+                if len(bucket) < per_terminal:
+                    bucket.append({
+                        'run_id': run['run_id'],
+                        'task': run['task'],
+                        'cli': run['cli'],
+                        'status': run['status'],
+                        'ts': run['ts'],
+                        'output_preview': list(run['output']),
+                    })
+            self._live_runs_cache = (per_terminal, result)
+            return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'offset': self._offset,
+                'lines_parsed': self.lines_parsed,
+                'resets': self.resets,
+                'rotations_followed': self.rotations_followed,
+                'terminals': len(self._terminals),
+                'runs': len(self._runs),
+            }
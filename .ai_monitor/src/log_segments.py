@@ -0,0 +1,306 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/log_segments.py
+# 📝 설명: JSONL 로그 세그먼트 관리자 — 크기/시간 기준 회전, 닫힌 세그먼트 압축, manifest, 보존 정책
+#          task_logs / agent_live / agent_runs / skill_results / orchestrator_log.jsonl이 끝없이 커지던 것을
+#          data/segments/<이름>/000001.jsonl[.gz|.zst] 번호 세그먼트로 나눕니다.
+#          - 회전: 활성 파일이 max_bytes 이상이거나 첫 레코드가 max_age초보다 오래되면 os.replace로 세그먼트화.
+#            기록자(cli_agent, agent_shell, orchestrator 등)는 매번 'a' 모드로 열어 쓰므로 다음 기록부터
+#            새 활성 파일이 생김. Windows에서 다른 프로세스가 열고 있어 이름 변경이 실패하면 다음 주기에 재시도
+#          - 압축: 회전 후 compress_after초가 지난 세그먼트만 (회전 직전에 파일을 연 늦은 기록자 보호).
+#            'zstd'는 zstandard 패키지가 있을 때만, 없으면 gzip
+#          - manifest.json: 세그먼트별 첫/마지막 타임스탬프, 레코드 수, 원본/저장 바이트 — 임시 파일 + os.replace
+#          - 보존: keep_segments개 초과분과 마지막 레코드가 keep_days일보다 오래된 세그먼트 삭제
+#          - 읽기: closed_segments()가 최신순 세그먼트 경로를 주고 src.jsonl_tail이 활성 파일 다음으로 이어 읽음
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: JSONL 로그 무한 증가 제거
+# ────────────────────────────────────────────────────────────────────────────
+import gzip
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MANIFEST = 'manifest.json'
+TS_FIELDS = ('timestamp', 'ts', 'completed_at')   # task_logs · agent_live/agent_runs · skill_results
+_COMPRESSED_SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd'}
+
+
+@dataclass
+class SegmentPolicy:
+    max_bytes: int = 8 * 1024 * 1024
+    max_age: float | None = 24 * 3600        # 활성 파일 첫 레코드 기준 (초)
+    compress: str | None = 'gzip'            # 'gzip' | 'zstd' | None
+    compress_after: float = 60.0
+    keep_segments: int | None = 30
+    keep_days: float | None = 30
+
+
+def segment_dir(path) -> Path:
+    path = Path(path)
+    return path.parent / 'segments' / path.stem
+
+
+def load_manifest(path) -> dict:
+    try:
+        manifest = json.loads((segment_dir(path) / MANIFEST).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {'next_seq': 1, 'segments': []}
+    manifest.setdefault('next_seq', 1)
+    manifest.setdefault('segments', [])
+    return manifest
+
+
+def closed_segments(path) -> list[Path]:
+    """path의 닫힌 세그먼트 파일 경로 (최신순). manifest가 없으면 빈 목록."""
+    directory = segment_dir(path)
+    return [directory / seg['file'] for seg in reversed(load_manifest(path)['segments'])]
+
+
+def read_segment_bytes(segment) -> bytes:
+    """세그먼트 전체 내용 (압축 해제). zstd 세그먼트인데 zstandard가 없으면 b''."""
+    segment = Path(segment)
+    kind = _COMPRESSED_SUFFIXES.get(segment.suffix)
+    if kind == 'gzip':
+        with gzip.open(segment, 'rb') as f:
+            return f.read()
+    if kind == 'zstd':
+        if zstandard is None:
+            return b''
+        with open(segment, 'rb') as f:
+            return zstandard.ZstdDecompressor().stream_reader(f).read()
+    return segment.read_bytes()
+
+
+def _record_ts(line: bytes) -> str:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return ''
+    if isinstance(record, dict):
+        for field in TS_FIELDS:
+            value = record.get(field)
+            if isinstance(value, str) and value:
+                return value
+    return ''
+
+
+def _epoch(ts: str) -> float | None:
+    try:
+        return datetime.fromisoformat(ts).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _summarize(data: bytes) -> dict:
+    """세그먼트 내용의 첫/마지막 타임스탬프와 레코드 수."""
+    lines = [line for line in data.split(b'\n') if line.strip()]
+    first = next((ts for ts in map(_record_ts, lines) if ts), '')
+    last = next((ts for ts in map(_record_ts, reversed(lines)) if ts), '')
+    return {'first_ts': first, 'last_ts': last, 'records': len(lines), 'bytes': len(data)}
+
+
+class SegmentedLog:
+    """JSONL 파일 1개의 회전/압축/보존. maintain()을 주기적으로 호출합니다."""
+
+    def __init__(self, path, policy: SegmentPolicy | None = None):
+        self.path = Path(path)
+        self.policy = policy or SegmentPolicy()
+        self.directory = segment_dir(self.path)
+        self._lock = threading.Lock()
+        self.rotations = 0
+        self.compressions = 0
+        self.removals = 0
+        self.last_error = ''
+
+    # ── manifest ────────────────────────────────────────────────────────────
+    def _save(self, manifest: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / (MANIFEST + '.tmp')
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding='utf-8')
+        os.replace(tmp, self.directory / MANIFEST)
+
+    def segments(self) -> list[dict]:
+        """manifest 항목 (오래된 순)."""
+        return load_manifest(self.path)['segments']
+
+    # ── 회전 ────────────────────────────────────────────────────────────────
+    def _rotation_due(self, now: float) -> bool:
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return False
+        if size == 0:
+            return False
+        if size >= self.policy.max_bytes:
+            return True
+        if self.policy.max_age is None:
+            return False
+        try:
+            with open(self.path, 'rb') as f:
+                first = _epoch(_record_ts(f.readline().strip()))
+        except OSError:
+            return False
+        return first is not None and now - first >= self.policy.max_age
+
+    def rotate(self, now: float | None = None) -> Path | None:
+        """활성 파일을 다음 번호 세그먼트로 옮깁니다. 옮긴 경로 반환 (비었거나 실패하면 None)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            manifest = load_manifest(self.path)
+            seq = manifest['next_seq']
+            dest = self.directory / f'{seq:06d}.jsonl'
+            self.directory.mkdir(parents=True, exist_ok=True)
+            try:
+                if self.path.stat().st_size == 0:
+                    return None
+                os.replace(self.path, dest)
+            except OSError as e:   # 없음 / 다른 프로세스가 열고 있음(Windows) — 다음 주기에 재시도
+                self.last_error = str(e)
+                return None
+            entry = {'seq': seq, 'file': dest.name, 'rotated_at': now, 'compressed': None}
+            entry.update(_summarize(dest.read_bytes()))
+            entry['stored_bytes'] = entry['bytes']
+            manifest['segments'].append(entry)
+            manifest['next_seq'] = seq + 1
+            self._save(manifest)
+            self.rotations += 1
+            return dest
+
+    # ── 압축 / 보존 ─────────────────────────────────────────────────────────
+    def _compress(self, entry: dict) -> bool:
+        kind = self.policy.compress
+        if kind == 'zstd' and zstandard is None:
+            kind = 'gzip'
+        raw_path = self.directory / entry['file']
+        data = raw_path.read_bytes()
+        if kind == 'zstd':
+            target, payload = raw_path.with_suffix('.jsonl.zst'), zstandard.ZstdCompressor(level=10).compress(data)
+        else:
+            target, payload = raw_path.with_suffix('.jsonl.gz'), gzip.compress(data, compresslevel=6)
+        tmp = target.with_name(target.name + '.tmp')
+        tmp.write_bytes(payload)
+        os.replace(tmp, target)
+        entry.update(_summarize(data))   # 회전 직후 늦게 들어온 기록까지 반영
+        entry.update({'file': target.name, 'compressed': kind, 'stored_bytes': len(payload)})
+        return True
+
+    def _expired(self, entry: dict, now: float) -> bool:
+        if self.policy.keep_days is None:
+            return False
+        last = _epoch(entry.get('last_ts', ''))
+        return last is not None and now - last > self.policy.keep_days * 86400
+
+    def maintain(self, now: float | None = None) -> dict:
+        """회전 → 압축 → 보존을 한 번 수행합니다. 수행 결과 카운트 반환."""
+        now = time.time() if now is None else now
+        result = {'rotated': False, 'compressed': 0, 'removed': 0}
+        if self._rotation_due(now):
+            result['rotated'] = self.rotate(now) is not None
+        with self._lock:
+            manifest = load_manifest(self.path)
+            segments = manifest['segments']
+            changed = False
+            replaced = []   # 압축 전 원본 — manifest가 압축본을 가리킨 뒤에 삭제 (읽는 쪽이 빈 경로를 보지 않도록)
+            if self.policy.compress:
+                for entry in segments:
+                    if entry.get('compressed') or now - entry.get('rotated_at', now) < self.policy.compress_after:
+                        continue
+                    raw_path = self.directory / entry['file']
+                    try:
+                        self._compress(entry)
+                    except OSError as e:
+                        self.last_error = str(e)
+                        continue
+                    replaced.append(raw_path)
+                    result['compressed'] += 1
+                    changed = True
+            keep = self.policy.keep_segments
+            while segments and ((keep is not None and len(segments) > keep) or self._expired(segments[0], now)):
+                entry = segments.pop(0)
+                try:
+                    (self.directory / entry['file']).unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    self.last_error = str(e)
+                    segments.insert(0, entry)
+                    break
+                result['removed'] += 1
+                changed = True
+            if changed:
+                self._save(manifest)
+            for raw_path in replaced:
+                try:
+                    raw_path.unlink()
+                except OSError as e:
+                    self.last_error = str(e)
+        self.compressions += result['compressed']
+        self.removals += result['removed']
+        return result
+
+    def stats(self) -> dict:
+        segments = self.segments()
+        try:
+            active = self.path.stat().st_size
+        except OSError:
+            active = 0
+        return {
+            'active_bytes': active,
+            'segments': len(segments),
+            'segment_bytes': sum(s.get('bytes', 0) for s in segments),
+            'stored_bytes': sum(s.get('stored_bytes', 0) for s in segments),
+            'oldest_ts': segments[0].get('first_ts', '') if segments else '',
+            'rotations': self.rotations,
+            'compressions': self.compressions,
+            'removals': self.removals,
+            'last_error': self.last_error,
+        }
+
+
+class LogSegmentManager:
+    """여러 SegmentedLog를 백그라운드 스레드 하나로 주기 관리합니다."""
+
+    def __init__(self, interval: float = 60.0):
+        self.interval = interval
+        self.logs: dict[str, SegmentedLog] = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add(self, name: str, path, policy: SegmentPolicy | None = None) -> SegmentedLog:
+        log = self.logs[name] = SegmentedLog(path, policy)
+        return log
+
+    def run_once(self, now: float | None = None) -> dict:
+        results = {}
+        for name, log in self.logs.items():
+            try:
+                results[name] = log.maintain(now)
+            except Exception as e:   # 로그 하나의 실패가 나머지 관리를 막지 않도록
+                log.last_error = str(e)
+        return results
+
+    def _run(self) -> None:
+        self.run_once()
+        while not self._stop.wait(self.interval):
+            self.run_once()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True, name='LogSegments')
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> dict:
+        return {name: {'path': log.path.name, 'segments_dir': str(log.directory),
+                       'policy': vars(log.policy), **log.stats()}
+                for name, log in self.logs.items()}
@@ -0,0 +1,244 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/memory_index.py
+# 📝 설명: hive_memory 의미 검색 — 임베딩 행렬 캐시와 벡터화 코사인 유사도
+#          hive_memory.embedding(BYTEA float32)을 L2 정규화된 (N, D) 행렬 하나로 메모리에 올려두고
+#          질의마다 행렬-벡터 곱 한 번으로 전체 유사도를 계산합니다.
+#          임베딩이 없는 행(훅/CLI 등 서버 밖에서 기록된 메모리)은 검색 시 일부씩 지연 계산합니다.
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: /api/memory?semantic=1 지원
+# [2026-10-17] — refresh(): 누락 임베딩을 embed_batch_fn으로 한 번에 제출 (배치 임베딩 워커)
+# [2026-10-17] — attach_ann(): 행 수가 ANN_MIN_ROWS 이상이면 디스크 IVF 인덱스(src/ann_index)로 검색
+# ────────────────────────────────────────────────────────────────────────────
+import threading
+import time
+from typing import Callable
+
+try:
+    import numpy as np
+except ImportError:  # 의미 검색만 비활성화 — 텍스트 검색은 그대로 동작
+    np = None
+
+from src.pg_store import get_memories, load_memory_embeddings, set_memory_embedding
+
+EmbedFn = Callable[[str], 'bytes | None']
+EmbedBatchFn = Callable[[list], list]
+
+RELOAD_INTERVAL = 300.0   # 다른 프로세스의 삭제/수정을 반영하기 위한 전체 재적재 주기 (초)
+BACKFILL_PER_QUERY = 64   # 검색 1회당 지연 계산할 최대 행 수
+ANN_MIN_ROWS = 20000      # 이 행 수 이상에서만 근사 검색 사용 (그 아래는 전수 비교가 더 빠르고 정확)
+ANN_OVERFETCH = 4         # 프로젝트 필터 시 후보를 top_k × N개 가져와 거름
+
+
+def memory_text(title: str, content: str) -> str:
+    """임베딩 입력 텍스트 — 제목과 본문을 함께 사용."""
+    return f"{title or ''}\n{content or ''}".strip()
+
+
+class MemoryEmbeddingIndex:
+    """key → 행 위치 매핑과 정규화된 임베딩 행렬을 관리하는 스레드 안전 캐시."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys: list[str] = []
+        self._projects: list[str] = []
+        self._pos: dict[str, int] = {}
+        self._matrix = None
+        self._loaded_at = 0.0
+        self._ann = None          # IVFFlatIndex | None — 쓰기 경로를 미러링
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+    @property
+    def loaded_at(self) -> float:
+        return self._loaded_at
+
+    def attach_ann(self, ann) -> None:
+        """근사 검색 인덱스를 연결합니다. 다음 load()에서 캐시와 내용이 다르면 재구축됩니다."""
+        self._ann = ann
+
+    def ann_stats(self) -> dict | None:
+        return self._ann.stats() if self._ann is not None else None
+
+    @staticmethod
+    def _normalize(embedding: bytes):
+        vec = np.frombuffer(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm > 1e-10 else None
+
+    def load(self, rows: list[dict]) -> None:
+        """(key, project, embedding bytes) 행 전체로 행렬을 재구성합니다."""
+        keys, projects, vectors = [], [], []
+        for row in rows:
+            vec = self._normalize(row.get('embedding') or b'')
+            if vec is None or (vectors and vec.shape != vectors[0].shape):
+                continue
+            keys.append(row['key'])
+            projects.append(row.get('project') or '')
+            vectors.append(vec)
+        matrix = np.vstack(vectors).astype(np.float32) if vectors else None
+        with self._lock:
+            self._keys, self._projects = keys, projects
+            self._pos = {key: i for i, key in enumerate(keys)}
+            self._matrix = matrix
+            self._loaded_at = time.time()
+        self._sync_ann(keys, matrix)
+
+    def _sync_ann(self, keys: list[str], matrix) -> None:
+        """디스크 인덱스의 키 집합이 DB와 다르면 (다른 프로세스의 변경 등) 백그라운드 재구축."""
+        ann = self._ann
+        if ann is None or matrix is None or len(keys) < ANN_MIN_ROWS:
+            return
+        if len(ann) == len(keys) and ann.dim == matrix.shape[1] and all(key in ann for key in keys):
+            return
+        threading.Thread(target=ann.rebuild, args=(keys, matrix), daemon=True, name='ANNSync').start()
+
+    def upsert(self, key: str, project: str, embedding: bytes) -> None:
+        vec = self._normalize(embedding)
+        if vec is None:
+            return
+        with self._lock:
+            if self._matrix is not None and vec.shape[0] != self._matrix.shape[1]:
+                return  # 모델(차원) 불일치 — 다음 재적재 때 정리
+            i = self._pos.get(key)
+            if i is not None:
+                self._matrix[i] = vec
+                self._projects[i] = project or ''
+            else:
+                self._pos[key] = len(self._keys)
+                self._keys.append(key)
+                self._projects.append(project or '')
+                self._matrix = vec[None, :].copy() if self._matrix is None else np.vstack([self._matrix, vec])
+        if self._ann is not None:
+            self._ann.put(key, vec)
+
+    def remove(self, key: str) -> None:
+        """마지막 행을 빈자리로 옮겨 O(D) 삭제."""
+        with self._lock:
+            i = self._pos.pop(key, None)
+            if i is None:
+                return
+            last = len(self._keys) - 1
+            if i != last:
+                self._keys[i] = self._keys[last]
+                self._projects[i] = self._projects[last]
+                self._matrix[i] = self._matrix[last]
+                self._pos[self._keys[i]] = i
+            self._keys.pop()
+            self._projects.pop()
+            self._matrix = self._matrix[:last] if last else None
+        if self._ann is not None:
+            self._ann.delete(key)
+
+    def search(self, query_embedding: bytes, top_k: int = 20, project: str = '') -> list[tuple[str, float]]:
+        """코사인 유사도 상위 top_k (key, score) — matrix @ q 한 번으로 계산."""
+        query = self._normalize(query_embedding)
+        if query is None:
+            return []
+        ann = self._ann
+        if ann is not None and len(self) >= ANN_MIN_ROWS and ann.dim == query.shape[0]:
+            return self._search_ann(ann, query, top_k, project)
+        with self._lock:
+            if self._matrix is None or query.shape[0] != self._matrix.shape[1]:
+                return []
+            scores = self._matrix @ query
+            keys = list(self._keys)
+            if project:
+                scores = np.where(np.asarray(self._projects) == project, scores, -np.inf)
+        k = min(max(1, int(top_k)), len(keys))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(keys[i], float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+    def _search_ann(self, ann, query, top_k: int, project: str) -> list[tuple[str, float]]:
+        k = max(1, int(top_k))
+        hits = ann.search(query, k * ANN_OVERFETCH if project else k)
+        if not project:
+            return hits
+        with self._lock:
+            matched = [(key, score) for key, score in hits
+                       if key in self._pos and self._projects[self._pos[key]] == project]
+        return matched[:k]
+
+
+MEMORY_INDEX = MemoryEmbeddingIndex()
+_refresh_lock = threading.Lock()
+
+
+def attach_ann(path) -> bool:
+    """path 디렉터리의 IVF 인덱스를 MEMORY_INDEX에 연결 (NumPy 없으면 False)."""
+    if np is None:
+        return False
+    from src.ann_index import IVFFlatIndex
+    MEMORY_INDEX.attach_ann(IVFFlatIndex(path))
+    return True
+
+
+def index_memory(key: str, project: str, title: str, content: str, embed_fn: EmbedFn) -> bool:
+    """메모리 한 건의 임베딩을 계산하여 DB와 캐시에 반영합니다 (쓰기 경로)."""
+    if np is None or not key:
+        return False
+    embedding = embed_fn(memory_text(title, content))
+    if not embedding:
+        return False
+    set_memory_embedding(key, embedding)
+    MEMORY_INDEX.upsert(key, project, embedding)
+    return True
+
+
+def refresh(embed_fn: EmbedFn, backfill_limit: int = BACKFILL_PER_QUERY,
+            embed_batch_fn: EmbedBatchFn | None = None) -> int:
+    """캐시가 없거나 오래되었으면 재적재하고, 임베딩 없는 행을 최대 backfill_limit개 계산합니다.
+
+    embed_batch_fn이 있으면 누락 행 전체를 한 번에 제출하여 임베딩 워커가 배치로 처리합니다.
+
+    Returns:
+        int: 이번 호출에서 새로 계산한 임베딩 수
+    """
+    with _refresh_lock:
+        if not MEMORY_INDEX.loaded_at or time.time() - MEMORY_INDEX.loaded_at > RELOAD_INTERVAL:
+            MEMORY_INDEX.load(load_memory_embeddings())
+        rows = [row for row in load_memory_embeddings(missing=True, limit=backfill_limit) if row.get('key')]
+        if not rows:
+            return 0
+        texts = [memory_text(row.get('title', ''), row.get('content', '')) for row in rows]
+        if embed_batch_fn is not None:
+            embeddings = embed_batch_fn(texts)
+        else:
+            embeddings = []
+            for text in texts:
+                embedding = embed_fn(text)
+                if not embedding:
+                    break  # 임베더 불가 — 이번 검색에서는 더 시도하지 않음
+                embeddings.append(embedding)
+        computed = 0
+        for row, embedding in zip(rows, embeddings):
+            if not embedding:
+                continue
+            set_memory_embedding(row['key'], embedding)
+            MEMORY_INDEX.upsert(row['key'], row.get('project', ''), embedding)
+            computed += 1
+        return computed
+
+
+def semantic_search(q: str, embed_fn: EmbedFn, top_k: int = 20, project: str = '',
+                    embed_batch_fn: EmbedBatchFn | None = None) -> list[dict] | None:
+    """q와 의미적으로 가까운 메모리 top_k개. 임베더/NumPy를 쓸 수 없으면 None."""
+    if np is None:
+        return None
+    query_embedding = embed_fn(q)
+    if not query_embedding:
+        return None
+    refresh(embed_fn, embed_batch_fn=embed_batch_fn)
+    hits = MEMORY_INDEX.search(query_embedding, top_k=top_k, project=project)
+    rows = {row['key']: row for row in get_memories([key for key, _ in hits])}
+    results = []
+    for key, score in hits:
+        row = rows.get(key)
+        if row is None:
+            MEMORY_INDEX.remove(key)  # 다른 프로세스에서 삭제됨
+            continue
+        row['score'] = round(score, 4)
+        results.append(row)
+    return results
@@ -0,0 +1,139 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/pg_listener.py
+# 📝 설명: 프로세스 전역 PostgreSQL LISTEN 리스너 — 채널당 연결 1개, 스레드 1개
+#          /stream SSE 클라이언트마다 psycopg2 연결 + LISTEN을 열던 것을 대체합니다.
+#          - on_notify(payload): NOTIFY 1건당 한 번 호출 (디코딩/프레임 직렬화는 호출자가 1회 수행)
+#          - on_connect(conn): (재)연결 직후 LISTEN 다음에 호출 — 끊긴 동안 놓친 행 재동기화용
+#          - 연결 실패/끊김 시 지수 백오프(min_backoff → max_backoff)로 재연결
+#          - RecentIds: 재동기화 조회와 NOTIFY가 겹친 행만 거르는 최근 id 집합 (도착 순서와 무관)
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: hive_log_channel 공유 리스너
+# [2026-10-17] — RecentIds 추가: 단일 최대 id 비교가 순서가 뒤바뀐 NOTIFY(커밋 순서 ≠ id 순서)를 버리던 것 수정
+# ────────────────────────────────────────────────────────────────────────────
+import select
+import threading
+from collections import deque
+from typing import Callable
+
+MIN_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+RECENT_IDS = 4096         # 재동기화 조회 상한(1000행)보다 넉넉하게
+
+
+class RecentIds:
+    """최근 발행한 행 id 집합(크기 제한) + 지금까지 본 최대 id.
+    시퀀스 id는 커밋 순서와 다르게 도착할 수 있으므로 '최대 id 이하'가 아니라 '이미 본 id'만 중복으로 봅니다.
+    호출자가 잠금을 잡고 사용합니다."""
+
+    def __init__(self, maxlen: int = RECENT_IDS):
+        self._order: deque = deque()
+        self._seen: set = set()
+        self.maxlen = maxlen
+        self.high = 0             # 재연결 시 '이후 행' 재조회 기준
+
+    def add(self, row_id: int) -> bool:
+        """처음 보는 id면 기록하고 True, 이미 발행한 id면 False."""
+        if row_id in self._seen:
+            return False
+        self._seen.add(row_id)
+        self._order.append(row_id)
+        if len(self._order) > self.maxlen:
+            self._seen.discard(self._order.popleft())
+        self.high = max(self.high, row_id)
+        return True
+
+
+class PgChannelListener:
+    """LISTEN 연결을 소유하는 백그라운드 스레드. start()는 몇 번 호출해도 스레드 1개."""
+
+    def __init__(self, channel: str, connect: Callable, on_notify: Callable[[str], None],
+                 on_connect: Callable | None = None, poll_interval: float = 5.0,
+                 min_backoff: float = MIN_BACKOFF, max_backoff: float = MAX_BACKOFF):
+        self.channel = channel
+        self._connect = connect
+        self._on_notify = on_notify
+        self._on_connect = on_connect
+        self._poll_interval = poll_interval
+        self._min_backoff = min_backoff
+        self._max_backoff = max_backoff
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self.ready = threading.Event()      # 첫 연결 시도(성공/실패)가 끝나면 set
+        self.connected = False
+        self.connects = 0
+        self.failures = 0
+        self.notifies = 0
+        self.errors = 0                     # on_notify 예외 (해당 NOTIFY만 건너뜀)
+        self.last_error = ''
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name=f'PgListen-{self.channel}')
+                self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stopping.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        backoff = self._min_backoff
+        while not self._stopping.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                conn.cursor().execute(f"LISTEN {self.channel};")
+                if self._on_connect is not None:
+                    self._on_connect(conn)
+                self.connected = True
+                self.connects += 1
+                backoff = self._min_backoff
+                self.ready.set()
+                self._listen(conn)
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e)
+                if self.connected or self.failures == 1:
+                    print(f"[PgListen] {self.channel} 연결 끊김/실패: {e} — {backoff:.1f}초 후 재연결")
+            finally:
+                self.connected = False
+                self.ready.set()
+                if conn is not None:
+                    try: conn.close()
+                    except Exception: pass
+            if self._stopping.wait(backoff):
+                return
+            backoff = min(backoff * 2, self._max_backoff)
+
+    def _listen(self, conn) -> None:
+        while not self._stopping.is_set():
+            if select.select([conn], [], [], self._poll_interval) == ([], [], []):
+                continue
+            conn.poll()
+            while conn.notifies:
+                payload = conn.notifies.pop(0).payload
+                self.notifies += 1
+                try:
+                    self._on_notify(payload)
+                except Exception as e:
+                    self.errors += 1
+                    self.last_error = str(e)
+
+    def stats(self) -> dict:
+        return {
+            'channel': self.channel,
+            'running': self._thread is not None and self._thread.is_alive(),
+            'connected': self.connected,
+            'connects': self.connects,
+            'failures': self.failures,
+            'notifies': self.notifies,
+            'errors': self.errors,
+            'last_error': self.last_error,
+        }
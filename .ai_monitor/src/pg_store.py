@@ -6,17 +6,46 @@
 #   - 기존: PROJECT_ROOT / '.ai_monitor' / 'bin' / 'pgsql' (개발 경로 하드코딩)
 #   - 수정: frozen 모드 → Path(sys.executable).parent / "pgsql" / "bin" / "psql.exe"
 #           개발 모드 → 기존 경로 유지
+# [2026-10-17] — psycopg2 커넥션 풀 백엔드 추가
+#   - query_rows/execute/execute_raw: 스레드 안전 풀의 영속 연결로 실행 (psql 프로세스 생성 제거)
+#   - 행은 RealDictCursor로 타입 그대로 반환 (CSV 왕복 없음)
+#   - 풀 크기: VIBE_PG_POOL_SIZE 환경변수 또는 configure_pool()
+#   - psycopg2 미설치 시에만 기존 psql.exe 경로로 폴백
+#   - _pool_run: psycopg2.Error 외의 예외에도 연결을 finally에서 풀에 반환 (끊긴 연결은 close)
+# [2026-10-17] — write-behind 배치 헬퍼 추가
+#   - insert_pg_logs / insert_pg_thoughts: 다중 행 INSERT 한 번으로 배치 기록
+#   - reserve_thought_ids: 시퀀스에서 id 블록 선점 (비동기 기록 전에 id 응답 가능)
+# [2026-10-17] — thought 체인 헤드 캐시 지원
+#   - load_thought_heads: 에이전트별 마지막 thought id 조회 + (agent, id DESC) 인덱스 보장
+# [2026-10-17] — parent_id 소급 연결 청크화
+#   - backfill_thought_parents: id 구간 단위 LAG 윈도우 UPDATE + hive_state 워터마크
+# [2026-10-17] — hive_memory 전문 검색
+#   - list_memory(q): LIKE '%q%' 4중 OR → search_tsv(GIN, 'simple') 접두 일치 + 트라이그램 부분 일치
+#   - 관련도(score) 순 정렬, tags GIN(jsonb_path_ops) 인덱스
+# [2026-10-17] — hive_memory 의미 검색 지원
+#   - embedding BYTEA 컬럼 (title/content 변경 시 NULL → 지연 재계산)
+#   - set_memory_embedding / load_memory_embeddings / get_memories
+# [2026-10-17] — 임베딩 캐시 테이블
+#   - hive_embedding_cache (model, text_hash) → embedding: load_cached_embeddings / save_cached_embeddings
 # ────────────────────────────────────────────────────────────────────────────
 import csv
 import io
 import json
 import os
+import re
 import subprocess
 import sys
 import threading
 import time
 from pathlib import Path
 
+try:
+    import psycopg2
+    import psycopg2.extras
+    import psycopg2.pool
+except ImportError:  # 드라이버 미설치 → psql.exe 폴백
+    psycopg2 = None
+
 from src.file_store import (
     ensure_legacy_store,
     load_memory_entries,
@@ -38,10 +67,24 @@ else:
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / '.ai_monitor' / 'data'
 PG_BIN = _PG_DIR / 'bin' / 'psql.exe'
+PG_HOST = 'localhost'
 PG_PORT = '5433'
 PG_USER = 'postgres'
 PG_DB = 'postgres'
 
+# ── 커넥션 풀 설정 ────────────────────────────────────────────────────────────
+# 대시보드 폴링이 분당 수백 회 쿼리를 발생시키므로 psql 프로세스(30~80ms) 대신
+# 영속 연결을 재사용합니다. 최대 연결 수는 환경변수로 조정 가능.
+try:
+    PG_POOL_SIZE = max(1, int(os.getenv('VIBE_PG_POOL_SIZE', '8')))
+except ValueError:
+    PG_POOL_SIZE = 8
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+_POOL_SLOTS = threading.BoundedSemaphore(PG_POOL_SIZE)
+_CONN_TIMEOUTS: dict[int, int] = {}  # id(conn) → 마지막으로 설정한 statement_timeout(초)
+
 _SCHEMA_LOCK = threading.Lock()
 _SCHEMA_READY = False
 _MIGRATION_DONE = False
@@ -102,8 +145,115 @@ def _run_psql(sql: str, csv_output: bool = False, timeout: int = 15) -> tuple[bo
         return False, str(exc)
 
 
+def configure_pool(size: int) -> None:
+    """풀 최대 연결 수를 변경합니다. 기존 풀은 닫고 다음 쿼리 시 새 크기로 재생성."""
+    global PG_POOL_SIZE, _POOL_SLOTS
+    with _POOL_LOCK:
+        PG_POOL_SIZE = max(1, int(size))
+        _POOL_SLOTS = threading.BoundedSemaphore(PG_POOL_SIZE)
+        _close_pool_locked()
+
+
+def close_pool() -> None:
+    """풀의 모든 연결을 닫습니다 (서버 종료/테스트용)."""
+    with _POOL_LOCK:
+        _close_pool_locked()
+
+
+def _close_pool_locked() -> None:
+    global _POOL
+    if _POOL is not None:
+        try:
+            _POOL.closeall()
+        except Exception:
+            pass
+    _POOL = None
+    _CONN_TIMEOUTS.clear()
+
+
+def _get_pool():
+    """ThreadedConnectionPool lazy 생성. 드라이버가 없거나 접속 실패 시 None."""
+    global _POOL
+    if psycopg2 is None:
+        return None
+    if _POOL is not None:
+        return _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            try:
+                _POOL = psycopg2.pool.ThreadedConnectionPool(
+                    1, PG_POOL_SIZE,
+                    host=PG_HOST, port=int(PG_PORT), user=PG_USER, dbname=PG_DB,
+                    connect_timeout=3, client_encoding='UTF8',
+                )
+            except Exception:
+                return None
+        return _POOL
+
+
+def _pool_run(sql: str, fetch: bool = False, timeout: int = 15) -> tuple[bool, list[dict] | str]:
+    """풀에서 연결을 빌려 SQL을 실행합니다.
+
+    ThreadedConnectionPool.getconn()은 소진 시 대기하지 않고 예외를 던지므로
+    세마포어로 동시 사용 수를 풀 크기에 맞춰 제한합니다. 끊어진 연결은 폐기 후 1회 재시도.
+    빌린 연결은 어떤 예외로 끝나든 finally에서 반환합니다 (누수 시 풀이 소진됨).
+    """
+    pool = _get_pool()
+    if pool is None:
+        return False, 'connection pool unavailable'
+    slots = _POOL_SLOTS
+    if not slots.acquire(timeout=timeout):
+        return False, 'connection pool exhausted'
+    try:
+        error = ''
+        for _ in range(2):
+            try:
+                conn = pool.getconn()
+            except Exception as exc:
+                return False, str(exc)
+            try:
+                conn.autocommit = True
+                with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                    if _CONN_TIMEOUTS.get(id(conn)) != timeout:
+                        cur.execute(f'SET statement_timeout = {int(timeout) * 1000};')
+                        _CONN_TIMEOUTS[id(conn)] = timeout
+                    cur.execute(sql)
+                    rows = [dict(row) for row in cur.fetchall()] if fetch and cur.description else []
+                return True, rows
+            except psycopg2.Error as exc:
+                error = str(exc).strip()
+                if not conn.closed:
+                    return False, error
+            finally:
+                # 성공/SQL 오류/그 밖의 예외 모두 연결을 풀에 반환 — 끊긴 연결은 닫아서 폐기
+                broken = bool(conn.closed)
+                if broken:
+                    _CONN_TIMEOUTS.pop(id(conn), None)
+                try:
+                    pool.putconn(conn, close=broken)
+                except Exception:
+                    pass
+        return False, error
+    finally:
+        slots.release()
+
+
+def _run_sql(sql: str, fetch: bool = False, timeout: int = 15) -> tuple[bool, list[dict] | str]:
+    """풀 백엔드 우선 실행. psycopg2가 없을 때만 psql.exe + CSV 파싱으로 폴백."""
+    if psycopg2 is not None:
+        return _pool_run(sql, fetch=fetch, timeout=timeout)
+    ok, output = _run_psql(sql, csv_output=fetch, timeout=timeout)
+    if not ok:
+        return False, output
+    if not fetch:
+        return True, []
+    if not output.strip():
+        return True, []
+    return True, list(csv.DictReader(io.StringIO(output)))
+
+
 def _ensure_pg_running() -> bool:
-    ok, _ = _run_psql('SELECT 1;', timeout=2)
+    ok, _ = _run_sql('SELECT 1;', timeout=2)
     if ok:
         return True
     pg_manager = PROJECT_ROOT / 'scripts' / 'pg_manager.py'
@@ -122,7 +272,7 @@ def _ensure_pg_running() -> bool:
         return False
     for _ in range(10):
         time.sleep(0.5)
-        ok, _ = _run_psql('SELECT 1;', timeout=2)
+        ok, _ = _run_sql('SELECT 1;', timeout=2)
         if ok:
             return True
     return False
@@ -131,16 +281,16 @@ def _ensure_pg_running() -> bool:
 def query_rows(sql: str, timeout: int = 15) -> list[dict]:
     if not ensure_schema():
         return []
-    ok, output = _run_psql(sql, csv_output=True, timeout=timeout)
-    if not ok or not output.strip():
+    ok, rows = _run_sql(sql, fetch=True, timeout=timeout)
+    if not ok:
         return []
-    return list(csv.DictReader(io.StringIO(output)))
+    return rows
 
 
 def execute(sql: str, timeout: int = 15) -> bool:
     if not ensure_schema():
         return False
-    ok, _ = _run_psql(sql, csv_output=False, timeout=timeout)
+    ok, _ = _run_sql(sql, timeout=timeout)
     return ok
 
 
@@ -168,6 +318,25 @@ def ensure_schema(data_dir: Path | None = None) -> bool:
         );
         CREATE INDEX IF NOT EXISTS idx_hive_memory_updated ON hive_memory (updated_at DESC);
         CREATE INDEX IF NOT EXISTS idx_hive_memory_project ON hive_memory (project);
+        ALTER TABLE hive_memory ADD COLUMN IF NOT EXISTS search_tsv tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', key || ' ' || title), 'A')
+                || setweight(jsonb_to_tsvector('simple', tags, '["string"]'), 'A')
+                || setweight(to_tsvector('simple', content), 'B')
+            ) STORED;
+        CREATE INDEX IF NOT EXISTS idx_hive_memory_search ON hive_memory USING GIN (search_tsv);
+        CREATE INDEX IF NOT EXISTS idx_hive_memory_trgm
+            ON hive_memory USING GIN ((key || ' ' || title || ' ' || content) gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_hive_memory_tags ON hive_memory USING GIN (tags jsonb_path_ops);
+        ALTER TABLE hive_memory ADD COLUMN IF NOT EXISTS embedding BYTEA;
+
+        CREATE TABLE IF NOT EXISTS hive_embedding_cache (
+            model TEXT NOT NULL,
+            text_hash TEXT NOT NULL,
+            embedding BYTEA NOT NULL,
+            created_at TEXT NOT NULL DEFAULT '',
+            PRIMARY KEY (model, text_hash)
+        );
 
         CREATE TABLE IF NOT EXISTS hive_sessions (
             id BIGSERIAL PRIMARY KEY,
@@ -245,7 +414,7 @@ def ensure_schema(data_dir: Path | None = None) -> bool:
 
 
 def execute_raw(sql: str, timeout: int = 15) -> bool:
-    ok, _ = _run_psql(sql, csv_output=False, timeout=timeout)
+    ok, _ = _run_sql(sql, timeout=timeout)
     return ok
 
 
@@ -324,24 +493,54 @@ def _migrate_skill_chains(data_dir: Path) -> None:
         upsert_skill_chain_row(row, legacy_id=row.get('id'))
 
 
+# 검색 문서 — idx_hive_memory_trgm 표현식과 정확히 같아야 트라이그램 인덱스가 사용됩니다.
+_MEMORY_DOC_SQL = "(key || ' ' || title || ' ' || content)"
+_SEARCH_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def _memory_tsquery(q: str) -> str:
+    """검색어를 접두 일치 tsquery 문자열로 변환 ('서버 버그' → "'서버':* & '버그':*").
+
+    'simple' 설정은 형태소 분석을 하지 않으므로, 한국어 조사가 붙은 어절('서버가')도
+    접두 일치로 찾을 수 있게 각 토큰에 :* 를 붙입니다.
+    """
+    tokens = _SEARCH_TOKEN_RE.findall(q.lower())
+    return ' & '.join(f"'{token}':*" for token in tokens)
+
+
+def _like_pattern(q: str) -> str:
+    return '%' + q.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
 def list_memory(q: str = '', top_k: int = 20, project: str = '', show_all: bool = False) -> list[dict]:
+    """hive_memory 조회. q가 있으면 전문 검색 + 트라이그램 부분 일치로 찾고 관련도 순 정렬.
+
+    - search_tsv(GIN): key/title/tags(가중치 A) + content(B) 토큰 접두 일치
+    - idx_hive_memory_trgm(GIN): 토큰 경계와 무관한 부분 문자열 (한국어 어절 내부 등)
+    - idx_hive_memory_tags(GIN): 태그 정확 일치
+    결과 행에는 score(ts_rank_cd + word_similarity)가 포함됩니다.
+    """
     filters = []
     if project and not show_all:
         filters.append(f"project = {_sql_text(project)}")
     where_sql = f"WHERE {' AND '.join(filters)}" if filters else ''
     if q:
         q_sql = _sql_text(q)
+        tsquery = _memory_tsquery(q)
+        tsq_sql = f"to_tsquery('simple', {_sql_text(tsquery)})" if tsquery else 'NULL::tsquery'
+        match_sql = (
+            f"search_tsv @@ {tsq_sql}" if tsquery else 'FALSE'
+        ) + (
+            f" OR {_MEMORY_DOC_SQL} ILIKE {_sql_text(_like_pattern(q))}"
+            f" OR tags @> jsonb_build_array({q_sql}::text)"
+        )
         query = f"""
-        SELECT key, title, content, author, project, created_at, updated_at, tags::text AS tags
+        SELECT key, title, content, author, project, created_at, updated_at, tags::text AS tags,
+               ROUND((COALESCE(ts_rank_cd(search_tsv, {tsq_sql}), 0) * 2
+                      + word_similarity({q_sql}, {_MEMORY_DOC_SQL}))::numeric, 4)::float AS score
         FROM hive_memory
-        {where_sql} {'AND' if where_sql else 'WHERE'}
-            (
-                LOWER(key) LIKE LOWER('%' || {q_sql} || '%')
-                OR LOWER(title) LIKE LOWER('%' || {q_sql} || '%')
-                OR LOWER(content) LIKE LOWER('%' || {q_sql} || '%')
-                OR tags::text LIKE '%' || {q_sql} || '%'
-            )
-        ORDER BY updated_at DESC
+        {where_sql} {'AND' if where_sql else 'WHERE'} ({match_sql})
+        ORDER BY score DESC, updated_at DESC
         LIMIT {int(top_k)};
         """
     else:
@@ -355,6 +554,11 @@ def list_memory(q: str = '', top_k: int = 20, project: str = '', show_all: bool
     rows = query_rows(query)
     for row in rows:
         row['tags'] = _parse_json_text(row.get('tags'), [])
+        if 'score' in row:
+            try:
+                row['score'] = float(row['score'])
+            except (TypeError, ValueError):
+                row['score'] = 0.0
     return rows
 
 
@@ -405,12 +609,94 @@ def set_memory(
             tags = EXCLUDED.tags,
             author = EXCLUDED.author,
             project = EXCLUDED.project,
-            updated_at = EXCLUDED.updated_at;
+            updated_at = EXCLUDED.updated_at,
+            embedding = CASE
+                WHEN hive_memory.title IS DISTINCT FROM EXCLUDED.title
+                  OR hive_memory.content IS DISTINCT FROM EXCLUDED.content
+                THEN NULL ELSE hive_memory.embedding END;
         """
     )
     return get_memory(key)
 
 
+def set_memory_embedding(key: str, embedding: bytes) -> bool:
+    """float32 임베딩 bytes를 hive_memory 행에 저장합니다."""
+    return execute(
+        f"UPDATE hive_memory SET embedding = decode('{bytes(embedding).hex()}', 'hex') "
+        f"WHERE key = {_sql_text(key)};"
+    )
+
+
+def load_memory_embeddings(missing: bool = False, limit: int | None = None) -> list[dict]:
+    """임베딩 조회. missing=True면 아직 임베딩이 없는 행(title/content 포함)을 반환합니다.
+
+    embedding은 hex 문자열 → bytes로 변환하여 반환 (풀/psql 두 백엔드 공통 형식).
+    """
+    limit_sql = f"LIMIT {int(limit)}" if limit else ''
+    if missing:
+        return query_rows(
+            f"SELECT key, project, title, content FROM hive_memory "
+            f"WHERE embedding IS NULL ORDER BY updated_at DESC {limit_sql};"
+        )
+    rows = query_rows(
+        f"SELECT key, project, encode(embedding, 'hex') AS embedding FROM hive_memory "
+        f"WHERE embedding IS NOT NULL {limit_sql};",
+        timeout=60,
+    )
+    for row in rows:
+        try:
+            row['embedding'] = bytes.fromhex(row.get('embedding') or '')
+        except ValueError:
+            row['embedding'] = b''
+    return rows
+
+
+def load_cached_embeddings(model: str, hashes: list[str]) -> dict[str, bytes]:
+    """임베딩 캐시 조회 — {text_hash: float32 bytes}."""
+    if not hashes:
+        return {}
+    rows = query_rows(
+        f"SELECT text_hash, encode(embedding, 'hex') AS embedding FROM hive_embedding_cache "
+        f"WHERE model = {_sql_text(model)} "
+        f"AND text_hash IN ({', '.join(_sql_text(h) for h in hashes)});"
+    )
+    cached = {}
+    for row in rows:
+        try:
+            cached[row['text_hash']] = bytes.fromhex(row.get('embedding') or '')
+        except (KeyError, ValueError):
+            continue
+    return cached
+
+
+def save_cached_embeddings(model: str, items: dict[str, bytes]) -> bool:
+    """임베딩 캐시 다중 행 저장 (이미 있는 해시는 유지)."""
+    if not items:
+        return True
+    now = _sql_text(_now_iso())
+    values = ',\n'.join(
+        f"({_sql_text(model)}, {_sql_text(digest)}, decode('{bytes(embedding).hex()}', 'hex'), {now})"
+        for digest, embedding in items.items()
+    )
+    return execute(
+        "INSERT INTO hive_embedding_cache (model, text_hash, embedding, created_at) VALUES "
+        + values + " ON CONFLICT (model, text_hash) DO NOTHING;"
+    )
+
+
+def get_memories(keys: list[str]) -> list[dict]:
+    """key 목록의 메모리 행을 한 번에 조회합니다 (반환 순서는 보장하지 않음)."""
+    if not keys:
+        return []
+    rows = query_rows(
+        f"SELECT key, title, content, author, project, created_at, updated_at, tags::text AS tags "
+        f"FROM hive_memory WHERE key IN ({', '.join(_sql_text(key) for key in keys)});"
+    )
+    for row in rows:
+        row['tags'] = _parse_json_text(row.get('tags'), [])
+    return rows
+
+
 def delete_memory(key: str) -> bool:
     return execute(f"DELETE FROM hive_memory WHERE key = {_sql_text(key)};")
 
@@ -684,3 +970,159 @@ def list_skill_chain_rows() -> list[dict]:
         ORDER BY updated_at DESC, id DESC;
         """
     )
+
+
+# ── write-behind 배치 기록 (server.py WriteBehindQueue flush 콜백) ────────────
+def insert_pg_logs(rows: list[dict]) -> bool:
+    """pg_logs 다중 행 INSERT + PGMQ send_batch (INSERT 성공 시에만). PGMQ 실패(확장 미설치)는 무시."""
+    if not rows:
+        return True
+    values = ',\n'.join(
+        f"({_sql_text(row.get('agent', 'unknown'))}, {_sql_text(row.get('terminal_id', ''))}, "
+        f"{_sql_text(row.get('task', ''))}, {_sql_text(row.get('status', 'success'))})"
+        for row in rows
+    )
+    ok = execute_raw(f"INSERT INTO pg_logs (agent, terminal_id, task, status) VALUES {values};")
+    if not ok:
+        # 실패한 배치는 호출측(server._flush_rows)이 행 단위로 재시도 — 그때 성공한 행만 큐에 보냄
+        return False
+    messages = ', '.join(
+        _sql_json({
+            'agent': row.get('agent', 'unknown'),
+            'tid': row.get('terminal_id', ''),
+            'task': row.get('task', ''),
+            'status': row.get('status', 'success'),
+        })
+        for row in rows
+    )
+    execute_raw(f"SELECT pgmq.send_batch('hive_queue', ARRAY[{messages}]);")
+    return True
+
+
+def reserve_thought_ids(count: int) -> list[int]:
+    """pg_thoughts id 시퀀스에서 count개를 선점합니다. 실패 시 빈 리스트."""
+    ok, rows = _run_sql(
+        f"SELECT nextval(pg_get_serial_sequence('pg_thoughts', 'id')) AS id "
+        f"FROM generate_series(1, {max(1, int(count))});",
+        fetch=True,
+    )
+    if not ok:
+        return []
+    ids = []
+    for row in rows:
+        try:
+            ids.append(int(row.get('id')))
+        except (TypeError, ValueError):
+            continue
+    return ids
+
+
+def load_thought_heads() -> dict[str, int]:
+    """에이전트별 마지막 thought id(체인 헤드)를 조회합니다.
+
+    (agent, id DESC) 인덱스를 함께 보장하여 DISTINCT ON이 인덱스 순서로 읽히도록 합니다.
+    """
+    execute_raw("CREATE INDEX IF NOT EXISTS idx_pg_thoughts_agent_id ON pg_thoughts (agent, id DESC);",
+                timeout=60)
+    ok, rows = _run_sql(
+        "SELECT DISTINCT ON (agent) agent, id FROM pg_thoughts ORDER BY agent, id DESC;",
+        fetch=True, timeout=30,
+    )
+    if not ok:
+        return {}
+    heads = {}
+    for row in rows:
+        try:
+            heads[str(row.get('agent'))] = int(row.get('id'))
+        except (TypeError, ValueError):
+            continue
+    return heads
+
+
+THOUGHT_BACKFILL_STATE_KEY = 'thought_parent_backfill'
+
+
+def backfill_thought_parents(chunk_size: int = 5000, pause: float = 0.05) -> int:
+    """parent_id가 NULL인 pg_thoughts 행을 같은 에이전트의 직전 id로 소급 연결합니다.
+
+    id 구간(chunk_size) 단위로 LAG 윈도우 UPDATE를 한 번씩 실행하고, 처리한 마지막 id를
+    hive_state 워터마크에 기록하여 다음 기동 시에는 새 행만 처리합니다.
+    구간의 첫 행은 LAG가 비므로 구간 이전의 같은 에이전트 최신 id를 (agent, id DESC) 인덱스로 조회.
+
+    Returns:
+        int: parent_id가 채워진 행 수
+    """
+    chunk_size = max(1, int(chunk_size))
+    state = load_state(THOUGHT_BACKFILL_STATE_KEY, {}) or {}
+    try:
+        low = int(state.get('last_id', 0))
+    except (TypeError, ValueError):
+        low = 0
+    ok, rows = _run_sql("SELECT COALESCE(MAX(id), 0) AS max_id FROM pg_thoughts;", fetch=True)
+    if not ok or not rows:
+        return 0
+    max_id = int(rows[0].get('max_id') or 0)
+    linked = 0
+    while low < max_id:
+        high = min(low + chunk_size, max_id)
+        ok, rows = _run_sql(
+            f"""
+            WITH chunk AS (
+                SELECT c.id,
+                       COALESCE(
+                           LAG(c.id) OVER (PARTITION BY c.agent ORDER BY c.id),
+                           (SELECT MAX(p.id) FROM pg_thoughts p WHERE p.agent = c.agent AND p.id <= {low})
+                       ) AS prev_id
+                FROM pg_thoughts c
+                WHERE c.id > {low} AND c.id <= {high}
+            ), linked AS (
+                UPDATE pg_thoughts t SET parent_id = chunk.prev_id
+                FROM chunk
+                WHERE t.id = chunk.id AND t.parent_id IS NULL AND chunk.prev_id IS NOT NULL
+                RETURNING 1
+            )
+            SELECT COUNT(*) AS n FROM linked;
+            """,
+            fetch=True, timeout=60,
+        )
+        if not ok:
+            break
+        linked += int((rows[0].get('n') if rows else 0) or 0)
+        low = high
+        save_state(THOUGHT_BACKFILL_STATE_KEY, {'last_id': low, 'updated_at': _now_iso()})
+        if pause:
+            time.sleep(pause)
+    return linked
+
+
+def insert_pg_thoughts(rows: list[dict]) -> bool:
+    """선점된 id로 pg_thoughts 다중 행 INSERT.
+
+    parent_id가 없으면 같은 에이전트의 직전 thought를 부모로 연결합니다.
+    배치 안에 직전 thought가 있으면 그 id를, 없으면 이미 기록된 행 중 MAX(id)를 사용.
+    """
+    if not rows:
+        return True
+    last_in_batch: dict[str, int] = {}
+    values = []
+    for row in rows:
+        thought_id = int(row['id'])
+        agent = str(row.get('agent', 'unknown'))
+        parent_id = row.get('parent_id')
+        if parent_id:
+            parent_sql = str(int(parent_id))
+        elif agent in last_in_batch:
+            parent_sql = str(last_in_batch[agent])
+        else:
+            parent_sql = (
+                f"(SELECT MAX(id) FROM pg_thoughts WHERE agent = {_sql_text(agent)} AND id < {thought_id})"
+            )
+        last_in_batch[agent] = thought_id
+        values.append(
+            f"({thought_id}, {_sql_text(agent)}, {_sql_text(row.get('skill', 'general'))}, "
+            f"{_sql_json(row.get('thought', {}))}, {parent_sql})"
+        )
+    return execute_raw(
+        "INSERT INTO pg_thoughts (id, agent, skill, thought, parent_id) VALUES "
+        + ',\n'.join(values) + ';'
+    )
@@ -0,0 +1,149 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/pg_writer.py
+# 📝 설명: PostgreSQL write-behind 그룹 커밋 큐
+#          요청 핸들러는 레코드를 큐에 넣고 즉시 반환하며, 백그라운드 라이터가
+#          크기(기본 200행) 또는 시간(기본 50ms) 조건으로 묶어서 다중 행 INSERT로 flush합니다.
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: log_to_pg / thought_to_pg 요청 경로에서 psql 실행 제거
+# ────────────────────────────────────────────────────────────────────────────
+import queue
+import threading
+import time
+from typing import Callable
+
+
+class WriteBehindQueue:
+    """배치 단위로 flush 하는 비동기 쓰기 큐.
+
+    - put(): 큐가 가득 차면 timeout 동안 블로킹 (백프레셔), 초과 시 False 반환
+    - flush_fn(batch) -> bool: 한 배치를 DB에 기록하는 콜백 (라이터 스레드에서만 호출)
+    - stop(): 남은 레코드를 모두 flush 한 뒤 라이터 종료
+    - stats(): 큐 깊이 / flush 지연 카운터
+    """
+
+    def __init__(self, name: str, flush_fn: Callable[[list], bool],
+                 max_batch: int = 200, max_delay: float = 0.05, max_queue: int = 10000):
+        self.name = name
+        self._flush_fn = flush_fn
+        self._max_batch = max(1, int(max_batch))
+        self._max_delay = max(0.0, float(max_delay))
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._idle = threading.Condition()
+        self._in_flight = 0
+        self._stats_lock = threading.Lock()
+        self._enqueued = 0
+        self._rejected = 0
+        self._flushed = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    # ── 생산자 측 ───────────────────────────────────────────────────────────
+    def put(self, record, timeout: float | None = 1.0) -> bool:
+        self.start()
+        with self._idle:
+            self._in_flight += 1
+        try:
+            self._queue.put(record, timeout=timeout)
+        except queue.Full:
+            with self._idle:
+                self._in_flight -= 1
+                self._idle.notify_all()
+            with self._stats_lock:
+                self._rejected += 1
+            return False
+        with self._stats_lock:
+            self._enqueued += 1
+        return True
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name=f'WriteBehind-{self.name}'
+                )
+                self._thread.start()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """지금까지 put()된 레코드가 모두 기록될 때까지 대기합니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._in_flight > 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def stop(self, timeout: float | None = 5.0) -> bool:
+        """셧다운: 남은 레코드를 flush 하고 라이터 스레드를 종료합니다."""
+        drained = self.flush(timeout)
+        self._stopping.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return drained
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            avg = self._total_flush_ms / self._batches if self._batches else 0.0
+            return {
+                'name': self.name,
+                'queue_depth': self._queue.qsize(),
+                'queue_capacity': self._queue.maxsize,
+                'enqueued': self._enqueued,
+                'rejected': self._rejected,
+                'flushed': self._flushed,
+                'failed': self._failed,
+                'batches': self._batches,
+                'last_flush_ms': round(self._last_flush_ms, 2),
+                'avg_flush_ms': round(avg, 2),
+                'max_flush_ms': round(self._max_flush_ms, 2),
+            }
+
+    # ── 라이터 스레드 ───────────────────────────────────────────────────────
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            batch = [first]
+            deadline = time.monotonic() + self._max_delay
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0
+                                 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _write(self, batch: list) -> None:
+        started = time.perf_counter()
+        try:
+            ok = bool(self._flush_fn(batch))
+        except Exception as exc:
+            print(f"[WriteBehind:{self.name}] flush 실패: {exc}")
+            ok = False
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self._batches += 1
+            self._last_flush_ms = elapsed_ms
+            self._total_flush_ms += elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            if ok:
+                self._flushed += len(batch)
+            else:
+                self._failed += len(batch)
+        with self._idle:
+            self._in_flight -= len(batch)
+            self._idle.notify_all()
@@ -0,0 +1,237 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/response_cache.py
+# 📝 설명: 폴링 대상 GET 라우트용 single-flight TTL 응답 캐시
+#          /api/orchestrator/status, /api/agent/terminals 등 UI마다 ~3초 주기로 폴링되는 라우트가
+#          요청마다 메모리 스캔/세션/태스크/JSONL 읽기를 반복하던 것을 (라우트, 쿼리) 키로 캐시합니다.
+#          - 라우트 핸들러를 캡처용 프록시로 실행해 상태/헤더/원본 본문을 저장, 적중 시 send_body로 재전송
+#            (캡처 시 Accept-Encoding을 가려 원본을 저장하고 압축은 요청자별로 협상)
+#          - 같은 키의 동시 요청은 진행 중인 계산 1건에 합류 (single-flight)
+#          - 태그 기반 명시적 무효화: 쓰기 라우트가 끝나면 invalidate('tasks') 등 — 계산 도중 무효화되면
+#            그 결과는 저장하지 않음 (세대 번호 비교)
+#          - 200 응답만 저장, 라우트별 hit / miss / coalesced / 적중률 집계
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: 폴링 라우트 재계산 제거
+# [2026-10-17] — add_listener(): 무효화 태그를 대시보드 상태 채널(src.state_channel)에 전달
+# ────────────────────────────────────────────────────────────────────────────
+import io
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import parse_qsl
+
+from src.http_response import send_body
+
+FLIGHT_WAIT = 30.0   # 진행 중 계산을 기다리는 최대 시간 — 초과 시 직접 계산
+_RECOMPUTED_HEADERS = ('content-length', 'content-encoding', 'vary', 'content-type')
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    content_type: str
+    headers: list
+    body: bytes
+    expires: float = 0.0
+
+
+class _HeadersWithoutEncoding:
+    """요청 헤더 프록시 — Accept-Encoding만 숨겨 캡처 본문을 항상 원본으로."""
+
+    def __init__(self, headers):
+        self._headers = headers
+
+    def get(self, name, default=None):
+        if name.lower() == 'accept-encoding':
+            return default
+        return self._headers.get(name, default) if self._headers is not None else default
+
+    def __getitem__(self, name):
+        return self.get(name)
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+
+class _CaptureHandler:
+    """SSEHandler 대신 라우트에 넘겨 응답을 메모리에 기록. 나머지 속성은 실제 핸들러로 위임."""
+
+    def __init__(self, real):
+        self._real = real
+        self.headers = _HeadersWithoutEncoding(getattr(real, 'headers', None))
+        self.wfile = io.BytesIO()
+        self.status = 200
+        self.sent: list[tuple[str, str]] = []
+
+    def send_response(self, code, message=None):
+        self.status = code
+
+    def send_header(self, keyword, value):
+        self.sent.append((keyword, value))
+
+    def end_headers(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+    def result(self) -> CachedResponse:
+        content_type = 'application/octet-stream'
+        headers = []
+        for name, value in self.sent:
+            lowered = name.lower()
+            if lowered == 'content-type':
+                content_type = value
+            elif lowered not in _RECOMPUTED_HEADERS:
+                headers.append((name, value))
+        return CachedResponse(self.status, content_type, headers, self.wfile.getvalue())
+
+
+class _Flight:
+    __slots__ = ('done', 'response')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: CachedResponse | None = None
+
+
+class _RouteStats:
+    __slots__ = ('ttl', 'tags', 'hits', 'misses', 'coalesced', 'invalidations', 'uncached')
+
+    def __init__(self, ttl: float, tags: tuple):
+        self.ttl = ttl
+        self.tags = tags
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+        self.uncached = 0   # 200 이외 응답 또는 계산 중 무효화로 저장하지 않은 횟수
+
+
+class ResponseCache:
+    """라우트별 TTL 캐시. cache_route()로 등록된 Route.fn을 감싸 사용합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, CachedResponse] = {}
+        self._flights: dict[tuple, _Flight] = {}
+        self._routes: dict[str, _RouteStats] = {}
+        self._generations: dict[str, int] = {}
+        self._listeners: list = []
+
+    # ── 등록 ────────────────────────────────────────────────────────────────
+    def cache_route(self, router, path: str, ttl: float, tags=()) -> None:
+        """router에 등록된 GET path의 핸들러를 캐시 래퍼로 교체합니다."""
+        route = router.resolve('GET', path)
+        if route is None or route.path != path:
+            raise KeyError(f"캐시할 GET 라우트가 없습니다: {path}")
+        self._routes[path] = _RouteStats(float(ttl), tuple(tags))
+        self._generations[path] = 0
+        fn = route.fn
+        route.fn = lambda handler, req, _fn=fn, _path=path: self.serve(_path, _fn, handler, req)
+
+    def invalidate_after(self, router, method: str, paths, tags) -> None:
+        """쓰기 라우트가 실행된 뒤(성공/실패 무관) tags에 해당하는 캐시를 무효화하도록 감쌉니다."""
+        tags = tuple(tags)
+        for path in paths:
+            route = router.resolve(method, path)
+            if route is None or route.path != path:
+                raise KeyError(f"무효화 대상 라우트가 없습니다: {method} {path}")
+            fn = route.fn
+
+            def _write_then_invalidate(handler, req, _fn=fn):
+                try:
+                    _fn(handler, req)
+                finally:
+                    self.invalidate(*tags)
+
+            route.fn = _write_then_invalidate
+
+    # ── 조회 ────────────────────────────────────────────────────────────────
+    def serve(self, path: str, fn, handler, req) -> None:
+        key = (path, tuple(sorted(parse_qsl(req.parsed.query, keep_blank_values=True))))
+        stats = self._routes[path]
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > now:
+                stats.hits += 1
+                flight = leader = None
+            else:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = _Flight()
+                    stats.misses += 1
+                    generation = self._generations[path]
+                else:
+                    stats.coalesced += 1
+        if flight is None:
+            return self._send(handler, entry)
+        if not leader:
+            if flight.done.wait(FLIGHT_WAIT) and flight.response is not None:
+                return self._send(handler, flight.response)
+            return fn(handler, req)   # 선행 계산 실패/지연 — 캐시 없이 직접 처리
+
+        response = None
+        try:
+            capture = _CaptureHandler(handler)
+            fn(capture, req)
+            response = capture.result()
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+                if (response is not None and response.status == 200
+                        and generation == self._generations[path]):
+                    response.expires = time.monotonic() + stats.ttl
+                    self._entries[key] = response
+                elif response is not None:
+                    stats.uncached += 1
+            flight.response = response
+            flight.done.set()
+        self._send(handler, response)
+
+    @staticmethod
+    def _send(handler, response: CachedResponse) -> None:
+        send_body(handler, response.body, response.content_type, response.status,
+                  headers=dict(response.headers), cors=False)
+
+    # ── 무효화 / 통계 ───────────────────────────────────────────────────────
+    def add_listener(self, fn) -> None:
+        """invalidate(*tags) 때마다 fn(*tags) 호출 — 캐시 밖의 파생 상태(대시보드 상태 채널) 갱신용."""
+        self._listeners.append(fn)
+
+    def invalidate(self, *tags: str) -> int:
+        """tags 중 하나라도 가진 라우트의 캐시를 비웁니다. 비운 항목 수 반환."""
+        wanted = set(tags)
+        removed = 0
+        with self._lock:
+            paths = [path for path, stats in self._routes.items() if wanted & set(stats.tags)]
+            for path in paths:
+                self._generations[path] += 1
+                self._routes[path].invalidations += 1
+            for key in [k for k in self._entries if k[0] in paths]:
+                del self._entries[key]
+                removed += 1
+        for listener in self._listeners:
+            listener(*tags)
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._generations:
+                self._generations[path] += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            result = {}
+            for path, s in self._routes.items():
+                served = s.hits + s.misses + s.coalesced
+                result[path] = {
+                    'ttl': s.ttl, 'tags': list(s.tags),
+                    'hits': s.hits, 'misses': s.misses, 'coalesced': s.coalesced,
+                    'invalidations': s.invalidations, 'uncached': s.uncached,
+                    'hit_ratio': round((s.hits + s.coalesced) / served, 3) if served else None,
+                    'entries': sum(1 for k in self._entries if k[0] == path),
+                }
+        return result
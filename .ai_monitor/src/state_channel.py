@@ -0,0 +1,321 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/state_channel.py
+# 📝 설명: 대시보드 상태 채널 — 정규 상태 객체 보관 + 변경분(JSON Patch)만 SSE로 푸시
+#          UI 패널마다 /api/agent/terminals · /api/orchestrator/status · skill-chain · tasks/kanban ·
+#          hive/activity 를 3~5초 주기로 각자 폴링하던 것을 /api/events/state 구독 1개로 대체합니다.
+#          - 소스(이름 → 계산 함수, 갱신 주기, 태그)를 채널 스레드 1개가 갱신하고 이전 값과 비교해
+#            달라진 경로만 RFC 6902 ops로 발행 ({type: 'patch', version, ops}) — 변화 없으면 0바이트
+#          - 구독 시 전체 스냅샷 ({type: 'snapshot', version, state}) — 발행과 같은 락 안에서 찍어
+#            스냅샷 version 이후 patch만 구독자 링에 쌓임. Last-Event-ID 재연결은 놓친 patch만 재전송
+#          - 구독자가 0명이면 스레드가 대기만 함 (대시보드가 없으면 계산 없음)
+#          - mark_dirty(tag): 쓰기 라우트 후 해당 태그 소스를 주기와 무관하게 즉시 재계산
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: 대시보드 폴링 → 델타 푸시
+# ────────────────────────────────────────────────────────────────────────────
+import copy
+import io
+import json
+import threading
+import time
+from typing import Callable
+
+from src.event_bus import EventBus, sse_frame
+
+DEFAULT_TICK = 0.25     # 소스 계산 최소 간격 (dirty 폭주 시에도 초당 4회 이하)
+
+
+# ── JSON Patch (RFC 6902 부분집합: add / remove / replace) ───────────────────
+def _escape(key) -> str:
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def _same(old, new) -> bool:
+    """JSON 기준 동일 여부 — 파이썬 ==와 달리 1 / 1.0 / True를 구분합니다."""
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(_same(v, new[k]) for k, v in old.items())
+    if isinstance(old, list):
+        return len(old) == len(new) and all(map(_same, old, new))
+    return old == new
+
+
+def _list_diff(old: list, new: list, path: str) -> list[dict] | None:
+    """길이 같은 리스트는 인덱스별 비교, 앞/뒤로 밀린 슬라이딩 창(최신 N개 목록)은 add/remove로.
+
+    어느 쪽도 전체 교체보다 작지 않으면 None (호출자가 replace).
+    """
+    if len(old) == len(new):
+        ops = []
+        for i, (a, b) in enumerate(zip(old, new)):
+            ops.extend(json_diff(a, b, f'{path}/{i}'))
+        if len(ops) <= max(1, len(new) // 2):
+            return ops
+    # 앞에 k개 추가(최신순 목록) 또는 뒤에 k개 추가(시간순 목록) — 넘친 만큼 반대쪽이 잘림
+    for k in range(1, min(len(new) - 1, 16) + 1):
+        kept = len(new) - k
+        if kept > len(old):
+            continue
+        if _same(new[k:], old[:kept]):
+            ops = [{'op': 'remove', 'path': f'{path}/{i}'} for i in range(len(old) - 1, kept - 1, -1)]
+            return ops + [{'op': 'add', 'path': f'{path}/{i}', 'value': new[i]} for i in range(k)]
+        if _same(new[:kept], old[len(old) - kept:]):
+            ops = [{'op': 'remove', 'path': f'{path}/0'} for _ in range(len(old) - kept)]
+            return ops + [{'op': 'add', 'path': f'{path}/-', 'value': v} for v in new[kept:]]
+    return None
+
+
+def json_diff(old, new, path: str = '') -> list[dict]:
+    """old → new로 바꾸는 JSON Patch ops. 같으면 []."""
+    if _same(old, new):
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [{'op': 'remove', 'path': f'{path}/{_escape(k)}'} for k in old if k not in new]
+        for k, v in new.items():
+            child = f'{path}/{_escape(k)}'
+            if k not in old:
+                ops.append({'op': 'add', 'path': child, 'value': v})
+            else:
+                ops.extend(json_diff(old[k], v, child))
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        ops = _list_diff(old, new, path)
+        if ops is not None:
+            return ops
+    return [{'op': 'replace', 'path': path, 'value': new}]
+
+
+def apply_patch(doc, ops: list[dict]):
+    """ops를 적용한 새 문서 반환 (doc는 변경하지 않음)."""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        tokens = [_unescape(t) for t in op['path'].split('/')[1:]]
+        if not tokens:
+            doc = copy.deepcopy(op.get('value'))
+            continue
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if op['op'] == 'add':
+                parent.insert(len(parent) if last == '-' else int(last), copy.deepcopy(op['value']))
+            elif op['op'] == 'remove':
+                del parent[int(last)]
+            else:
+                parent[int(last)] = copy.deepcopy(op['value'])
+        elif op['op'] == 'remove':
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op['value'])
+    return doc
+
+
+# ── 라우트 → 상태 소스 ──────────────────────────────────────────────────────
+class _RouteProbe:
+    """라우트 핸들러에 넘기는 최소 핸들러 — 응답 본문을 메모리에 받음 (압축 없음)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.headers = {}
+        self.rfile = io.BytesIO(b'')
+        self.wfile = io.BytesIO()
+        self.status = 200
+
+    def send_response(self, code, message=None):
+        self.status = code
+
+    def send_header(self, keyword, value):
+        pass
+
+    def end_headers(self):
+        pass
+
+
+def route_source(router, path: str) -> Callable[[], object]:
+    """등록된 GET 라우트의 JSON 응답을 그대로 상태 값으로 쓰는 소스 함수.
+
+    폴링 응답과 같은 형태를 보장하고, 응답 캐시가 걸린 라우트는 캐시를 그대로 거칩니다.
+    """
+    def fetch():
+        probe = _RouteProbe(path)
+        if not router.dispatch(probe, 'GET'):
+            raise LookupError(f"등록되지 않은 라우트: {path}")
+        if probe.status != 200:
+            raise RuntimeError(f"{path} → HTTP {probe.status}")
+        return json.loads(probe.wfile.getvalue() or b'null')
+    return fetch
+
+
+class _Source:
+    __slots__ = ('name', 'fn', 'interval', 'tags', 'volatile', 'next_at', 'dirty',
+                 'refreshes', 'changes', 'errors', 'last_error')
+
+    def __init__(self, name: str, fn: Callable, interval: float, tags: tuple, volatile: tuple):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.tags = tags
+        self.volatile = volatile
+        self.next_at = 0.0
+        self.dirty = True
+        self.refreshes = 0
+        self.changes = 0
+        self.errors = 0
+        self.last_error = ''
+
+
+class StateChannel:
+    """소스별 정규 상태 + 버전. 변경 시 bus의 topic으로 patch 발행."""
+
+    def __init__(self, bus: EventBus, topic: str = 'state', tick: float = DEFAULT_TICK):
+        self.bus = bus
+        self.topic = topic
+        self._tick = tick
+        self._sources: dict[str, _Source] = {}
+        self._state: dict = {}
+        self.version = 0
+        self._lock = threading.Lock()           # 상태/버전/발행/스냅샷
+        self._refresh_lock = threading.Lock()   # 소스 계산은 한 번에 한 스레드
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self.patches = 0
+        self.ops = 0
+        self.patch_bytes = 0
+        self.snapshots = 0
+        self.snapshot_bytes = 0
+
+    def add_source(self, name: str, fn: Callable[[], object], interval: float, tags=(), volatile=()) -> None:
+        """volatile: 계산할 때마다 바뀌는 최상위 키(응답 생성 시각 등) — 상태에서 제외해 빈 patch 방지."""
+        self._sources[name] = _Source(name, fn, float(interval), tuple(tags), tuple(volatile))
+
+    # ── 갱신 ────────────────────────────────────────────────────────────────
+    def mark_dirty(self, *tags: str) -> None:
+        """tags 중 하나라도 가진 소스를 다음 틱에 재계산 (ResponseCache 무효화 리스너)."""
+        wanted = set(tags)
+        hit = False
+        for source in self._sources.values():
+            if wanted & set(source.tags):
+                source.dirty = hit = True
+        if hit:
+            self._wake.set()
+
+    def refresh(self, force: bool = False) -> int:
+        """주기가 지났거나 dirty인 소스를 계산하고 변경분을 발행. 발행한 op 수 반환."""
+        with self._refresh_lock:
+            now = time.monotonic()
+            computed = {}
+            for source in self._sources.values():
+                if not (force or source.dirty or now >= source.next_at):
+                    continue
+                source.dirty = False
+                source.next_at = now + source.interval
+                source.refreshes += 1
+                try:
+                    value = source.fn()
+                    if source.volatile and isinstance(value, dict):
+                        value = {k: v for k, v in value.items() if k not in source.volatile}
+                    computed[source.name] = value
+                except Exception as e:
+                    source.errors += 1
+                    source.last_error = str(e)
+            if not computed:
+                return 0
+            with self._lock:
+                ops = []
+                for name, value in computed.items():
+                    path = f'/{_escape(name)}'
+                    changed = ([{'op': 'add', 'path': path, 'value': value}] if name not in self._state
+                               else json_diff(self._state[name], value, path))
+                    if changed:
+                        self._sources[name].changes += 1
+                        ops.extend(changed)
+                    self._state[name] = value
+                if ops:
+                    self.version += 1
+                    frame = sse_frame({'type': 'patch', 'version': self.version, 'ops': ops})
+                    self.bus.publish(self.topic, frame)
+                    self.patches += 1
+                    self.ops += len(ops)
+                    self.patch_bytes += len(frame)
+            return len(ops)
+
+    # ── 구독 ────────────────────────────────────────────────────────────────
+    def subscribe(self, last_event_id: int | None = None):
+        """(Subscriber, 초기 프레임 목록). resumed면 초기 프레임 없이 놓친 patch만 링에 있음.
+
+        대시보드가 없던 동안 멈춰 있던 소스는 스냅샷 전에 먼저 갱신합니다.
+        """
+        self.start()
+        self.refresh()
+        with self._lock:
+            sub = self.bus.subscribe(self.topic, last_event_id=last_event_id)
+            frames = []
+            if not sub.resumed:
+                snapshot = sse_frame({'type': 'snapshot', 'version': self.version, 'state': self._state})
+                frames = [snapshot, sub.cursor_frame()]
+                self.snapshots += 1
+                self.snapshot_bytes += len(snapshot)
+        self._wake.set()
+        return sub, frames
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {'version': self.version, 'state': copy.deepcopy(self._state)}
+
+    # ── 스레드 ──────────────────────────────────────────────────────────────
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name=f'StateChannel-{self.topic}')
+                self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stopping.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            if self.bus.subscriber_count(self.topic) == 0:
+                # 대시보드 없음 — 구독/정지 신호까지 계산 없이 대기
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            self.refresh()
+            if self._stopping.wait(self._tick):
+                return
+            self._wake.wait(self._until_next_due())
+            self._wake.clear()
+
+    def _until_next_due(self) -> float:
+        now = time.monotonic()
+        if any(s.dirty for s in self._sources.values()):
+            return 0.0
+        return max(0.0, min((s.next_at - now for s in self._sources.values()), default=1.0))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'version': self.version,
+                'subscribers': self.bus.subscriber_count(self.topic),
+                'patches': self.patches, 'ops': self.ops, 'patch_bytes': self.patch_bytes,
+                'snapshots': self.snapshots, 'snapshot_bytes': self.snapshot_bytes,
+                'sources': {
+                    s.name: {'interval': s.interval, 'tags': list(s.tags), 'refreshes': s.refreshes,
+                             'changes': s.changes, 'errors': s.errors, 'last_error': s.last_error}
+                    for s in self._sources.values()
+                },
+            }
@@ -0,0 +1,194 @@
+# ────────────────────────────────────────────────────────────────────────────
+# 📄 파일명: src/static_assets.py
+# 📝 설명: vibe-view/dist 정적 파일 계층 — 메모리 캐시 + 사전 압축 + ETag
+#          - 파일을 처음 요청(또는 preload) 시 한 번 읽어 gzip/brotli 변형까지 만들어 두고,
+#            이후에는 os.stat 한 번으로 mtime/size 변경만 확인 (변경 시 다시 적재)
+#          - Vite 콘텐츠 해시 파일(assets/index-BdX3k9aZ.js 등)은 immutable + 1년 max-age
+#          - index.html 등 해시 없는 파일은 no-cache(매번 재검증) — ETag로 304 응답
+#          brotli 모듈이 없으면 gzip만 사용합니다.
+# 🕒 변경 이력:
+# [2026-10-17] — 최초 작성: 요청마다 디스크 읽기 + no-store 전송하던 _serve_static 대체
+# [2026-10-17] — accepted_encodings를 src/http_response로 이동 (동적 JSON 응답과 공용)
+# ────────────────────────────────────────────────────────────────────────────
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import stat
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.http_response import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # gzip만 제공
+    brotli = None
+
+MIN_COMPRESS_BYTES = 1024   # 이보다 작은 파일은 압축 이득보다 헤더/CPU 비용이 큼
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+
+# Vite 기본 출력: [name]-[hash].[ext] (hash는 8자 base64url)
+_HASHED_NAME = re.compile(r'[-.][A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$')
+_COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml',
+                       'application/xml', 'application/wasm', 'application/manifest+json')
+_MIME_OVERRIDES = {'.js': 'application/javascript', '.mjs': 'application/javascript',
+                   '.css': 'text/css', '.svg': 'image/svg+xml', '.wasm': 'application/wasm',
+                   '.json': 'application/json', '.map': 'application/json'}
+
+
+@dataclass
+class StaticAsset:
+    """메모리에 올린 정적 파일 한 개와 인코딩별 변형."""
+    rel_path: str
+    content_type: str
+    cache_control: str
+    etag: str
+    mtime_ns: int
+    size: int
+    variants: dict = field(default_factory=dict)   # encoding('identity'|'gzip'|'br') → bytes
+
+    def etag_for(self, encoding: str) -> str:
+        # 인코딩마다 바이트가 다르므로 강한 ETag도 달라야 함 (RFC 9110 8.8.3)
+        return self.etag if encoding == 'identity' else f'{self.etag[:-1]}-{encoding}"'
+
+
+def _content_type(path: Path) -> str:
+    mimetype = _MIME_OVERRIDES.get(path.suffix.lower()) or mimetypes.guess_type(path.name)[0]
+    mimetype = mimetype or 'application/octet-stream'
+    if mimetype.startswith('text/') or mimetype in ('application/javascript', 'application/json'):
+        mimetype += '; charset=utf-8'
+    return mimetype
+
+
+def is_hashed(rel_path: str) -> bool:
+    """Vite 콘텐츠 해시가 파일명에 포함된 빌드 산출물인지 (내용이 바뀌면 이름도 바뀜)."""
+    return rel_path.startswith('assets/') and bool(_HASHED_NAME.search(rel_path))
+
+
+def etag_matches(if_none_match: str | None, etags: list[str]) -> bool:
+    """If-None-Match 비교 — 약한 비교(W/ 무시), '*' 허용."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return '*' in candidates or any(tag in candidates for tag in etags)
+
+
+class StaticAssetStore:
+    """root 아래 정적 파일을 캐시하고 (status, headers, body)를 결정합니다."""
+
+    def __init__(self, root: Path, fallback: str = 'index.html'):
+        self.root = Path(root).resolve()
+        self.fallback = fallback
+        self._assets: dict[str, StaticAsset] = {}
+        self._lock = threading.Lock()
+        self.loads = 0   # 디스크에서 (재)적재한 횟수 — 변경 감지 확인용
+
+    # ── 적재 ────────────────────────────────────────────────────────────────
+    def preload(self) -> int:
+        """서버 시작 시 dist 전체를 미리 읽고 압축 — 첫 요청에서 압축 지연을 없앰."""
+        count = 0
+        if not self.root.is_dir():
+            return count
+        for path in self.root.rglob('*'):
+            if path.is_file():
+                if self.get(path.relative_to(self.root).as_posix()) is not None:
+                    count += 1
+        return count
+
+    def _resolve(self, rel_path: str) -> Path | None:
+        candidate = (self.root / rel_path.lstrip('/')).resolve()
+        # 경로 조작(../) 차단 — root 밖 파일은 서비스하지 않음
+        if candidate != self.root and self.root not in candidate.parents:
+            return None
+        return candidate
+
+    def get(self, rel_path: str) -> StaticAsset | None:
+        """캐시된 자산을 반환. 파일이 바뀌었으면 다시 읽고, 없으면 None."""
+        rel_path = rel_path.lstrip('/')
+        asset = self._assets.get(rel_path)
+        # 캐시 적중 시에는 stat 한 번만 — 경로 정규화(resolve)는 최초 적재 때 이미 검증됨
+        path = self.root / rel_path if asset is not None else self._resolve(rel_path)
+        if path is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            if asset is not None:
+                with self._lock:
+                    self._assets.pop(rel_path, None)
+            return None
+        if asset is not None and asset.mtime_ns == st.st_mtime_ns and asset.size == st.st_size:
+            return asset
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        asset = self._load(rel_path, path, st)
+        with self._lock:
+            self._assets[rel_path] = asset
+        return asset
+
+    def _load(self, rel_path: str, path: Path, st: os.stat_result) -> StaticAsset:
+        data = path.read_bytes()
+        content_type = _content_type(path)
+        asset = StaticAsset(
+            rel_path=rel_path,
+            content_type=content_type,
+            cache_control=IMMUTABLE_CACHE if is_hashed(rel_path) else REVALIDATE_CACHE,
+            etag='"' + hashlib.sha1(data).hexdigest()[:20] + '"',
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            variants={'identity': data},
+        )
+        if len(data) >= MIN_COMPRESS_BYTES and content_type.startswith(_COMPRESSIBLE_TYPES):
+            gz = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(gz) < len(data):
+                asset.variants['gzip'] = gz
+            if brotli is not None:
+                br = brotli.compress(data, quality=11)
+                if len(br) < len(data):
+                    asset.variants['br'] = br
+        self.loads += 1
+        return asset
+
+    # ── 응답 결정 ───────────────────────────────────────────────────────────
+    def lookup(self, rel_path: str) -> StaticAsset | None:
+        """요청 경로 → 자산. 없으면 SPA fallback(index.html)."""
+        return self.get(rel_path) or self.get(self.fallback)
+
+    def respond(self, asset: StaticAsset, accept_encoding: str | None = None,
+                if_none_match: str | None = None) -> tuple[int, list[tuple[str, str]], bytes]:
+        """협상된 인코딩으로 (status, headers, body)를 만듭니다. ETag 일치 시 304."""
+        accepted = accepted_encodings(accept_encoding)
+        encoding = next((enc for enc in ('br', 'gzip') if enc in accepted and enc in asset.variants), 'identity')
+        etag = asset.etag_for(encoding)
+        headers = [
+            ('ETag', etag),
+            ('Cache-Control', asset.cache_control),
+        ]
+        if len(asset.variants) > 1:
+            headers.append(('Vary', 'Accept-Encoding'))
+        if etag_matches(if_none_match, [etag, asset.etag]):
+            return 304, headers, b''
+        body = asset.variants[encoding]
+        headers.append(('Content-Type', asset.content_type))
+        if encoding != 'identity':
+            headers.append(('Content-Encoding', encoding))
+        headers.append(('Content-Length', str(len(body))))
+        return 200, headers, body
+
+    def stats(self) -> dict:
+        with self._lock:
+            assets = list(self._assets.values())
+        return {
+            'root': str(self.root),
+            'files': len(assets),
+            'bytes': sum(a.size for a in assets),
+            'compressed_bytes': sum(len(a.variants.get('br') or a.variants.get('gzip') or a.variants['identity'])
+                                    for a in assets),
+            'immutable': sum(1 for a in assets if a.cache_control == IMMUTABLE_CACHE),
+            'brotli': brotli is not None,
+            'loads': self.loads,
+        }
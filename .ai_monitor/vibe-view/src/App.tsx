@@ -7,6 +7,7 @@
  *          각 기능 영역은 독립 컴포넌트(TopMenuBar, ActivityBar, FileExplorer,
  *          MessageComposer, 각 패널)로 분리되어 있습니다.
  * REVISION HISTORY:
+ * - 2026-10-17: skill-chain / agent/terminals / hive/activity 폴링 → 상태 채널(useDashboardState) 푸시.
  * - 2026-03-07 Claude: ActivityBar HiveEngineStatus 통합 — globalEngineStage 계산 + hive_health 폴링 추가.
  *                      agentTerminals에서 최고 우선순위 파이프라인 단계를 추출, ActivityBar LED 링에 연동.
  * - 2026-03-02 Claude: TopMenuBar, ActivityBar, FileExplorer, MessageComposer 분리.
@@ -33,6 +34,7 @@ import { motion } from 'framer-motion';
 import { Menu, ChevronRight, ChevronDown, RotateCw, X, Minimize2, Maximize2, ExternalLink } from 'lucide-react';
 /* ── 공유 상수/타입 ── */
 import { API_BASE, OpenFile, TreeItem } from './constants';
+import { useDashboardState } from './dashboardState';
 /* ── 레이아웃 컴포넌트 — App.tsx 2차 분리에서 추출 ── */
 import TopMenuBar from './components/TopMenuBar';
 import ActivityBar from './components/ActivityBar';
@@ -125,7 +127,7 @@ function App() {
   const [agentTerminals, setAgentTerminals] = useState<Record<string, any>>({});
   // 하이브 엔진 상태 (자가 치유 등) — /api/hive/health 폴링으로 수신
   const [hiveHealth, setHiveHealth] = useState<any>(null);
-  // 하이브 활동 이벤트 — /api/hive/activity 폴링 (memory_write/orchestrate 여부 TerminalSlot에 전달)
+  // 하이브 활동 이벤트 — 상태 채널 hive_activity (memory_write/orchestrate 여부 TerminalSlot에 전달)
   const [hiveActivity, setHiveActivity] = useState<any[]>([]);
   // 자가 치유 활성 여부 — hiveHealth에서 파생 (별도 폴링 불필요)
   const isHealingActive = hiveHealth?.healing_active === true || hiveHealth?.status === 'healing';
@@ -217,18 +219,11 @@ function App() {
     return () => clearInterval(interval);
   }, []);
 
-  // 스킬 체인 상태 폴링 (3초) — Activity Bar 오케스트레이터 탭 펄스 배지용
+  // 스킬 체인 상태 — 상태 채널 푸시 (변경 시에만) — Activity Bar 오케스트레이터 탭 펄스 배지용
+  const pushedSkillChain = useDashboardState('skill_chain');
   useEffect(() => {
-    const fetchChain = () => {
-      fetch(`${API_BASE}/api/orchestrator/skill-chain`)
-        .then(res => res.json())
-        .then(data => setSkillChain(data))
-        .catch(() => {});
-    };
-    fetchChain();
-    const interval = setInterval(fetchChain, 3000);
-    return () => clearInterval(interval);
-  }, []);
+    if (pushedSkillChain) setSkillChain(pushedSkillChain);
+  }, [pushedSkillChain]);
 
   // MCP 설치 현황 폴링 (5초) — Activity Bar 배지(mcpInstalled.length)용
   useEffect(() => {
@@ -243,18 +238,12 @@ function App() {
     return () => clearInterval(interval);
   }, []);
 
-  // 터미널별 에이전트 파이프라인 상태 폴링 (3초) — TerminalSlot 모니터링 뷰 단계 표시용
+  // 터미널별 에이전트 파이프라인 상태 — 상태 채널 푸시 — TerminalSlot 모니터링 뷰 단계 표시용
+  const pushedTerminals = useDashboardState('terminals');
   useEffect(() => {
-    const fetchTerminals = () => {
-      fetch(`${API_BASE}/api/agent/terminals`)
-        .then(res => res.json())
-        .then(data => setAgentTerminals(typeof data === 'object' && data !== null ? data : {}))
-        .catch(() => {});
-    };
-    fetchTerminals();
-    const interval = setInterval(fetchTerminals, 3000);
-    return () => clearInterval(interval);
-  }, []);
+    if (pushedTerminals !== undefined)
+      setAgentTerminals(typeof pushedTerminals === 'object' && pushedTerminals !== null ? pushedTerminals : {});
+  }, [pushedTerminals]);
 
   // 하이브 엔진 헬스 상태 폴링 (5초) — ActivityBar 엔진 라이브 표시용
   useEffect(() => {
@@ -269,18 +258,11 @@ function App() {
     return () => clearInterval(interval);
   }, []);
 
-  // 하이브 활동 이벤트 폴링 (5초) — TerminalSlot 모니터링 패널 하이브 저장 상태 표시용
+  // 하이브 활동 이벤트 — 상태 채널 푸시 — TerminalSlot 모니터링 패널 하이브 저장 상태 표시용
+  const pushedActivity = useDashboardState('hive_activity');
   useEffect(() => {
-    const fetchActivity = () => {
-      fetch(`${API_BASE}/api/hive/activity`)
-        .then(res => res.json())
-        .then(data => setHiveActivity(Array.isArray(data) ? data : []))
-        .catch(() => {});
-    };
-    fetchActivity();
-    const interval = setInterval(fetchActivity, 5000);
-    return () => clearInterval(interval);
-  }, []);
+    if (pushedActivity !== undefined) setHiveActivity(Array.isArray(pushedActivity) ? pushedActivity : []);
+  }, [pushedActivity]);
 
   // 글로벌 파이프라인 단계 계산 — 모든 터미널 중 가장 '전진된' 단계를 표시
   const globalPipelineStage = (() => {
@@ -8,6 +8,9 @@
  *          하나의 SSE 스트림을 공유하여 모든 뷰를 동시 업데이트합니다.
  *
  * REVISION HISTORY:
+ * - 2026-10-17: [상태 채널] terminals / skill-chain / status / hive activity 폴링 → useDashboardState 푸시
+ * - 2026-10-17: [SSE] 수동 재연결 시 마지막 이벤트 id 전달 (?last_event_id=)
+ *   - 서버 replay 링에서 끊긴 사이 이벤트만 재전송 — done 이벤트 유실/중복 렌더링 방지
  * - 2026-03-08 Claude: [UI] 각 TerminalCard가 개별 파이프라인 표시하도록 개선
  *   - TerminalState에 pipeline_stage 필드 추가 (서버 값 직접 사용)
  *   - TerminalCard: 서버 pipeline_stage 우선, last_line detectStage fallback
@@ -89,6 +92,7 @@ import {
   Save, ChevronDown, ChevronUp,
 } from 'lucide-react';
 import FilePathText from '../FilePathText';
+import { useDashboardState } from '../../dashboardState';
 
 // 현재 접속 포트 기반으로 API 주소 자동 결정
 const API_BASE = `http://${window.location.hostname}:${window.location.port}`;
@@ -680,7 +684,7 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
   const [_analyzedFiles, setAnalyzedFiles] = useState<string[]>([]);
   const [_modifiedFiles, setModifiedFiles] = useState<string[]>([]);
 
-  // ── 하이브 활동 탭 데이터 — /api/hive/activity 3초 폴링 ───────────────────
+  // ── 하이브 활동 탭 데이터 — 상태 채널 hive_activity 푸시 ────────────────────
   // 하이브 메모리 읽기/쓰기, 오케스트레이션, 메시지 수신 이벤트를 시각화
   const [hiveEvents, setHiveEvents] = useState<HiveEvent[]>([]);
 
@@ -709,7 +713,7 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
   const [orchLastRun, setOrchLastRun]     = useState<string | null>(null);
   const [orchTerminalAgents, setOrchTerminalAgents] = useState<Record<string, string>>({});
 
-  // ── 터미널별 상태 카드 (T1~T8) — /api/agent/terminals 폴링 ─────────────────
+  // ── 터미널별 상태 카드 (T1~T8) — 상태 채널 terminals 푸시 ──────────────────
   const [terminals, setTerminals] = useState<Record<string, TerminalState>>(() => {
     const init: Record<string, TerminalState> = {};
     for (let i = 1; i <= 8; i++) {
@@ -746,6 +750,8 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
   const textareaRef       = useRef<HTMLTextAreaElement>(null);
   // 재연결 타이머 ref — 언마운트/신규 연결 시 취소하여 stale 재연결 완전 차단
   const reconnectTimer    = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // 마지막으로 받은 SSE 이벤트 id — 새 EventSource는 Last-Event-ID를 자동 전송하지 않으므로 쿼리로 전달
+  const lastEventIdRef    = useRef<string>('');
   // 실행 응답 대기 타임아웃 ref — connectSSE 클로저에서 참조하므로 먼저 선언
   const runTimeoutRef     = useRef<ReturnType<typeof setTimeout> | null>(null);
   // 전체 실행 최대 시간 타임아웃 ref — started 이후에도 5분 이상 실행 시 강제 오류 처리
@@ -766,39 +772,25 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
       thoughtEndRef.current?.scrollIntoView({ behavior: 'smooth' });
   }, [thoughts, activeTab]);
 
-  // ─── 오케스트레이터 스킬 체인 폴링 (3초) — 오케스트레이터 탭 데이터 갱신 ──
+  // ─── 오케스트레이터 탭 데이터 — 상태 채널 푸시 (변경 시에만) ──────────────
+  // 스킬 체인 데이터 (스킬 목록 + 터미널별 단계)
+  const pushedChain = useDashboardState('skill_chain');
   useEffect(() => {
-    const fetchOrch = () => {
-      // 스킬 체인 데이터 (스킬 목록 + 터미널별 단계)
-      fetch(`${API_BASE}/api/orchestrator/skill-chain`)
-        .then(res => res.json())
-        .then(data => { if (data.skill_registry !== undefined) setOrchChainData(data); })
-        .catch(() => {});
-      // 터미널 에이전트 매핑 (orchTerminalAgents)
-      fetch(`${API_BASE}/api/orchestrator/status`)
-        .then(res => res.json())
-        .then(data => { if (data.terminal_agents) setOrchTerminalAgents(data.terminal_agents); })
-        .catch(() => {});
-    };
-    fetchOrch();
-    const iv = setInterval(fetchOrch, 3000);
-    return () => clearInterval(iv);
-  }, []);
+    if (pushedChain?.skill_registry !== undefined) setOrchChainData(pushedChain);
+  }, [pushedChain]);
+  // 터미널 에이전트 매핑 (orchTerminalAgents)
+  const pushedOrch = useDashboardState('orchestrator');
+  useEffect(() => {
+    if (pushedOrch?.terminal_agents) setOrchTerminalAgents(pushedOrch.terminal_agents);
+  }, [pushedOrch]);
 
-  // ─── 하이브 활동 폴링 (5초) — 하이브 탭 데이터 갱신 ─────────────────────
+  // ─── 하이브 활동 — 하이브 탭 데이터 갱신 ─────────────────────────────────
   // task_logs에서 하이브 시스템 관련 이벤트만 필터링하여 표시
   // → 사용자가 Claude/Gemini가 실제로 하이브를 사용하는지 눈으로 확인 가능
+  const pushedHive = useDashboardState<HiveEvent[]>('hive_activity');
   useEffect(() => {
-    const fetchHive = () => {
-      fetch(`${API_BASE}/api/hive/activity`)
-        .then(res => res.json())
-        .then((data: HiveEvent[]) => { if (Array.isArray(data)) setHiveEvents(data); })
-        .catch(() => {});
-    };
-    fetchHive();
-    const iv = setInterval(fetchHive, 5000);
-    return () => clearInterval(iv);
-  }, []);
+    if (Array.isArray(pushedHive)) setHiveEvents(pushedHive);
+  }, [pushedHive]);
 
   // ─── 오케스트레이터 수동 실행 핸들러 ───────────────────────────────────
   const runOrchestrator = () => {
@@ -814,36 +806,32 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
       .finally(() => setOrchRunning(false));
   };
 
-  // ─── 터미널별 상태 폴링 (T1~T8 상황판 카드 갱신) ────────────────────────
-  const loadTerminals = useCallback(async () => {
-    try {
-      const res = await fetch(`${API_BASE}/api/agent/terminals`);
-      if (!res.ok) return;
-      const data: Record<string, TerminalState> = await res.json();
-      // 선택된 터미널이 외부에서 새로 running 진입 시 워크플로우 파이프라인 초기화
-      // (대시보드가 아닌 T1.bat 등 외부 실행으로 감지된 경우)
-      setTerminals(prev => {
-        const prevStatus  = prev[selectedTerminalId]?.status;
-        const newStatus   = data[selectedTerminalId]?.status;
-        // 외부 실행으로 running 진입 → 파이프라인 초기화
-        if (newStatus === 'running' && prevStatus !== 'running' && status !== 'running') {
-          setWfStage('analyzing');
-          wfCurrentStageRef.current = 'analyzing';
-          setWfLoop(0);
-        }
-        // 서버에 저장된 pipeline_stage로 wfStage 복원
-        // — 대시보드를 새로 열었을 때 이전 실행의 파이프라인 단계를 복구합니다.
-        const serverStage = (data[selectedTerminalId] as any)?.pipeline_stage as WorkflowStage | undefined;
-        if (serverStage && serverStage !== 'idle' && wfCurrentStageRef.current === 'idle') {
-          wfCurrentStageRef.current = serverStage;
-          setWfStage(serverStage);
-        }
-        return data;
-      });
-    } catch {
-      // 서버 미실행 시 무시 (초기 idle 상태 유지)
-    }
-  }, [selectedTerminalId, status]);
+  // ─── 터미널별 상태 (T1~T8 상황판 카드 갱신) — 상태 채널 푸시 ─────────────
+  const pushedTerminals = useDashboardState<Record<string, TerminalState>>('terminals');
+  useEffect(() => {
+    const data = pushedTerminals;
+    if (!data || typeof data !== 'object') return;
+    // 선택된 터미널이 외부에서 새로 running 진입 시 워크플로우 파이프라인 초기화
+    // (대시보드가 아닌 T1.bat 등 외부 실행으로 감지된 경우)
+    setTerminals(prev => {
+      const prevStatus  = prev[selectedTerminalId]?.status;
+      const newStatus   = data[selectedTerminalId]?.status;
+      // 외부 실행으로 running 진입 → 파이프라인 초기화
+      if (newStatus === 'running' && prevStatus !== 'running' && status !== 'running') {
+        setWfStage('analyzing');
+        wfCurrentStageRef.current = 'analyzing';
+        setWfLoop(0);
+      }
+      // 서버에 저장된 pipeline_stage로 wfStage 복원
+      // — 대시보드를 새로 열었을 때 이전 실행의 파이프라인 단계를 복구합니다.
+      const serverStage = (data[selectedTerminalId] as any)?.pipeline_stage as WorkflowStage | undefined;
+      if (serverStage && serverStage !== 'idle' && wfCurrentStageRef.current === 'idle') {
+        wfCurrentStageRef.current = serverStage;
+        setWfStage(serverStage);
+      }
+      return data;
+    });
+  }, [pushedTerminals, selectedTerminalId, status]);
 
   // ─── 히스토리 로드 ──────────────────────────────────────────────────────
   const loadHistory = useCallback(async () => {
@@ -932,7 +920,8 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
     // 기존 연결 닫기. onerror는 sseRef.current !== es 체크로 stale 재연결 방지
     sseRef.current?.close();
 
-    const es = new EventSource(`${API_BASE}/api/events/agent`);
+    const resume = lastEventIdRef.current ? `?last_event_id=${encodeURIComponent(lastEventIdRef.current)}` : '';
+    const es = new EventSource(`${API_BASE}/api/events/agent${resume}`);
     sseRef.current = es;
 
     // SSE 연결 성공 직후 서버 상태 즉시 동기화
@@ -940,6 +929,7 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
     es.onopen = () => { loadStatus(); };
 
     es.onmessage = (e) => {
+      if (e.lastEventId) lastEventIdRef.current = e.lastEventId;
       try {
         const data = JSON.parse(e.data);
         const type = data.type as OutputLine['type'];
@@ -1100,7 +1090,6 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
   useEffect(() => {
     loadStatus();
     loadHistory();
-    loadTerminals();
     loadCodexPolicy();
     connectSSE();
 
@@ -1110,14 +1099,8 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
       loadHistory();
       loadStatus();
     }, 10000);
-
-    // 3초마다 터미널별 상태 폴링 (상황판 T1~T8 카드 갱신)
-    const terminalTimer = setInterval(() => {
-      loadTerminals();
-    }, 3000);
     return () => {
       clearInterval(timer);
-      clearInterval(terminalTimer);
       // 언마운트 시: 모든 타이머 취소 + sseRef null 교체 → stale 재연결/타임아웃 완전 차단
       if (reconnectTimer.current) { clearTimeout(reconnectTimer.current); reconnectTimer.current = null; }
       if (runTimeoutRef.current) { clearTimeout(runTimeoutRef.current); runTimeoutRef.current = null; }
@@ -1126,7 +1109,7 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
       sseRef.current = null;
       es?.close();
     };
-  }, [loadStatus, loadHistory, loadTerminals, loadCodexPolicy, connectSSE]);
+  }, [loadStatus, loadHistory, loadCodexPolicy, connectSSE]);
 
   // ─── 양방향 상태 동기화: 3초마다 서버 폴링 ─────────────────────────────────
   // 케이스 A: UI=running, 서버!=running → done 이벤트 유실 복구 (running 고착 해소)
@@ -1892,7 +1875,7 @@ export default function AgentPanel({ onStatusChange, onOpenFilePath }: AgentPane
              - 보라: 오케스트레이션 (스킬 체인 실행)
              - 노랑: 메시지 수신 (Gemini↔Claude 통신)
              - 빨강: 자기치유 (스킬 자동 설치)
-             5초마다 /api/hive/activity 폴링 → 실시간 갱신
+             상태 채널(hive_activity) 푸시 → 실시간 갱신
         ─────────────────────────────────────────────────────────────── */}
         {activeTab === 'hive' && (
           <div className="flex flex-col h-full overflow-hidden">
@@ -4,12 +4,14 @@
  *              App.tsx에서 분리된 독립 컴포넌트로, 오케스트레이터 상태와 하이브 헬스를
  *              자체 폴링하여 렌더링합니다.
  * REVISION HISTORY:
+ * - 2026-10-17: 오케스트레이터 상태 3초 폴링 → 상태 채널(useDashboardState) 푸시
  * - 2026-03-01 Claude: App.tsx에서 분리 — 독립 컴포넌트화
  */
 
 import { useState, useEffect } from 'react';
 import { Bot, AlertTriangle, Cpu, RotateCw, CheckCircle2, Zap } from 'lucide-react';
 import { HiveHealth, OrchestratorStatus } from '../../types';
+import { useDashboardState } from '../../dashboardState';
 
 // 현재 접속 포트 기반으로 API 주소 자동 결정 (App.tsx와 동일한 패턴)
 const API_BASE = `http://${window.location.hostname}:${window.location.port}`;
@@ -21,7 +23,7 @@ const API_BASE = `http://${window.location.hostname}:${window.location.port}`;
  *       스킬 복구 및 자가 치유 액션을 제공하는 독립 패널 컴포넌트.
  *
  * 폴링 주기:
- *   - /api/orchestrator/status : 3초 (에이전트 상태 + 경고 + 터미널 슬롯 현황)
+ *   - /api/orchestrator/status : 상태 채널 푸시 (에이전트 상태 + 경고 + 터미널 슬롯 현황)
  *   - /api/hive/health         : 30초 (하이브 시스템 진단 데이터)
  *
  * props: 없음 (완전 독립 컴포넌트 — 모든 데이터를 자체 폴링)
@@ -36,18 +38,11 @@ export default function HivePanel() {
   // 스킬 복구 버튼용 현재 경로 — 서버 설정에서 가져옴
   const [currentPath, setCurrentPath] = useState('');
 
-  // ── 오케스트레이터 상태 폴링 (3초 간격) ──────────────────────────────────
+  // ── 오케스트레이터 상태 — 상태 채널 푸시 (변경 시에만) ─────────────────────
+  const pushedOrch = useDashboardState<OrchestratorStatus>('orchestrator');
   useEffect(() => {
-    const fetchOrch = () => {
-      fetch(`${API_BASE}/api/orchestrator/status`)
-        .then(res => res.json())
-        .then((data: OrchestratorStatus) => setOrchStatus(data))
-        .catch(() => {});
-    };
-    fetchOrch();
-    const interval = setInterval(fetchOrch, 3000);
-    return () => clearInterval(interval);
-  }, []);
+    if (pushedOrch) setOrchStatus(pushedOrch);
+  }, [pushedOrch]);
 
   // ── 하이브 헬스 API 호출 함수 (버튼에서도 직접 호출 가능) ────────────────
   const fetchHiveHealth = () => {
@@ -4,10 +4,11 @@
  * 설명: 오케스트레이션 현황판.
  *       1번 컬럼: 전체 스킬 카탈로그 (영어+한글 설명 나열)
  *       2번~ 컬럼: 지시받아 실행 중인 각 스킬 (어떤 파일 수정, 변경 내용)
- *       데이터: /api/orchestrator/skill-chain (3초 폴링 — 라이브)
+ *       데이터: /api/orchestrator/skill-chain (상태 채널 푸시 — 라이브)
  *              /api/skill-results (10초 폴링 — 완료된 세션 요약)
  *
  * REVISION HISTORY:
+ * - 2026-10-17: skill-chain 3초 폴링 → 상태 채널(useDashboardState) 푸시
  * - 2026-03-06 Claude: 최초 구현
  * - 2026-03-06 Claude: v6 — 스킬 카탈로그 + 실행 스킬 컬럼 통합 뷰
  *                           1번=전체스킬목록, 2번~=실행스킬(파일/변경내용)
@@ -17,6 +18,7 @@
 import { useState, useEffect } from 'react';
 import { Monitor, Cpu, CheckCircle, Clock, AlertCircle, Loader, BookOpen, Radio, Database, Terminal, ExternalLink } from 'lucide-react';
 import { API_BASE } from '../../constants';
+import { useDashboardState } from '../../dashboardState';
 
 // ─── 타입 ─────────────────────────────────────────────────────────────────────
 
@@ -101,28 +103,21 @@ export default function KanbanPanel() {
       .catch(err => console.error('Kanban Launch Error:', err));
   };
 
-  // ── /api/orchestrator/skill-chain 폴링 (3초) ─────────────────────────────
+  // ── /api/orchestrator/skill-chain — 상태 채널 푸시 (변경 시에만) ──────────
+  const skillChain = useDashboardState('skill_chain');
   useEffect(() => {
-    const load = () =>
-      fetch(`${API_BASE}/api/orchestrator/skill-chain`)
-        .then(r => r.json())
-        .then(data => {
-          const result: Record<string, LiveChain> = {};
-          for (const [tid, chain] of Object.entries(data?.terminals ?? {})) {
-            const steps: LiveStep[] = (chain as any)?.steps ?? [];
-            // running 상태인 스텝이 하나라도 있어야만 표시
-            // — pending만 있거나 전부 done/failed인 과거 체인은 표시 안 함
-            const hasActive = steps.some(s => s.status === 'running');
-            if (hasActive)
-              result[tid] = { request: (chain as any)?.request ?? '', steps };
-          }
-          setLiveChains(result);
-        })
-        .catch(() => {});
-    load();
-    const id = setInterval(load, 3000);
-    return () => clearInterval(id);
-  }, []);
+    if (!skillChain) return;
+    const result: Record<string, LiveChain> = {};
+    for (const [tid, chain] of Object.entries(skillChain?.terminals ?? {})) {
+      const steps: LiveStep[] = (chain as any)?.steps ?? [];
+      // running 상태인 스텝이 하나라도 있어야만 표시
+      // — pending만 있거나 전부 done/failed인 과거 체인은 표시 안 함
+      const hasActive = steps.some(s => s.status === 'running');
+      if (hasActive)
+        result[tid] = { request: (chain as any)?.request ?? '', steps };
+    }
+    setLiveChains(result);
+  }, [skillChain]);
 
   // ── /api/skill-results 폴링 (10초) — 완료 세션 요약 ─────────────────────
   useEffect(() => {
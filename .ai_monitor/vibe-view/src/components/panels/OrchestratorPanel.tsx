@@ -6,6 +6,7 @@
  *              App.tsx에서 분리된 독립 컴포넌트로, skill_chain.db 기반 API를
  *              자체 폴링하여 렌더링합니다.
  * REVISION HISTORY:
+ * - 2026-10-17: status / skill-chain 3초 폴링 → 상태 채널(useDashboardState) 푸시
  * - 2026-03-01 Claude: [UI 전면 개편] 사용자 요청 — 스킬 세로 나열 + 터미널별 사용 순서
  *                      - 상단: 스킬 ①~⑦ 세로 목록, 각 스킬 옆에 사용 중인 터미널 배지
  *                      - 하단: 터미널별 체인 순서 (T1: 1-① → 1-③)
@@ -17,6 +18,7 @@
 import { useState, useEffect } from 'react';
 import { Play } from 'lucide-react';
 import { OrchestratorStatus } from '../../types';
+import { useDashboardState } from '../../dashboardState';
 
 // 현재 접속 포트 기반으로 API 주소 자동 결정
 const API_BASE = `http://${window.location.hostname}:${window.location.port}`;
@@ -80,9 +82,9 @@ interface OrchestratorPanelProps {
  *   상단 — 스킬 ①~⑦ 세로 목록. 각 스킬 오른쪽에 그 스킬을 실행 중인 터미널 배지 표시.
  *   하단 — 터미널별 스킬 사용 순서 (T1: 1-① → 1-③ → 1-⑤).
  *
- * 폴링 주기:
- *   - /api/orchestrator/status    : 3초
- *   - /api/orchestrator/skill-chain: 3초
+ * 데이터 (상태 채널 /api/events/state 푸시 — 변경 시에만):
+ *   - /api/orchestrator/status
+ *   - /api/orchestrator/skill-chain
  */
 export default function OrchestratorPanel({ onWarningCount }: OrchestratorPanelProps) {
   const [orchStatus, setOrchStatus] = useState<OrchestratorStatus | null>(null);
@@ -93,38 +95,21 @@ export default function OrchestratorPanel({ onWarningCount }: OrchestratorPanelP
     terminals: {},
   });
 
-  // ── 오케스트레이터 상태 폴링 ─────────────────────────────────────────────
+  // ── 오케스트레이터 상태 — 상태 채널 푸시 ───────────────────────────────
+  const pushedOrch = useDashboardState<OrchestratorStatus>('orchestrator');
   useEffect(() => {
-    const fetchOrch = () => {
-      fetch(`${API_BASE}/api/orchestrator/status`)
-        .then(res => res.json())
-        .then((data: OrchestratorStatus) => {
-          setOrchStatus(data);
-          onWarningCount(data.warnings?.length ?? 0);
-        })
-        .catch(() => {});
-    };
-    fetchOrch();
-    const interval = setInterval(fetchOrch, 3000);
-    return () => clearInterval(interval);
-  }, [onWarningCount]);
-
-  // ── 스킬 체인 폴링 ───────────────────────────────────────────────────────
+    if (!pushedOrch) return;
+    setOrchStatus(pushedOrch);
+    onWarningCount(pushedOrch.warnings?.length ?? 0);
+  }, [pushedOrch, onWarningCount]);
+
+  // ── 스킬 체인 — 상태 채널 푸시 ─────────────────────────────────────────
+  const pushedChain = useDashboardState<SkillChainResponse>('skill_chain');
   useEffect(() => {
-    const fetchChain = () => {
-      fetch(`${API_BASE}/api/orchestrator/skill-chain`)
-        .then(res => res.json())
-        .then((data: SkillChainResponse) => {
-          if (data.skill_registry !== undefined) {
-            setChainData(data);
-          }
-        })
-        .catch(() => {});
-    };
-    fetchChain();
-    const interval = setInterval(fetchChain, 3000);
-    return () => clearInterval(interval);
-  }, []);
+    if (pushedChain?.skill_registry !== undefined) {
+      setChainData(pushedChain);
+    }
+  }, [pushedChain]);
 
   // ── 수동 실행 ────────────────────────────────────────────────────────────
   const runOrchestrator = () => {
@@ -2,9 +2,10 @@
  * ------------------------------------------------------------------------
  * 📄 파일명: SkillResultsPanel.tsx
  * 📝 설명: AI 오케스트레이터 스킬 실행 결과 패널.
- *          [현재 실행 중] 섹션: /api/orchestrator/skill-chain 3초 폴링 → 라이브 체인 표시
+ *          [현재 실행 중] 섹션: /api/orchestrator/skill-chain 상태 채널 푸시 → 라이브 체인 표시
  *          [완료 기록] 섹션: skill_results.jsonl 10초 폴링 → 이전 세션 히스토리
  * REVISION HISTORY:
+ * - 2026-10-17: [현재 실행 중] skill-chain 3초 폴링 → 상태 채널(useDashboardState) 푸시
  * - 2026-03-06 Claude: 오케스트레이션 현황판 수평 파이프라인 레인 뷰로 전면 개편
  *          [오케스트레이션] → [스킬1: 뭘하는지] → [스킬2: 뭘하는지] 가로 레인 구조
  *          완료 기록도 동일한 가로 파이프라인 미니뷰로 통일
@@ -17,6 +18,7 @@
 import { useState, useEffect, useMemo } from 'react';
 import { Zap, CheckCircle2, SkipForward, AlertCircle, Clock, BarChart3, Radio } from 'lucide-react';
 import { API_BASE } from '../../constants';
+import { useDashboardState } from '../../dashboardState';
 
 // ─── 현재 실행 중 체인 타입 ────────────────────────────────────────────────
 
@@ -90,34 +92,26 @@ export default function SkillResultsPanel() {
   // 현재 실행 중인 스킬 체인 (터미널별)
   const [liveChains, setLiveChains] = useState<Record<string, LiveChain>>({});
 
-  // [라이브] 현재 실행 중 스킬 체인 — 3초마다 빠르게 폴링
+  // [라이브] 현재 실행 중 스킬 체인 — 상태 채널 푸시 (변경 시에만)
+  const skillChain = useDashboardState('skill_chain');
   useEffect(() => {
-    const fetchLive = () => {
-      fetch(`${API_BASE}/api/orchestrator/skill-chain`)
-        .then(res => res.json())
-        .then(data => {
-          // terminals 맵에서 running/pending 스텝이 있는 것만 추출
-          const active: Record<string, LiveChain> = {};
-          const terminals: Record<string, any> = data?.terminals ?? {};
-          for (const [tid, chain] of Object.entries(terminals)) {
-            const steps: LiveStep[] = chain?.steps ?? [];
-            const isActive = steps.some((s: LiveStep) => s.status === 'running' || s.status === 'pending');
-            if (isActive) {
-              active[tid] = {
-                request: chain?.request ?? '',
-                steps,
-                terminal_id: parseInt(tid, 10) || undefined,
-              };
-            }
-          }
-          setLiveChains(active);
-        })
-        .catch(() => {});
-    };
-    fetchLive();
-    const interval = setInterval(fetchLive, 3000);
-    return () => clearInterval(interval);
-  }, []);
+    if (!skillChain) return;
+    // terminals 맵에서 running/pending 스텝이 있는 것만 추출
+    const active: Record<string, LiveChain> = {};
+    const terminals: Record<string, any> = skillChain?.terminals ?? {};
+    for (const [tid, chain] of Object.entries(terminals)) {
+      const steps: LiveStep[] = chain?.steps ?? [];
+      const isActive = steps.some((s: LiveStep) => s.status === 'running' || s.status === 'pending');
+      if (isActive) {
+        active[tid] = {
+          request: chain?.request ?? '',
+          steps,
+          terminal_id: parseInt(tid, 10) || undefined,
+        };
+      }
+    }
+    setLiveChains(active);
+  }, [skillChain]);
 
   // [히스토리] 완료된 스킬 결과 폴링 (10초 간격)
   useEffect(() => {
@@ -10,6 +10,7 @@ import {
   TerminalSquare,
 } from 'lucide-react';
 import { API_BASE } from '../../constants';
+import { useDashboardState } from '../../dashboardState';
 
 interface LiveStep {
   skill_name: string;
@@ -179,57 +180,39 @@ export default function TaskBoardPanel() {
   const [hasApiSignal, setHasApiSignal] = useState(false);
   const [fetchFailures, setFetchFailures] = useState(0);
 
+  // 스킬 체인 / 터미널 상태 — 상태 채널(/api/events/state) 푸시, 변경 시에만 재계산
+  const skillChain = useDashboardState('skill_chain');
   useEffect(() => {
-    const load = () => {
-      fetch(`${API_BASE}/api/orchestrator/skill-chain`)
-        .then((response) => response.json())
-        .then((data) => {
-          const next: Record<string, LiveChain> = {};
-          const terminalMap: Record<string, any> = data?.terminals ?? {};
-          for (const [terminalId, chain] of Object.entries(terminalMap)) {
-            const steps: LiveStep[] = (chain as any)?.steps ?? [];
-            // 실제 작업이 있는 체인만 포함 (done/running/failed 중 하나라도 있어야 함)
-            const hasRealWork = steps.some(
-              (step) => step.status === 'running' || step.status === 'pending' || step.status === 'done' || step.status === 'failed',
-            );
-            if (!hasRealWork) continue;
-            const isLive = steps.some((step) => step.status === 'running' || step.status === 'pending');
-            next[terminalId] = {
-              request: (chain as any)?.request ?? '',
-              steps,
-              terminal_id: Number.parseInt(terminalId, 10) || undefined,
-              isLive,
-              updatedAt: (chain as any)?.updated_at ?? undefined,
-            };
-          }
-          setLiveChains(next);
-          setHasApiSignal(true);
-        })
-        .catch(() => setFetchFailures((prev) => prev + 1));
-    };
-
-    load();
-    const timer = setInterval(load, 3000);
-    return () => clearInterval(timer);
-  }, []);
-
+    if (!skillChain) return;
+    const next: Record<string, LiveChain> = {};
+    const terminalMap: Record<string, any> = skillChain?.terminals ?? {};
+    for (const [terminalId, chain] of Object.entries(terminalMap)) {
+      const steps: LiveStep[] = (chain as any)?.steps ?? [];
+      // 실제 작업이 있는 체인만 포함 (done/running/failed 중 하나라도 있어야 함)
+      const hasRealWork = steps.some(
+        (step) => step.status === 'running' || step.status === 'pending' || step.status === 'done' || step.status === 'failed',
+      );
+      if (!hasRealWork) continue;
+      const isLive = steps.some((step) => step.status === 'running' || step.status === 'pending');
+      next[terminalId] = {
+        request: (chain as any)?.request ?? '',
+        steps,
+        terminal_id: Number.parseInt(terminalId, 10) || undefined,
+        isLive,
+        updatedAt: (chain as any)?.updated_at ?? undefined,
+      };
+    }
+    setLiveChains(next);
+    setHasApiSignal(true);
+  }, [skillChain]);
+
+  const pushedTerminals = useDashboardState<Record<string, TerminalStatus>>('terminals');
   useEffect(() => {
-    const load = () => {
-      fetch(`${API_BASE}/api/agent/terminals`)
-        .then((response) => response.json())
-        .then((data) => {
-          if (data && typeof data === 'object') {
-            setTerminals(data);
-            setHasApiSignal(true);
-          }
-        })
-        .catch(() => setFetchFailures((prev) => prev + 1));
-    };
-
-    load();
-    const timer = setInterval(load, 3000);
-    return () => clearInterval(timer);
-  }, []);
+    if (pushedTerminals && typeof pushedTerminals === 'object') {
+      setTerminals(pushedTerminals);
+      setHasApiSignal(true);
+    }
+  }, [pushedTerminals]);
 
   useEffect(() => {
     const load = () => {
@@ -0,0 +1,146 @@
+/**
+ * ------------------------------------------------------------------------
+ * 📄 파일명: dashboardState.ts
+ * 📝 설명: 대시보드 상태 채널(/api/events/state) 공유 구독 + useDashboardState 훅.
+ *          패널마다 /api/agent/terminals · /api/orchestrator/status · skill-chain ·
+ *          tasks/kanban · hive/activity 를 setInterval로 폴링하던 것을 대체합니다.
+ *          - 탭 전체에서 EventSource 1개 공유 (첫 구독 시 연결, 마지막 구독 해제 5초 후 종료)
+ *          - 연결 시 전체 스냅샷, 이후 JSON Patch(add/remove/replace)만 수신 — 구조 공유로
+ *            바뀐 키의 객체만 새 참조가 되어 해당 키를 쓰는 컴포넌트만 리렌더
+ *          - patch version이 이어지지 않으면 Last-Event-ID 없이 재연결해 스냅샷부터 다시 받음
+ * REVISION HISTORY:
+ * - 2026-10-17: 최초 작성 — 대시보드 폴링 → 델타 푸시 채널
+ * ------------------------------------------------------------------------
+ */
+
+import { useSyncExternalStore } from 'react';
+import { API_BASE } from './constants';
+
+// 상태 키 — 서버 server.py _STATE_SOURCES와 동일 (값은 각 GET 라우트 응답과 같은 형태)
+export type DashboardStateKey = 'terminals' | 'orchestrator' | 'skill_chain' | 'kanban' | 'hive_activity';
+
+type PatchOp =
+  | { op: 'add' | 'replace'; path: string; value: unknown }
+  | { op: 'remove'; path: string };
+
+type StateMessage =
+  | { type: 'snapshot'; version: number; state: Record<string, unknown> }
+  | { type: 'patch'; version: number; ops: PatchOp[] };
+
+const RECONNECT_MS = 2000;
+const IDLE_CLOSE_MS = 5000;
+
+let state: Record<string, unknown> = {};
+let version = -1;            // 스냅샷 수신 전 -1 — 이 상태의 patch는 무시
+let source: EventSource | null = null;
+let lastEventId = '';
+let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+let idleTimer: ReturnType<typeof setTimeout> | null = null;
+const listeners = new Set<() => void>();
+
+// ─── JSON Patch 적용 (구조 공유 — 경로상의 객체만 복사) ───────────────────
+const unescapeToken = (token: string) => token.replace(/~1/g, '/').replace(/~0/g, '~');
+
+function applyOp(node: unknown, tokens: string[], op: PatchOp): unknown {
+  if (tokens.length === 0) return op.op === 'remove' ? undefined : op.value;
+  const [head, ...rest] = tokens;
+  if (Array.isArray(node)) {
+    const next = node.slice();
+    if (rest.length > 0) {
+      next[Number(head)] = applyOp(next[Number(head)], rest, op);
+    } else if (op.op === 'add') {
+      next.splice(head === '-' ? next.length : Number(head), 0, op.value);
+    } else if (op.op === 'remove') {
+      next.splice(Number(head), 1);
+    } else {
+      next[Number(head)] = op.value;
+    }
+    return next;
+  }
+  const next: Record<string, unknown> = { ...(node as Record<string, unknown> ?? {}) };
+  if (rest.length > 0) {
+    next[head] = applyOp(next[head], rest, op);
+  } else if (op.op === 'remove') {
+    delete next[head];
+  } else {
+    next[head] = op.value;
+  }
+  return next;
+}
+
+export function applyPatch<T>(doc: T, ops: PatchOp[]): T {
+  let result: unknown = doc;
+  for (const op of ops) {
+    result = applyOp(result, op.path.split('/').slice(1).map(unescapeToken), op);
+  }
+  return result as T;
+}
+
+// ─── 공유 EventSource ───────────────────────────────────────────────────
+const notify = () => listeners.forEach(fn => fn());
+
+function connect(resume: boolean) {
+  if (reconnectTimer) { clearTimeout(reconnectTimer); reconnectTimer = null; }
+  source?.close();
+  const query = resume && lastEventId ? `?last_event_id=${encodeURIComponent(lastEventId)}` : '';
+  if (!resume) version = -1;
+  const es = new EventSource(`${API_BASE}/api/events/state${query}`);
+  source = es;
+  es.onmessage = (e) => {
+    if (e.lastEventId) lastEventId = e.lastEventId;
+    let msg: StateMessage;
+    try { msg = JSON.parse(e.data); } catch { return; }
+    if (msg.type === 'snapshot') {
+      state = msg.state ?? {};
+      version = msg.version;
+      notify();
+      return;
+    }
+    if (version < 0 || msg.version <= version) return;   // 스냅샷 이전/중복 patch
+    if (msg.version !== version + 1) {
+      // 중간 patch 유실 (링 초과 등) — 스냅샷부터 다시
+      connect(false);
+      return;
+    }
+    state = applyPatch(state, msg.ops);
+    version = msg.version;
+    notify();
+  };
+  // 재연결 위치는 patch의 id로만 갱신 — patch 없이 끊기면 다음 연결에서 스냅샷을 다시 받음
+  es.onerror = () => {
+    if (source !== es) return;
+    es.close();
+    source = null;
+    if (listeners.size > 0 && !reconnectTimer) {
+      reconnectTimer = setTimeout(() => { reconnectTimer = null; connect(true); }, RECONNECT_MS);
+    }
+  };
+}
+
+function subscribe(listener: () => void) {
+  listeners.add(listener);
+  if (idleTimer) { clearTimeout(idleTimer); idleTimer = null; }
+  if (!source && !reconnectTimer) connect(true);
+  return () => {
+    listeners.delete(listener);
+    if (listeners.size === 0 && !idleTimer) {
+      // 탭 전환 등으로 잠깐 0이 되는 경우 재연결 비용을 피하려고 지연 종료
+      idleTimer = setTimeout(() => {
+        idleTimer = null;
+        if (listeners.size > 0) return;
+        if (reconnectTimer) { clearTimeout(reconnectTimer); reconnectTimer = null; }
+        source?.close();
+        source = null;
+      }, IDLE_CLOSE_MS);
+    }
+  };
+}
+
+/**
+ * 상태 채널의 key 값 — 스냅샷 수신 전에는 undefined.
+ * 값이 바뀔 때만 새 참조가 되므로 useEffect 의존성으로 그대로 사용할 수 있습니다.
+ */
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+export function useDashboardState<T = any>(key: DashboardStateKey): T | undefined {
+  return useSyncExternalStore(subscribe, () => state[key] as T | undefined);
+}
@@ -0,0 +1,162 @@
+"""
+FILE: scripts/bench_http_connections.py
+DESCRIPTION: HTTP 서버 연결 확장성 벤치마크 — ThreadingMixIn(스레드 모드) vs src.async_http(asyncio 모드).
+             SSE 연결을 N개(기본 50/200/800) 열어둔 상태에서
+               - 프로세스 스레드 증가 수
+               - 일반 GET 요청 지연 p50/p95 (ms)
+               - 모든 SSE 클라이언트에 브로드캐스트 1회가 도달하는 시간 (ms)
+             을 측정합니다. 스레드 수는 서버 시작 전 대비 증가분입니다 (스레드 모드의 SSE 스레드는
+             종료 후에도 sleep 중이라 남으므로 asyncio 모드를 먼저 측정).
+             server.py 대신 같은 패턴(하트비트 sleep 루프 / async generator)의 최소 핸들러를
+             사용하므로 PostgreSQL 없이 실행됩니다.
+
+             사용법:
+               python scripts/bench_http_connections.py
+               python scripts/bench_http_connections.py -c 100 400 1600 -r 200
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — asyncio HTTP/SSE 모드 도입
+"""
+
+import argparse
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MONITOR_DIR = ROOT_DIR / '.ai_monitor'
+if str(MONITOR_DIR) not in sys.path:
+    sys.path.insert(0, str(MONITOR_DIR))
+
+from src.async_http import AsyncHTTPServer  # noqa: E402
+
+CLIENTS: set = set()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """server.py SSEHandler와 같은 모양 — /events는 연결당 하트비트 루프, 나머지는 짧은 JSON."""
+
+    def do_GET(self):
+        if self.path == '/events':
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.end_headers()
+            CLIENTS.add(self)
+            try:
+                while True:
+                    time.sleep(30)
+                    self.wfile.write(b": heartbeat\n\n")
+                    self.wfile.flush()
+            except Exception:
+                pass
+            finally:
+                CLIENTS.discard(self)
+            return
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ThreadedServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 1024
+
+
+async def _events(client, target):
+    CLIENTS.add(client)
+    try:
+        async for frame in client.frames(heartbeat=30.0):
+            yield frame
+    finally:
+        CLIENTS.discard(client)
+
+
+def _start(mode: str):
+    if mode == 'asyncio':
+        server = AsyncHTTPServer(('127.0.0.1', 0), _Handler, streams={'/events': _events}, max_workers=16)
+    else:
+        server = _ThreadedServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _open_streams(address, count: int) -> list[socket.socket]:
+    socks = []
+    for _ in range(count):
+        sock = socket.create_connection(address)
+        sock.sendall(b"GET /events HTTP/1.1\r\nHost: bench\r\n\r\n")
+        socks.append(sock)
+    deadline = time.monotonic() + 30
+    while len(CLIENTS) < count and time.monotonic() < deadline:
+        time.sleep(0.05)
+    for sock in socks:
+        sock.settimeout(10)
+        sock.recv(4096)   # 응답 헤더
+    return socks
+
+
+def _get_latency_ms(address, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with socket.create_connection(address) as sock:
+            sock.sendall(b"GET /ping HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n\r\n")
+            while sock.recv(4096):
+                pass
+        samples.append((time.perf_counter() - started) * 1000)
+    return sorted(samples)
+
+
+def _broadcast_ms(socks: list[socket.socket]) -> float:
+    frame = b"data: {\"bench\": 1}\n\n"
+    started = time.perf_counter()
+    for client in list(CLIENTS):
+        try:
+            client.wfile.write(frame)
+            client.wfile.flush()
+        except Exception:
+            pass
+    for sock in socks:
+        sock.recv(4096)
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='스레드 vs asyncio HTTP 서버 SSE 연결 확장성')
+    parser.add_argument('-c', '--connections', type=int, nargs='+', default=[50, 200, 800])
+    parser.add_argument('-r', '--repeat', type=int, default=100, help='연결 수별 GET 지연 측정 횟수')
+    args = parser.parse_args()
+
+    print(f"{'mode':<9} {'sse':>5} {'+threads':>8} {'GET p50':>8} {'GET p95':>8} {'bcast ms':>9}")
+    for mode in ('asyncio', 'threaded'):
+        for count in args.connections:
+            CLIENTS.clear()
+            baseline = threading.active_count()
+            server = _start(mode)
+            socks = _open_streams(server.server_address, count)
+            threads = threading.active_count() - baseline
+            latency = _get_latency_ms(server.server_address, args.repeat)
+            bcast = _broadcast_ms(socks)
+            p50 = latency[len(latency) // 2]
+            p95 = latency[int(len(latency) * 0.95) - 1]
+            print(f"{mode:<9} {count:>5} {threads:>8} {p50:>8.2f} {p95:>8.2f} {bcast:>9.1f}")
+            for sock in socks:
+                sock.close()
+            server.shutdown()
+            server.server_close()
+            time.sleep(0.5)
+
+
+if __name__ == '__main__':
+    main()
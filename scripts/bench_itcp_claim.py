@@ -0,0 +1,110 @@
+"""
+FILE: scripts/bench_itcp_claim.py
+DESCRIPTION: ITCP receive() 동시 수신 처리량 / 중복 전달 검증 벤치마크.
+             전용 수신자(bench_<pid>)에게 N개 메시지를 넣고 K개 스레드가 동시에 receive()를 반복하여
+             - 모든 메시지가 정확히 한 번씩 전달되는지 (중복/누락 0)
+             - 초당 처리 메시지 수
+             를 측정합니다. 이어서 브로드캐스트 M개를 K명의 서로 다른 소비자가 각각 M개씩 받는지 확인합니다.
+
+             사용법:
+               python scripts/bench_itcp_claim.py               # 메시지 500개, 수신자 8개
+               python scripts/bench_itcp_claim.py -n 2000 -c 16
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — itcp_claim() (UPDATE … SKIP LOCKED RETURNING) 도입 검증용
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import itcp
+
+
+def _drain(consumer: str) -> list[str]:
+    ids = []
+    while True:
+        batch = itcp.receive(consumer)
+        if not batch:
+            return ids
+        ids.extend(m["id"] for m in batch if m["to_agent"] == consumer)
+
+
+def _bench_direct(target: str, count: int, consumers: int) -> bool:
+    itcp._run_psql(
+        f"INSERT INTO pg_messages (from_agent, to_agent, msg_type, content, channel) "
+        f"SELECT 'bench', '{target}', 'info', 'msg ' || g, 'general' FROM generate_series(1, {count}) g;",
+        timeout=30,
+    )
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=consumers) as executor:
+        results = list(executor.map(lambda _: _drain(target), range(consumers)))
+    elapsed = time.perf_counter() - started
+    counts = Counter(i for ids in results for i in ids)
+    duplicated = sum(1 for n in counts.values() if n > 1)
+    missing = count - len(counts)
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"direct     {count:>6} msgs  {consumers:>3} receivers  {elapsed:8.2f}s  "
+          f"{rate:10.1f} msg/s  duplicated={duplicated} missing={missing}")
+    return duplicated == 0 and missing == 0
+
+
+def _bench_broadcast(prefix: str, count: int, consumers: int) -> bool:
+    names = [f"{prefix}_r{i}" for i in range(consumers)]
+    for name in names:                       # 커서를 현재 위치로 초기화
+        itcp._run_psql(
+            f"INSERT INTO pg_message_cursors (consumer, last_id) "
+            f"SELECT '{name}', COALESCE(MAX(id), 0) FROM pg_messages "
+            f"ON CONFLICT (consumer) DO UPDATE SET last_id = EXCLUDED.last_id;"
+        )
+    itcp._run_psql(
+        f"INSERT INTO pg_messages (from_agent, to_agent, msg_type, content, channel) "
+        f"SELECT '{prefix}', 'all', 'broadcast', 'bc ' || g, 'broadcast' FROM generate_series(1, {count}) g;",
+        timeout=30,
+    )
+
+    def _drain_broadcast(name: str) -> int:
+        got = 0
+        while True:
+            batch = itcp.receive(name)
+            if not batch:
+                return got
+            got += sum(1 for m in batch if m["from_agent"] == prefix)
+
+    with ThreadPoolExecutor(max_workers=consumers) as executor:
+        received = list(executor.map(_drain_broadcast, names))
+    ok = all(n == count for n in received)
+    print(f"broadcast  {count:>6} msgs  {consumers:>3} consumers  per-consumer={received}  "
+          f"{'OK' if ok else 'MISMATCH'}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='ITCP 동시 수신 처리량 / 정확히 한 번 전달 검증')
+    parser.add_argument('-n', '--count', type=int, default=500)
+    parser.add_argument('-c', '--consumers', type=int, default=8)
+    parser.add_argument('-b', '--broadcasts', type=int, default=50)
+    args = parser.parse_args()
+
+    if not itcp._ensure_pg_running() or not itcp.ensure_schema():
+        print('PostgreSQL에 연결할 수 없습니다 (port 5433).')
+        sys.exit(1)
+
+    prefix = f"bench_{os.getpid()}"
+    try:
+        ok = _bench_direct(prefix, args.count, args.consumers)
+        ok = _bench_broadcast(prefix, args.broadcasts, args.consumers) and ok
+    finally:
+        itcp._run_psql(
+            f"DELETE FROM pg_messages WHERE to_agent = '{prefix}' OR from_agent = '{prefix}';"
+            f"DELETE FROM pg_message_cursors WHERE consumer LIKE '{prefix}%';",
+            timeout=30,
+        )
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
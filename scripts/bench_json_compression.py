@@ -0,0 +1,94 @@
+"""
+FILE: scripts/bench_json_compression.py
+DESCRIPTION: 대용량 JSON API 응답 압축 효과 벤치마크 — src.http_response.send_json.
+             /api/hive/logs(세션 200건), /api/tasks, /api/agent/live-runs, /api/hive/knowledge-graph와
+             비슷한 모양의 합성 페이로드로 원본 대비 전송 바이트와 응답 1건당 직렬화+압축 시간(ms)을
+             측정합니다. 폴링 주기(-i, 기본 3초) 기준 클라이언트 1개의 시간당 전송량도 함께 표시합니다.
+
+             사용법:
+               python scripts/bench_json_compression.py
+               python scripts/bench_json_compression.py -r 500 -i 5
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — JSON 응답 협상 압축 도입
+"""
+
+import argparse
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MONITOR_DIR = ROOT_DIR / '.ai_monitor'
+if str(MONITOR_DIR) not in sys.path:
+    sys.path.insert(0, str(MONITOR_DIR))
+
+from src.http_response import send_json  # noqa: E402
+
+
+class _Handler:
+    def __init__(self, accept_encoding: str | None):
+        self.headers = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+        self.wfile = io.BytesIO()
+
+    def send_response(self, code):
+        pass
+
+    def send_header(self, name, value):
+        pass
+
+    def end_headers(self):
+        pass
+
+
+def _payloads() -> dict:
+    rng = random.Random(3)
+    agents = ['claude', 'gemini', 'codex', 'Hive']
+    words = ['하이브', '메모리', '스킬', 'orchestrate', 'pg_logs', 'refactor', '테스트', 'server.py', 'kanban']
+    text = lambda n: ' '.join(rng.choice(words) for _ in range(n))  # noqa: E731
+    return {
+        '/api/hive/logs': [
+            {'id': i, 'agent': rng.choice(agents), 'terminal_id': f"T{rng.randint(1, 8)}",
+             'project': 'vibe', 'status': 'success', 'trigger': text(30),
+             'ts_start': '2026-10-17T09:00:00', 'ts_end': '2026-10-17T09:00:05'} for i in range(200)],
+        '/api/tasks': [
+            {'id': str(1760000000000 + i), 'title': text(6), 'description': text(40), 'status': 'pending',
+             'assigned_to': rng.choice(agents), 'priority': 'medium', 'tags': ['ui', 'api'],
+             'kanban_status': 'todo'} for i in range(150)],
+        '/api/agent/live-runs': [
+            {'run_id': f"run-{i}", 'terminal_id': f"T{i % 8 + 1}", 'cli': rng.choice(agents),
+             'status': 'running', 'last_line': text(20), 'lines': [text(12) for _ in range(10)]} for i in range(40)],
+        '/api/hive/knowledge-graph': {
+            'nodes': [{'id': i, 'label': text(5), 'agent': rng.choice(agents), 'skill': text(2)} for i in range(500)],
+            'links': [{'source': i, 'target': rng.randint(0, 499)} for i in range(700)],
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='JSON 응답 gzip 협상 효과')
+    parser.add_argument('-r', '--repeat', type=int, default=200, help='엔드포인트별 반복 횟수')
+    parser.add_argument('-i', '--interval', type=float, default=3.0, help='UI 폴링 주기(초)')
+    args = parser.parse_args()
+
+    per_hour = 3600 / args.interval
+    print(f"{'endpoint':<28} {'raw KB':>8} {'gzip KB':>8} {'ratio':>6} {'raw ms':>7} {'gzip ms':>8} {'MB/h raw→gzip':>16}")
+    for endpoint, payload in _payloads().items():
+        sizes, timings = {}, {}
+        for accept in (None, 'gzip, deflate, br'):
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                handler = _Handler(accept)
+                send_json(handler, payload)
+            timings[accept] = (time.perf_counter() - started) * 1000 / args.repeat
+            sizes[accept] = len(handler.wfile.getvalue())
+        raw, gz = sizes[None], sizes['gzip, deflate, br']
+        print(f"{endpoint:<28} {raw / 1024:>8.1f} {gz / 1024:>8.1f} {gz / raw:>6.2f} "
+              f"{timings[None]:>7.2f} {timings['gzip, deflate, br']:>8.2f} "
+              f"{raw * per_hour / 1e6:>7.1f}→{gz * per_hour / 1e6:<7.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+FILE: scripts/bench_jsonl_tail.py
+DESCRIPTION: JSONL 역방향 tail 리더(src.jsonl_tail) 벤치마크 — 전체 읽기(read_text().splitlines()) 대비 지연.
+             임시 디렉터리에 task_logs.jsonl 형태의 로그(기본 500 MB)를 만들고, 기존 라우트들이 하던
+             "전체 읽기 후 끝 N개" 방식과 tail_records()로 최근 N개(필터 유무)를 가져오는 시간을 비교합니다.
+             tail 쪽은 로그 크기와 무관하게 거의 일정해야 합니다.
+
+             사용법:
+               python scripts/bench_jsonl_tail.py                    # 500 MB, N = 1 / 20 / 100 / 500
+               python scripts/bench_jsonl_tail.py --size-mb 50 -n 20 100 --repeat 5
+               python scripts/bench_jsonl_tail.py --path .ai_monitor/data/task_logs.jsonl   # 실제 로그로 측정
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — JSONL 역방향 tail 리더 도입
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MONITOR_DIR = ROOT_DIR / '.ai_monitor'
+if str(MONITOR_DIR) not in sys.path:
+    sys.path.insert(0, str(MONITOR_DIR))
+
+from src.jsonl_tail import tail_records
+
+_AGENTS = ['Claude', 'Gemini', 'Hive', '사용자', 'Codex']
+
+
+def _generate(path: Path, size_mb: int) -> int:
+    """task_logs.jsonl과 비슷한 레코드로 size_mb MB 파일 생성. 줄 수 반환."""
+    target = size_mb * 1024 * 1024
+    written = lines = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        batch = []
+        while written < target:
+            record = {
+                'timestamp': f'2026-10-17T12:{lines // 60 % 60:02d}:{lines % 60:02d}',
+                'agent': _AGENTS[lines % len(_AGENTS)],
+                'terminal_id': f'T{lines % 8 + 1}',
+                'task': f'하이브 컨텍스트 자동 로드 — 작업 {lines} ' + 'x' * (lines % 120),
+            }
+            line = json.dumps(record, ensure_ascii=False) + '\n'
+            batch.append(line)
+            written += len(line.encode('utf-8'))
+            lines += 1
+            if len(batch) >= 10000:
+                f.write(''.join(batch))
+                batch.clear()
+        f.write(''.join(batch))
+    return lines
+
+
+def _full_read(path: Path, n: int, predicate=None) -> list:
+    """기존 방식 — 파일 전체를 읽고 끝에서부터 N개."""
+    rows = []
+    for line in reversed(path.read_text(encoding='utf-8').splitlines()):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if predicate is None or predicate(record):
+            rows.append(record)
+            if len(rows) >= n:
+                break
+    return rows
+
+
+def _time_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='JSONL 역방향 tail 벤치마크')
+    parser.add_argument('--size-mb', type=int, default=500, help='생성할 로그 크기 (MB, 기본 500)')
+    parser.add_argument('--path', type=Path, default=None, help='생성 대신 기존 JSONL 파일로 측정')
+    parser.add_argument('-n', type=int, nargs='+', default=[1, 20, 100, 500], help='가져올 최근 레코드 수')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수 (중앙값 출력)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.path
+        if path is None:
+            path = Path(tmp) / 'task_logs.jsonl'
+            start = time.perf_counter()
+            lines = _generate(path, args.size_mb)
+            print(f'생성: {lines:,}줄 / {path.stat().st_size / 1e6:,.0f} MB ({time.perf_counter() - start:.1f}s)')
+        else:
+            print(f'대상: {path} ({path.stat().st_size / 1e6:,.1f} MB)')
+
+        gemini = lambda r: r.get('agent') == 'Gemini'   # /api/task-logs?agent=gemini 에 해당
+        print(f'{"N":>6} {"필터":>6} {"전체 읽기(ms)":>14} {"tail(ms)":>10} {"배속":>8}')
+        for n in args.n:
+            for label, predicate in (('-', None), ('agent', gemini)):
+                full = _time_ms(lambda: _full_read(path, n, predicate), args.repeat)
+                tail = _time_ms(lambda: tail_records(path, n, predicate), args.repeat)
+                assert _full_read(path, n, predicate) == tail_records(path, n, predicate)
+                print(f'{n:>6} {label:>6} {full:>14,.1f} {tail:>10,.2f} {full / tail:>7,.0f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+FILE: scripts/bench_keepalive.py
+DESCRIPTION: HTTP/1.1 keep-alive 효과 벤치마크 — urllib(요청마다 새 TCP 연결) vs src.http_client 연결 풀.
+             KeepAliveMixin 핸들러를 로컬 ThreadingHTTPServer로 띄우고 orchestrator / task.py가
+             보내는 것과 비슷한 작은 JSON GET·POST를 반복해 요청 1건당 지연(ms)과 새 연결 수를 비교합니다.
+
+             사용법:
+               python scripts/bench_keepalive.py
+               python scripts/bench_keepalive.py -n 2000
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — HTTP/1.1 keep-alive 도입
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MONITOR_DIR = ROOT_DIR / '.ai_monitor'
+if str(MONITOR_DIR) not in sys.path:
+    sys.path.insert(0, str(MONITOR_DIR))
+
+from src.http_client import HTTPPool  # noqa: E402
+from src.http_response import KeepAliveMixin, send_json  # noqa: E402
+
+_STATUS = {'agents': {'claude': 'active', 'gemini': 'idle'}, 'pending_tasks': 3, 'warnings': []}
+
+
+class _Handler(KeepAliveMixin, BaseHTTPRequestHandler):
+    connections = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_GET(self):
+        with self.buffered_body():
+            send_json(self, _STATUS)
+
+    def do_POST(self):
+        with self.buffered_body():
+            length = int(self.headers.get('Content-Length') or 0)
+            send_json(self, {'status': 'success', 'echo': json.loads(self.rfile.read(length))})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _urllib_round(base: str) -> None:
+    with urllib.request.urlopen(f'{base}/api/orchestrator/status', timeout=3) as r:
+        json.loads(r.read())
+    req = urllib.request.Request(f'{base}/api/tasks', data=b'{"id": "1"}',
+                                 headers={'Content-Type': 'application/json'}, method='POST')
+    with urllib.request.urlopen(req, timeout=3) as r:
+        json.loads(r.read())
+
+
+def _pool_round(pool: HTTPPool, base: str) -> None:
+    pool.request('GET', f'{base}/api/orchestrator/status').json()
+    pool.request('POST', f'{base}/api/tasks', body=b'{"id": "1"}',
+                 headers={'Content-Type': 'application/json'}).json()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='keep-alive 연결 재사용 효과')
+    parser.add_argument('-n', '--rounds', type=int, default=500, help='GET+POST 왕복 횟수')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    pool = HTTPPool()
+    cases = {'urllib (연결마다 새로)': lambda: _urllib_round(base),
+             'http_client 풀': lambda: _pool_round(pool, base)}
+
+    print(f"{'client':<24} {'ms/req':>8} {'req/s':>9} {'TCP 연결':>9}")
+    try:
+        for name, run in cases.items():
+            _Handler.connections = 0
+            started = time.perf_counter()
+            for _ in range(args.rounds):
+                run()
+            elapsed = time.perf_counter() - started
+            requests = args.rounds * 2
+            print(f"{name:<24} {elapsed * 1000 / requests:>8.3f} {requests / elapsed:>9.0f} {_Handler.connections:>9}")
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
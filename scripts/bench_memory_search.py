@@ -0,0 +1,109 @@
+"""
+FILE: scripts/bench_memory_search.py
+DESCRIPTION: hive_memory 검색 벤치마크 — 기존 LIKE '%q%' 4중 OR 스캔 vs 전문 검색(search_tsv) + 트라이그램.
+             전용 project(bench_<pid>)로 합성 메모리 행(기본 100,000개, 한/영 혼합)을 넣고
+             동일 검색어 목록에 대해 평균 지연(ms)을 비교한 뒤 행을 삭제합니다.
+
+             사용법:
+               python scripts/bench_memory_search.py               # 100k 행, 검색어당 20회
+               python scripts/bench_memory_search.py -n 200000 -r 50
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — list_memory(q) 전문 검색 전환 전후 비교용
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MONITOR_DIR = ROOT_DIR / '.ai_monitor'
+if str(MONITOR_DIR) not in sys.path:
+    sys.path.insert(0, str(MONITOR_DIR))
+
+from src import pg_store
+
+QUERIES = ['서버', '데이터베이스 연결', 'websocket', 'pty 세션', '캐시', 'xyz_not_found']
+
+# 합성 본문 어휘 — 한국어 어절(조사 포함)과 영문 식별자를 섞어 실제 메모리 분포를 흉내냄
+_WORDS = [
+    '서버가', '서버를', '데이터베이스', '연결이', '끊김', '캐시를', '무효화', 'pty', '세션', '터미널',
+    'websocket', 'postgres', 'index', 'query', '배포', '빌드', '오류', '수정', 'hive', 'agent',
+]
+
+
+def _seed(project: str, count: int) -> None:
+    words = ', '.join(pg_store._sql_text(w) for w in _WORDS)
+    pg_store.execute_raw(
+        f"""
+        INSERT INTO hive_memory (key, title, content, tags, author, project, created_at, updated_at)
+        SELECT '{project}_' || g,
+               (ARRAY[{words}])[1 + g % 20] || ' ' || (ARRAY[{words}])[1 + (g / 20) % 20],
+               (SELECT string_agg((ARRAY[{words}])[1 + ((g * 7 + i * 13) % 20)], ' ')
+                  FROM generate_series(1, 40) i),
+               jsonb_build_array((ARRAY[{words}])[1 + g % 20]),
+               'bench', '{project}',
+               to_char(now() - (g || ' seconds')::interval, 'YYYY-MM-DD"T"HH24:MI:SS'),
+               to_char(now() - (g || ' seconds')::interval, 'YYYY-MM-DD"T"HH24:MI:SS')
+        FROM generate_series(1, {count}) g;
+        ANALYZE hive_memory;
+        """,
+        timeout=600,
+    )
+
+
+def _legacy_sql(q: str, project: str) -> str:
+    q_sql = pg_store._sql_text(q)
+    return f"""
+    SELECT key, title, content, author, project, created_at, updated_at, tags::text AS tags
+    FROM hive_memory
+    WHERE project = {pg_store._sql_text(project)} AND (
+        LOWER(key) LIKE LOWER('%' || {q_sql} || '%')
+        OR LOWER(title) LIKE LOWER('%' || {q_sql} || '%')
+        OR LOWER(content) LIKE LOWER('%' || {q_sql} || '%')
+        OR tags::text LIKE '%' || {q_sql} || '%'
+    )
+    ORDER BY updated_at DESC LIMIT 20;
+    """
+
+
+def _time_ms(fn, repeat: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='hive_memory LIKE vs 전문 검색 지연 비교')
+    parser.add_argument('-n', '--rows', type=int, default=100_000)
+    parser.add_argument('-r', '--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    if not pg_store.ensure_schema():
+        print('PostgreSQL에 연결할 수 없습니다 (port 5433).')
+        sys.exit(1)
+
+    project = f"bench_{os.getpid()}"
+    print(f"시드: {args.rows:,}행 (project={project}) ...")
+    started = time.perf_counter()
+    _seed(project, args.rows)
+    print(f"시드 완료 {time.perf_counter() - started:.1f}s\n")
+    print(f"{'query':<20} {'LIKE ms':>10} {'FTS ms':>10} {'speedup':>8} {'hits':>5}")
+    try:
+        for q in QUERIES:
+            legacy = _time_ms(lambda: pg_store.query_rows(_legacy_sql(q, project)), args.repeat)
+            hits = len(pg_store.list_memory(q=q, project=project))
+            fts = _time_ms(lambda: pg_store.list_memory(q=q, project=project), args.repeat)
+            speedup = legacy / fts if fts else 0.0
+            print(f"{q:<20} {legacy:>10.2f} {fts:>10.2f} {speedup:>7.1f}x {hits:>5}")
+    finally:
+        pg_store.execute_raw(f"DELETE FROM hive_memory WHERE project = '{project}';", timeout=600)
+        pg_store.close_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+FILE: scripts/bench_pg_store.py
+DESCRIPTION: pg_store 쿼리 처리량 벤치마크 — psql.exe 서브프로세스 vs psycopg2 커넥션 풀.
+             로컬 PostgreSQL(5433)에 대해 동일한 SELECT를 반복 실행하여 queries/sec를 비교합니다.
+
+             사용법:
+               python scripts/bench_pg_store.py               # 기본 200회, 스레드 4개
+               python scripts/bench_pg_store.py -n 1000 -t 8
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 커넥션 풀 도입 전후 비교용
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MONITOR_DIR = ROOT_DIR / '.ai_monitor'
+if str(MONITOR_DIR) not in sys.path:
+    sys.path.insert(0, str(MONITOR_DIR))
+
+from src import pg_store
+
+SQL = "SELECT key, title, updated_at FROM hive_memory ORDER BY updated_at DESC LIMIT 20;"
+
+
+def _psql_once() -> bool:
+    ok, _ = pg_store._run_psql(SQL, csv_output=True)
+    return ok
+
+
+def _pool_once() -> bool:
+    ok, _ = pg_store._pool_run(SQL, fetch=True)
+    return ok
+
+
+def _measure(label: str, fn, count: int, threads: int) -> float:
+    fn()  # 워밍업 (풀 연결 생성 / psql 캐시)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(lambda _: fn(), range(count)))
+    elapsed = time.perf_counter() - started
+    failed = results.count(False)
+    qps = count / elapsed if elapsed > 0 else 0.0
+    print(f"{label:<10} {count:>6} queries  {elapsed:8.2f}s  {qps:10.1f} q/s  failed={failed}")
+    return qps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='pg_store psql vs pool 처리량 비교')
+    parser.add_argument('-n', '--count', type=int, default=200)
+    parser.add_argument('-t', '--threads', type=int, default=4)
+    args = parser.parse_args()
+
+    if not pg_store.ensure_schema():
+        print('PostgreSQL에 연결할 수 없습니다 (port 5433).')
+        sys.exit(1)
+
+    pg_store.configure_pool(args.threads)
+    before = after = 0.0
+    if pg_store.PG_BIN.exists():
+        before = _measure('psql', _psql_once, args.count, args.threads)
+    else:
+        print(f"psql      건너뜀 — {pg_store.PG_BIN} 없음")
+    if pg_store.psycopg2 is not None:
+        after = _measure('pool', _pool_once, args.count, args.threads)
+    else:
+        print('pool      건너뜀 — psycopg2 미설치')
+    if before and after:
+        print(f"speedup   x{after / before:.1f}")
+    pg_store.close_pool()
+
+
+if __name__ == '__main__':
+    main()
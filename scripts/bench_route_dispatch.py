@@ -0,0 +1,99 @@
+"""
+FILE: scripts/bench_route_dispatch.py
+DESCRIPTION: SSEHandler 라우팅 비용 마이크로벤치마크 — 요청 1건당 디스패치 시간(µs).
+             server.py를 import하여 실제 ROUTER 테이블(api/* 모듈 + 인라인 라우트)을 얻고,
+             같은 경로 목록을 등록 순서대로 훑는 이전 방식(GET마다 본문 읽기 + json.loads 후
+             if/elif 선형 비교)과 ROUTER.resolve()(exact dict → prefix) 비용을 비교합니다.
+             핸들러 본문은 실행하지 않으며 라우트 탐색 비용만 측정합니다.
+
+             사용법:
+               python scripts/bench_route_dispatch.py            # 경로당 200,000회
+               python scripts/bench_route_dispatch.py -r 1000000
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 테이블 기반 라우팅 도입 전후 비교용
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MONITOR_DIR = ROOT_DIR / '.ai_monitor'
+if str(MONITOR_DIR) not in sys.path:
+    sys.path.insert(0, str(MONITOR_DIR))
+
+import server  # noqa: E402 — 라우트 등록을 위해 import (인라인 라우트 포함)
+from api.router import ROUTER, Request  # noqa: E402
+
+# 체인 앞/뒤, prefix, 미등록(정적 파일) 경로를 섞은 요청 표본
+SAMPLE_PATHS = [
+    '/api/events/thoughts', '/api/heartbeat', '/api/agent/terminals', '/api/orchestrator/status',
+    '/api/memory/db-info', '/api/pty/output', '/api/kanban/pg-activity', '/assets/index-abc123.js',
+]
+
+
+class _FakeHandler:
+    def __init__(self, path: str):
+        self.path = path + '?since=0'
+        self.headers = {'Content-Length': '0'}
+        self.rfile = io.BytesIO(b'')
+
+
+def _legacy_table() -> list[tuple[str, bool]]:
+    """이전 if/elif 체인 근사 — 등록된 경로를 소스(server 먼저) 순서로 선형 비교."""
+    rows = [r for r in ROUTER.table() if r['method'] == 'GET']
+    rows.sort(key=lambda r: r['source'] != 'server')
+    return [(r['path'].rstrip('*'), r['path'].endswith('*')) for r in rows]
+
+
+def _legacy_dispatch(handler: _FakeHandler, table: list[tuple[str, bool]]):
+    parsed = urlparse(handler.path)
+    path = parsed.path
+    content_length = int(handler.headers.get('Content-Length', 0))
+    post_data = handler.rfile.read(content_length).decode('utf-8') if content_length > 0 else '{}'
+    json.loads(post_data)
+    for candidate, prefix in table:
+        if (path.startswith(candidate) if prefix else path == candidate):
+            return candidate
+    return None
+
+
+def _registry_dispatch(handler: _FakeHandler):
+    req = Request(handler, 'GET', ROUTER.deps)
+    return ROUTER.resolve('GET', req.path)
+
+
+def _time_us(fn, handler, repeat: int, *args) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(handler, *args)
+    return (time.perf_counter() - started) * 1e6 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='if/elif 체인 vs 라우팅 테이블 디스패치 비용')
+    parser.add_argument('-r', '--repeat', type=int, default=200_000, help='경로당 반복 횟수')
+    args = parser.parse_args()
+
+    table = _legacy_table()
+    print(f"GET 라우트 {len(table)}개\n")
+    print(f"{'path':<28} {'chain µs':>9} {'table µs':>9} {'speedup':>8}")
+    total_chain = total_table = 0.0
+    for path in SAMPLE_PATHS:
+        handler = _FakeHandler(path)
+        chain = _time_us(_legacy_dispatch, handler, args.repeat, table)
+        routed = _time_us(_registry_dispatch, handler, args.repeat)
+        total_chain += chain
+        total_table += routed
+        print(f"{path:<28} {chain:>9.3f} {routed:>9.3f} {chain / routed:>7.1f}x")
+    n = len(SAMPLE_PATHS)
+    print(f"{'평균':<28} {total_chain / n:>9.3f} {total_table / n:>9.3f} {total_chain / total_table:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+FILE: scripts/bench_static_assets.py
+DESCRIPTION: 정적 파일 서비스 비용 벤치마크 — 이전 _serve_static(요청마다 디스크 읽기, 무압축,
+             no-store라 재방문도 전체 재전송) vs src.static_assets.StaticAssetStore.
+             Vite 빌드와 비슷한 크기의 합성 dist(index.html + 해시 JS/CSS 청크)를 임시 폴더에 만들고
+               - 요청 1건 처리 시간 (µs)
+               - 첫 방문 전송 바이트 (gzip/brotli 협상)
+               - 재방문 전송 바이트 (immutable 자산은 요청 자체가 없음, index.html은 304)
+             를 비교합니다. 실제 dist를 쓰려면 --dist 경로를 지정합니다.
+
+             사용법:
+               python scripts/bench_static_assets.py
+               python scripts/bench_static_assets.py --dist .ai_monitor/vibe-view/dist -r 2000
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 정적 파일 캐시/사전 압축 도입
+"""
+
+import argparse
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+MONITOR_DIR = ROOT_DIR / '.ai_monitor'
+if str(MONITOR_DIR) not in sys.path:
+    sys.path.insert(0, str(MONITOR_DIR))
+
+from src.static_assets import IMMUTABLE_CACHE, StaticAssetStore  # noqa: E402
+
+# (파일명, 대략 크기 KB) — vite.config manualChunks 구성과 비슷한 비율
+SYNTHETIC_DIST = [
+    ('index.html', 1), ('assets/index-Cq1x9aZb.js', 420), ('assets/vendor-react-D4kP2mQa.js', 190),
+    ('assets/vendor-monaco-B7hN3sLc.js', 800), ('assets/vendor-icons-A9fT6eWd.js', 60),
+    ('assets/index-E2rY8uJk.css', 90),
+]
+
+
+def _make_dist(root: Path) -> None:
+    rng = random.Random(7)
+    words = [''.join(rng.choices(string.ascii_letters, k=rng.randint(3, 12))) for _ in range(2000)]
+    for name, kb in SYNTHETIC_DIST:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = []
+        size = 0
+        while size < kb * 1024:
+            line = f"const {rng.choice(words)}=function({rng.choice(words)}){{return {rng.choice(words)}.{rng.choice(words)}}};\n"
+            text.append(line)
+            size += len(line)
+        path.write_text(''.join(text), encoding='utf-8')
+
+
+def _legacy_serve(root: Path, rel: str) -> bytes:
+    filepath = root / rel
+    if not filepath.exists() or not filepath.is_file():
+        filepath = root / 'index.html'
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+
+def _time_us(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) * 1e6 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='이전 정적 파일 서비스 vs StaticAssetStore')
+    parser.add_argument('--dist', type=Path, default=None, help='측정할 dist 폴더 (기본: 합성 dist)')
+    parser.add_argument('-r', '--repeat', type=int, default=500, help='파일당 요청 반복 횟수')
+    parser.add_argument('--accept-encoding', default='gzip, deflate, br', help='클라이언트 Accept-Encoding')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.dist.resolve() if args.dist else Path(tmp)
+        if args.dist is None:
+            _make_dist(root)
+        files = sorted(p.relative_to(root).as_posix() for p in root.rglob('*') if p.is_file())
+        store = StaticAssetStore(root)
+        started = time.perf_counter()
+        store.preload()
+        print(f"preload {len(files)}개 파일: {(time.perf_counter() - started) * 1000:.1f} ms "
+              f"(brotli={'on' if store.stats()['brotli'] else 'off'})\n")
+
+        print(f"{'file':<36} {'old µs':>8} {'new µs':>8} {'old KB':>8} {'new KB':>8} {'revisit KB':>10}")
+        totals = [0.0, 0.0, 0, 0, 0]
+        for rel in files:
+            asset = store.lookup(rel)
+            old_us = _time_us(lambda: _legacy_serve(root, rel), args.repeat)
+            new_us = _time_us(lambda: store.respond(store.lookup(rel), args.accept_encoding), args.repeat)
+            _, headers, body = store.respond(asset, args.accept_encoding)
+            etag = dict(headers)['ETag']
+            old_bytes = len(_legacy_serve(root, rel))
+            # 재방문: 이전 방식은 no-store라 전체 재전송, immutable은 요청 없음, 나머지는 304(본문 0)
+            revisit = 0 if asset.cache_control == IMMUTABLE_CACHE else len(
+                store.respond(asset, args.accept_encoding, etag)[2])
+            for i, value in enumerate((old_us, new_us, old_bytes, len(body), revisit)):
+                totals[i] += value
+            print(f"{rel:<36} {old_us:>8.1f} {new_us:>8.1f} {old_bytes / 1024:>8.1f} "
+                  f"{len(body) / 1024:>8.1f} {revisit / 1024:>10.1f}")
+        print(f"{'합계':<36} {totals[0]:>8.1f} {totals[1]:>8.1f} {totals[2] / 1024:>8.1f} "
+              f"{totals[3] / 1024:>8.1f} {totals[4] / 1024:>10.1f}")
+        print(f"\n재방문 전송량: 이전 {totals[2] / 1024:.1f} KB → {totals[4] / 1024:.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -34,6 +34,7 @@
 #   - 단순 조회/요약 작업은 저비용 모델(`codex_background_model`)로 자동 라우팅
 #   - 복잡 코딩 작업은 메인 모델(`codex_main_model`) 또는 Codex CLI 기본 모델 유지
 #   - 구형 `--yolo` 대신 `codex exec --dangerously-bypass-approvals-and-sandbox` 사용
+# [2026-10-17] get_recent_runs(): src.jsonl_tail 역방향 tail — agent_runs.jsonl 전체 읽기 제거
 # ------------------------------------------------------------------------
 """
 
@@ -67,6 +68,11 @@ _ANSI_ESCAPE = re.compile(
 #   - 수정: frozen 모드에서는 APPDATA/VibeCoding 을 DATA_DIR로 사용 (server.py와 동일)
 _SCRIPTS_DIR = Path(__file__).resolve().parent
 _PROJECT_ROOT = _SCRIPTS_DIR.parent
+if str(_PROJECT_ROOT / ".ai_monitor") not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.jsonl_tail import tail_records
+
 if getattr(sys, 'frozen', False):
     # PyInstaller EXE: server.py와 동일한 데이터 디렉토리 사용 (APPDATA/VibeCoding)
     _appdata = Path(os.environ.get('APPDATA', Path.home())) / 'VibeCoding'
@@ -734,18 +740,9 @@ def _save_run(result: dict) -> None:
 
 
 def get_recent_runs(limit: int = 20) -> list[dict]:
-    """agent_runs.jsonl에서 최근 실행 기록을 반환합니다."""
-    if not RUNS_FILE.exists():
-        return []
+    """agent_runs.jsonl에서 최근 실행 기록을 반환합니다 (회전된 세그먼트 포함, 활성 파일이 없어도 됨)."""
     try:
-        lines = RUNS_FILE.read_text(encoding='utf-8').strip().splitlines()
-        records = []
-        for line in reversed(lines[-limit * 2:]):  # 최근 레코드 우선
-            try:
-                records.append(json.loads(line))
-            except Exception:
-                continue
-        return records[:limit]
+        return tail_records(RUNS_FILE, limit)  # 최근 레코드 우선 (파일 끝 블록만 읽음)
     except Exception:
         return []
 
@@ -5,6 +5,14 @@
 #          기존의 JSONL 및 SQLite 레거시를 대체합니다.
 #
 # 🕒 변경 이력 (History):
+# [2026-10-17] - (체인 헤드 사용처 연결)
+#   - reflect_to_pg: parent_id를 get_chain_head()로 결정 (프로세스 캐시 → 서버 헤드)
+#   - log_thought psql 폴백: 프로세스 캐시에 헤드가 있으면 SELECT MAX(id) 서브쿼리 대신 그 id 사용
+# [2026-10-17] - (keep-alive 연결 재사용)
+#   - _call_api / get_chain_head / log_thought: urllib 요청별 연결 → src.http_client 연결 풀 (HTTP/1.1 keep-alive)
+# [2026-10-17] - (thought 체인 헤드 캐시)
+#   - get_chain_head: 서버 인메모리 체인 헤드 조회 (/api/hive/thought/head) — 훅 프로세스마다 재계산 제거
+#   - log_thought psql 폴백: parent_id 미지정 시 같은 에이전트 직전 thought를 부모로 연결
 # [2026-03-11] - Claude (지식 그래프 연결선 수정)
 #   - log_thought: parent_id 파라미터 추가 → API/psql 양쪽 경로에 parent_id 전달
 #   - log_thought: 삽입 완료 후 반환된 id를 _LAST_THOUGHT_ID에 저장
@@ -21,7 +29,7 @@ import json
 import time
 import subprocess
 from datetime import datetime
-import urllib.request
+import urllib.parse
 
 # Windows 터미널(CP949 등)에서 이모지/한글 출력 시 UnicodeEncodeError 방지
 if sys.stdout.encoding and sys.stdout.encoding.lower() not in ("utf-8", "utf8"):
@@ -36,6 +44,10 @@ PROJECT_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__f
 SERVER_URL = "http://localhost:9000"
 PG_BIN = os.path.join(PROJECT_ROOT, ".ai_monitor", "bin", "pgsql", "bin", "psql.exe")
 
+if os.path.join(PROJECT_ROOT, '.ai_monitor') not in sys.path:
+    sys.path.insert(0, os.path.join(PROJECT_ROOT, '.ai_monitor'))
+from src import http_client  # noqa: E402 — keep-alive 연결 풀
+
 # 에이전트별 마지막 삽입된 thought id — reflect_to_pg parent_id 체인에 사용
 # (프로세스 수명 동안 인메모리 유지, 재시작 시 리셋됨)
 _LAST_THOUGHT_ID: dict = {}
@@ -43,13 +55,7 @@ _LAST_THOUGHT_ID: dict = {}
 def _call_api(path: str, data: dict) -> bool:
     """server.py API를 호출합니다."""
     try:
-        req = urllib.request.Request(
-            f"{SERVER_URL}{path}",
-            data=json.dumps(data, ensure_ascii=False).encode('utf-8'),
-            headers={'Content-Type': 'application/json'}
-        )
-        with urllib.request.urlopen(req, timeout=2) as res:
-            return res.status == 200
+        return http_client.post_json(f"{SERVER_URL}{path}", data, timeout=2).status == 200
     except Exception:
         return False
 
@@ -95,6 +101,26 @@ def log_task(agent_name, task_summary, terminal_id=None, status="success"):
     else:
         print(f"[ERROR] Failed to log task to Postgres.")
 
+def get_chain_head(agent_name: str, ask_server: bool = True) -> int:
+    """에이전트의 마지막 thought id(체인 헤드)를 반환합니다. 없거나 조회 불가 시 0.
+
+    1. 이 프로세스에서 직접 기록한 id (_LAST_THOUGHT_ID)
+    2. server.py 인메모리 캐시 (/api/hive/thought/head) — DB 조회 없음 (ask_server=False면 생략)
+    """
+    if agent_name in _LAST_THOUGHT_ID:
+        return _LAST_THOUGHT_ID[agent_name]
+    if not ask_server:
+        return 0
+    try:
+        query = urllib.parse.urlencode({'agent': agent_name})
+        res = http_client.get(f"{SERVER_URL}/api/hive/thought/head?{query}", timeout=2)
+        head_id = int(res.json().get('id', 0)) if res.status == 200 else 0
+    except Exception:
+        return 0
+    if head_id:
+        _LAST_THOUGHT_ID[agent_name] = head_id
+    return head_id
+
 def log_thought(agent_name: str, skill: str, thought_dict: dict,
                 parent_id: int = None) -> int:
     """AI의 사고 과정을 PostgreSQL에 기록합니다 (JSONB).
@@ -115,30 +141,27 @@ def log_thought(agent_name: str, skill: str, thought_dict: dict,
 
     # 1. 서버 API 우선 호출 — 응답 body에서 id 파싱
     try:
-        req = __import__('urllib.request', fromlist=['Request']).Request(
-            f"{SERVER_URL}/api/hive/thought/pg",
-            data=json.dumps(data, ensure_ascii=False).encode('utf-8'),
-            headers={'Content-Type': 'application/json'}
-        )
-        import urllib.request as _ur
-        with _ur.urlopen(req, timeout=2) as res:
-            if res.status == 200:
-                body = json.loads(res.read().decode('utf-8'))
-                new_id = int(body.get('id', 0))
-                if new_id:
-                    _LAST_THOUGHT_ID[agent_name] = new_id
-                return new_id
+        res = http_client.post_json(f"{SERVER_URL}/api/hive/thought/pg", data, timeout=2)
+        if res.status == 200:
+            new_id = int(res.json().get('id', 0))
+            if new_id:
+                _LAST_THOUGHT_ID[agent_name] = new_id
+            return new_id
     except Exception:
         pass
 
     # 2. 서버 미가동 시 psql 직접 호출 폴백
     safe_thought = json.dumps(thought_dict, ensure_ascii=False).replace("'", "''")
+    # 서버가 방금 응답하지 않았으므로 헤드 조회는 이 프로세스의 캐시만 사용
+    parent_id = parent_id or get_chain_head(agent_name, ask_server=False)
     if parent_id:
         sql = (f"INSERT INTO pg_thoughts (agent, skill, thought, parent_id) "
                f"VALUES ('{agent_name}', '{skill}', '{safe_thought}'::jsonb, {int(parent_id)}) RETURNING id;")
     else:
-        sql = (f"INSERT INTO pg_thoughts (agent, skill, thought) "
-               f"VALUES ('{agent_name}', '{skill}', '{safe_thought}'::jsonb) RETURNING id;")
+        # 체인 헤드를 모름: (agent, id DESC) 인덱스로 직전 thought 조회
+        sql = (f"INSERT INTO pg_thoughts (agent, skill, thought, parent_id) "
+               f"VALUES ('{agent_name}', '{skill}', '{safe_thought}'::jsonb, "
+               f"(SELECT MAX(id) FROM pg_thoughts WHERE agent = '{agent_name}')) RETURNING id;")
     output = _run_psql(sql)
     # RETURNING id 파싱 (psql 기본 출력: " id\n----\n 42\n(1 row)")
     for line in output.splitlines():
@@ -185,7 +208,8 @@ def reflect_to_pg(agent_name: str, task_summary: str, learned: list, failed: lis
         "terminal": _tid
     }
     # 동일 에이전트의 직전 thought를 parent로 연결 → 지식 그래프에 연결선 생성
-    _prev_id = _LAST_THOUGHT_ID.get(agent_name)
+    # (이 프로세스에서 기록한 적이 없으면 서버의 체인 헤드를 조회 — 단명 훅 프로세스에서도 체인 유지)
+    _prev_id = get_chain_head(agent_name) or None
     log_thought(agent_name, "self-reflect", thought_dict, parent_id=_prev_id)
 
 def get_active_debate_context():
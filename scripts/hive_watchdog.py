@@ -9,6 +9,7 @@ DESCRIPTION: 하이브 마인드(Hive Mind) 시스템 자가 치유(Self-Healing
              계층 3 — 지식 치유: (미래) LLM 응답 분석 → 스킬 파일 갱신
 
 REVISION HISTORY:
+- 2026-10-17: check_agent_activity() — readlines() 전체 읽기 대신 src.jsonl_tail로 마지막 레코드만 읽기.
 - 2026-03-09 Claude: [버그 3건 수정]
   Bug 1) repair_memory_sync() subprocess.run에 encoding='utf-8' 미지정 →
          Windows CP949 환경에서 이모지 포함 출력 시 UnicodeDecodeError 발생 →
@@ -45,6 +46,7 @@ MONITOR_DIR = ROOT_DIR / '.ai_monitor'
 if str(MONITOR_DIR) not in sys.path:
     sys.path.insert(0, str(MONITOR_DIR))
 
+from src.jsonl_tail import tail_records
 from src.pg_store import ensure_schema, save_state
 
 # Windows 터미널(CP949 등)에서 이모지/한글 출력 시 UnicodeEncodeError 방지
@@ -197,26 +199,22 @@ class HiveWatchdog:
         - 에이전트는 사용자 요청이 있을 때만 활동하므로 짧은 유휴 상태는 정상임
         - 1시간 임계값은 오탐(false alarm)을 과다 발생시켜 불필요한 복구 루프 유발
         """
-        if not LOG_FILE.exists():
-            self.status["agent_active"] = False
-            return False
-
         try:
-            with open(LOG_FILE, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                if not lines:
-                    return False
+            # 마지막 레코드만 필요 — 파일 끝 블록만 읽음 (회전 직후 활성 파일이 없으면 최신 세그먼트에서)
+            last = tail_records(LOG_FILE, 1)
+            if not last:
+                self.status["agent_active"] = False
+                return False
 
-                last_line = json.loads(lines[-1])
-                last_time = datetime.fromisoformat(last_line["timestamp"])
+            last_time = datetime.fromisoformat(last[0]["timestamp"])
 
-                if datetime.now() - last_time < timedelta(hours=8):
-                    self.status["agent_active"] = True
-                    return True
-                else:
-                    self._add_log("⚠️ 장시간(8h+) 에이전트 활동 없음")
-                    self.status["agent_active"] = False
-                    return False
+            if datetime.now() - last_time < timedelta(hours=8):
+                self.status["agent_active"] = True
+                return True
+            else:
+                self._add_log("⚠️ 장시간(8h+) 에이전트 활동 없음")
+                self.status["agent_active"] = False
+                return False
         except Exception as e:
             self._add_log(f"⚠️ 로그 분석 실패: {e}")
             return False
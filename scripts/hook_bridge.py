@@ -23,6 +23,8 @@
 #   - _start_server(): 서버 미실행 시 server.py를 백그라운드 자동 기동 (최대 5초 대기)
 #   - fallback 순서: 서버 API → 서버 자동시작 후 재시도 → 직접 subprocess
 #   - 각 터미널 지시 입력 시 서버 없어도 자동으로 에이전트 연결됨
+# [2026-10-17] Claude: keep-alive 연결 재사용
+#   - _is_server_alive / _call_api: urllib → src.http_client 연결 풀 (헬스체크와 실행 요청이 한 연결 공유)
 # ------------------------------------------------------------------------
 """
 
@@ -31,8 +33,6 @@ import json
 import subprocess
 import os
 from pathlib import Path
-from urllib import request as urllib_request
-from urllib.error import URLError
 
 # --- 경로 설정 ---
 SCRIPT_DIR  = Path(__file__).parent
@@ -43,6 +43,9 @@ SERVER_PORT = 9000
 API_URL     = f'http://localhost:{SERVER_PORT}/api/agent/run'
 HEALTH_URL  = f'http://localhost:{SERVER_PORT}/api/hive/health'
 
+sys.path.insert(0, str(SCRIPT_DIR.parent / '.ai_monitor'))
+from src import http_client  # noqa: E402 — keep-alive 연결 풀
+
 # --- 터미널 ID ---
 # 각 터미널 실행 전 환경변수로 지정:
 #   Terminal 1: set TERMINAL_ID=T1 && claude
@@ -68,41 +71,29 @@ def _call_api(prompt: str) -> dict | None:
     """서버 HTTP API로 에이전트 실행 요청 전송.
     반환: dict(서버 응답) 또는 None(서버 미실행)
     """
-    payload = json.dumps({
+    payload = {
         'task': prompt,
         'cli': 'auto',
         'terminal_id': TERMINAL_ID,
-    }).encode('utf-8')
-
-    req = urllib_request.Request(
-        API_URL,
-        data=payload,
-        headers={'Content-Type': 'application/json'},
-        method='POST',
-    )
+    }
 
     try:
-        with urllib_request.urlopen(req, timeout=2) as resp:
-            body = resp.read().decode('utf-8')
-            return json.loads(body) if body else {'status': 'started'}
-    except urllib_request.HTTPError as e:
-        # 4xx/5xx 응답도 body를 파싱하여 반환 (409 already_running 등 처리)
-        try:
-            body = e.read().decode('utf-8')
-            return json.loads(body) if body else {'error': str(e)}
-        except Exception:
-            return {'error': str(e)}
-    except URLError:
-        return None
+        resp = http_client.post_json(API_URL, payload, timeout=2)
+    except Exception:
+        return None  # 연결 실패 = 서버 미실행
+    # 4xx/5xx 응답도 body를 파싱하여 반환 (409 already_running 등 처리)
+    try:
+        if resp.body:
+            return resp.json()
+        return {'status': 'started'} if resp.status < 400 else {'error': f'HTTP {resp.status}'}
     except Exception:
-        return None
+        return {'error': f'HTTP {resp.status}'}
 
 
 def _is_server_alive() -> bool:
     """서버 헬스체크. 응답하면 True."""
     try:
-        with urllib_request.urlopen(HEALTH_URL, timeout=1) as r:
-            return r.status == 200
+        return http_client.get(HEALTH_URL, timeout=1).status == 200
     except Exception:
         return False
 
@@ -33,12 +33,24 @@ REVISION HISTORY:
   - PostgreSQL 자동 시작 로직 포함 (pg_manager 연동)
   - psycopg2 없이 psql.exe 직접 호출 방식으로 외부 의존성 제거
   - history(), clear_old() 유틸리티 추가
+- 2026-10-17: LISTEN/NOTIFY 구독 모드 추가
+  - wait_for_messages(): 단일 LISTEN 연결(hive_messages)로 새 메시지 도착 즉시 반환 (롱폴링)
+  - psycopg2 미설치 시 receive() 주기 폴링으로 폴백
+- 2026-10-17: 원자적 claim-and-read
+  - receive(): SELECT 후 UPDATE 2단계 → itcp_claim() 단일 호출 (UPDATE … SKIP LOCKED RETURNING)
+  - 브로드캐스트는 소비자별 커서(pg_message_cursors)로 수신자마다 한 번씩 전달
+  - 미읽음 부분 인덱스 idx_pg_messages_unread, ensure_schema() 추가
+- 2026-10-17: receive()/ensure_schema()는 psql -v ON_ERROR_STOP=1로 실행
+  - 기본 psql은 SQL 오류에도 종료 코드 0 → 스키마 미생성을 감지하지 못해 수신이 영구히 빈 결과였음
+  - 실패 시 stderr를 반환/출력, 스키마 생성 실패면 _SCHEMA_READY를 세우지 않음
 """
 
 import os
 import sys
 import json
+import select
 import subprocess
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -56,6 +68,12 @@ PG_PORT = "5433"
 PG_USER = "postgres"
 PG_DB = "postgres"
 
+try:
+    import psycopg2
+    import psycopg2.extensions
+except ImportError:  # 구독 모드만 비활성화 — send/receive는 psql.exe로 동작
+    psycopg2 = None
+
 # Windows 환경 UTF-8 강제
 if hasattr(sys.stdout, "reconfigure"):
     try:
@@ -64,7 +82,7 @@ if hasattr(sys.stdout, "reconfigure"):
         pass
 
 
-def _run_psql(sql: str, timeout: int = 5) -> tuple[bool, str]:
+def _run_psql(sql: str, timeout: int = 5, stop_on_error: bool = False) -> tuple[bool, str]:
     """psql.exe를 통해 SQL을 실행하고 결과를 CSV로 반환합니다.
 
     [설계 의도]
@@ -76,6 +94,11 @@ def _run_psql(sql: str, timeout: int = 5) -> tuple[bool, str]:
     해결: SQL을 stdin으로 전달하여 UTF-8 인코딩을 명시적으로 보장합니다.
     또한 PGCLIENTENCODING=UTF8 환경변수로 PostgreSQL 클라이언트 인코딩을 강제합니다.
 
+    [오류 판정]
+    psql은 SQL 오류가 나도 기본적으로 종료 코드 0으로 끝납니다. 결과로 성공/실패를 판단해야 하는
+    호출(itcp_claim, 스키마 생성)은 stop_on_error=True로 -v ON_ERROR_STOP=1을 넘겨 오류 시 0이 아닌
+    종료 코드를 받고, 이때 출력텍스트는 stderr(오류 메시지)입니다.
+
     반환: (성공여부, 출력텍스트)
     """
     if not _PG_BIN.exists():
@@ -84,10 +107,12 @@ def _run_psql(sql: str, timeout: int = 5) -> tuple[bool, str]:
     no_window = getattr(subprocess, "CREATE_NO_WINDOW", 0x08000000)
     env = {**os.environ, "PGCLIENTENCODING": "UTF8"}  # 클라이언트 인코딩 UTF-8 강제
 
+    args = [str(_PG_BIN), "-p", PG_PORT, "-U", PG_USER, "-d", PG_DB, "--csv", "--tuples-only"]
+    if stop_on_error:
+        args += ["-v", "ON_ERROR_STOP=1"]
     try:
         result = subprocess.run(
-            [str(_PG_BIN), "-p", PG_PORT, "-U", PG_USER, "-d", PG_DB,
-             "--csv", "--tuples-only"],
+            args,
             input=sql,              # stdin으로 SQL 전달 → CP949/UTF-8 충돌 방지
             capture_output=True,
             text=True,
@@ -97,7 +122,9 @@ def _run_psql(sql: str, timeout: int = 5) -> tuple[bool, str]:
             creationflags=no_window,
             env=env,
         )
-        return result.returncode == 0, result.stdout.strip()
+        if result.returncode != 0:
+            return False, (result.stderr or result.stdout).strip()
+        return True, result.stdout.strip()
     except subprocess.TimeoutExpired:
         return False, "timeout"
     except Exception as e:
@@ -197,13 +224,106 @@ def send(
     return False
 
 
+# ── 원자적 수신 (claim-and-read) ──────────────────────────────────────────────
+# 1:1 메시지는 UPDATE … WHERE id IN (SELECT … FOR UPDATE SKIP LOCKED) RETURNING 한 문장으로
+# 조회와 읽음 처리를 동시에 수행하므로, 같은 수신자의 소비자가 동시에 실행돼도 중복 전달이 없습니다.
+# 브로드캐스트(to_agent='all')는 전역 is_read 대신 소비자별 커서(pg_message_cursors)로 추적하여
+# 각 수신자에게 정확히 한 번씩 전달됩니다.
+_RECEIVE_LIMIT = 20
+_MESSAGE_FIELDS = ["id", "from_agent", "to_agent", "channel", "msg_type", "content", "ts"]
+_SCHEMA_READY = False
+
+_SCHEMA_SQL = """
+ALTER TABLE pg_messages ADD COLUMN IF NOT EXISTS channel VARCHAR(50) DEFAULT 'general';
+ALTER TABLE pg_messages ADD COLUMN IF NOT EXISTS terminal_id VARCHAR(50) DEFAULT '';
+ALTER TABLE pg_messages ADD COLUMN IF NOT EXISTS metadata JSONB DEFAULT '{}'::jsonb;
+
+CREATE INDEX IF NOT EXISTS idx_pg_messages_unread ON pg_messages (to_agent) WHERE NOT is_read;
+
+CREATE TABLE IF NOT EXISTS pg_message_cursors (
+    consumer VARCHAR(50) PRIMARY KEY,
+    last_id INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE OR REPLACE FUNCTION itcp_claim(p_consumer TEXT, p_limit INTEGER DEFAULT 20)
+RETURNS TABLE (id INTEGER, from_agent TEXT, to_agent TEXT, channel TEXT,
+               msg_type TEXT, content TEXT, ts TEXT) AS $$
+#variable_conflict use_column
+DECLARE
+    v_from INTEGER;
+    v_to INTEGER;
+BEGIN
+    -- 신규 소비자: 아직 아무도 읽지 않은 브로드캐스트부터 받도록 커서 초기화
+    INSERT INTO pg_message_cursors (consumer, last_id)
+    VALUES (p_consumer, COALESCE(
+        (SELECT MIN(m.id) - 1 FROM pg_messages m WHERE m.to_agent = 'all' AND NOT m.is_read),
+        (SELECT MAX(m.id) FROM pg_messages m), 0))
+    ON CONFLICT (consumer) DO NOTHING;
+
+    -- 커서 행 잠금 → 같은 소비자의 동시 호출은 브로드캐스트 구간을 나눠 갖지 않고 직렬화
+    SELECT c.last_id INTO v_from FROM pg_message_cursors c WHERE c.consumer = p_consumer FOR UPDATE;
+    SELECT MAX(b.id) INTO v_to FROM (
+        SELECT m.id FROM pg_messages m
+        WHERE m.to_agent = 'all' AND m.id > v_from
+        ORDER BY m.id LIMIT p_limit
+    ) b;
+    IF v_to IS NOT NULL THEN
+        UPDATE pg_message_cursors SET last_id = v_to, updated_at = NOW() WHERE consumer = p_consumer;
+        -- 이력/정리(clear_old)용 표시 — 전달 여부는 커서가 결정
+        UPDATE pg_messages SET is_read = TRUE
+        WHERE to_agent = 'all' AND id > v_from AND id <= v_to AND NOT is_read;
+    END IF;
+
+    RETURN QUERY
+    WITH claimed AS (
+        UPDATE pg_messages m SET is_read = TRUE
+        WHERE m.id IN (
+            SELECT q.id FROM pg_messages q
+            WHERE q.to_agent = p_consumer AND NOT q.is_read
+            ORDER BY q.id LIMIT p_limit
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING m.id, m.from_agent, m.to_agent, m.channel, m.msg_type, m.content, m.ts
+    )
+    SELECT x.id, x.from_agent::text, x.to_agent::text, x.channel::text,
+           x.msg_type::text, x.content, x.ts::text
+    FROM (
+        SELECT * FROM claimed
+        UNION ALL
+        SELECT m.id, m.from_agent, m.to_agent, m.channel, m.msg_type, m.content, m.ts
+        FROM pg_messages m
+        WHERE m.to_agent = 'all' AND m.id > v_from AND m.id <= COALESCE(v_to, v_from)
+    ) x
+    ORDER BY x.id;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def ensure_schema() -> bool:
+    """ITCP 수신에 필요한 인덱스/커서 테이블/itcp_claim() 함수를 생성합니다 (멱등)."""
+    global _SCHEMA_READY
+    ok, error = _run_psql(_SCHEMA_SQL, timeout=15, stop_on_error=True)
+    _SCHEMA_READY = ok
+    if not ok:
+        print(f"[ITCP] 스키마 생성 실패: {error}", file=sys.stderr)
+    return ok
+
+
+def _parse_messages(result: str) -> list[dict]:
+    import csv, io
+    reader = csv.DictReader(io.StringIO(result), fieldnames=_MESSAGE_FIELDS)
+    return [dict(row) for row in reader]
+
+
 def receive(terminal_name: str, mark_read: bool = True) -> list[dict]:
     """나(terminal_name)에게 온 미읽음 메시지를 가져옵니다.
 
     [동작]
-    1. pg_messages에서 to_agent = terminal_name OR 'all' AND is_read = false 조회
-    2. mark_read=True면 조회한 메시지를 is_read=true로 업데이트
-    3. 메시지 목록 반환
+    - mark_read=True : itcp_claim() 한 번의 호출로 1:1 메시지 claim + 브로드캐스트 커서 전진
+    - mark_read=False: 상태 변경 없이 미읽음 메시지와 커서 이후 브로드캐스트만 조회 (peek)
+    - 함수/커서 테이블이 없으면(최초 실행) ensure_schema() 후 한 번 재시도
 
     [훅에서의 활용]
     hive_hook.py의 UserPromptSubmit 이벤트에서 호출되어
@@ -214,37 +334,31 @@ def receive(terminal_name: str, mark_read: bool = True) -> list[dict]:
     if not _ensure_pg_running():
         return _fallback_file_receive(terminal_name, mark_read)
 
-    # 미읽음 메시지 조회 (내게 온 것 + 전체 브로드캐스트)
-    sql = (
-        f"SELECT id, from_agent, to_agent, channel, msg_type, content, ts::text "
-        f"FROM pg_messages "
-        f"WHERE (to_agent = '{terminal_name}' OR to_agent = 'all') "
-        f"AND is_read = false "
-        f"ORDER BY ts ASC "
-        f"LIMIT 20;"
-    )
-    ok, result = _run_psql(sql)
-    if not ok or not result:
+    name = terminal_name.replace("'", "''")
+    if mark_read:
+        sql = f"SELECT * FROM itcp_claim('{name}', {_RECEIVE_LIMIT});"
+    else:
+        sql = (
+            f"SELECT id, from_agent, to_agent, channel, msg_type, content, ts::text FROM ("
+            f"  (SELECT * FROM pg_messages WHERE to_agent = '{name}' AND NOT is_read"
+            f"   ORDER BY id LIMIT {_RECEIVE_LIMIT})"
+            f"  UNION ALL"
+            f"  (SELECT * FROM pg_messages WHERE to_agent = 'all' AND id > COALESCE("
+            f"     (SELECT last_id FROM pg_message_cursors WHERE consumer = '{name}'),"
+            f"     (SELECT MIN(id) - 1 FROM pg_messages WHERE to_agent = 'all' AND NOT is_read),"
+            f"     2147483647)"
+            f"   ORDER BY id LIMIT {_RECEIVE_LIMIT})"
+            f") m ORDER BY id;"
+        )
+    ok, result = _run_psql(sql, stop_on_error=True)
+    if not ok and not _SCHEMA_READY and ensure_schema():
+        ok, result = _run_psql(sql, stop_on_error=True)
+    if not ok:
+        print(f"[ITCP] 수신 실패: {result}", file=sys.stderr)
         return []
-
-    messages = []
-    import csv, io
-    reader = csv.DictReader(
-        io.StringIO(result),
-        fieldnames=["id", "from_agent", "to_agent", "channel", "msg_type", "content", "ts"]
-    )
-    for row in reader:
-        messages.append(dict(row))
-
-    if not messages:
+    if not result:
         return []
-
-    # 읽음 처리
-    if mark_read:
-        ids = ",".join(m["id"] for m in messages)
-        _run_psql(f"UPDATE pg_messages SET is_read = true WHERE id IN ({ids});")
-
-    return messages
+    return _parse_messages(result)
 
 
 def broadcast(from_terminal: str, content: str, channel: str = "broadcast") -> bool:
@@ -306,6 +420,138 @@ def clear_old(days: int = 7) -> int:
     return 0
 
 
+# ── LISTEN/NOTIFY 구독 (롱폴링) ───────────────────────────────────────────────
+_NOTIFY_CHANNEL = "hive_messages"
+_POLL_FALLBACK_SEC = 2.0   # psycopg2 미설치/LISTEN 불가 시 receive() 재시도 간격
+
+
+class _MessageListener:
+    """프로세스당 하나의 LISTEN hive_messages 연결을 소유하고 대기자들을 깨웁니다.
+
+    [설계 의도]
+    send()가 NOTIFY hive_messages, '<to_terminal>' 을 보내므로 payload만 보고
+    어떤 수신자가 깨어나야 하는지 알 수 있습니다. 대기 중인 요청이 몇 개든
+    DB 연결은 하나만 사용하며, 실제 메시지 조회는 깨어난 뒤 receive()가 수행합니다.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._seq = 0                           # 수신한 NOTIFY 누적 카운터
+        self._last_seen: dict[str, int] = {}    # payload(수신자) → 마지막 NOTIFY seq
+        self._connected = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def ensure_started(self, timeout: float = 3.0) -> bool:
+        """LISTEN 스레드를 시작하고 연결될 때까지 최대 timeout 초 대기."""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True, name="ITCPListener")
+                self._thread.start()
+        return self._connected.wait(timeout)
+
+    def mark(self) -> int:
+        with self._cond:
+            return self._seq
+
+    def wait(self, targets: set, since: int, timeout: float) -> bool:
+        """targets 중 하나로 since 이후 NOTIFY가 오면 True, timeout 시 False."""
+        watch = set(targets) | {"*"}   # "*" = 재연결 등으로 전체 재확인 필요
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: any(self._last_seen.get(t, 0) > since for t in watch),
+                timeout,
+            )
+
+    def _notify(self, payloads: list[str]) -> None:
+        with self._cond:
+            for payload in payloads:
+                self._seq += 1
+                self._last_seen[payload] = self._seq
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        backoff = 0.5
+        while True:
+            conn = None
+            try:
+                conn = psycopg2.connect(
+                    host="localhost", port=int(PG_PORT), user=PG_USER, dbname=PG_DB,
+                    connect_timeout=3,
+                )
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {_NOTIFY_CHANNEL};")
+                self._connected.set()
+                backoff = 0.5
+                while True:
+                    if select.select([conn], [], [], 5) == ([], [], []):
+                        continue
+                    conn.poll()
+                    payloads = []
+                    while conn.notifies:
+                        payloads.append(conn.notifies.pop(0).payload)
+                    if payloads:
+                        self._notify(payloads)
+            except Exception:
+                # 연결이 끊긴 동안 도착한 메시지를 놓치지 않도록 모든 대기자에게 재확인 신호
+                if self._connected.is_set():
+                    self._connected.clear()
+                    self._notify(["*"])
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 10.0)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+_LISTENER: Optional[_MessageListener] = None
+_LISTENER_LOCK = threading.Lock()
+
+
+def _get_listener() -> Optional[_MessageListener]:
+    global _LISTENER
+    if psycopg2 is None:
+        return None
+    with _LISTENER_LOCK:
+        if _LISTENER is None:
+            _LISTENER = _MessageListener()
+        return _LISTENER
+
+
+def wait_for_messages(terminal_name: str, timeout: float = 25.0, mark_read: bool = True) -> list[dict]:
+    """terminal_name(또는 'all')에게 메시지가 도착할 때까지 최대 timeout 초 블로킹합니다.
+
+    [동작]
+    1. LISTEN 연결을 먼저 확보한 뒤 receive()로 이미 쌓인 메시지 확인 (경쟁 조건 방지)
+    2. 없으면 NOTIFY가 올 때까지 대기 → 깨어나면 receive() 재조회
+    3. timeout 내 메시지가 없으면 빈 리스트
+
+    LISTEN을 쓸 수 없으면(psycopg2 미설치, PG 중단) _POLL_FALLBACK_SEC 간격으로 receive() 폴링.
+    """
+    deadline = time.monotonic() + max(0.0, timeout)
+    listener = _get_listener()
+    listening = listener is not None and listener.ensure_started(timeout=min(3.0, max(0.0, timeout)))
+    since = listener.mark() if listening else 0
+
+    messages = receive(terminal_name, mark_read=mark_read)
+    while not messages:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return []
+        if listening:
+            if not listener.wait({terminal_name, "all"}, since, remaining):
+                return []
+            since = listener.mark()
+        else:
+            time.sleep(min(_POLL_FALLBACK_SEC, remaining))
+        messages = receive(terminal_name, mark_read=mark_read)
+    return messages
+
+
 # ── 파일 기반 폴백 (PostgreSQL 완전 불가 시 최후 수단) ──────────────────────────
 _FALLBACK_FILE = _PROJECT_ROOT / ".ai_monitor" / "data" / "messages.jsonl"
 
@@ -376,13 +622,14 @@ if __name__ == "__main__":
     CLI 사용법:
       python scripts/itcp.py send claude gemini "서버 버그 발견" debug
       python scripts/itcp.py receive claude
+      python scripts/itcp.py wait claude 30
       python scripts/itcp.py broadcast gemini "빌드 완료"
       python scripts/itcp.py history 10
       python scripts/itcp.py status
     """
     args = sys.argv[1:]
     if not args:
-        print("사용법: itcp.py [send|receive|broadcast|history|status] ...")
+        print("사용법: itcp.py [send|receive|wait|broadcast|history|status] ...")
         sys.exit(1)
 
     cmd = args[0]
@@ -403,6 +650,17 @@ if __name__ == "__main__":
         else:
             print(f"📭 {terminal}의 미읽음 메시지 없음")
 
+    elif cmd == "wait" and len(args) >= 2:
+        terminal = args[1]
+        wait_sec = float(args[2]) if len(args) > 2 else 25.0
+        msgs = wait_for_messages(terminal, timeout=wait_sec)
+        if msgs:
+            print(f"📨 {terminal}의 새 메시지 {len(msgs)}개:")
+            for m in msgs:
+                print(f"  [{m['from_agent']} → {m['to_agent']}] ({m['channel']}) {m['content'][:80]}")
+        else:
+            print(f"📭 {wait_sec:.0f}초 동안 {terminal}에게 온 메시지 없음")
+
     elif cmd == "broadcast" and len(args) >= 3:
         from_t, content = args[1], args[2]
         channel = args[3] if len(args) > 3 else "broadcast"
@@ -9,7 +9,7 @@ MONITOR_DIR = PROJECT_ROOT / '.ai_monitor'
 if str(MONITOR_DIR) not in __import__('sys').path:
     __import__('sys').path.insert(0, str(MONITOR_DIR))
 
-from src.file_store import ensure_legacy_store, save_skill_chain_rows, upsert_memory_entry
+from src.file_store import ensure_legacy_store, memory_file, save_skill_chain_rows, upsert_memory_entry
 
 
 def _read_memory(db_path: Path) -> list[dict]:
@@ -98,7 +98,7 @@ def migrate(data_dir: Path) -> dict:
         'memory_entries': len(memory_entries),
         'session_logs': len(session_rows),
         'skill_chain_rows': len(skill_rows),
-        'memory_file': str(data_dir / 'shared_memory.json'),
+        'memory_file': str(memory_file(data_dir)),
         'session_file': str(data_dir / 'session_logs.jsonl'),
         'skill_chain_file': str(data_dir / 'skill_chain.json'),
     }
@@ -18,8 +18,6 @@ import os
 import time
 import json
 import argparse
-import urllib.request
-import urllib.error
 import webbrowser
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -29,6 +27,7 @@ MONITOR_DIR = ROOT_DIR / '.ai_monitor'
 if str(MONITOR_DIR) not in sys.path:
     sys.path.insert(0, str(MONITOR_DIR))
 
+from src import http_client
 from src.pg_store import get_agent_last_seen as pg_get_agent_last_seen, list_tasks, save_task
 
 # ─── 설정 상수 ────────────────────────────────────────────────────────────────
@@ -78,10 +77,10 @@ def open_mission_control() -> None:
 # ─── API 헬퍼 ─────────────────────────────────────────────────────────────────
 
 def api_get(path: str, port: int):
-    """GET 요청 헬퍼 - 실패 시 None 반환"""
+    """GET 요청 헬퍼 - 실패 시 None 반환 (keep-alive 연결 풀 재사용, 데몬 주기마다 새 연결 없음)"""
     try:
-        with urllib.request.urlopen(f'http://localhost:{port}{path}', timeout=3) as r:
-            return json.loads(r.read().decode('utf-8'))
+        r = http_client.get(f'http://localhost:{port}{path}', timeout=3)
+        return r.json() if r.status < 400 else None
     except Exception:
         return None
 
@@ -89,15 +88,8 @@ def api_get(path: str, port: int):
 def api_post(path: str, body: dict, port: int):
     """POST 요청 헬퍼 - 실패 시 None 반환"""
     try:
-        payload = json.dumps(body).encode('utf-8')
-        req = urllib.request.Request(
-            f'http://localhost:{port}{path}',
-            data=payload,
-            headers={'Content-Type': 'application/json'},
-            method='POST',
-        )
-        with urllib.request.urlopen(req, timeout=3) as r:
-            return json.loads(r.read().decode('utf-8'))
+        r = http_client.post_json(f'http://localhost:{port}{path}', body, timeout=3)
+        return r.json() if r.status < 400 else None
     except Exception:
         return None
 
@@ -7,6 +7,8 @@ REVISION HISTORY:
 - 2026-03-06 Gemini: 최초 작성. 시작/중지/상태체크 및 확장 기능 활성화 로직 구현.
 - 2026-03-10 Gemini: Task 17 강화 - pg_logs/pg_thoughts 스키마 통합 및 지식 그래프 기반 마련.
 - 2026-03-11 Claude: frozen(배포) 모드 경로 추가 — {exe dir}\pgsql + %APPDATA%\VibeCoding\pgdata
+- 2026-10-17: setup 시 itcp.ensure_schema() 호출 — 미읽음 부분 인덱스 및 브로드캐스트 커서 생성
+- 2026-10-17: pg_thoughts (agent, id DESC) 인덱스 추가 — 에이전트별 직전 thought 조회용
 """
 
 import os
@@ -152,6 +154,7 @@ def init_log_schema():
     END $$;
 
     CREATE INDEX IF NOT EXISTS idx_thoughts_parent ON pg_thoughts(parent_id);
+    CREATE INDEX IF NOT EXISTS idx_pg_thoughts_agent_id ON pg_thoughts(agent, id DESC);
 
     -- 3. Agent Messaging Table (pg_messages)
     CREATE TABLE IF NOT EXISTS pg_messages (
@@ -236,6 +239,10 @@ def init_log_schema():
             str(psql), "-p", str(PORT), "-U", "postgres", "-d", "postgres", "-c", schema_sql
         ], check=True, capture_output=True, text=True, encoding="utf-8", errors="replace")
         print("✅ 로그 스키마 세팅 성공.")
+        # ITCP 수신용 부분 인덱스 / 브로드캐스트 커서 / itcp_claim() 함수
+        import itcp
+        if itcp.ensure_schema():
+            print("✅ ITCP 메시지 스키마 세팅 성공.")
     except Exception as e:
         stderr = getattr(e, 'stderr', 'No stderr')
         print(f"❌ 로그 스키마 세팅 실패: {e}\n{stderr}")
@@ -1,9 +1,6 @@
 import argparse
-import json
 import sys
 import time
-import urllib.error
-import urllib.request
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
@@ -11,6 +8,7 @@ MONITOR_DIR = ROOT_DIR / '.ai_monitor'
 if str(MONITOR_DIR) not in sys.path:
     sys.path.insert(0, str(MONITOR_DIR))
 
+from src import http_client
 from src.pg_store import delete_task, list_tasks, save_task, update_task
 
 
@@ -18,24 +16,18 @@ DEFAULT_PORTS = [8005, 8000]
 
 
 def api_get(path: str, port: int) -> dict | list | None:
+    # keep-alive 연결 풀 (src.http_client) — 같은 프로세스의 연속 호출이 TCP 연결을 재사용
     try:
-        with urllib.request.urlopen(f'http://localhost:{port}{path}', timeout=3) as response:
-            return json.loads(response.read().decode('utf-8'))
+        response = http_client.get(f'http://localhost:{port}{path}', timeout=3)
+        return response.json() if response.status < 400 else None
     except Exception:
         return None
 
 
 def api_post(path: str, body: dict, port: int) -> dict | None:
     try:
-        payload = json.dumps(body).encode('utf-8')
-        request = urllib.request.Request(
-            f'http://localhost:{port}{path}',
-            data=payload,
-            headers={'Content-Type': 'application/json'},
-            method='POST',
-        )
-        with urllib.request.urlopen(request, timeout=3) as response:
-            return json.loads(response.read().decode('utf-8'))
+        response = http_client.post_json(f'http://localhost:{port}{path}', body, timeout=3)
+        return response.json() if response.status < 400 else None
     except Exception:
         return None
 
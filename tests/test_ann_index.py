@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_ann_index.py
+DESCRIPTION: src.ann_index.IVFFlatIndex 단위 테스트.
+             임시 디렉터리에 작은 합성 임베딩으로 인덱스를 만들고
+             증분 put/delete, mmap 재오픈, 단편화율 기반 재구축을 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 메모리/사고 근사 검색 도입
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.ann_index import IVFFlatIndex, _normalize_rows
+
+
+def _vectors(count: int, dim: int = 16, seed: int = 0) -> np.ndarray:
+    return _normalize_rows(np.random.default_rng(seed).standard_normal((count, dim)))
+
+
+@pytest.fixture()
+def built(tmp_path):
+    vectors = _vectors(400)
+    keys = [f"k{i}" for i in range(len(vectors))]
+    IVFFlatIndex(tmp_path / "idx", auto_rebuild=False).rebuild(keys, vectors)
+    return tmp_path / "idx", keys, vectors
+
+
+class TestIVFFlatIndex:
+    """검색 정확도, 증분 변경, 디스크 영속성."""
+
+    def test_전체_리스트_탐색시_전수비교와_동일(self, built):
+        path, keys, vectors = built
+        index = IVFFlatIndex(path, auto_rebuild=False)
+        query = vectors[7]
+        hits = index.search(query, k=5, nprobe=10_000)
+        expected = np.argsort(-(vectors @ query))[:5]
+        assert [key for key, _ in hits] == [keys[i] for i in expected]
+        assert hits[0][0] == "k7"
+
+    def test_재오픈시_기본_벡터는_mmap(self, built):
+        path, _, _ = built
+        index = IVFFlatIndex(path, auto_rebuild=False)
+        assert isinstance(index._vectors, np.memmap)
+        assert len(index) == 400
+
+    def test_put_delete가_재오픈후에도_유지(self, built):
+        path, _, vectors = built
+        index = IVFFlatIndex(path, auto_rebuild=False)
+        fresh = _vectors(1, seed=99)[0]
+        index.put("new", fresh)
+        index.delete("k7")
+        reopened = IVFFlatIndex(path, auto_rebuild=False)
+        assert "new" in reopened and "k7" not in reopened
+        assert reopened.search(fresh, k=1)[0][0] == "new"
+        assert "k7" not in [key for key, _ in reopened.search(vectors[7], k=10, nprobe=10_000)]
+
+    def test_기존_키_put은_덮어쓰기(self, built):
+        path, _, _ = built
+        index = IVFFlatIndex(path, auto_rebuild=False)
+        target = _vectors(1, seed=5)[0]
+        index.put("k3", target)
+        index.put("k3", target)
+        assert len(index) == 400
+        assert index.search(target, k=1)[0][0] == "k3"
+
+    def test_차원_불일치는_거부(self, built):
+        path, _, _ = built
+        index = IVFFlatIndex(path, auto_rebuild=False)
+        assert index.put("bad", np.ones(8, dtype=np.float32)) is False
+        assert index.search(np.ones(8, dtype=np.float32)) == []
+
+    def test_단편화율_초과시_백그라운드_재구축(self, built):
+        path, _, vectors = built
+        index = IVFFlatIndex(path, rebuild_ratio=0.1, min_rebuild_rows=10)
+        for i in range(50):
+            index.delete(f"k{i}")
+        index._rebuild_thread.join(timeout=30)
+        stats = index.stats()
+        assert stats["rebuilds"] == 1
+        assert stats["tombstones"] + stats["delta_rows"] <= 50
+        assert len(index) == 350
+        assert "k3" not in index
+        assert index.search(vectors[200], k=1, nprobe=10_000)[0][0] == "k200"
+
+    def test_재구축은_세대_디렉터리와_포인터_교체(self, built):
+        path, _, vectors = built
+        index = IVFFlatIndex(path, auto_rebuild=False)
+        index.delete("k1")
+        index.rebuild()
+        assert sorted(p.name for p in path.iterdir() if p.is_dir()) == ["base.000002"]
+        assert not (path / "meta.json").exists()
+        reopened = IVFFlatIndex(path, auto_rebuild=False)
+        assert len(reopened) == 399 and "k1" not in reopened
+        assert reopened.search(vectors[9], k=1, nprobe=10_000)[0][0] == "k9"
+
+    def test_포인터_교체_전_실패하면_이전_세대_유지(self, built, monkeypatch):
+        from src import ann_index
+        path, _, vectors = built
+        index = IVFFlatIndex(path, auto_rebuild=False)
+        index.delete("k1")
+        real_write_json = ann_index._write_json
+
+        def failing_pointer(target, payload):
+            if target.name == "CURRENT":
+                raise OSError("디스크 가득 참")
+            real_write_json(target, payload)
+
+        monkeypatch.setattr(ann_index, "_write_json", failing_pointer)
+        index.rebuild()
+        assert index.rebuilds == 0 and len(index) == 399 and "k1" not in index
+        reopened = IVFFlatIndex(path, auto_rebuild=False)
+        assert len(reopened) == 399 and "k1" not in reopened
+        assert reopened.search(vectors[9], k=1, nprobe=10_000)[0][0] == "k9"
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_async_http.py
+DESCRIPTION: src.async_http.AsyncHTTPServer 단위 테스트.
+             최소 BaseHTTPRequestHandler로 일반 GET/POST가 executor에서 기존 핸들러 그대로
+             처리되는지, SSE 스트림이 스레드 없이 브로드캐스트를 받고 연결 종료 시 정리되는지 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — asyncio HTTP/SSE 모드 도입
+- 2026-10-17: 스트림에 요청 헤더 전달(client.headers) 테스트 추가
+"""
+
+import json
+import socket
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.async_http import AsyncHTTPServer
+
+CLIENTS: set = set()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self._reply({"path": self.path, "thread": threading.current_thread().name})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply(json.loads(self.rfile.read(length)))
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def _events(client, target):
+    yield f"data: hello {client.headers.get('last-event-id', '-')}\n\n".encode()
+    CLIENTS.add(client)
+    try:
+        async for frame in client.frames(heartbeat=0.2):
+            yield frame
+    finally:
+        CLIENTS.discard(client)
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return predicate()
+
+
+@pytest.fixture()
+def server():
+    CLIENTS.clear()
+    srv = AsyncHTTPServer(("127.0.0.1", 0), _Handler, streams={"/events": _events}, max_workers=2)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _url(srv, path):
+    return f"http://127.0.0.1:{srv.server_address[1]}{path}"
+
+
+def _open_stream(srv):
+    sock = socket.create_connection(srv.server_address)
+    sock.sendall(b"GET /events HTTP/1.1\r\nHost: t\r\nLast-Event-ID: 17\r\n\r\n")
+    sock.settimeout(3)
+    return sock
+
+
+class TestAsyncHTTPServer:
+    """executor 위임과 async generator SSE."""
+
+    def test_일반_GET은_executor에서_기존_핸들러로_처리(self, server):
+        with urllib.request.urlopen(_url(server, "/api/x?a=1")) as resp:
+            data = json.loads(resp.read())
+        assert data["path"] == "/api/x?a=1"
+        assert data["thread"].startswith("HTTPWorker")
+
+    def test_POST_본문_전달(self, server):
+        req = urllib.request.Request(_url(server, "/api/y"), data=b'{"k": 1}', method="POST")
+        with urllib.request.urlopen(req) as resp:
+            assert json.loads(resp.read()) == {"k": 1}
+
+    def test_SSE는_스레드_브로드캐스트를_받고_하트비트(self, server):
+        sock = _open_stream(server)
+        assert _wait_for(lambda: len(CLIENTS) == 1)
+        client = next(iter(CLIENTS))
+        threading.Thread(target=client.wfile.write, args=(b"data: x\n\n",)).start()
+        received = b""
+        deadline = time.monotonic() + 3
+        while (b"data: x" not in received or b": heartbeat" not in received) and time.monotonic() < deadline:
+            received += sock.recv(4096)
+        assert b"text/event-stream" in received
+        assert b"data: hello 17" in received and b"data: x" in received
+        assert b": heartbeat" in received
+        sock.close()
+
+    def test_연결_종료시_클라이언트_정리_및_쓰기_실패(self, server):
+        sock = _open_stream(server)
+        assert _wait_for(lambda: len(CLIENTS) == 1)
+        client = next(iter(CLIENTS))
+        sock.close()
+        assert _wait_for(lambda: not CLIENTS and server.active_streams == 0)
+        with pytest.raises(BrokenPipeError):
+            client.wfile.write(b"data: late\n\n")
+
+    def test_shutdown시_열린_스트림도_정리(self, server):
+        sock = _open_stream(server)
+        assert _wait_for(lambda: len(CLIENTS) == 1)
+        server.shutdown()
+        assert not CLIENTS
+        sock.close()
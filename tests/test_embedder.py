@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_embedder.py
+DESCRIPTION: src/embedder.py EmbeddingService 단위 테스트.
+             배치 크기, SHA-256 캐시(메모리/영속), 텍스트 정규화, 모델 로드 실패, 카운터를 검증합니다.
+
+             [테스트 전략]
+             - model_factory로 호출 배치를 기록하는 가짜 모델 주입 (fastembed 로드 없음)
+             - 영속 캐시는 dict 기반 가짜 store
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 배치 임베딩 워커 도입
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.embedder import EmbeddingService, normalize_text, text_hash
+
+
+class _FakeModel:
+    def __init__(self):
+        self.batches = []
+
+    def embed(self, texts, batch_size=256):
+        self.batches.append(list(texts))
+        for text in texts:
+            yield np.array([len(text), 1.0], dtype=np.float32)
+
+
+class _DictStore:
+    def __init__(self, initial=None):
+        self.data = dict(initial or {})
+        self.puts = 0
+
+    def get_many(self, model, hashes):
+        return {h: self.data[(model, h)] for h in hashes if (model, h) in self.data}
+
+    def put_many(self, model, items):
+        self.puts += 1
+        for digest, value in items.items():
+            self.data[(model, digest)] = value
+
+
+def _service(model=None, store=None, **kwargs):
+    model = model or _FakeModel()
+    return EmbeddingService('fake-model', store=store, model_factory=lambda: model, **kwargs), model
+
+
+class TestEmbeddingService:
+    """배치 처리와 캐시 적중 검증."""
+
+    def test_여러_텍스트는_배치크기_이하로_묶여_처리됨(self):
+        service, model = _service(batch_size=32)
+        results = service.embed_many([f"text {i}" for i in range(40)])
+        assert all(r is not None for r in results)
+        assert sum(len(b) for b in model.batches) == 40
+        assert max(len(b) for b in model.batches) <= 32
+        assert len(model.batches) <= 3
+
+    def test_같은_텍스트는_다시_임베딩하지_않음(self):
+        service, model = _service()
+        first = service.embed("서버  재시작\n")
+        second = service.embed(" 서버 재시작")
+        assert first == second == np.array([6, 1.0], dtype=np.float32).tobytes()
+        assert sum(len(b) for b in model.batches) == 1
+        stats = service.stats()
+        assert stats['cache_hits'] == 1 and stats['cache_misses'] == 1
+        assert stats['hit_rate'] == 0.5
+        assert stats['texts_embedded'] == 1
+
+    def test_영속_캐시_적중시_모델_호출없음(self):
+        cached = np.array([9, 9], dtype=np.float32).tobytes()
+        store = _DictStore({('fake-model', text_hash(normalize_text('캐시됨'))): cached})
+        service, model = _service(store=store)
+        assert service.embed('캐시됨') == cached
+        assert model.batches == []
+        assert service.embed('새 텍스트') is not None
+        assert store.puts == 1
+
+    def test_모델_로드_실패시_None(self):
+        def _broken():
+            raise RuntimeError("no model")
+
+        service = EmbeddingService('fake-model', model_factory=_broken)
+        assert service.embed('텍스트', timeout=5) is None
+        assert service.stats()['model_failed'] is True
+
+    def test_warm_up은_요청없이_모델을_로드함(self):
+        service, _ = _service()
+        service.warm_up()
+        service.embed('x')  # 워커가 warm-up 신호를 먼저 처리한 뒤 응답
+        assert service.ready
+        assert service.stats()['model_loaded'] is True
+
+    def test_빈_텍스트는_None(self):
+        service, model = _service()
+        assert service.embed_many(['', '   ']) == [None, None]
+        assert model.batches == []
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_event_bus.py
+DESCRIPTION: src.event_bus.EventBus 단위 테스트.
+             구독자가 읽지 않아도 publish가 블로킹하지 않는지, 링 초과 시 가장 오래된 프레임을 버리고
+             lagged를 세는지, 느린 라이터가 생산자를 붙잡지 않는지, 스레드/asyncio 소비자 모두
+             하트비트와 구독 해제를 처리하는지 검증합니다.
+             Last-Event-ID 재연결 시 replay 링에서 놓친 프레임만 복구하는지도 확인합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — SSE 이벤트 버스 도입
+- 2026-10-17: 이벤트 id / replay 링 / Last-Event-ID 복구 테스트 추가
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.event_bus import HEARTBEAT, EventBus, parse_last_event_id, sse_frame
+
+
+class _SlowWfile:
+    """쓰기마다 지연되는 브라우저 탭 흉내."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.frames = []
+
+    def write(self, data):
+        time.sleep(self.delay)
+        self.frames.append(data)
+
+    def flush(self):
+        pass
+
+
+class TestEventBus:
+    """발행/링 버퍼/구독 해제."""
+
+    def test_링_초과시_가장_오래된_프레임_폐기(self):
+        bus = EventBus(default_ring_size=3)
+        sub = bus.subscribe("fs")
+        for i in range(5):
+            assert bus.publish("fs", sse_frame({"n": i})) == 1
+        batch = sub.drain(0)
+        assert [frame.split(b"\n", 1)[1] for frame in batch] == [sse_frame({"n": i}) for i in (2, 3, 4)]
+        assert sub.lagged == 2
+        assert bus.stats()["fs"]["lagged"] == 2
+        assert bus.stats()["fs"]["published"] == 5
+
+    def test_토픽별_링_크기와_구독_해제(self):
+        bus = EventBus({"agent": 10})
+        with bus.subscribe("agent") as sub:
+            assert sub.ring_size == 10
+            assert bus.subscriber_count("agent") == 1
+        assert bus.subscriber_count("agent") == 0
+        assert sub.drain(0) is None
+        assert bus.publish("agent", b"data: x\n\n") == 0
+
+    def test_느린_구독자가_생산자를_붙잡지_않음(self):
+        bus = EventBus(default_ring_size=8)
+        sub = bus.subscribe("thoughts")
+        slow = _SlowWfile(0.05)
+        writer = threading.Thread(target=sub.write_to, args=(slow, 0.2), daemon=True)
+        writer.start()
+        started = time.perf_counter()
+        for i in range(200):
+            bus.publish_json("thoughts", {"i": i})
+        assert time.perf_counter() - started < 0.5
+        time.sleep(0.3)
+        sub.close()
+        writer.join(2)
+        assert not writer.is_alive()
+        assert sub.lagged > 0
+        assert len(slow.frames) <= sub.delivered
+        assert sub.delivered + sub.lagged <= 200
+
+    def test_스레드_소비자_하트비트(self):
+        bus = EventBus()
+        sub = bus.subscribe("fs")
+        frames = sub.frames(heartbeat=0.05)
+        assert next(frames) == HEARTBEAT
+        bus.publish("fs", b"data: a\n\n")
+        assert next(frames).endswith(b"data: a\n\n")
+        sub.close()
+        assert list(frames) == []
+
+    def test_asyncio_소비자는_스레드_발행을_받음(self):
+        bus = EventBus()
+
+        async def consume():
+            sub = bus.subscribe("hive_logs")
+            got = []
+            threading.Timer(0.05, bus.publish, args=("hive_logs", b"data: 1\n\n")).start()
+            async for frame in sub.aframes(heartbeat=0.5):
+                got.append(frame)
+                if frame != HEARTBEAT:
+                    break
+            sub.close()
+            return got
+
+        got = asyncio.run(consume())
+        assert len(got) == 1 and got[0].endswith(b"data: 1\n\n")
+        assert bus.subscriber_count("hive_logs") == 0
+
+    def test_sse_frame_직렬화(self):
+        assert sse_frame('{"a": 1}') == b'data: {"a": 1}\n\n'
+        assert sse_frame({"msg": "하이브"}) == 'data: {"msg": "하이브"}\n\n'.encode("utf-8")
+
+
+def _ids(frames):
+    return [int(frame.split(b"\n", 1)[0][len(b"id: "):]) for frame in frames]
+
+
+class TestReplay:
+    """이벤트 id와 Last-Event-ID 재연결 복구."""
+
+    def test_id는_토픽별_단조_증가(self):
+        bus = EventBus()
+        sub = bus.subscribe("fs")
+        for i in range(3):
+            bus.publish_json("fs", {"i": i})
+        bus.publish_json("agent", {"x": 1})
+        ids = _ids(sub.drain(0))
+        assert ids == sorted(ids) and ids[1] == ids[0] + 1
+        assert bus.last_id("fs") == ids[-1]
+        assert sub.cursor_frame() == f"id: {sub.cursor}\n\n".encode()
+
+    def test_놓친_프레임만_복구(self):
+        bus = EventBus()
+        first = bus.subscribe("thoughts")
+        bus.publish_json("thoughts", {"n": 1})
+        seen = _ids(first.drain(0))[-1]
+        first.close()
+        for n in (2, 3):
+            bus.publish_json("thoughts", {"n": n})
+        resumed = bus.subscribe("thoughts", last_event_id=seen)
+        assert resumed.resumed
+        assert _ids(resumed.drain(0)) == [seen + 1, seen + 2]
+        assert bus.stats()["thoughts"]["resumed"] == 1
+
+    def test_최신_id로_재연결하면_재전송_없음(self):
+        bus = EventBus()
+        bus.publish_json("fs", {"n": 1})
+        sub = bus.subscribe("fs", last_event_id=bus.last_id("fs"))
+        assert sub.resumed and sub.drain(0) == []
+        fresh = EventBus()
+        assert fresh.subscribe("fs", last_event_id=fresh.last_id("fs")).resumed
+
+    def test_replay_범위_밖이면_스냅샷_필요(self):
+        bus = EventBus(default_replay_size=2)
+        start = bus.last_id("fs")
+        for n in range(5):
+            bus.publish_json("fs", {"n": n})
+        assert not bus.subscribe("fs", last_event_id=start + 1).resumed       # 링에서 밀려남
+        assert not bus.subscribe("fs", last_event_id=start - 10_000).resumed  # 이전 서버 실행의 id
+        assert not bus.subscribe("fs", last_event_id=start + 999).resumed     # 미래 id
+        assert bus.subscribe("fs", last_event_id=start + 3).resumed
+        assert bus.stats()["fs"]["snapshots"] == 3
+        assert bus.stats()["fs"]["replay"] == 2
+
+    def test_Last_Event_ID_파싱(self):
+        assert parse_last_event_id({"Last-Event-ID": " 42 "}) == 42
+        assert parse_last_event_id({"last-event-id": "7"}) == 7
+        assert parse_last_event_id({}, {"last_event_id": ["9"]}) == 9
+        assert parse_last_event_id({"Last-Event-ID": "abc"}) is None
+        assert parse_last_event_id(None) is None
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_file_store.py
+DESCRIPTION: src.file_store 공유 메모리 레코드 로그 단위 테스트.
+             upsert/get/delete/merge가 기존 JSON 배열 방식과 같은 결과를 내면서 한 줄 추가만 하는지,
+             열 때 인덱스 재구성(미완결 줄 무시, 다른 프로세스의 추가 반영), 기존 shared_memory.json
+             가져오기, 죽은 레코드 임계값 초과 시 압축을 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — append-only 레코드 로그 + key→오프셋 인덱스 도입
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src import file_store
+from src.file_store import (
+    MemoryLog,
+    delete_memory_entry,
+    get_memory_entry,
+    load_memory_entries,
+    memory_file,
+    merge_memory_files,
+    upsert_memory_entry,
+)
+
+
+def _entry(key, updated_at, **extra):
+    return {'key': key, 'content': f'{key} 내용', 'updated_at': updated_at, **extra}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stores(monkeypatch):
+    monkeypatch.setattr(file_store, '_STORES', {})
+
+
+class TestMemoryLog:
+    """공개 함수 동작."""
+
+    def test_upsert는_한_줄_추가하고_created_at_유지(self, tmp_path):
+        upsert_memory_entry(tmp_path, _entry('a', '2026-10-01T00:00:00', created_at='2026-09-01T00:00:00'))
+        size = memory_file(tmp_path).stat().st_size
+        saved = upsert_memory_entry(tmp_path, _entry('a', '2026-10-02T00:00:00', tags='x, y'))
+        assert saved['created_at'] == '2026-09-01T00:00:00' and saved['tags'] == ['x', 'y']
+        lines = memory_file(tmp_path).read_bytes().splitlines()
+        assert len(lines) == 2 and memory_file(tmp_path).stat().st_size > size
+        assert get_memory_entry(tmp_path, 'a')['updated_at'] == '2026-10-02T00:00:00'
+        assert get_memory_entry(tmp_path, '없음') is None
+
+    def test_목록은_updated_at_내림차순_삭제는_묘비(self, tmp_path):
+        for key, ts in (('a', '2026-10-01'), ('b', '2026-10-03'), ('c', '2026-10-02')):
+            upsert_memory_entry(tmp_path, _entry(key, ts))
+        assert [e['key'] for e in load_memory_entries(tmp_path)] == ['b', 'c', 'a']
+        assert delete_memory_entry(tmp_path, 'c') is True
+        assert delete_memory_entry(tmp_path, 'c') is False
+        assert [e['key'] for e in load_memory_entries(tmp_path)] == ['b', 'a']
+        assert json.loads(memory_file(tmp_path).read_bytes().splitlines()[-1]) == {'k': 'c', 'v': None}
+
+    def test_merge는_더_최신인_항목만_한_번에_추가(self, tmp_path):
+        source, target = tmp_path / 'src', tmp_path / 'dst'
+        upsert_memory_entry(source, _entry('a', '2026-10-05'))
+        upsert_memory_entry(source, _entry('b', '2026-10-01'))
+        upsert_memory_entry(target, _entry('b', '2026-10-02'))
+        assert merge_memory_files(source, target) == (1, 1)
+        assert [e['key'] for e in load_memory_entries(target)] == ['a', 'b']
+        assert get_memory_entry(target, 'b')['updated_at'] == '2026-10-02'
+
+    def test_기존_JSON_배열_가져오기(self, tmp_path):
+        legacy = [_entry('a', '2026-10-02', tags='["t"]'), _entry('a', '2026-10-01'), _entry('b', '2026-10-03'), 'x']
+        (tmp_path / 'shared_memory.json').write_text(json.dumps(legacy, ensure_ascii=False), encoding='utf-8')
+        entries = load_memory_entries(tmp_path)
+        assert [(e['key'], e['updated_at']) for e in entries] == [('b', '2026-10-03'), ('a', '2026-10-02')]
+        assert entries[1]['tags'] == ['t']
+        assert memory_file(tmp_path).exists()
+
+
+class TestIndex:
+    """인덱스 재구성 / 압축."""
+
+    def test_미완결_줄과_다른_프로세스_추가(self, tmp_path):
+        upsert_memory_entry(tmp_path, _entry('a', '2026-10-01'))
+        path = memory_file(tmp_path)
+        with open(path, 'ab') as f:                            # 다른 프로세스가 추가
+            f.write(json.dumps({'k': 'b', 'v': _entry('b', '2026-10-02')}).encode() + b'\n')
+            f.write(b'{"k": "c", "v": {"ke')                    # 쓰기 도중 중단
+        assert [e['key'] for e in load_memory_entries(tmp_path)] == ['b', 'a']
+        upsert_memory_entry(tmp_path, _entry('d', '2026-10-03'))
+        reopened = MemoryLog(path)                              # 새로 열어 재구성
+        assert [e['key'] for e in reopened.entries()] == ['d', 'b', 'a']
+        assert reopened.stats()['dead'] == 0
+
+    def test_죽은_레코드_임계값_초과시_압축(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(file_store, 'COMPACT_MIN_DEAD', 10)
+        store = file_store.memory_log(tmp_path)
+        upsert_memory_entry(tmp_path, _entry('keep', '2026-10-01'))
+        for n in range(10):
+            upsert_memory_entry(tmp_path, _entry('hot', f'2026-10-02T00:00:{n:02d}'))
+        assert (store.stats()['live'], store.stats()['dead'], store.compactions) == (2, 9, 0)
+        upsert_memory_entry(tmp_path, _entry('hot', '2026-10-02T00:00:10'))    # 죽은 레코드 10개 → 백그라운드 압축
+        deadline = time.time() + 5
+        while store.compactions == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        stats = store.stats()
+        assert (stats['live'], stats['dead'], stats['compactions']) == (2, 0, 1)
+        assert len(memory_file(tmp_path).read_bytes().splitlines()) == 2
+        assert [e['key'] for e in load_memory_entries(tmp_path)] == ['hot', 'keep']
+        assert get_memory_entry(tmp_path, 'hot')['updated_at'] == '2026-10-02T00:00:10'
+
+    def test_압축_중_다른_프로세스_추가는_잠금_뒤에_기록(self, tmp_path, monkeypatch):
+        upsert_memory_entry(tmp_path, _entry('a', '2026-10-01'))
+        upsert_memory_entry(tmp_path, _entry('a', '2026-10-02'))
+        path = memory_file(tmp_path)
+        compactor, other = MemoryLog(path), MemoryLog(path)     # 서로 다른 프로세스 흉내 (잠금 파일만 공유)
+        real_rewrite = compactor._rewrite
+        writers = []
+
+        def rewrite_with_concurrent_append(items):
+            # 살아 있는 항목을 읽은 뒤, 교체 직전에 다른 쪽이 추가를 시도
+            writer = threading.Thread(target=other.write, args=([('late', _entry('late', '2026-10-03'))],))
+            writer.start()
+            writer.join(0.2)
+            assert writer.is_alive()                            # 압축이 끝날 때까지 대기
+            writers.append(writer)
+            real_rewrite(items)
+
+        monkeypatch.setattr(compactor, '_rewrite', rewrite_with_concurrent_append)
+        compactor.compact()
+        writers[0].join(5)
+        assert [e['key'] for e in MemoryLog(path).entries()] == ['late', 'a']
+        assert len(path.read_bytes().splitlines()) == 2
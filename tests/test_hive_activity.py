@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_hive_activity.py
+DESCRIPTION: src.hive_activity 단위 테스트.
+             컴파일된 단일 정규식 분류가 기존 "dict 순서대로 any(kw in task)" 규칙과 같은 결과를 내는지,
+             링/타입별 인덱스 크기 제한과 최신순 조회, task_logs.jsonl 시드 순서를 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 하이브 활동 기록 시점 분류 도입
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.hive_activity import HIVE_KEYWORDS, HiveActivityFeed, classify
+
+
+def _classify_by_scan(agent: str, task: str):
+    """기존 /api/hive/activity의 읽기 시점 분류 (비교 기준)."""
+    if agent not in ('Hive', 'Claude', '사용자', 'Gemini'):
+        return None
+    for etype, keywords in HIVE_KEYWORDS.items():
+        if any(kw in task for kw in keywords):
+            return etype
+    return 'hive_ctx' if agent == 'Hive' else None
+
+
+class TestClassify:
+    """분류 규칙."""
+
+    def test_우선순위와_겹치는_키워드(self):
+        # '하이브 컨텍스트 자동 주입'은 hive_ctx 키워드지만 memory_read의 '하이브 컨텍스트'가 먼저
+        assert classify('Claude', '[하이브 컨텍스트 자동 주입] 완료') == 'memory_read'
+        # 뒤쪽에 나오는 키워드라도 우선순위가 높은 타입이 이김
+        assert classify('Claude', '응답 완료 후 스킬 실행 → 메모리 저장') == 'memory_write'
+        assert classify('Gemini', 'self heal 시작') == 'heal'
+        assert classify('Gemini', 'HEAL') is None            # 대소문자 구분 유지
+
+    def test_대상_에이전트와_Hive_기본값(self):
+        assert classify('Hive', '아무 작업') == 'hive_ctx'
+        assert classify('Claude', '아무 작업') is None
+        assert classify('Codex', '메모리 저장') is None
+
+    def test_무작위_입력에서_기존_스캔과_동일(self):
+        rng = random.Random(24)
+        pieces = [kw for kws in HIVE_KEYWORDS.values() for kw in kws] + ['작업', ' ', 'abc', '하이브', '→', '완료']
+        agents = ['Hive', 'Claude', '사용자', 'Gemini', 'Codex']
+        for _ in range(3000):
+            task = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 5)))
+            agent = rng.choice(agents)
+            assert classify(agent, task) == _classify_by_scan(agent, task), (agent, task)
+
+
+class TestFeed:
+    """링 / 타입별 인덱스 / 시드."""
+
+    def test_링_크기_제한과_최신순(self):
+        feed = HiveActivityFeed(maxlen=5)
+        for n in range(8):
+            feed.add('Claude', f'메모리 저장 {n}', timestamp=f't{n}')
+        feed.add('Claude', '관계없는 작업')
+        assert [e['timestamp'] for e in feed.recent()] == ['t7', 't6', 't5', 't4', 't3']
+        assert [e['timestamp'] for e in feed.recent(2)] == ['t7', 't6']
+        stats = feed.stats()
+        assert (stats['size'], stats['ingested'], stats['classified']) == (5, 9, 8)
+
+    def test_타입별_인덱스(self):
+        feed = HiveActivityFeed()
+        feed.add('Hive', '하트비트', timestamp='a')
+        feed.add('Claude', '스킬 체인 실행', timestamp='b')
+        feed.add('Gemini', '오케스트레이션 시작', timestamp='c')
+        assert [e['timestamp'] for e in feed.recent(event_type='orchestrate')] == ['c', 'b']
+        assert [e['timestamp'] for e in feed.recent(event_type='hive_ctx')] == ['a']
+        assert feed.recent(event_type='없는타입') == []
+        assert len(feed.add('Claude', '메모리 저장 ' + 'x' * 500)['task']) == 200
+
+    def test_시드는_새_이벤트보다_앞에(self, tmp_path):
+        path = tmp_path / 'task_logs.jsonl'
+        with open(path, 'w', encoding='utf-8') as f:
+            for n in range(6):
+                f.write(json.dumps({'timestamp': f's{n}', 'agent': 'Claude', 'task': f'메모리 저장 {n}'},
+                                   ensure_ascii=False) + '\n')
+            f.write('{"timestamp": "s6", "agent": "Codex", "task": "메모리 저장"}\n')
+            f.write('깨진 줄\n')
+        feed = HiveActivityFeed(seed_path=path, maxlen=4)
+        feed.add('Hive', '라이브 이벤트', timestamp='live')
+        assert [e['timestamp'] for e in feed.recent()] == ['live', 's5', 's4', 's3']
+        feed.add('Hive', '두 번째', timestamp='live2')         # 시드는 1회만
+        assert [e['timestamp'] for e in feed.recent()] == ['live2', 'live', 's5', 's4']
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_http_keepalive.py
+DESCRIPTION: HTTP/1.1 keep-alive 단위 테스트 — src.http_response.KeepAliveMixin + src.http_client.HTTPPool.
+             연속 요청이 TCP 연결 1개를 재사용하는지, 길이 없는 응답은 연결 종료로 끝나는지,
+             읽지 않은 POST 본문이 다음 요청을 오염시키지 않는지, 서버가 먼저 닫은 유휴 연결은
+             새 연결로 재시도하는지(요청을 보낸 뒤 끊긴 POST는 다시 보내지 않음), asyncio 모드(src.async_http)도 같은 연결로 여러 요청을 처리하는지 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — HTTP/1.1 keep-alive 도입
+- 2026-10-17: 응답 전에 끊긴 POST 재전송 금지 테스트 추가
+"""
+
+import http.client
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.async_http import AsyncHTTPServer
+from src.http_client import HTTPPool
+from src.http_response import KeepAliveMixin, send_json
+
+
+_DROPPED = []   # /drop이 처리한 요청 본문
+
+
+class _Handler(KeepAliveMixin, BaseHTTPRequestHandler):
+    def do_GET(self):
+        with self.buffered_body():
+            if self.path == "/legacy":
+                # Content-Length 없는 레거시 응답 — 연결 종료로 본문 끝 표시돼야 함
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain")
+                self.end_headers()
+                self.wfile.write(b"legacy body")
+                return
+            if self.path == "/big":
+                send_json(self, [{"n": i, "text": "하이브 로그"} for i in range(300)])
+                return
+            send_json(self, {"path": self.path, "port": self.client_address[1]})
+
+    def do_POST(self):
+        with self.buffered_body():
+            if self.path == "/drop":
+                # 요청을 처리한 뒤 응답 없이 연결 종료 (처리 직후 서버 재시작/크래시 흉내)
+                _DROPPED.append(self.rfile.read(int(self.headers["Content-Length"])))
+                self.close_connection = True
+                return
+            if self.path == "/ignore-body":
+                send_json(self, {"ignored": True})   # 본문을 읽지 않는 라우트
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            send_json(self, json.loads(self.rfile.read(length)))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ShortIdleHandler(_Handler):
+    timeout = 0.1
+
+
+def _serve(srv):
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+@pytest.fixture()
+def threaded():
+    srv = _serve(ThreadingHTTPServer(("127.0.0.1", 0), _Handler))
+    srv.daemon_threads = True
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture()
+def pool():
+    p = HTTPPool()
+    yield p
+    p.close()
+
+
+class TestKeepAlive:
+    """연결 재사용과 프레이밍 안전망."""
+
+    def test_연속_요청은_연결_하나를_재사용(self, threaded, pool):
+        ports = {pool.request("GET", f"{threaded}/api/{i}").json()["port"] for i in range(5)}
+        assert len(ports) == 1
+        assert pool.stats() == {"created": 1, "reused": 4, "idle": 1}
+
+    def test_길이_없는_응답은_연결_종료(self, threaded, pool):
+        resp = pool.request("GET", f"{threaded}/legacy")
+        assert resp.body == b"legacy body"
+        assert resp.headers["connection"] == "close"
+        assert pool.stats()["idle"] == 0
+        assert pool.request("GET", f"{threaded}/api/after").json()["path"] == "/api/after"
+
+    def test_읽지_않은_POST_본문이_다음_요청을_오염시키지_않음(self, threaded, pool):
+        body = json.dumps({"x": "y" * 5000}).encode("utf-8")
+        assert pool.request("POST", f"{threaded}/ignore-body", body=body).json() == {"ignored": True}
+        echoed = pool.request("POST", f"{threaded}/echo", body=b'{"k": 1}').json()
+        assert echoed == {"k": 1}
+        assert pool.request("GET", f"{threaded}/api/z").json()["path"] == "/api/z"
+        assert pool.stats()["created"] == 1
+
+    def test_gzip_응답_자동_해제(self, threaded, pool):
+        resp = pool.request("GET", f"{threaded}/big")
+        assert resp.headers["content-encoding"] == "gzip"
+        assert int(resp.headers["content-length"]) < len(resp.body)
+        assert resp.json()[299]["text"] == "하이브 로그"
+
+    def test_서버가_닫은_유휴_연결은_새_연결로_재시도(self, pool):
+        srv = _serve(ThreadingHTTPServer(("127.0.0.1", 0), _ShortIdleHandler))
+        base = f"http://127.0.0.1:{srv.server_address[1]}"
+        try:
+            pool.request("GET", f"{base}/api/a")
+            time.sleep(_ShortIdleHandler.timeout * 3)   # 서버가 유휴 타임아웃으로 연결을 닫음
+            assert pool.request("GET", f"{base}/api/b").json()["path"] == "/api/b"
+            assert pool.stats()["created"] == 2
+        finally:
+            srv.shutdown()
+            srv.server_close()
+
+    def test_응답_전에_끊긴_POST는_다시_보내지_않음(self, threaded, pool):
+        _DROPPED.clear()
+        pool.request("GET", f"{threaded}/api/warm")             # 재사용될 유휴 연결 1개
+        with pytest.raises(http.client.RemoteDisconnected):
+            pool.request("POST", f"{threaded}/drop", body=b'{"n": 1}')
+        assert _DROPPED == [b'{"n": 1}']                          # 서버는 연결을 닫기 전에 기록
+        assert pool.stats()["created"] == 1
+
+
+class TestAsyncKeepAlive:
+    """asyncio 모드도 한 연결에서 여러 요청 처리."""
+
+    def test_asyncio_서버_연결_재사용(self, pool):
+        srv = _serve(AsyncHTTPServer(("127.0.0.1", 0), _Handler, max_workers=2))
+        base = f"http://127.0.0.1:{srv.server_address[1]}"
+        try:
+            for i in range(3):
+                assert pool.request("GET", f"{base}/api/{i}").json()["path"] == f"/api/{i}"
+            assert pool.request("POST", f"{base}/echo", body=b'{"a": 2}').json() == {"a": 2}
+            assert pool.stats()["created"] == 1
+            resp = pool.request("GET", f"{base}/legacy")
+            assert resp.body == b"legacy body" and resp.headers["connection"] == "close"
+        finally:
+            srv.shutdown()
+            srv.server_close()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_http_response.py
+DESCRIPTION: src.http_response 공용 응답 작성기 단위 테스트.
+             임계값 이상 JSON만 gzip, Accept-Encoding 미지원/q=0이면 원본,
+             Content-Length가 항상 실제 전송 바이트와 일치하는지 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — JSON 응답 협상 압축 도입
+"""
+
+import gzip
+import io
+import json
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src import http_response
+from src.http_response import COMPRESS_MIN_BYTES, send_body, send_json
+
+
+class _Handler:
+    """BaseHTTPRequestHandler의 응답 작성 메서드만 흉내."""
+
+    def __init__(self, accept_encoding=None):
+        self.headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+        self.status = None
+        self.sent = {}
+        self.wfile = io.BytesIO()
+
+    def send_response(self, code):
+        self.status = code
+
+    def send_header(self, name, value):
+        self.sent[name] = value
+
+    def end_headers(self):
+        pass
+
+
+_LARGE = [{"agent": "claude", "task": "한글 작업 설명 " * 4, "n": i} for i in range(200)]
+
+
+class TestSendJson:
+    """압축 협상과 길이 헤더."""
+
+    def test_큰_본문은_gzip_협상(self):
+        h = _Handler("gzip, deflate, br")
+        send_json(h, _LARGE)
+        body = h.wfile.getvalue()
+        assert h.sent["Content-Encoding"] == "gzip"
+        assert h.sent["Vary"] == "Accept-Encoding"
+        assert int(h.sent["Content-Length"]) == len(body)
+        assert json.loads(gzip.decompress(body)) == _LARGE
+
+    def test_gzip_미지원이면_원본_그대로(self):
+        for accept in (None, "br", "gzip;q=0"):
+            h = _Handler(accept)
+            send_json(h, _LARGE)
+            body = h.wfile.getvalue()
+            assert "Content-Encoding" not in h.sent
+            assert int(h.sent["Content-Length"]) == len(body)
+            assert json.loads(body) == _LARGE
+
+    def test_작은_본문은_압축하지_않음(self):
+        h = _Handler("gzip")
+        send_json(h, {"status": "success"}, 503)
+        assert h.status == 503
+        assert "Content-Encoding" not in h.sent and "Vary" not in h.sent
+        assert len(h.wfile.getvalue()) < COMPRESS_MIN_BYTES
+        assert h.sent["Access-Control-Allow-Origin"] == "*"
+
+    def test_한글은_이스케이프_없이_UTF8(self):
+        h = _Handler()
+        send_json(h, {"msg": "하이브"}, cors=False)
+        assert "하이브".encode("utf-8") in h.wfile.getvalue()
+        assert "Access-Control-Allow-Origin" not in h.sent
+
+    def test_비텍스트_본문은_압축하지_않음(self):
+        h = _Handler("gzip")
+        payload = b"\x89PNG" + b"\x00" * 4096
+        send_body(h, payload, "image/png")
+        assert "Content-Encoding" not in h.sent
+        assert h.wfile.getvalue() == payload
+
+    def test_통계_집계(self):
+        before = http_response.stats()
+        send_json(_Handler("gzip"), _LARGE)
+        after = http_response.stats()
+        assert after["responses"] == before["responses"] + 1
+        assert after["compressed"] == before["compressed"] + 1
+        assert after["bytes_out"] - before["bytes_out"] < after["bytes_in"] - before["bytes_in"]
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_itcp_claim.py
+DESCRIPTION: itcp.receive() 원자적 claim-and-read 단위 테스트.
+             receive()가 SELECT+UPDATE 2단계 대신 itcp_claim() 단일 호출을 쓰는지,
+             peek 모드는 상태를 바꾸지 않는지, 스키마 미생성 시 한 번 재시도하는지 검증합니다.
+             (스키마 미생성 경로는 subprocess.run 수준의 psql 흉내로 — 오류에도 종료 코드 0인 실제 동작 재현)
+
+             [테스트 전략]
+             - _ensure_pg_running()은 True로, _run_psql()은 SQL을 기록하는 가짜로 대체
+             - 실제 동시성(SKIP LOCKED) 검증은 scripts/bench_itcp_claim.py (PostgreSQL 필요)
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — itcp_claim() / 브로드캐스트 커서 도입
+- 2026-10-17: 스키마 미생성 테스트를 실제 psql 종료 코드 동작(오류에도 0 + stderr)으로 변경
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / "scripts"))
+
+import itcp
+
+_CSV = (
+    '3,gemini,claude,debug,info,"버그 발견\n두 번째 줄",2026-10-17 10:00:00+09\n'
+    '4,codex,all,broadcast,broadcast,"빌드 완료, 확인 요청",2026-10-17 10:00:01+09'
+)
+
+
+@pytest.fixture()
+def psql(monkeypatch):
+    """_run_psql 호출을 기록하고 outputs 순서대로 결과를 반환하는 가짜."""
+    calls = []
+    outputs = []
+
+    def _fake(sql, timeout=5, stop_on_error=False):
+        calls.append(sql)
+        return outputs.pop(0) if outputs else (True, "")
+
+    monkeypatch.setattr(itcp, "_ensure_pg_running", lambda: True)
+    monkeypatch.setattr(itcp, "_run_psql", _fake)
+    monkeypatch.setattr(itcp, "_SCHEMA_READY", False)
+    return calls, outputs
+
+
+class TestReceiveClaim:
+    """mark_read=True 경로: itcp_claim() 한 번 호출로 claim."""
+
+    def test_단일_호출로_claim하고_csv를_파싱함(self, psql):
+        calls, outputs = psql
+        outputs.append((True, _CSV))
+        messages = itcp.receive("claude")
+        assert calls == ["SELECT * FROM itcp_claim('claude', 20);"]
+        assert [m["id"] for m in messages] == ["3", "4"]
+        assert messages[0]["content"] == "버그 발견\n두 번째 줄"
+        assert messages[1]["to_agent"] == "all"
+
+    def test_수신자_이름의_따옴표는_이스케이프됨(self, psql):
+        calls, _ = psql
+        itcp.receive("o'neil")
+        assert "itcp_claim('o''neil', 20)" in calls[0]
+
+    def test_스키마가_준비된_뒤의_실패는_재시도하지_않음(self, psql, monkeypatch):
+        calls, outputs = psql
+        monkeypatch.setattr(itcp, "_SCHEMA_READY", True)
+        outputs.append((False, ""))
+        assert itcp.receive("claude") == []
+        assert len(calls) == 1
+
+
+class _FakePsql:
+    """psql.exe 흉내 — SQL 오류 시 stderr에 메시지, 종료 코드는 ON_ERROR_STOP=1일 때만 3 (아니면 0)."""
+
+    def __init__(self, schema_ok=True):
+        self.schema_ok = schema_ok
+        self.schema_created = False
+        self.calls = []
+
+    def __call__(self, args, input="", **kwargs):
+        self.calls.append(input)
+        stop_on_error = "ON_ERROR_STOP=1" in args
+        error = ""
+        stdout = ""
+        if "CREATE OR REPLACE FUNCTION itcp_claim" in input:
+            if self.schema_ok:
+                self.schema_created = True
+            else:
+                error = 'ERROR:  relation "pg_messages" does not exist'
+        elif not self.schema_created:
+            error = "ERROR:  function itcp_claim(unknown, integer) does not exist"
+        else:
+            stdout = _CSV
+        code = 3 if error and stop_on_error else 0
+        return subprocess.CompletedProcess(args, code, stdout=stdout, stderr=error)
+
+
+@pytest.fixture()
+def fake_psql(monkeypatch, tmp_path):
+    """_run_psql은 그대로 두고 subprocess.run만 psql 흉내로 대체."""
+    fake = _FakePsql()
+    psql_exe = tmp_path / "psql.exe"
+    psql_exe.write_text("")
+    monkeypatch.setattr(itcp, "_PG_BIN", psql_exe)
+    monkeypatch.setattr(itcp, "_ensure_pg_running", lambda: True)
+    monkeypatch.setattr(itcp, "_SCHEMA_READY", False)
+    monkeypatch.setattr(itcp.subprocess, "run", fake)
+    return fake
+
+
+class TestSchemaBootstrap:
+    """스키마 미생성 설치본: psql은 오류에도 0으로 끝나므로 ON_ERROR_STOP으로 감지해야 함."""
+
+    def test_스키마_없으면_생성후_한번_재시도(self, fake_psql):
+        messages = itcp.receive("claude")
+        assert len(fake_psql.calls) == 3
+        assert "CREATE OR REPLACE FUNCTION itcp_claim" in fake_psql.calls[1]
+        assert [m["id"] for m in messages] == ["3", "4"]
+        assert itcp._SCHEMA_READY is True
+
+    def test_스키마_생성_실패는_준비됨으로_표시하지_않음(self, fake_psql, capsys):
+        fake_psql.schema_ok = False
+        assert itcp.ensure_schema() is False
+        assert itcp._SCHEMA_READY is False
+        assert "does not exist" in capsys.readouterr().err
+        assert itcp.receive("claude") == []                  # 다음 호출에서 다시 생성 시도
+        assert sum("CREATE OR REPLACE FUNCTION" in sql for sql in fake_psql.calls) == 2
+
+
+class TestReceivePeek:
+    """mark_read=False 경로: 읽음 처리/커서 전진 없이 조회만."""
+
+    def test_peek은_상태를_변경하지_않음(self, psql):
+        calls, outputs = psql
+        outputs.append((True, _CSV))
+        messages = itcp.receive("claude", mark_read=False)
+        assert len(messages) == 2
+        sql = calls[0].upper()
+        assert "ITCP_CLAIM" not in sql
+        assert "UPDATE" not in sql and "INSERT" not in sql
+        assert "PG_MESSAGE_CURSORS" in sql
+
+
+class TestSchemaSql:
+    """요청 사항이 스키마 SQL에 반영되어 있는지 확인."""
+
+    def test_부분_인덱스와_skip_locked_claim(self):
+        sql = itcp._SCHEMA_SQL
+        assert "ON pg_messages (to_agent) WHERE NOT is_read" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING" in sql
+        assert "pg_message_cursors" in sql
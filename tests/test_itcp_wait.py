@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_itcp_wait.py
+DESCRIPTION: itcp.wait_for_messages() 롱폴링 단위 테스트.
+             LISTEN 연결 없이 _MessageListener의 대기/깨우기 로직과
+             psycopg2 미설치 시 폴링 폴백을 검증합니다.
+
+             [테스트 전략]
+             - receive()는 모킹하여 호출 순서대로 준비된 결과 반환
+             - 리스너 스레드는 시작하지 않고 _notify()를 직접 호출하여 NOTIFY 도착을 재현
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — LISTEN/NOTIFY 구독 모드 도입
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / "scripts"))
+
+import itcp
+
+_MSG = {"id": "1", "from_agent": "gemini", "to_agent": "claude", "channel": "debug",
+        "msg_type": "info", "content": "버그 발견", "ts": "2026-10-17"}
+
+
+def _scripted_receive(results: list):
+    """호출될 때마다 results에서 하나씩 꺼내 반환하는 가짜 receive()."""
+    calls = []
+
+    def _receive(terminal_name, mark_read=True):
+        calls.append(terminal_name)
+        return results.pop(0) if results else []
+
+    return _receive, calls
+
+
+@pytest.fixture()
+def listener(monkeypatch):
+    """스레드 없이 동작하는 리스너 — ensure_started()는 항상 연결됨으로 간주."""
+    lst = itcp._MessageListener()
+    monkeypatch.setattr(lst, "ensure_started", lambda timeout=3.0: True)
+    monkeypatch.setattr(itcp, "_get_listener", lambda: lst)
+    return lst
+
+
+class TestWaitForMessages:
+    """NOTIFY 기반 대기와 폴백 폴링 검증."""
+
+    def test_이미_쌓인_메시지는_즉시_반환(self, listener, monkeypatch):
+        fake, calls = _scripted_receive([[_MSG]])
+        monkeypatch.setattr(itcp, "receive", fake)
+        assert itcp.wait_for_messages("claude", timeout=5) == [_MSG]
+        assert len(calls) == 1
+
+    def test_notify_도착시_대기중인_호출이_깨어남(self, listener, monkeypatch):
+        fake, calls = _scripted_receive([[], [_MSG]])
+        monkeypatch.setattr(itcp, "receive", fake)
+        threading.Timer(0.1, listener._notify, args=[["claude"]]).start()
+        started = time.monotonic()
+        assert itcp.wait_for_messages("claude", timeout=5) == [_MSG]
+        assert time.monotonic() - started < 2
+
+    def test_all_브로드캐스트도_깨움(self, listener, monkeypatch):
+        fake, _ = _scripted_receive([[], [_MSG]])
+        monkeypatch.setattr(itcp, "receive", fake)
+        threading.Timer(0.1, listener._notify, args=[["all"]]).start()
+        assert itcp.wait_for_messages("claude", timeout=5) == [_MSG]
+
+    def test_다른_수신자_notify는_무시하고_timeout(self, listener, monkeypatch):
+        fake, calls = _scripted_receive([[], [_MSG]])
+        monkeypatch.setattr(itcp, "receive", fake)
+        threading.Timer(0.05, listener._notify, args=[["gemini"]]).start()
+        assert itcp.wait_for_messages("claude", timeout=0.3) == []
+        assert len(calls) == 1
+
+    def test_psycopg2없으면_폴링으로_폴백(self, monkeypatch):
+        monkeypatch.setattr(itcp, "_get_listener", lambda: None)
+        monkeypatch.setattr(itcp, "_POLL_FALLBACK_SEC", 0.05)
+        fake, calls = _scripted_receive([[], [], [_MSG]])
+        monkeypatch.setattr(itcp, "receive", fake)
+        assert itcp.wait_for_messages("claude", timeout=5) == [_MSG]
+        assert len(calls) == 3
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_jsonl_tail.py
+DESCRIPTION: src.jsonl_tail 단위 테스트.
+             역방향 블록 읽기가 전체 읽기(splitlines)와 같은 결과를 최신순으로 내는지 — 블록 경계에 걸린 줄과
+             한글(다바이트) 문자, 끝 개행 없음, 빈 줄/깨진 JSON, CRLF — 그리고 limit / predicate / max_lines로
+             필요한 만큼만 읽고 멈추는지 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — JSONL 역방향 tail 리더 도입
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src import jsonl_tail
+from src.jsonl_tail import iter_lines_reverse, iter_records, tail_lines, tail_records
+
+
+def _write(path: Path, records, trailing_newline=True) -> Path:
+    text = "\n".join(json.dumps(r, ensure_ascii=False) for r in records)
+    path.write_text(text + ("\n" if trailing_newline else ""), encoding="utf-8")
+    return path
+
+
+@pytest.fixture()
+def log(tmp_path):
+    records = [{"n": n, "agent": "Claude" if n % 3 else "Gemini", "task": f"하이브 작업 {n} " + "가" * (n % 7)}
+               for n in range(200)]
+    return _write(tmp_path / "task_logs.jsonl", records), records
+
+
+class TestReverseLines:
+    """블록 경계 / 다바이트 / 개행 처리."""
+
+    @pytest.mark.parametrize("block_size", [1, 2, 3, 7, 64, 1 << 16])
+    def test_전체_읽기와_같은_결과_최신순(self, log, block_size):
+        path, _ = log
+        expected = [l for l in path.read_text(encoding="utf-8").splitlines() if l.strip()][::-1]
+        assert list(iter_lines_reverse(path, block_size)) == expected
+
+    def test_끝_개행_없음(self, tmp_path):
+        path = _write(tmp_path / "a.jsonl", [{"n": 1}, {"n": 2}], trailing_newline=False)
+        assert [r["n"] for r in iter_records(path, block_size=4)] == [2, 1]
+
+    def test_빈_줄_깨진_JSON_CRLF_건너뜀(self, tmp_path):
+        path = tmp_path / "b.jsonl"
+        path.write_bytes(b'{"n": 1}\r\n\r\n{broken\n   \n{"n": 2}\r\n{"n": 3, "task": "\xec\x93\xb0')
+        assert [r["n"] for r in iter_records(path, block_size=5)] == [2, 1]
+
+    def test_파일_없음(self, tmp_path):
+        assert tail_records(tmp_path / "missing.jsonl", 10) == []
+        assert tail_lines(tmp_path / "missing.jsonl", 10) == []
+
+
+class TestTailRecords:
+    """limit / predicate / max_lines."""
+
+    def test_limit(self, log):
+        path, records = log
+        assert tail_records(path, 5) == records[-5:][::-1]
+        assert tail_records(path, 500) == records[::-1]
+        assert tail_records(path, 0) == []
+
+    def test_predicate(self, log):
+        path, records = log
+        wanted = [r for r in records if r["agent"] == "Gemini"][-4:][::-1]
+        assert tail_records(path, 4, lambda r: r["agent"] == "Gemini") == wanted
+
+    def test_max_lines는_훑는_줄_수_제한(self, log):
+        path, records = log
+        found = tail_records(path, 100, lambda r: r["agent"] == "Gemini", max_lines=30)
+        assert found == [r for r in records[-30:] if r["agent"] == "Gemini"][::-1]
+
+    def test_limit을_채우면_앞쪽_블록은_읽지_않음(self, tmp_path, monkeypatch):
+        path = _write(tmp_path / "big.jsonl", [{"n": n, "task": "x" * 100} for n in range(5000)])
+        reads = []
+        real_open = open
+
+        class _Spy:
+            def __init__(self, f):
+                self._f = f
+
+            def read(self, n):
+                reads.append(n)
+                return self._f.read(n)
+
+            def __getattr__(self, name):
+                return getattr(self._f, name)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+        monkeypatch.setattr(jsonl_tail, "open", lambda *a, **kw: _Spy(real_open(*a, **kw)), raising=False)
+        assert [r["n"] for r in tail_records(path, 2)] == [4999, 4998]
+        assert path.stat().st_size > 4 * jsonl_tail.BLOCK_SIZE
+        assert reads == [jsonl_tail.BLOCK_SIZE]                  # 마지막 블록 1개만 읽음
+
+    def test_tail_lines는_원문_그대로(self, log):
+        path, records = log
+        assert [json.loads(l) for l in tail_lines(path, 3)] == records[-3:][::-1]
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_live_index.py
+DESCRIPTION: src.live_index.LiveRunIndex 단위 테스트.
+             새로 추가된 줄만 파싱하는지(쓰기 도중인 마지막 줄은 보류), 잘림 / 로테이션(inode 변경) /
+             같은 경로 재작성 시 처음부터 다시 읽는지, 터미널별 최신 started·done 집계와 10분 cutoff,
+             run_id별 정리된 task · 미리보기 3줄 · 터미널별 최근 20개 그룹화와 캐시를 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — agent_live.jsonl 증분 인덱스 도입
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.live_index import LiveRunIndex, clean_task
+
+
+def _ts(seconds_ago: float = 0) -> str:
+    return datetime.fromtimestamp(time.time() - seconds_ago).isoformat()
+
+
+def _append(path: Path, *events, raw: str = "") -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for ev in events:
+            f.write(json.dumps(ev, ensure_ascii=False) + "\n")
+        f.write(raw)
+
+
+def _started(rid, tid="T1", task="코드 리뷰", seconds_ago=30):
+    return {"type": "started", "run_id": rid, "terminal_id": tid, "task": task, "cli": "claude",
+            "ts": _ts(seconds_ago)}
+
+
+@pytest.fixture()
+def live(tmp_path):
+    path = tmp_path / "agent_live.jsonl"
+    return path, LiveRunIndex(path)
+
+
+class TestIncremental:
+    """오프셋 추적 / 잘림 / 로테이션."""
+
+    def test_새_줄만_파싱(self, live):
+        path, index = live
+        _append(path, _started("r1"), {"type": "output", "run_id": "r1", "line": "첫 줄"})
+        index.refresh()
+        assert index.stats()["lines_parsed"] == 2
+        index.refresh()                                   # 변경 없음 → 다시 읽지 않음
+        assert index.stats()["lines_parsed"] == 2
+        _append(path, {"type": "done", "run_id": "r1", "terminal_id": "T1", "ts": _ts(5)})
+        index.refresh()
+        assert index.stats()["lines_parsed"] == 3
+        assert index.live_runs()["T1"][0]["status"] == "done"
+
+    def test_쓰기_도중인_줄은_다음_refresh에서(self, live):
+        path, index = live
+        line = json.dumps(_started("r1", task="부분 기록 작업"), ensure_ascii=False)
+        _append(path, raw=line[:20])
+        assert index.live_runs() == {}
+        _append(path, raw=line[20:] + "\n")
+        assert index.live_runs()["T1"][0]["task"] == "부분 기록 작업"
+
+    def test_잘림은_처음부터(self, live):
+        path, index = live
+        _append(path, _started("r1"), _started("r2", tid="T2"))
+        assert set(index.live_runs()) == {"T1", "T2"}
+        path.write_text("")
+        _append(path, _started("r3", tid="T3"))
+        assert set(index.live_runs()) == {"T3"}
+        assert index.stats()["resets"] == 1
+
+    def test_로테이션은_새_파일부터(self, live):
+        path, index = live
+        _append(path, _started("r1"))
+        index.refresh()
+        rotated = path.with_name("agent_live.new")
+        _append(rotated, *[_started(f"n{i}", tid="T4", task=f"새 파일 작업 {i}") for i in range(5)])
+        os.replace(rotated, path)                          # 더 큰 새 파일로 교체
+        runs = index.live_runs()
+        assert set(runs) == {"T4"} and len(runs["T4"]) == 5
+
+    def test_같은_경로에_다시_쓰면_감지(self, live):
+        path, index = live
+        _append(path, _started("r1", task="이전 내용"))
+        index.refresh()
+        with open(path, "w", encoding="utf-8") as f:      # 같은 inode, 더 긴 내용
+            for ev in (_started("x1", tid="T5", task="새 내용 하나"), _started("x2", tid="T5", task="새 내용 둘")):
+                f.write(json.dumps(ev, ensure_ascii=False) + "\n")
+        assert [r["task"] for r in index.live_runs()["T5"]] == ["새 내용 둘", "새 내용 하나"]
+        assert "T1" not in index.live_runs()
+
+    def test_파일_삭제되면_빈_상태(self, live):
+        path, index = live
+        _append(path, _started("r1"))
+        assert index.live_runs()
+        path.unlink()
+        assert index.live_runs() == {} and index.terminal_events() == {}
+
+
+class TestAggregates:
+    """터미널 집계 / run 집계."""
+
+    def test_터미널별_최신_started_done과_cutoff(self, live):
+        path, index = live
+        _append(path,
+                _started("a", tid="T1", seconds_ago=120),
+                {"type": "done", "run_id": "a", "terminal_id": "T1", "ts": _ts(60)},
+                _started("b", tid="T1", seconds_ago=30),
+                _started("old", tid="T2", seconds_ago=700),
+                {"type": "started", "run_id": "c", "terminal": "T3", "task": "셸 실행", "ts": _ts(10)},
+                {"type": "started", "run_id": "d", "terminal_id": 4, "task": "숫자 id", "ts": _ts(10)})
+        events = index.terminal_events(cutoff=600)
+        assert events["T1"]["last_started"]["run_id"] == "b"
+        assert events["T1"]["last_done"]["run_id"] == "a"
+        assert "T2" not in events                          # 10분 초과
+        assert events["T3"]["last_started"]["run_id"] == "c"
+        assert set(events) == {"T1", "T3"}
+
+    def test_run_미리보기_3줄과_task_정리(self, live):
+        path, index = live
+        _append(path,
+                _started("r1", task="\x1b[31m]11;rgb:1e1e/1e1e/1e1e\\[?1;2c'버그 수정해줘'"),
+                *[{"type": "output", "run_id": "r1", "line": f" 출력 {n} "} for n in range(5)],
+                _started("noise", task="\x1b[0m[O rgb"),
+                {"type": "error", "run_id": "r1", "terminal_id": "T6", "status": "failed"})
+        runs = index.live_runs()
+        assert runs == {"T6": [{"run_id": "r1", "task": "버그 수정해줘", "cli": "claude", "status": "failed",
+                                "ts": runs["T6"][0]["ts"], "output_preview": ["출력 0", "출력 1", "출력 2"]}]}
+
+    def test_터미널별_최근_20개_최신순_캐시(self, live):
+        path, index = live
+        _append(path, *[_started(f"r{n}", task=f"작업 {n}") for n in range(25)])
+        first = index.live_runs()
+        assert [r["run_id"] for r in first["T1"]][:3] == ["r24", "r23", "r22"]
+        assert len(first["T1"]) == 20
+        assert index.live_runs() is first                  # 변경 없으면 같은 결과 재사용
+        _append(path, _started("r25", task="작업 25"))
+        assert index.live_runs()["T1"][0]["run_id"] == "r25"
+
+    def test_run_상한_초과시_오래된_것부터(self, tmp_path):
+        path = tmp_path / "agent_live.jsonl"
+        index = LiveRunIndex(path, max_runs=3)
+        _append(path, *[_started(f"r{n}", tid=f"T{n}", task=f"작업 {n}") for n in range(5)])
+        assert sorted(index.live_runs()) == ["T2", "T3", "T4"]
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("정상 작업", "정상 작업"),
+        ("\x1b[32mrefactor\x1b[0m", "refactor"),
+        ("]11;rgb:0000/0000/0000\\", ""),
+        ("abc", ""),
+    ])
+    def test_clean_task(self, raw, expected):
+        assert clean_task(raw) == expected
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_log_segments.py
+DESCRIPTION: src.log_segments 단위 테스트.
+             크기/기간 기준 회전, 유예 시간이 지난 세그먼트만 압축(zstd 미설치 시 gzip), manifest의
+             세그먼트별 시간 범위, 개수/일수 보존 정책, 그리고 src.jsonl_tail 역방향 리더와
+             src.live_index 증분 인덱스가 회전된 세그먼트를 투명하게 이어 읽는지 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — JSONL 로그 세그먼트 관리 도입
+"""
+
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src import log_segments
+from src.jsonl_tail import tail_lines, tail_records
+from src.live_index import LiveRunIndex
+from src.log_segments import LogSegmentManager, SegmentedLog, SegmentPolicy, closed_segments
+
+NOW = datetime(2026, 10, 17, 12, 0, 0).timestamp()
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch).isoformat()
+
+
+def _append(path: Path, start: int, count: int, field="timestamp", at=NOW, step=60.0) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for n in range(start, start + count):
+            f.write(json.dumps({field: _iso(at + (n - start) * step), "n": n, "task": "하이브 작업"},
+                               ensure_ascii=False) + "\n")
+
+
+@pytest.fixture()
+def log_path(tmp_path):
+    return tmp_path / "task_logs.jsonl"
+
+
+class TestRotation:
+    """회전 / 압축 / manifest."""
+
+    def test_크기_초과시_번호_세그먼트로_회전(self, log_path):
+        log = SegmentedLog(log_path, SegmentPolicy(max_bytes=2000, max_age=None, compress=None))
+        _append(log_path, 0, 10)
+        assert log.maintain(NOW)["rotated"] is False
+        _append(log_path, 10, 40, at=NOW + 600)
+        assert log.maintain(NOW)["rotated"] is True
+        assert not log_path.exists()
+        [entry] = log.segments()
+        assert entry["file"] == "000001.jsonl" and entry["records"] == 50
+        assert (entry["first_ts"], entry["last_ts"]) == (_iso(NOW), _iso(NOW + 49 * 60))
+
+    def test_첫_레코드가_오래되면_회전(self, log_path):
+        log = SegmentedLog(log_path, SegmentPolicy(max_age=3600, compress=None))
+        _append(log_path, 0, 3, at=NOW - 1800)
+        assert log.maintain(NOW)["rotated"] is False
+        assert log.maintain(NOW + 1800)["rotated"] is True
+
+    def test_유예_후_압축_zstd_없으면_gzip(self, log_path, monkeypatch):
+        monkeypatch.setattr(log_segments, "zstandard", None)
+        log = SegmentedLog(log_path, SegmentPolicy(compress="zstd", compress_after=60))
+        _append(log_path, 0, 20)
+        log.rotate(NOW)
+        assert log.maintain(NOW + 30)["compressed"] == 0       # 늦은 기록자 유예
+        _append(log.directory / "000001.jsonl", 20, 1)          # 회전 직전에 연 기록자가 뒤늦게 씀
+        assert log.maintain(NOW + 61)["compressed"] == 1
+        [entry] = log.segments()
+        assert entry["file"] == "000001.jsonl.gz" and entry["compressed"] == "gzip"
+        assert entry["records"] == 21 and entry["stored_bytes"] < entry["bytes"]
+        assert not (log.directory / "000001.jsonl").exists()
+        assert log_segments.read_segment_bytes(log.directory / entry["file"]).count(b"\n") == 21
+
+    def test_보존_개수와_일수(self, log_path):
+        log = SegmentedLog(log_path, SegmentPolicy(compress=None, keep_segments=3, keep_days=10))
+        for day in range(5):
+            _append(log_path, day * 10, 10, at=NOW - (20 - day) * 86400)
+            log.rotate(NOW)
+        result = log.maintain(NOW)
+        # 개수 초과 2개 삭제, 남은 3개 중 마지막 레코드가 10일보다 오래된 것(16~18일 전)도 삭제
+        assert result["removed"] == 5 and log.segments() == []
+        for day in range(4):
+            _append(log_path, day, 1, at=NOW - day * 86400)
+            log.rotate(NOW)
+        log.maintain(NOW)
+        assert [s["seq"] for s in log.segments()] == [7, 8, 9]
+        assert sorted(p.name for p in log.directory.glob("*.jsonl")) == ["000007.jsonl", "000008.jsonl", "000009.jsonl"]
+
+    def test_관리자는_로그별_실패를_격리(self, tmp_path, monkeypatch):
+        manager = LogSegmentManager()
+        good = manager.add("task_logs", tmp_path / "task_logs.jsonl", SegmentPolicy(max_bytes=10, compress=None))
+        bad = manager.add("agent_runs", tmp_path / "agent_runs.jsonl")
+        monkeypatch.setattr(bad, "maintain", lambda now=None: 1 / 0)
+        _append(good.path, 0, 2)
+        results = manager.run_once(NOW)
+        assert results["task_logs"]["rotated"] is True and "agent_runs" not in results
+        assert manager.stats()["agent_runs"]["last_error"] == "division by zero"
+
+
+class TestReadersSpanSegments:
+    """tail 리더 / 증분 인덱스가 세그먼트를 이어 읽음."""
+
+    def test_tail은_활성_파일_다음_세그먼트로(self, log_path):
+        log = SegmentedLog(log_path, SegmentPolicy(compress="gzip", compress_after=0))
+        _append(log_path, 0, 5)
+        log.rotate(NOW)
+        log.maintain(NOW)                                       # 000001 → gzip
+        _append(log_path, 5, 5)
+        log.rotate(NOW)                                         # 000002 (원본)
+        _append(log_path, 10, 3)
+        assert [r["n"] for r in tail_records(log_path, 100)] == list(range(12, -1, -1))
+        assert [r["n"] for r in tail_records(log_path, 4)] == [12, 11, 10, 9]
+        assert len(tail_lines(log_path, 7)) == 7
+        assert [p.name for p in closed_segments(log_path)] == ["000002.jsonl", "000001.jsonl.gz"]
+
+    def test_활성_파일이_없어도_세그먼트에서(self, log_path):
+        log = SegmentedLog(log_path, SegmentPolicy(compress=None))
+        _append(log_path, 0, 3)
+        log.rotate(NOW)
+        assert [r["n"] for r in tail_records(log_path, 2)] == [2, 1]
+
+    def test_증분_인덱스는_회전을_따라감(self, tmp_path):
+        path = tmp_path / "agent_live.jsonl"
+        index = LiveRunIndex(path)
+        now = time.time()
+
+        def started(rid, tid, task):
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"type": "started", "run_id": rid, "terminal_id": tid, "task": task,
+                                    "ts": _iso(now - 5)}, ensure_ascii=False) + "\n")
+
+        started("r1", "T1", "회전 전 작업")
+        index.refresh()
+        started("r2", "T2", "회전 직전 작업")                  # 인덱스가 읽기 전에 회전됨
+        SegmentedLog(path, SegmentPolicy(compress=None)).rotate()
+        started("r3", "T3", "회전 후 작업")
+        runs = index.live_runs()
+        assert sorted(runs) == ["T1", "T2", "T3"]
+        assert set(index.terminal_events()) == {"T1", "T2", "T3"}
+        assert index.stats()["rotations_followed"] == 1 and index.stats()["resets"] == 0
+
+    def test_회전_후_다음_기록_전_조회도_집계_유지(self, tmp_path):
+        path = tmp_path / "agent_live.jsonl"
+        index = LiveRunIndex(path)
+        ts = _iso(time.time() - 5)
+
+        def started(rid, tid):
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"type": "started", "run_id": rid, "terminal_id": tid,
+                                    "task": "하이브 작업", "ts": ts}, ensure_ascii=False) + "\n")
+
+        started("r1", "T1")
+        index.refresh()
+        started("r2", "T2")
+        SegmentedLog(path, SegmentPolicy(compress=None)).rotate()
+        assert not path.exists()
+        assert sorted(index.live_runs()) == ["T1", "T2"]        # 활성 파일이 없는 사이의 폴링
+        assert index.stats()["resets"] == 0 and index.stats()["rotations_followed"] == 1
+        started("r3", "T3")
+        assert sorted(index.live_runs()) == ["T1", "T2", "T3"]
+        assert index.stats()["resets"] == 0
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_memory_index.py
+DESCRIPTION: src/memory_index.py 의미 검색 캐시 단위 테스트.
+             임베딩 행렬 적재/갱신/삭제, 프로젝트 필터, 지연 임베딩 계산을 검증합니다.
+
+             [테스트 전략]
+             - 임베더는 단어 → 고정 축 벡터로 매핑하는 가짜 함수 (모델 로드 없음)
+             - pg_store 조회/저장 함수는 memory_index 모듈 네임스페이스에서 모킹
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — /api/memory?semantic=1 도입
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src import memory_index
+from src.memory_index import MemoryEmbeddingIndex
+
+_AXES = {'서버': 0, '캐시': 1, '배포': 2, '터미널': 3}
+
+
+def _vec(*weights) -> bytes:
+    return np.array(weights, dtype=np.float32).tobytes()
+
+
+def _fake_embed(text: str) -> bytes:
+    vec = np.zeros(4, dtype=np.float32)
+    for word, axis in _AXES.items():
+        if word in text:
+            vec[axis] += 1.0
+    return vec.tobytes() if vec.any() else _vec(0.1, 0.1, 0.1, 0.1)
+
+
+class TestMemoryEmbeddingIndex:
+    """행렬 캐시: 코사인 순위, 프로젝트 필터, upsert/remove 일관성."""
+
+    def _index(self):
+        index = MemoryEmbeddingIndex()
+        index.load([
+            {'key': 'a', 'project': 'p1', 'embedding': _vec(1, 0, 0, 0)},
+            {'key': 'b', 'project': 'p1', 'embedding': _vec(1, 1, 0, 0)},
+            {'key': 'c', 'project': 'p2', 'embedding': _vec(0, 0, 1, 0)},
+            {'key': 'bad', 'project': 'p1', 'embedding': b''},
+        ])
+        return index
+
+    def test_코사인_유사도_내림차순(self):
+        hits = self._index().search(_vec(2, 0, 0, 0), top_k=3)
+        assert [key for key, _ in hits] == ['a', 'b', 'c']
+        assert hits[0][1] == pytest.approx(1.0)
+        assert hits[1][1] == pytest.approx(1 / np.sqrt(2))
+
+    def test_프로젝트_필터(self):
+        hits = self._index().search(_vec(0, 0, 1, 0), top_k=5, project='p1')
+        assert {key for key, _ in hits} == {'a', 'b'}
+
+    def test_upsert는_기존행을_교체하고_remove는_빈자리를_채움(self):
+        index = self._index()
+        index.upsert('a', 'p1', _vec(0, 0, 0, 1))
+        index.upsert('d', 'p2', _vec(0, 1, 0, 0))
+        index.remove('b')
+        assert len(index) == 3
+        hits = dict(index.search(_vec(0, 0, 0, 1), top_k=3))
+        assert hits['a'] == pytest.approx(1.0)
+        assert 'b' not in hits
+        assert dict(index.search(_vec(0, 1, 0, 0), top_k=1)) == {'d': pytest.approx(1.0)}
+
+    def test_차원이_다른_벡터는_무시(self):
+        index = self._index()
+        index.upsert('x', 'p1', _vec(1, 0))
+        assert len(index) == 3
+        assert index.search(_vec(1, 0), top_k=3) == []
+
+    def test_모두_삭제하면_빈_결과(self):
+        index = self._index()
+        for key in ('a', 'b', 'c'):
+            index.remove(key)
+        assert len(index) == 0
+        assert index.search(_vec(1, 0, 0, 0)) == []
+
+
+class TestSemanticSearch:
+    """semantic_search: 지연 임베딩 계산 후 상위 결과를 DB 행과 결합."""
+
+    @pytest.fixture()
+    def store(self, monkeypatch):
+        rows = {
+            'k1': {'key': 'k1', 'project': 'p1', 'title': '서버 재시작', 'content': '', 'embedding': None},
+            'k2': {'key': 'k2', 'project': 'p1', 'title': '캐시 무효화', 'content': '', 'embedding': None},
+        }
+
+        def _load(missing=False, limit=None):
+            if missing:
+                return [dict(r) for r in rows.values() if r['embedding'] is None][:limit]
+            return [dict(r) for r in rows.values() if r['embedding'] is not None]
+
+        def _save(key, embedding):
+            rows[key]['embedding'] = embedding
+            return True
+
+        monkeypatch.setattr(memory_index, "MEMORY_INDEX", MemoryEmbeddingIndex())
+        monkeypatch.setattr(memory_index, "load_memory_embeddings", _load)
+        monkeypatch.setattr(memory_index, "set_memory_embedding", _save)
+        monkeypatch.setattr(memory_index, "get_memories",
+                            lambda keys: [{'key': k, 'title': rows[k]['title']} for k in keys if k in rows])
+        return rows
+
+    def test_임베딩없는_행을_지연계산하고_검색(self, store):
+        results = memory_index.semantic_search('서버 오류', _fake_embed, top_k=1)
+        assert [r['key'] for r in results] == ['k1']
+        assert results[0]['score'] == pytest.approx(1.0)
+        assert all(r['embedding'] is not None for r in store.values())
+
+    def test_임베더_불가시_None(self, store):
+        assert memory_index.semantic_search('서버', lambda text: None) is None
+
+    def test_DB에서_사라진_키는_결과와_캐시에서_제거(self, store, monkeypatch):
+        memory_index.semantic_search('서버', _fake_embed)
+        del store['k1']
+        results = memory_index.semantic_search('서버', _fake_embed, top_k=2)
+        assert [r['key'] for r in results] == ['k2']
+        assert len(memory_index.MEMORY_INDEX) == 1
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_pg_listener.py
+DESCRIPTION: src.pg_listener.PgChannelListener 단위 테스트 (PostgreSQL 없이 socketpair 가짜 연결).
+             LISTEN 실행과 NOTIFY 1건당 on_notify 1회 호출, 연결 끊김 시 백오프 재연결과
+             on_connect 재동기화 호출, 첫 연결 실패 시에도 ready가 풀리는지,
+             RecentIds가 역순 NOTIFY는 통과시키고 재동기화와 겹친 id만 거르는지 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — /stream 공유 LISTEN 리스너 도입
+- 2026-10-17: RecentIds 테스트 추가 — id 역순 도착 NOTIFY 누락 수정
+"""
+
+import json
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.pg_listener import PgChannelListener, RecentIds
+
+
+class _Notify:
+    def __init__(self, payload):
+        self.payload = payload
+
+
+class _FakeConn:
+    """psycopg2 연결 흉내 — select 가능한 fileno, poll()로 notifies 채움, drop()으로 끊김."""
+
+    def __init__(self):
+        self._r, self._w = socket.socketpair()
+        self._pending = []
+        self.notifies = []
+        self.executed = []
+
+    def fileno(self):
+        return self._r.fileno()
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, *args):
+        self.executed.append(sql)
+
+    def poll(self):
+        if not self._r.recv(4096):
+            raise OSError("server closed the connection unexpectedly")
+        while self._pending:
+            self.notifies.append(_Notify(self._pending.pop(0)))
+
+    def notify(self, payload):
+        self._pending.append(payload)
+        self._w.send(b"!")
+
+    def drop(self):
+        self._w.close()
+
+    def close(self):
+        self._r.close()
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture()
+def harness():
+    conns, received, resyncs = [], [], []
+    failures = {"left": 0}
+
+    def connect():
+        if failures["left"]:
+            failures["left"] -= 1
+            raise OSError("connection refused")
+        conns.append(_FakeConn())
+        return conns[-1]
+
+    listener = PgChannelListener("hive_log_channel", connect, received.append,
+                                 on_connect=resyncs.append, poll_interval=0.05,
+                                 min_backoff=0.01, max_backoff=0.05)
+    yield listener, conns, received, resyncs, failures
+    listener.stop()
+
+
+class TestPgChannelListener:
+    """공유 LISTEN 연결, 재연결, 재동기화."""
+
+    def test_NOTIFY마다_on_notify_1회(self, harness):
+        listener, conns, received, resyncs, _ = harness
+        listener.start()
+        listener.start()   # 중복 호출해도 스레드 1개
+        assert listener.ready.wait(2)
+        assert len(conns) == 1 and conns[0].executed == ["LISTEN hive_log_channel;"]
+        assert resyncs == [conns[0]]
+        for n in range(3):
+            conns[0].notify(f'{{"id": {n}}}')
+        assert _wait_for(lambda: len(received) == 3)
+        assert received == ['{"id": 0}', '{"id": 1}', '{"id": 2}']
+        assert listener.stats()["notifies"] == 3
+
+    def test_끊기면_재연결_후_재동기화(self, harness):
+        listener, conns, received, resyncs, _ = harness
+        listener.start()
+        assert _wait_for(lambda: listener.connected)
+        conns[0].drop()
+        assert _wait_for(lambda: len(conns) == 2 and listener.connected)
+        assert resyncs == conns   # 재연결마다 on_connect → 놓친 행 재조회
+        conns[1].notify("after")
+        assert _wait_for(lambda: received == ["after"])
+        stats = listener.stats()
+        assert stats["connects"] == 2 and stats["failures"] == 1
+
+    def test_첫_연결_실패해도_ready_후_백오프_재시도(self, harness):
+        listener, conns, _, _, failures = harness
+        failures["left"] = 2
+        listener.start()
+        assert listener.ready.wait(2)
+        assert _wait_for(lambda: listener.connected)
+        assert listener.stats()["failures"] == 2 and len(conns) == 1
+
+    def test_on_notify_예외는_해당_건만_건너뜀(self):
+        conn = _FakeConn()
+        seen = []
+
+        def on_notify(payload):
+            if payload == "bad":
+                raise ValueError("broken payload")
+            seen.append(payload)
+
+        listener = PgChannelListener("c", lambda: conn, on_notify, poll_interval=0.05)
+        listener.start()
+        try:
+            assert _wait_for(lambda: listener.connected)
+            conn.notify("bad")
+            conn.notify("good")
+            assert _wait_for(lambda: seen == ["good"])
+            assert listener.stats()["errors"] == 1 and listener.connected
+        finally:
+            listener.stop()
+        assert not any(t.name == "PgListen-c" and t.is_alive() for t in threading.enumerate())
+
+
+class TestRecentIds:
+    """/stream 중복 제거 — 이미 발행한 id만 건너뜀."""
+
+    def test_역순으로_도착한_NOTIFY도_모두_발행(self):
+        conn, seen, published = _FakeConn(), RecentIds(), []
+
+        def on_notify(payload):                                # server._hive_log_on_notify와 같은 판정
+            row = json.loads(payload)
+            if seen.add(int(row["id"])):
+                published.append(row["id"])
+
+        def resync(_conn):                                     # 재동기화 조회로 먼저 받은 행
+            for row_id in (1, 2):
+                seen.add(row_id)
+            published.extend([1, 2])
+
+        listener = PgChannelListener("c", lambda: conn, on_notify, on_connect=resync, poll_interval=0.05)
+        listener.start()
+        try:
+            assert _wait_for(lambda: listener.connected)
+            for row_id in (2, 1, 4, 3):                        # 1·2는 재동기화와 겹침, 4가 3보다 먼저 커밋
+                conn.notify(json.dumps({"id": row_id}))
+            assert _wait_for(lambda: listener.stats()["notifies"] == 4)
+        finally:
+            listener.stop()
+        assert published == [1, 2, 4, 3] and seen.high == 4
+
+    def test_크기_제한을_넘으면_오래된_id부터_잊음(self):
+        seen = RecentIds(maxlen=3)
+        assert [seen.add(n) for n in (2, 1, 2, 5, 3)] == [True, True, False, True, True]
+        assert seen.add(2) is True                             # 가장 오래된 2가 밀려남
+        assert seen.add(5) is False and seen.high == 5
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_pg_store.py
+DESCRIPTION: pg_store.py 실행 백엔드 단위 테스트.
+             psycopg2 커넥션 풀 경로(_pool_run)와 psql.exe 폴백 경로(_run_sql)를
+             실제 PostgreSQL 없이 검증합니다.
+
+             [테스트 전략]
+             - 풀은 가짜 ThreadedConnectionPool 객체로 대체
+             - psql 경로는 _run_psql을 모킹하여 CSV 출력만 주입
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 커넥션 풀 백엔드 도입
+- 2026-10-17: 드라이버 외 예외에도 연결이 풀에 반환되는지 검증 추가
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src import pg_store
+
+
+# ── 가짜 풀/연결 ──────────────────────────────────────────────────────────────
+
+class _FakeError(Exception):
+    pass
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.description = None
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.conn.executed.append(sql)
+        if self.conn.fail_with is not None:
+            exc, self.conn.fail_with = self.conn.fail_with, None
+            raise exc
+        if sql.startswith('SELECT'):
+            self.description = [('n',)]
+            self._rows = [{'n': 1, 'tags': ['a']}]
+
+    def fetchall(self):
+        return self._rows
+
+
+class _FakeConn:
+    def __init__(self):
+        self.closed = 0
+        self.autocommit = False
+        self.executed = []
+        self.fail_with = None
+
+    def cursor(self, cursor_factory=None):
+        return _FakeCursor(self)
+
+
+class _FakePool:
+    def __init__(self, conns):
+        self.conns = list(conns)
+        self.returned = []
+
+    def getconn(self):
+        return self.conns.pop(0)
+
+    def putconn(self, conn, close=False):
+        self.returned.append((conn, close))
+        if not close:
+            self.conns.append(conn)
+
+
+@pytest.fixture()
+def fake_driver(monkeypatch):
+    """psycopg2 모듈을 최소 기능 스텁으로 교체 (Error 계층 + RealDictCursor)."""
+    class _Extras:
+        RealDictCursor = object
+
+    class _Driver:
+        Error = _FakeError
+        extras = _Extras
+
+    monkeypatch.setattr(pg_store, "psycopg2", _Driver)
+    monkeypatch.setattr(pg_store, "_POOL_SLOTS", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(pg_store, "_CONN_TIMEOUTS", {})
+    return _Driver
+
+
+# ── _pool_run 테스트 ─────────────────────────────────────────────────────────
+
+class TestPoolRun:
+    """psycopg2 풀 경로: 타입 보존 행 반환, 연결 재사용, 끊긴 연결 폐기."""
+
+    def test_select는_타입이_보존된_행을_반환함(self, fake_driver, monkeypatch):
+        pool = _FakePool([_FakeConn()])
+        monkeypatch.setattr(pg_store, "_POOL", pool)
+        ok, rows = pg_store._pool_run("SELECT 1;", fetch=True)
+        assert ok is True
+        assert rows == [{'n': 1, 'tags': ['a']}]
+
+    def test_statement_timeout은_연결당_한번만_설정됨(self, fake_driver, monkeypatch):
+        conn = _FakeConn()
+        monkeypatch.setattr(pg_store, "_POOL", _FakePool([conn]))
+        pg_store._pool_run("SELECT 1;", fetch=True)
+        pg_store._pool_run("SELECT 1;", fetch=True)
+        assert sum(1 for sql in conn.executed if sql.startswith('SET statement_timeout')) == 1
+
+    def test_끊긴_연결은_폐기후_재시도됨(self, fake_driver, monkeypatch):
+        broken, healthy = _FakeConn(), _FakeConn()
+        broken.fail_with = _FakeError("server closed the connection")
+        broken.closed = 2
+        pool = _FakePool([broken, healthy])
+        monkeypatch.setattr(pg_store, "_POOL", pool)
+        ok, rows = pg_store._pool_run("SELECT 1;", fetch=True)
+        assert ok is True
+        assert (broken, True) in pool.returned
+
+    def test_sql_오류는_재시도없이_실패반환(self, fake_driver, monkeypatch):
+        conn = _FakeConn()
+        conn.fail_with = _FakeError("syntax error")
+        pool = _FakePool([conn])
+        monkeypatch.setattr(pg_store, "_POOL", pool)
+        monkeypatch.setattr(pg_store, "_CONN_TIMEOUTS", {id(conn): 15})
+        ok, message = pg_store._pool_run("SELEC 1;")
+        assert ok is False
+        assert "syntax error" in message
+        assert pool.returned == [(conn, False)]
+
+    def test_드라이버_외_예외에도_연결을_반환함(self, fake_driver, monkeypatch):
+        alive, dropped = _FakeConn(), _FakeConn()
+        alive.fail_with = KeyboardInterrupt()
+        dropped.fail_with, dropped.closed = KeyboardInterrupt(), 2     # 중단 시점에 이미 끊긴 연결
+        pool = _FakePool([alive, dropped])
+        monkeypatch.setattr(pg_store, "_POOL", pool)
+        for _ in range(2):
+            with pytest.raises(KeyboardInterrupt):
+                pg_store._pool_run("SELECT 1;", fetch=True)
+        assert pool.returned == [(alive, False), (dropped, True)]
+        assert pg_store._POOL_SLOTS.acquire(blocking=False) and pg_store._POOL_SLOTS.acquire(blocking=False)
+
+
+# ── psql 폴백 테스트 ─────────────────────────────────────────────────────────
+
+class TestPsqlFallback:
+    """드라이버 미설치 시 psql.exe CSV 경로로 폴백."""
+
+    def test_드라이버없으면_csv를_dict로_파싱함(self, monkeypatch):
+        monkeypatch.setattr(pg_store, "psycopg2", None)
+        monkeypatch.setattr(pg_store, "_run_psql",
+                            lambda sql, csv_output=False, timeout=15: (True, "key,title\nk1,t1\n"))
+        ok, rows = pg_store._run_sql("SELECT key, title FROM hive_memory;", fetch=True)
+        assert ok is True
+        assert rows == [{'key': 'k1', 'title': 't1'}]
+
+    def test_psql_실패시_False(self, monkeypatch):
+        monkeypatch.setattr(pg_store, "psycopg2", None)
+        monkeypatch.setattr(pg_store, "_run_psql",
+                            lambda sql, csv_output=False, timeout=15: (False, "psql.exe not found"))
+        ok, _ = pg_store._run_sql("SELECT 1;", fetch=True)
+        assert ok is False
+
+
+# ── 체인 헤드 시드 테스트 ─────────────────────────────────────────────────────
+
+class TestLoadThoughtHeads:
+    """load_thought_heads: 인덱스 보장 후 에이전트별 최신 id를 dict로 반환."""
+
+    def test_인덱스를_보장하고_에이전트별_헤드를_반환(self, monkeypatch):
+        executed = []
+
+        def _fake_run_sql(sql, fetch=False, timeout=15):
+            executed.append(sql)
+            if fetch:
+                return True, [{'agent': 'claude', 'id': 42}, {'agent': 'gemini', 'id': '7'}]
+            return True, []
+
+        monkeypatch.setattr(pg_store, "_run_sql", _fake_run_sql)
+        assert pg_store.load_thought_heads() == {'claude': 42, 'gemini': 7}
+        assert 'pg_thoughts (agent, id DESC)' in executed[0]
+        assert 'DISTINCT ON (agent)' in executed[1]
+
+    def test_조회_실패시_빈_dict(self, monkeypatch):
+        monkeypatch.setattr(pg_store, "_run_sql", lambda sql, fetch=False, timeout=15: (False, "down"))
+        assert pg_store.load_thought_heads() == {}
+
+
+# ── parent_id 소급 연결 테스트 ────────────────────────────────────────────────
+
+class TestBackfillThoughtParents:
+    """backfill_thought_parents: 워터마크 이후 id 구간만 청크 단위로 처리."""
+
+    def _patch(self, monkeypatch, max_id, watermark=None, linked_per_chunk=2):
+        executed, saved = [], []
+
+        def _fake_run_sql(sql, fetch=False, timeout=15):
+            executed.append(sql)
+            if 'MAX(id), 0' in sql:
+                return True, [{'max_id': max_id}]
+            return True, [{'n': linked_per_chunk}]
+
+        monkeypatch.setattr(pg_store, "_run_sql", _fake_run_sql)
+        monkeypatch.setattr(pg_store, "load_state",
+                            lambda key, default=None: {'last_id': watermark} if watermark is not None else default)
+        monkeypatch.setattr(pg_store, "save_state", lambda key, payload: saved.append(payload['last_id']) or True)
+        return executed, saved
+
+    def test_청크마다_워터마크를_전진시킴(self, monkeypatch):
+        executed, saved = self._patch(monkeypatch, max_id=12)
+        assert pg_store.backfill_thought_parents(chunk_size=5, pause=0) == 6
+        assert saved == [5, 10, 12]
+        updates = [sql for sql in executed if 'UPDATE pg_thoughts' in sql]
+        assert len(updates) == 3
+        assert 'c.id > 10 AND c.id <= 12' in updates[-1]
+        assert 'LAG(c.id) OVER (PARTITION BY c.agent ORDER BY c.id)' in updates[0]
+
+    def test_워터마크가_최신이면_UPDATE_없음(self, monkeypatch):
+        executed, saved = self._patch(monkeypatch, max_id=100, watermark=100)
+        assert pg_store.backfill_thought_parents(pause=0) == 0
+        assert saved == []
+        assert not any('UPDATE pg_thoughts' in sql for sql in executed)
+
+
+# ── hive_memory 검색 테스트 ───────────────────────────────────────────────────
+
+class TestMemorySearch:
+    """list_memory(q): 인덱스 사용 가능한 술어 + 관련도 정렬 SQL 생성."""
+
+    def _capture(self, monkeypatch, rows=None):
+        captured = []
+
+        def _fake_query_rows(sql, timeout=15):
+            captured.append(sql)
+            return [dict(row) for row in (rows or [])]
+
+        monkeypatch.setattr(pg_store, "query_rows", _fake_query_rows)
+        return captured
+
+    def test_토큰별_접두일치_tsquery(self):
+        assert pg_store._memory_tsquery("서버 버그!") == "'서버':* & '버그':*"
+        assert pg_store._memory_tsquery("!!!") == ''
+
+    def test_like_와일드카드_이스케이프(self):
+        assert pg_store._like_pattern("50%_a") == "%50\\%\\_a%"
+
+    def test_검색_SQL은_세가지_인덱스_술어와_score정렬(self, monkeypatch):
+        captured = self._capture(monkeypatch, rows=[
+            {'key': 'k', 'tags': '["db"]', 'score': '0.75'},
+        ])
+        rows = pg_store.list_memory(q="서버", project="p1")
+        sql = captured[0]
+        assert "search_tsv @@ to_tsquery('simple', '''서버'':*')" in sql
+        assert "(key || ' ' || title || ' ' || content) ILIKE '%서버%'" in sql
+        assert "tags @> jsonb_build_array('서버'::text)" in sql
+        assert "ORDER BY score DESC" in sql
+        assert "LIKE LOWER" not in sql
+        assert rows == [{'key': 'k', 'tags': ['db'], 'score': 0.75}]
+
+    def test_토큰없는_검색어는_부분일치만_사용(self, monkeypatch):
+        captured = self._capture(monkeypatch)
+        pg_store.list_memory(q="%%", show_all=True)
+        assert "search_tsv @@" not in captured[0]
+        assert "ILIKE '%\\%\\%%'" in captured[0]
+
+    def test_검색어없으면_최신순(self, monkeypatch):
+        captured = self._capture(monkeypatch)
+        pg_store.list_memory(show_all=True)
+        assert "ORDER BY updated_at DESC" in captured[0]
+        assert "score" not in captured[0]
+
+
+class TestInsertPgLogs:
+    """pg_logs 배치 INSERT + PGMQ 전송."""
+
+    def _capture(self, monkeypatch, insert_ok):
+        sent = []
+
+        def fake_execute_raw(sql):
+            sent.append(sql)
+            return insert_ok if sql.startswith('INSERT') else True
+
+        monkeypatch.setattr(pg_store, 'execute_raw', fake_execute_raw)
+        return sent
+
+    def test_INSERT_성공시에만_큐로_전송(self, monkeypatch):
+        sent = self._capture(monkeypatch, insert_ok=True)
+        assert pg_store.insert_pg_logs([{'agent': 'Claude', 'task': 'a'}, {'agent': 'Gemini', 'task': 'b'}])
+        assert len(sent) == 2 and "pgmq.send_batch('hive_queue'" in sent[1]
+
+    def test_INSERT_실패시_큐_전송_없음(self, monkeypatch):
+        sent = self._capture(monkeypatch, insert_ok=False)
+        assert pg_store.insert_pg_logs([{'agent': 'Claude', 'task': 'a'}]) is False
+        assert len(sent) == 1 and sent[0].startswith('INSERT')
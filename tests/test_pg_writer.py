@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_pg_writer.py
+DESCRIPTION: src/pg_writer.py WriteBehindQueue 단위 테스트.
+             배치 크기/시간 트리거, 종료 시 flush, 큐 포화 백프레셔, 카운터를 검증합니다.
+
+             [테스트 전략]
+             - flush_fn은 배치를 리스트에 기록만 하는 가짜 콜백
+             - 실제 DB 없이 순수 Python 스레드 동작만 확인
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — log_to_pg / thought_to_pg write-behind 도입
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.pg_writer import WriteBehindQueue
+
+
+class TestWriteBehindQueue:
+    """배치 flush, 백프레셔, 카운터 검증."""
+
+    def test_배치크기_이하로_묶여서_기록됨(self):
+        batches = []
+        writer = WriteBehindQueue('t', lambda b: batches.append(list(b)) or True,
+                                  max_batch=10, max_delay=0.5)
+        for i in range(25):
+            assert writer.put(i)
+        assert writer.flush(timeout=5)
+        writer.stop()
+        assert [x for b in batches for x in b] == list(range(25))
+        assert all(len(b) <= 10 for b in batches)
+
+    def test_stop은_남은_레코드를_모두_flush함(self):
+        written = []
+        writer = WriteBehindQueue('t', lambda b: written.extend(b) or True, max_delay=0.01)
+        for i in range(5):
+            writer.put(i)
+        assert writer.stop(timeout=5)
+        assert written == list(range(5))
+
+    def test_큐가득차면_put이_False_반환(self):
+        release = threading.Event()
+
+        def _slow_flush(batch):
+            release.wait(5)
+            return True
+
+        writer = WriteBehindQueue('t', _slow_flush, max_batch=1, max_delay=0, max_queue=1)
+        writer.put('a')                 # 라이터가 꺼내서 flush 대기
+        deadline_ok = False
+        for _ in range(50):             # 라이터가 첫 레코드를 꺼낼 때까지 큐를 채움
+            if writer.put('b', timeout=0.05):
+                deadline_ok = True
+                break
+        assert deadline_ok
+        assert writer.put('c', timeout=0.05) is False
+        release.set()
+        writer.stop()
+        assert writer.stats()['rejected'] == 1
+
+    def test_flush_실패는_failed_카운터에_반영(self):
+        writer = WriteBehindQueue('t', lambda b: False, max_delay=0)
+        writer.put(1)
+        writer.put(2)
+        writer.stop()
+        stats = writer.stats()
+        assert stats['failed'] == 2
+        assert stats['flushed'] == 0
+        assert stats['queue_depth'] == 0
+        assert stats['batches'] >= 1
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_response_cache.py
+DESCRIPTION: src.response_cache.ResponseCache 단위 테스트.
+             TTL 안의 반복 요청이 핸들러를 다시 실행하지 않는지, 쿼리별로 키가 나뉘는지,
+             동시 동일 요청이 계산 1건에 합류하는지(single-flight), 쓰기 라우트 후 태그 무효화와
+             계산 도중 무효화된 결과를 저장하지 않는지, 압축은 요청자별로 협상되는지 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 폴링 라우트 응답 캐시 도입
+"""
+
+import gzip
+import io
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from api.router import RouteRegistry
+from src.http_response import send_json
+from src.response_cache import ResponseCache
+
+
+class _Handler:
+    """SSEHandler 흉내 — 상태/헤더/본문을 기록."""
+
+    def __init__(self, path: str, accept_encoding: str | None = None):
+        self.path = path
+        self.headers = {"Content-Length": "0"}
+        if accept_encoding:
+            self.headers["Accept-Encoding"] = accept_encoding
+        self.rfile = io.BytesIO(b"")
+        self.wfile = io.BytesIO()
+        self.status = None
+        self.sent = {}
+
+    def send_response(self, code, message=None):
+        self.status = code
+
+    def send_header(self, keyword, value):
+        self.sent[keyword] = value
+
+    def end_headers(self):
+        pass
+
+    def body(self):
+        raw = self.wfile.getvalue()
+        if self.sent.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        return json.loads(raw)
+
+
+@pytest.fixture()
+def setup():
+    router = RouteRegistry()
+    cache = ResponseCache()
+    calls = {"status": 0, "error": 0}
+
+    def status(handler, req):
+        calls["status"] += 1
+        send_json(handler, {"n": calls["status"], "q": req.params.get("q", [""])[0],
+                            "pad": "하이브" * 400})
+
+    def error(handler, req):
+        calls["error"] += 1
+        send_json(handler, {"error": "down"}, status=500)
+
+    def save(handler, req):
+        send_json(handler, {"status": "success"})
+
+    router.add("GET", "/api/orchestrator/status", status)
+    router.add("GET", "/api/hive/health", error)
+    router.add("POST", "/api/tasks", save)
+    cache.cache_route(router, "/api/orchestrator/status", 60, ("tasks",))
+    cache.cache_route(router, "/api/hive/health", 60)
+    cache.invalidate_after(router, "POST", ["/api/tasks"], ("tasks",))
+    return router, cache, calls
+
+
+def _get(router, path, accept_encoding=None):
+    handler = _Handler(path, accept_encoding)
+    assert router.dispatch(handler, "GET")
+    return handler
+
+
+class TestResponseCache:
+    """TTL / 키 / 무효화 / 통계."""
+
+    def test_TTL_안에서는_재계산_없음(self, setup):
+        router, cache, calls = setup
+        first = _get(router, "/api/orchestrator/status")
+        second = _get(router, "/api/orchestrator/status")
+        assert calls["status"] == 1
+        assert first.body() == second.body()
+        assert second.status == 200 and second.sent["Access-Control-Allow-Origin"] == "*"
+        stats = cache.stats()["/api/orchestrator/status"]
+        assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+    def test_쿼리별로_키_분리_순서는_무시(self, setup):
+        router, _, calls = setup
+        assert _get(router, "/api/orchestrator/status?q=a&x=1").body()["q"] == "a"
+        assert _get(router, "/api/orchestrator/status?x=1&q=a").body()["q"] == "a"
+        assert _get(router, "/api/orchestrator/status?q=b").body()["q"] == "b"
+        assert calls["status"] == 2
+
+    def test_TTL_만료_후_재계산(self):
+        router, cache, calls = RouteRegistry(), ResponseCache(), []
+
+        def status(handler, req):
+            calls.append(1)
+            send_json(handler, {"n": len(calls)})
+
+        router.add("GET", "/api/kanban/pg-activity", status)
+        cache.cache_route(router, "/api/kanban/pg-activity", 0.05)
+        _get(router, "/api/kanban/pg-activity")
+        time.sleep(0.08)
+        assert _get(router, "/api/kanban/pg-activity").body() == {"n": 2}
+
+    def test_쓰기_라우트_후_태그_무효화(self, setup):
+        router, cache, calls = setup
+        _get(router, "/api/orchestrator/status")
+        post = _Handler("/api/tasks")
+        assert router.dispatch(post, "POST")
+        assert post.body() == {"status": "success"}
+        assert _get(router, "/api/orchestrator/status").body()["n"] == 2
+        assert cache.stats()["/api/orchestrator/status"]["invalidations"] == 1
+
+    def test_200_이외_응답은_저장하지_않음(self, setup):
+        router, cache, calls = setup
+        assert _get(router, "/api/hive/health").status == 500
+        assert _get(router, "/api/hive/health").status == 500
+        assert calls["error"] == 2
+        assert cache.stats()["/api/hive/health"]["uncached"] == 2
+
+    def test_압축은_요청자별_협상(self, setup):
+        router, _, calls = setup
+        plain = _get(router, "/api/orchestrator/status")
+        gz = _get(router, "/api/orchestrator/status", "gzip, deflate")
+        assert "Content-Encoding" not in plain.sent
+        assert gz.sent["Content-Encoding"] == "gzip"
+        assert int(gz.sent["Content-Length"]) == len(gz.wfile.getvalue())
+        assert gz.body() == plain.body() and calls["status"] == 1
+
+    def test_등록되지_않은_경로는_KeyError(self, setup):
+        router, cache, _ = setup
+        with pytest.raises(KeyError):
+            cache.cache_route(router, "/api/agent/terminals", 1)
+
+
+class TestSingleFlight:
+    """동시 동일 요청 합류와 계산 중 무효화."""
+
+    def _slow_router(self, release):
+        router = RouteRegistry()
+        cache = ResponseCache()
+        calls = []
+
+        def slow(handler, req):
+            calls.append(1)
+            release.wait(2)
+            send_json(handler, {"n": len(calls)})
+
+        router.add("GET", "/api/agent/terminals", slow)
+        cache.cache_route(router, "/api/agent/terminals", 60, ("stage",))
+        return router, cache, calls
+
+    def test_동시_요청은_계산_1건에_합류(self):
+        release = threading.Event()
+        router, cache, calls = self._slow_router(release)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(_get(router, "/api/agent/terminals")))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 2
+        while cache.stats()["/api/agent/terminals"]["coalesced"] < 7 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for t in threads:
+            t.join(3)
+        assert len(calls) == 1
+        assert [h.body() for h in results] == [{"n": 1}] * 8
+        stats = cache.stats()["/api/agent/terminals"]
+        assert (stats["misses"], stats["coalesced"], stats["hit_ratio"]) == (1, 7, 0.875)
+
+    def test_계산_중_무효화되면_결과를_저장하지_않음(self):
+        release = threading.Event()
+        router, cache, calls = self._slow_router(release)
+        worker = threading.Thread(target=_get, args=(router, "/api/agent/terminals"))
+        worker.start()
+        while not calls:
+            time.sleep(0.01)
+        cache.invalidate("stage")    # 계산 시작 후 쓰기 발생 → 이 결과는 이미 낡음
+        release.set()
+        worker.join(3)
+        assert _get(router, "/api/agent/terminals").body() == {"n": 2}
+        assert cache.stats()["/api/agent/terminals"]["uncached"] == 1
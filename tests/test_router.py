@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_router.py
+DESCRIPTION: api.router.RouteRegistry 단위 테스트.
+             exact/prefix 조회 우선순위, 메서드 분리, 중복 등록 거부,
+             GET 요청에서 본문을 읽지 않는지와 적중 횟수 집계를 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 테이블 기반 라우팅 도입
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from api.router import RouteRegistry
+
+
+class _Handler:
+    def __init__(self, path: str, body: bytes = b""):
+        self.path = path
+        self.headers = {"Content-Length": str(len(body))}
+        self.rfile = io.BytesIO(body)
+
+
+@pytest.fixture()
+def router():
+    return RouteRegistry()
+
+
+class TestRouteRegistry:
+    """조회 규칙과 디스패치 동작."""
+
+    def test_exact가_prefix보다_우선(self, router):
+        router.add("GET", "/api/hive/health", "exact")
+        router.add("GET", "/api/hive/", "prefix", prefix=True)
+        assert router.resolve("GET", "/api/hive/health").fn == "exact"
+        assert router.resolve("GET", "/api/hive/logs").fn == "prefix"
+
+    def test_가장_긴_prefix_선택(self, router):
+        router.add("GET", "/api/", "short", prefix=True)
+        router.add("GET", "/api/pty/", "long", prefix=True)
+        assert router.resolve("GET", "/api/pty/output/x").fn == "long"
+        assert router.resolve("GET", "/api/other").fn == "short"
+        assert router.resolve("GET", "/index.html") is None
+
+    def test_메서드별로_분리(self, router):
+        router.add("POST", "/api/tasks", "post")
+        assert router.resolve("GET", "/api/tasks") is None
+        assert router.resolve("POST", "/api/tasks").fn == "post"
+
+    def test_중복_등록은_거부(self, router):
+        router.add("GET", "/api/tasks", "a")
+        with pytest.raises(ValueError):
+            router.add("GET", "/api/tasks", "b")
+        with pytest.raises(ValueError):
+            router.add("GET", "/api/no-slash", "c", prefix=True)
+
+    def test_GET은_본문을_읽지_않고_쿼리는_파싱(self, router):
+        seen = {}
+
+        def _fn(handler, req):
+            seen["body"] = req.body
+            seen["q"] = req.params.get("q")
+
+        router.add("GET", "/api/memory", _fn)
+        handler = _Handler("/api/memory?q=abc", b'{"x": 1}')
+        assert router.dispatch(handler, "GET") is True
+        assert seen == {"body": {}, "q": ["abc"]}
+        assert handler.rfile.tell() == 0
+
+    def test_POST_본문은_한번만_읽음(self, router):
+        bodies = []
+
+        def _fn(handler, req):
+            bodies.extend([req.body, req.body])
+
+        router.add("POST", "/api/memory/set", _fn)
+        assert router.dispatch(_Handler("/api/memory/set", b'{"key": "k"}'), "POST")
+        assert bodies == [{"key": "k"}, {"key": "k"}]
+
+    def test_적중_횟수와_미등록_요청_집계(self, router):
+        router.add("GET", "/api/heartbeat", lambda h, r: None, source="server")
+        router.dispatch(_Handler("/api/heartbeat"), "GET")
+        router.dispatch(_Handler("/api/heartbeat?x=1"), "GET")
+        assert router.dispatch(_Handler("/missing"), "GET") is False
+        assert router.table() == [
+            {"method": "GET", "path": "/api/heartbeat", "source": "server", "hits": 2}
+        ]
+        assert router.misses["GET"] == 1
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_state_channel.py
+DESCRIPTION: src.state_channel 단위 테스트.
+             json_diff → apply_patch 왕복이 원본을 재현하는지(슬라이딩 창 목록은 전체 교체 대신 add/remove),
+             StateChannel이 구독 시 스냅샷을 주고 값이 바뀔 때만 patch를 발행하는지, 구독자가 없으면
+             계산하지 않는지, 무효화 태그로 즉시 재계산하는지, Last-Event-ID 재연결이 놓친 patch만 받는지 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 대시보드 상태 채널 도입
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from api.router import RouteRegistry
+from src.event_bus import EventBus
+from src.http_response import send_json
+from src.state_channel import StateChannel, apply_patch, json_diff, route_source
+
+
+def _payload(frame: bytes) -> dict:
+    return json.loads(frame.split(b"data: ", 1)[1])
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestJsonDiff:
+    """diff/patch 왕복."""
+
+    @pytest.mark.parametrize("old,new", [
+        ({"a": 1, "b": {"c": [1, 2]}}, {"a": 2, "b": {"c": [1, 3]}, "d": None}),
+        ({"T1": {"status": "idle"}, "T2": {}}, {"T1": {"status": "running"}}),
+        ({"a/b": 1, "m~n": 2}, {"a/b": 3, "m~n": 2}),
+        ([1, 2, 3], [1, 2, 3, 4, 5]),
+        ({"x": [1]}, {"x": "text"}),
+        ({"flag": 1}, {"flag": True}),
+    ])
+    def test_왕복(self, old, new):
+        # json.dumps 비교 — 1 → True 같은 타입 변화도 patch에 포함돼야 함
+        assert json.dumps(apply_patch(old, json_diff(old, new))) == json.dumps(new)
+
+    def test_같으면_빈_ops(self):
+        assert json_diff({"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}) == []
+
+    def test_최신순_목록_앞에_추가(self):
+        old = [{"id": n} for n in range(10, 0, -1)]          # 최신 10개, 최신순
+        new = [{"id": 12}, {"id": 11}] + old[:8]
+        ops = json_diff(old, new, "/hive_activity")
+        assert [op["op"] for op in ops] == ["remove", "remove", "add", "add"]
+        assert apply_patch({"hive_activity": old}, ops) == {"hive_activity": new}
+
+    def test_시간순_목록_뒤에_추가(self):
+        old = list(range(20))
+        new = old[3:] + [20, 21, 22]
+        ops = json_diff(old, new)
+        assert len(ops) == 6 and apply_patch(old, ops) == new
+
+    def test_원본은_변경하지_않음(self):
+        old = {"a": [1, 2]}
+        apply_patch(old, [{"op": "add", "path": "/a/-", "value": 3}])
+        assert old == {"a": [1, 2]}
+
+
+class _Counter:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+@pytest.fixture()
+def channel():
+    bus = EventBus()
+    ch = StateChannel(bus, "state", tick=0.01)
+    yield ch, bus
+    ch.stop()
+
+
+class TestStateChannel:
+    """스냅샷 / patch / 유휴 / 무효화 / 재연결."""
+
+    def test_스냅샷_후_변경분만_patch(self, channel):
+        ch, _ = channel
+        terminals = _Counter({"T1": {"status": "idle"}, "T2": {"status": "idle"}})
+        ch.add_source("terminals", terminals, interval=60)
+        sub, initial = ch.subscribe()
+        snapshot = _payload(initial[0])
+        assert snapshot == {"type": "snapshot", "version": 1,
+                            "state": {"terminals": {"T1": {"status": "idle"}, "T2": {"status": "idle"}}}}
+        assert initial[1] == sub.cursor_frame()
+
+        assert ch.refresh(force=True) == 0          # 값이 같으면 발행 없음
+        assert sub.drain(0) == []
+        terminals.value = {"T1": {"status": "running"}, "T2": {"status": "idle"}}
+        assert ch.refresh(force=True) == 1
+        patch = _payload(sub.drain(0)[0])
+        assert patch == {"type": "patch", "version": 2,
+                         "ops": [{"op": "replace", "path": "/terminals/T1/status", "value": "running"}]}
+        sub.close()
+
+    def test_volatile_키는_상태에서_제외(self, channel):
+        ch, _ = channel
+        ch.add_source("orchestrator", lambda: {"warnings": [], "timestamp": time.time()},
+                      interval=60, volatile=("timestamp",))
+        sub, initial = ch.subscribe()
+        assert _payload(initial[0])["state"]["orchestrator"] == {"warnings": []}
+        assert ch.refresh(force=True) == 0
+        sub.close()
+
+    def test_구독자_없으면_계산_없음(self, channel):
+        ch, _ = channel
+        source = _Counter({"n": 1})
+        ch.add_source("kanban", source, interval=0.01)
+        ch.start()
+        time.sleep(0.1)
+        assert source.calls == 0
+        sub, _ = ch.subscribe()
+        assert _wait_for(lambda: source.calls >= 3)   # 구독 중에는 주기 갱신
+        sub.close()
+        time.sleep(0.05)
+        calls = source.calls
+        time.sleep(0.1)
+        assert source.calls <= calls + 1              # 마지막 구독 해제 후 멈춤
+
+    def test_무효화_태그로_즉시_재계산(self, channel):
+        ch, _ = channel
+        tasks = _Counter({"todo": []})
+        ch.add_source("kanban", tasks, interval=60, tags=("tasks",))
+        sub, _ = ch.subscribe()
+        tasks.value = {"todo": [{"id": "t1"}]}
+        ch.mark_dirty("memory")                        # 관계없는 태그
+        time.sleep(0.05)
+        assert sub.drain(0) == []
+        ch.mark_dirty("tasks")
+        assert _wait_for(lambda: ch.version == 2)
+        ops = _payload(sub.drain(1)[0])["ops"]
+        assert apply_patch({"kanban": {"todo": []}}, ops) == {"kanban": {"todo": [{"id": "t1"}]}}
+        sub.close()
+
+    def test_재연결은_놓친_patch만(self, channel):
+        ch, bus = channel
+        value = _Counter({"n": 0})
+        ch.add_source("terminals", value, interval=60)
+        first, _ = ch.subscribe()
+        first.close()
+        seen = bus.last_id("state")
+        for n in (1, 2):
+            value.value = {"n": n}
+            ch.refresh(force=True)
+        resumed, initial = ch.subscribe(last_event_id=seen)
+        assert initial == [] and resumed.resumed
+        versions = [_payload(frame)["version"] for frame in resumed.drain(0)]
+        assert versions == [2, 3]
+        resumed.close()
+        assert ch.stats()["snapshots"] == 1 and ch.stats()["patches"] == 3
+
+    def test_소스_예외는_해당_소스만_건너뜀(self, channel):
+        ch, _ = channel
+
+        def broken():
+            raise OSError("db down")
+
+        ch.add_source("skill_chain", broken, interval=60)
+        ch.add_source("terminals", lambda: {"T1": {}}, interval=60)
+        sub, initial = ch.subscribe()
+        assert _payload(initial[0])["state"] == {"terminals": {"T1": {}}}
+        assert ch.stats()["sources"]["skill_chain"]["last_error"] == "db down"
+        sub.close()
+
+
+class TestRouteSource:
+    """라우트 응답 → 상태 값."""
+
+    def test_라우트_JSON_그대로(self):
+        router = RouteRegistry()
+        router.add("GET", "/api/tasks/kanban", lambda handler, req: send_json(handler, {"done": [1]}))
+        router.add("GET", "/api/hive/activity", lambda handler, req: send_json(handler, {}, status=503))
+        assert route_source(router, "/api/tasks/kanban")() == {"done": [1]}
+        with pytest.raises(RuntimeError):
+            route_source(router, "/api/hive/activity")()
+        with pytest.raises(LookupError):
+            route_source(router, "/api/missing")()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+FILE: tests/test_static_assets.py
+DESCRIPTION: src.static_assets.StaticAssetStore 단위 테스트.
+             해시 파일 immutable / index.html no-cache 구분, Accept-Encoding 협상,
+             If-None-Match 304, 파일 변경 시 재적재, SPA fallback과 경로 조작 차단을 검증합니다.
+
+REVISION HISTORY:
+- 2026-10-17: 최초 작성 — 정적 파일 캐시/사전 압축 도입
+"""
+
+import gzip
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT / ".ai_monitor"))
+
+from src.http_response import accepted_encodings
+from src.static_assets import IMMUTABLE_CACHE, REVALIDATE_CACHE, StaticAssetStore
+
+_JS = b"export const x = 1;\n" * 200
+
+
+@pytest.fixture()
+def store(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<html>vibe</html>", encoding="utf-8")
+    (tmp_path / "assets" / "index-BdX3k9aZ.js").write_bytes(_JS)
+    (tmp_path / "vite.svg").write_text("<svg/>", encoding="utf-8")
+    (tmp_path.parent / "secret.txt").write_text("nope", encoding="utf-8")
+    return StaticAssetStore(tmp_path)
+
+
+def _headers(headers):
+    return dict(headers)
+
+
+class TestStaticAssetStore:
+    """캐시 정책, 압축 협상, 조건부 요청."""
+
+    def test_해시_파일은_immutable_index는_재검증(self, store):
+        _, js, _ = store.respond(store.lookup("/assets/index-BdX3k9aZ.js"))
+        _, html, _ = store.respond(store.lookup("/index.html"))
+        assert _headers(js)["Cache-Control"] == IMMUTABLE_CACHE
+        assert _headers(html)["Cache-Control"] == REVALIDATE_CACHE
+        assert _headers(js)["Content-Type"].startswith("application/javascript")
+
+    def test_gzip_협상과_Content_Length(self, store):
+        asset = store.lookup("/assets/index-BdX3k9aZ.js")
+        status, headers, body = store.respond(asset, "gzip, deflate")
+        headers = _headers(headers)
+        assert status == 200
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Vary"] == "Accept-Encoding"
+        assert int(headers["Content-Length"]) == len(body) < len(_JS)
+        assert gzip.decompress(body) == _JS
+        _, plain, raw = store.respond(asset, "gzip;q=0")
+        assert "Content-Encoding" not in _headers(plain) and raw == _JS
+
+    def test_작은_파일은_압축하지_않음(self, store):
+        asset = store.lookup("/vite.svg")
+        assert set(asset.variants) == {"identity"}
+        assert "Vary" not in _headers(store.respond(asset, "gzip")[1])
+
+    def test_If_None_Match_일치시_304(self, store):
+        asset = store.lookup("/assets/index-BdX3k9aZ.js")
+        _, headers, _ = store.respond(asset, "gzip")
+        etag = _headers(headers)["ETag"]
+        status, headers304, body = store.respond(asset, "gzip", f'W/{etag}, "other"')
+        assert status == 304 and body == b""
+        assert _headers(headers304)["ETag"] == etag
+        assert store.respond(asset, "gzip", '"stale"')[0] == 200
+
+    def test_파일_변경시_재적재(self, store):
+        first = store.lookup("/index.html")
+        assert store.lookup("/index.html") is first
+        path = store.root / "index.html"
+        path.write_text("<html>new build</html>", encoding="utf-8")
+        os.utime(path, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+        second = store.lookup("/index.html")
+        assert second is not first and second.etag != first.etag
+        assert store.loads == 2
+
+    def test_SPA_fallback과_경로_조작_차단(self, store):
+        assert store.lookup("/kanban/board").rel_path == "index.html"
+        assert store.get("../secret.txt") is None
+        assert store.lookup("/../secret.txt").rel_path == "index.html"
+
+    def test_Accept_Encoding_파싱(self):
+        assert accepted_encodings("br;q=1.0, gzip;q=0") == {"identity", "br"}
+        assert accepted_encodings(None) == {"identity"}
+        assert {"gzip", "br"} <= accepted_encodings("*")